@@ -8,14 +8,19 @@ Security: Firebase Authentication + CORS protection
 
 from flask import Flask, jsonify
 from flask_cors import CORS
-from flask_sqlalchemy import SQLAlchemy
 from flask_migrate import Migrate
+from models import db
+from services import metrics, template_store
+from services.log_pipeline import configure_logging
 from dotenv import load_dotenv
 import os
 
 # Load environment variables
 load_dotenv('config.env')
 
+# 비동기 구조화 로깅 (LOG_LEVEL / LOG_FORMAT / LOG_SAMPLE_EVERY)
+configure_logging()
+
 # Initialize Flask app
 app = Flask(__name__)
 
@@ -24,14 +29,16 @@ app.config['SECRET_KEY'] = os.getenv('SECRET_KEY', 'dev-secret-key')
 app.config['SQLALCHEMY_DATABASE_URI'] = os.getenv('DATABASE_URL', 'sqlite:///email_automation.db')
 app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
 
-# Initialize extensions
-db = SQLAlchemy(app)
+# Initialize extensions (라우트와 동일한 models.db 인스턴스 사용)
+db.init_app(app)
 migrate = Migrate(app, db)
 CORS(app, origins=os.getenv('CORS_ORIGINS', 'http://localhost:3000').split(','))
+metrics.init_app(app)
 
-# 데이터베이스 테이블 생성 (개발용)
+# 데이터베이스 테이블 생성 및 기본 템플릿 등록 (개발용)
 with app.app_context():
     db.create_all()
+    template_store.seed_default_templates()
 
 # Import and register blueprints
 try:
@@ -57,6 +64,14 @@ def health_check():
         'version': '1.0.0'
     })
 
+@app.cli.command('backfill-email-stats')
+def backfill_email_stats():
+    """email_logs로 발송 통계 롤업(email_hourly_stats) 재구성 - 롤업 도입 후 한 번 실행"""
+    from services import email_stats
+
+    totals = email_stats.backfill()
+    print(f"📊 발송 통계 롤업 재구성 완료: {totals}")
+
 @app.errorhandler(404)
 def not_found(error):
     """404 에러 핸들러"""
@@ -0,0 +1 @@
+# Benchmarks for Email Automation System backend hot paths
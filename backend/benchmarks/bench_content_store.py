@@ -0,0 +1,93 @@
+"""
+발송 본문 저장 용량 리포트 - 렌더링 본문 저장 vs 중복 제거 저장
+
+인메모리 SQLite에 캠페인을 등록하고 content_store.storage_report로
+캠페인 저장 용량(이전/이후)을 출력합니다. 무작위 표본에 대해
+재렌더링 결과가 기존 방식(행마다 렌더링)과 같은지도 확인합니다.
+
+실행:
+    cd backend
+    python -m benchmarks.bench_content_store --recipients 20000 --body-kb 30
+"""
+
+import argparse
+import random
+import time
+
+from flask import Flask
+
+from models import Attendee, AttendeeType, EmailLog, db
+from services import campaigns, content_store
+from services.message_builder import recipient_variables, substitute_variables
+
+TEMPLATE_DATA = {'event_name': '2024 개발자 컨퍼런스', 'venue': '코엑스 그랜드볼룸'}
+
+
+def _template(body_kb: int) -> dict:
+    paragraph = '<p>{{name}}님, {{event_name}}({{venue}})에 오신 것을 환영합니다. 소속: {{company}}</p>\n'
+    repeat = max(1, body_kb * 1024 // len(paragraph.encode('utf-8')))
+    return {
+        'subject': '[{{event_name}}] {{name}}님, 참가 확정 안내드립니다',
+        'body': '<html><body>' + paragraph * repeat + '<p>{{current_date}} {{sender_name}}</p></body></html>'
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='발송 본문 저장 용량 리포트')
+    parser.add_argument('--recipients', type=int, default=20000)
+    parser.add_argument('--body-kb', type=int, default=30)
+    parser.add_argument('--samples', type=int, default=200)
+    args = parser.parse_args()
+
+    app = Flask(__name__)
+    app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite://'
+    app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+    db.init_app(app)
+    template = _template(args.body_kb)
+
+    with app.app_context():
+        db.create_all()
+        db.session.execute(Attendee.__table__.insert(), [
+            {
+                'name': f'참석자{i}',
+                'email': f'user{i}@example.com',
+                'company': f'회사 {i % 100}',
+                'position': '엔지니어',
+                'attendee_type': AttendeeType.ATTENDEE
+            }
+            for i in range(args.recipients)
+        ])
+        db.session.commit()
+
+        started = time.perf_counter()
+        result = campaigns.start_campaign(
+            '저장 용량 리포트', Attendee.query.all(), template, TEMPLATE_DATA, '컨퍼런스 운영팀'
+        )
+        enqueue_seconds = time.perf_counter() - started
+        campaign_id = result['campaign']['id']
+
+        # 재렌더링 결과가 기존 방식(공통 기본 변수 + 참석자 변수로 행마다 렌더링)과 같은지 확인
+        logs = EmailLog.query.filter_by(campaign_id=campaign_id).all()
+        _, _, shared = content_store.load_content(logs[0].content_hash)
+        defaults = {key: shared[key] for key in ('current_date', 'current_time', 'sender_name')}
+        for log in random.Random(1).sample(logs, min(args.samples, len(logs))):
+            attendee = log.recipient
+            legacy = {**defaults, **recipient_variables({
+                'name': attendee.name, 'email': attendee.email, 'company': attendee.company,
+                'position': attendee.position, 'attendee_type': 'attendee'
+            }, TEMPLATE_DATA)}
+            expected = (substitute_variables(template['subject'], legacy), substitute_variables(template['body'], legacy))
+            assert content_store.render_log(log)[:2] == expected, log.id
+
+        started = time.perf_counter()
+        report = content_store.storage_report(campaign_id)
+        report_seconds = time.perf_counter() - started
+
+    print(f"수신자: {report['messages']:,}, 본문: {args.body_kb}KB, 공유 blob: {report['shared_contents']}")
+    print(f"렌더링 본문 저장 (이전): {report['rendered_bytes'] / 1024 / 1024:>10.2f} MB")
+    print(f"중복 제거 저장 (이후):   {report['stored_bytes'] / 1024 / 1024:>10.2f} MB  (비율 {report['ratio']})")
+    print(f"큐 등록 {enqueue_seconds:.2f}s, 리포트 {report_seconds:.2f}s, 재렌더링 표본 {args.samples}건 일치")
+
+
+if __name__ == '__main__':
+    main()
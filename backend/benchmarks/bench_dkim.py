@@ -0,0 +1,154 @@
+"""
+DKIM 서명 처리량 벤치마크
+
+같은 메시지 묶음을 다음 방식으로 서명해 초당 서명 메시지 수를 비교합니다.
+- dkimpy: dkim.sign() 호출마다 키 파싱 + 헤더/본문 정규화 (dkimpy가 설치된 경우)
+- uncached: 메시지마다 키 파싱 + 헤더 정규화 + 본문 해시 (캐시 없음)
+- cached: DKIMSigner 하나로 키/고정 헤더/같은 본문 해시 재사용 (EmailService 경로)
+
+본문은 두 종류로 측정합니다.
+- personalized: 본문에 {{name}} 등이 있어 수신자마다 본문이 다름 (본문 해시 캐시 미적중)
+- identical: 본문이 같은 공지 메일 (본문 해시는 한 번만 계산)
+
+서명된 메시지는 모두 로컬 검증기로 확인합니다 (dkimpy가 있으면 dkim.verify에
+DNS 대신 공개 키 레코드를 넘기고, 없으면 services.dkim_signer.verify 사용).
+첨부 스트리밍 경로(message_segments)로 서명한 메시지도 한 건 검증합니다.
+
+실행:
+    cd backend
+    python -m benchmarks.bench_dkim --messages 2000 --body-kb 20
+"""
+
+import argparse
+import os
+import re
+import sys
+import tempfile
+import time
+from typing import Callable, List
+
+os.environ.setdefault('LOG_LEVEL', 'WARNING')
+
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+
+from services.attachments import FileAttachment, message_segments
+from services.dkim_signer import SMTP_POLICY, DKIMSigner, relaxed_header, verify
+from services.message_builder import build_mime_message, render_text_body, substitute_variables
+
+try:
+    import dkim
+except ImportError:  # pragma: no cover - 선택 의존성
+    dkim = None
+
+DOMAIN = 'example.com'
+SELECTOR = 'bench'
+FROM_HEADER = 'Email Automation System <events@example.com>'
+SUBJECT = '[2024 개발자 컨퍼런스] 참가 확정 안내드립니다'
+
+_DOT_STUFFED = re.compile(rb'^\.\.', re.MULTILINE)
+
+
+def _body(body_kb: int, personalized: bool) -> str:
+    greeting = '<p>{{name}}님, 안녕하세요.</p>\n' if personalized else '<p>참석자 여러분, 안녕하세요.</p>\n'
+    paragraph = '<p>2024 개발자 컨퍼런스에 오신 것을 환영합니다. 세션 안내와 장소 정보를 확인해 주세요.</p>\n'
+    repeat = max(1, body_kb * 1024 // len(paragraph.encode('utf-8')))
+    return '<html><body>' + greeting + paragraph * repeat + '</body></html>'
+
+
+def _messages(count: int, body_kb: int, personalized: bool) -> List[bytes]:
+    """수신자별 CRLF 메시지 (서명 전)"""
+    body_template = _body(body_kb, personalized)
+    messages = []
+    for i in range(count):
+        data = {'name': f'참석자{i}', 'email': f'user{i}@example.com'}
+        message = build_mime_message(
+            FROM_HEADER, data['email'], substitute_variables(SUBJECT, data),
+            substitute_variables(body_template, data), data['name'], render_text_body(body_template, data)
+        )
+        messages.append(message.as_bytes(policy=SMTP_POLICY))
+    return messages
+
+
+def _verifier(signer: DKIMSigner) -> Callable[[bytes], bool]:
+    if dkim is None:
+        public_key = signer.private_key.public_key()
+        return lambda data: verify(data, public_key)
+
+    record = signer.public_record().encode('ascii')
+    expected = f'{SELECTOR}._domainkey.{DOMAIN}.'.encode('ascii')
+
+    def dnsfunc(name, timeout=5):
+        return record if name in (expected, expected[:-1]) else None
+
+    return lambda data: dkim.verify(data, dnsfunc=dnsfunc)
+
+
+def _run(label: str, sign: Callable[[bytes], bytes], messages: List[bytes]) -> List[bytes]:
+    started = time.perf_counter()
+    signed = [sign(data) for data in messages]
+    elapsed = time.perf_counter() - started
+    print(f"{label:<28}{elapsed:>10.2f}{len(messages) / elapsed:>12.0f}")
+    return signed
+
+
+def _check_stream(signer: DKIMSigner, verifier: Callable[[bytes], bool]) -> bool:
+    """첨부 스트리밍 경로 서명 검증 (dot-stuffing을 되돌려 원래 메시지로 확인)"""
+    with tempfile.NamedTemporaryFile(suffix='.txt', delete=False) as f:
+        f.write(b'.leading dot line\n' + os.urandom(200 * 1024))
+    try:
+        message = build_mime_message(FROM_HEADER, 'stream@example.com', SUBJECT, '<p>첨부를 확인해 주세요.</p>')
+        segments = message_segments(message, [FileAttachment(f.name, 'program.bin')], signer)
+        data = b''.join(bytes(segment) for segment in segments())
+        return verifier(_DOT_STUFFED.sub(b'.', data))
+    finally:
+        os.unlink(f.name)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='DKIM 서명 처리량 벤치마크')
+    parser.add_argument('--messages', type=int, default=2000)
+    parser.add_argument('--body-kb', type=int, default=20)
+    parser.add_argument('--key-bits', type=int, default=2048)
+    args = parser.parse_args()
+
+    key = rsa.generate_private_key(public_exponent=65537, key_size=args.key_bits)
+    pem = key.private_bytes(serialization.Encoding.PEM, serialization.PrivateFormat.TraditionalOpenSSL,
+                            serialization.NoEncryption())
+    signer = DKIMSigner(DOMAIN, SELECTOR, key)
+    verifier = _verifier(signer)
+
+    def uncached(data: bytes) -> bytes:
+        relaxed_header.cache_clear()
+        private_key = serialization.load_pem_private_key(pem, password=None)
+        return DKIMSigner(DOMAIN, SELECTOR, private_key, body_cache_size=0).sign(data)
+
+    def dkimpy(data: bytes) -> bytes:
+        return dkim.sign(data, SELECTOR.encode(), DOMAIN.encode(), pem,
+                         canonicalize=(b'relaxed', b'relaxed'),
+                         include_headers=[name.encode() for name in ('from', 'to', 'subject')]) + data
+
+    print(f"메시지: {args.messages:,}, 본문: {args.body_kb}KB, RSA {args.key_bits}bit, "
+          f"검증기: {'dkimpy' if dkim is not None else 'services.dkim_signer.verify'}")
+    print(f"{'mode':<28}{'seconds':>10}{'signed/s':>12}")
+
+    failures = 0
+    for workload in ('personalized', 'identical'):
+        messages = _messages(args.messages, args.body_kb, workload == 'personalized')
+        modes = [('uncached', uncached), ('cached', signer.sign)]
+        if dkim is not None:
+            modes.insert(0, ('dkimpy', dkimpy))
+        for name, sign in modes:
+            signed = _run(f'{workload} / {name}', sign, messages)
+            failures += sum(not verifier(data) for data in signed)
+
+    stream_ok = _check_stream(signer, verifier)
+    print(f"캐시: {signer.stats()}")
+    if failures or not stream_ok:
+        print(f"❌ 서명 검증 실패: {failures}건, 첨부 스트리밍 {'정상' if stream_ok else '실패'}")
+        sys.exit(1)
+    print('✅ 모든 서명 검증 통과 (첨부 스트리밍 포함)')
+
+
+if __name__ == '__main__':
+    main()
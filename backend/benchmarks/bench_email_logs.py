@@ -0,0 +1,134 @@
+"""
+발송 로그 조회 벤치마크 - 키셋 페이지네이션 / 롤업 통계
+
+email_logs에 대량의 행을 넣은 뒤 다음을 비교합니다.
+- 깊은 페이지: OFFSET 페이지네이션 vs /api/emails/?cursor= 키셋
+- 통계: email_logs 전체 GROUP BY vs /api/emails/stats (email_hourly_stats 롤업)
+
+실행:
+    cd backend
+    python -m benchmarks.bench_email_logs --rows 200000 --repeat 10
+"""
+
+import argparse
+import random
+import statistics
+import time
+from datetime import datetime, timedelta
+
+from flask import Flask
+from sqlalchemy import func
+
+from models import Attendee, AttendeeType, EmailHourlyStat, EmailLog, EmailStatus, db
+from routes.emails import emails_bp
+from services.email_stats import hour_bucket
+
+
+def create_bench_app(rows: int) -> Flask:
+    """인메모리 SQLite에 발송 로그와 롤업을 채운 앱 생성"""
+    app = Flask(__name__)
+    app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite://'
+    app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+    db.init_app(app)
+    app.register_blueprint(emails_bp, url_prefix='/api/emails')
+
+    rng = random.Random(7)
+    statuses = [EmailStatus.SENT] * 8 + [EmailStatus.FAILED, EmailStatus.PENDING]
+    start = datetime.utcnow() - timedelta(days=7)
+
+    with app.app_context():
+        db.create_all()
+        db.session.execute(Attendee.__table__.insert(), [
+            {'name': f'참석자{i}', 'email': f'user{i}@example.com', 'attendee_type': AttendeeType.ATTENDEE}
+            for i in range(1000)
+        ])
+
+        rollup = {}
+        for offset in range(0, rows, 10000):
+            batch = []
+            for i in range(offset, min(rows, offset + 10000)):
+                created_at = start + timedelta(seconds=i * 7 * 86400 // rows)
+                status = rng.choice(statuses)
+                batch.append({
+                    'recipient_id': i % 1000 + 1,
+                    'sender_id': 1,
+                    'subject': f'제목 {i}',
+                    'body': '본문',
+                    'status': status,
+                    'created_at': created_at,
+                    'sent_at': created_at if status == EmailStatus.SENT else None
+                })
+                # 롤업은 실제 발송 경로처럼 등록 건수(pending)와 결과 건수를 누적
+                hour = hour_bucket(created_at)
+                rollup[(hour, EmailStatus.PENDING)] = rollup.get((hour, EmailStatus.PENDING), 0) + 1
+                if status != EmailStatus.PENDING:
+                    rollup[(hour, status)] = rollup.get((hour, status), 0) + 1
+            db.session.execute(EmailLog.__table__.insert(), batch)
+
+        db.session.execute(EmailHourlyStat.__table__.insert(), [
+            {'hour': hour, 'status': status, 'count': count}
+            for (hour, status), count in rollup.items()
+        ])
+        db.session.commit()
+
+    return app
+
+
+def timed(func_, repeat: int) -> float:
+    func_()  # warm-up
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func_()
+        timings.append((time.perf_counter() - started) * 1000)
+    return statistics.median(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='발송 로그 조회 벤치마크')
+    parser.add_argument('--rows', type=int, default=200000)
+    parser.add_argument('--page-size', type=int, default=50)
+    parser.add_argument('--repeat', type=int, default=10)
+    args = parser.parse_args()
+
+    app = create_bench_app(args.rows)
+    client = app.test_client()
+    deep_offset = args.rows - args.page_size * 2
+
+    with app.app_context():
+        cursor = EmailLog.query.with_entities(EmailLog.id).order_by(EmailLog.id.desc()).offset(deep_offset).limit(1).scalar()
+
+        def offset_page():
+            EmailLog.query.with_entities(EmailLog.id, EmailLog.subject, EmailLog.status) \
+                .filter(EmailLog.status == EmailStatus.SENT) \
+                .order_by(EmailLog.id.desc()).offset(deep_offset * 8 // 10).limit(args.page_size).all()
+
+        def keyset_page():
+            response = client.get(f'/api/emails/?status=sent&fields=id,subject,status&limit={args.page_size}&cursor={cursor}')
+            assert response.status_code == 200, response.data[:200]
+
+        def group_by_stats():
+            db.session.query(EmailLog.status, func.count(EmailLog.id)).group_by(EmailLog.status).all()
+            db.session.query(func.strftime('%Y-%m-%d %H', EmailLog.created_at), EmailLog.status, func.count(EmailLog.id)) \
+                .filter(EmailLog.created_at >= datetime.utcnow() - timedelta(hours=24)) \
+                .group_by(func.strftime('%Y-%m-%d %H', EmailLog.created_at), EmailLog.status).all()
+
+        def rollup_stats():
+            response = client.get('/api/emails/stats')
+            assert response.status_code == 200, response.data[:200]
+
+        scenarios = [
+            ('deep page: OFFSET', offset_page),
+            ('deep page: keyset (API)', keyset_page),
+            ('stats: GROUP BY email_logs', group_by_stats),
+            ('stats: rollup (API)', rollup_stats)
+        ]
+
+        print(f"email_logs: {args.rows:,} rows")
+        print(f"{'scenario':<32}{'median ms':>12}")
+        for label, func_ in scenarios:
+            print(f"{label:<32}{timed(func_, args.repeat):>12.2f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,104 @@
+"""
+목록 API 벤치마크 - 필드 프로젝션 vs 전체 직렬화
+
+1,000행 페이지를 기준으로 응답 시간과 페이로드 크기를 비교합니다.
+
+실행:
+    cd backend
+    python -m benchmarks.bench_list_endpoints --rows 1000 --repeat 20
+"""
+
+import argparse
+import statistics
+import time
+
+from flask import Flask, jsonify
+
+from models import Attendee, AttendeeType, db
+import routes.auth
+from routes.attendees import attendees_bp
+
+
+def create_bench_app(rows: int) -> Flask:
+    """인메모리 SQLite 기반 벤치마크 앱 생성"""
+    app = Flask(__name__)
+    app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite://'
+    app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+    db.init_app(app)
+
+    # 벤치마크에서는 Firebase 토큰 검증을 통과시킴
+    routes.auth.auth.verify_id_token = lambda token: {'uid': 'bench'}
+    app.register_blueprint(attendees_bp, url_prefix='/api/attendees')
+
+    @app.route('/legacy')
+    def legacy_list():
+        """기존 방식: ORM 객체 로드 + to_dict + jsonify"""
+        pagination = Attendee.query.paginate(page=1, per_page=rows, error_out=False)
+        return jsonify({'attendees': [a.to_dict() for a in pagination.items]})
+
+    types = list(AttendeeType)
+    with app.app_context():
+        db.create_all()
+        db.session.bulk_insert_mappings(Attendee, [
+            {
+                'name': f'참석자 {i}',
+                'email': f'user{i}@example.com',
+                'company': f'Company {i % 50}',
+                'position': 'Engineer',
+                'attendee_type': types[i % len(types)],
+                'phone': '010-0000-0000',
+                'custom_fields': {'note': 'x' * 200, 'tags': ['a', 'b', 'c'], 'row': i}
+            }
+            for i in range(rows)
+        ])
+        db.session.commit()
+
+    return app
+
+
+def measure(client, url: str, repeat: int) -> dict:
+    """URL을 반복 호출하여 응답 시간(ms)과 크기(bytes) 측정"""
+    headers = {'Authorization': 'Bearer bench'}
+    client.get(url, headers=headers)  # warm-up
+
+    timings = []
+    size = 0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        response = client.get(url, headers=headers)
+        timings.append((time.perf_counter() - start) * 1000)
+        size = len(response.data)
+        assert response.status_code == 200, response.data[:200]
+
+    return {
+        'median_ms': statistics.median(timings),
+        'p95_ms': sorted(timings)[int(len(timings) * 0.95) - 1],
+        'bytes': size
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='목록 API 필드 프로젝션 벤치마크')
+    parser.add_argument('--rows', type=int, default=1000)
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args()
+
+    app = create_bench_app(args.rows)
+    client = app.test_client()
+    base = f'/api/attendees/?per_page={args.rows}'
+
+    scenarios = [
+        ('legacy (to_dict + jsonify)', '/legacy'),
+        ('all fields (tuple rows)', base),
+        ('fields=id,name,email', base + '&fields=id,name,email'),
+        ('fields=id,email,attendee_type', base + '&fields=id,email,attendee_type')
+    ]
+
+    print(f"{'scenario':<34}{'median ms':>12}{'p95 ms':>10}{'bytes':>12}")
+    for label, url in scenarios:
+        result = measure(client, url, args.repeat)
+        print(f"{label:<34}{result['median_ms']:>12.2f}{result['p95_ms']:>10.2f}{result['bytes']:>12,}")
+
+
+if __name__ == '__main__':
+    main()
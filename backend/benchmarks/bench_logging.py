@@ -0,0 +1,97 @@
+"""
+발송 루프 로깅 오버헤드 벤치마크
+
+테스트 모드 send_bulk_emails를 로깅 설정별로 실행해 처리량을 비교합니다.
+출력은 임시 파일로 보내 프로세스 매니저가 stdout을 받는 상황을 흉내냅니다.
+
+실행:
+    cd backend
+    python -m benchmarks.bench_logging --recipients 20000
+"""
+
+import argparse
+import logging
+import os
+import tempfile
+import time
+
+os.environ.setdefault('EMAIL_TEST_MODE', 'true')
+
+from services import log_pipeline
+from services.email_service import email_service
+
+TEMPLATE = {
+    'subject': '[{{event_name}}] {{name}}님 환영합니다',
+    'body': '<p>{{name}}님, {{event_name}}에 오신 것을 환영합니다.</p>' * 20
+}
+
+
+def _configure(mode: str, stream):
+    """벤치마크 모드별 로깅 설정"""
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+    log_pipeline.shutdown_logging()
+
+    if mode == 'sync-unsampled':
+        # 기존 print()와 비슷한 동기 출력 (큐/샘플링 없음)
+        logging.getLogger(log_pipeline.RECIPIENT_LOGGER).filters.clear()
+        handler = logging.StreamHandler(stream)
+        handler.setFormatter(logging.Formatter('%(asctime)s %(levelname)s [%(name)s] %(message)s'))
+        root.addHandler(handler)
+        root.setLevel(logging.DEBUG)
+        return
+
+    settings = {
+        'disabled': ('WARNING', 'text', 1),
+        'info-sampled': ('INFO', 'text', 100),
+        'info-unsampled': ('INFO', 'text', 1),
+        'debug-unsampled': ('DEBUG', 'text', 1),
+        'json-sampled': ('INFO', 'json', 100)
+    }
+    level, log_format, sample_every = settings[mode]
+    log_pipeline.configure_logging(level, log_format, sample_every, stream=stream)
+
+
+def run(mode: str, recipients: int) -> dict:
+    attendees = [
+        {'id': i, 'name': f'참석자{i}', 'email': f'bench{i}@example.com', 'company': 'ACME'}
+        for i in range(recipients)
+    ]
+
+    with tempfile.TemporaryFile('w+', encoding='utf-8') as stream:
+        _configure(mode, stream)
+        start = time.perf_counter()
+        email_service.send_bulk_emails(attendees, TEMPLATE, {'event_name': 'Bench Conf'})
+        loop_seconds = time.perf_counter() - start
+        log_pipeline.shutdown_logging()  # 큐에 남은 로그까지 출력
+        drained_seconds = time.perf_counter() - start
+        stream.seek(0, os.SEEK_END)
+        log_bytes = stream.tell()
+
+    return {
+        'loop_s': loop_seconds,
+        'drained_s': drained_seconds,
+        'per_sec': recipients / loop_seconds,
+        'log_bytes': log_bytes
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='발송 루프 로깅 오버헤드 벤치마크')
+    parser.add_argument('--recipients', type=int, default=20000)
+    parser.add_argument('--modes', default='disabled,info-sampled,json-sampled,info-unsampled,debug-unsampled,sync-unsampled')
+    args = parser.parse_args()
+
+    results = {mode: run(mode, args.recipients) for mode in args.modes.split(',')}
+    baseline = results.get('disabled')
+
+    print(f"{'mode':<18}{'loop s':>9}{'drained s':>11}{'msgs/s':>11}{'overhead':>10}{'log bytes':>13}")
+    for mode, result in results.items():
+        overhead = f"{result['loop_s'] / baseline['loop_s'] - 1:+.1%}" if baseline else '-'
+        print(f"{mode:<18}{result['loop_s']:>9.3f}{result['drained_s']:>11.3f}"
+              f"{result['per_sec']:>11.0f}{overhead:>10}{result['log_bytes']:>13,}")
+
+
+if __name__ == '__main__':
+    main()
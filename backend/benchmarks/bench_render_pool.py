@@ -0,0 +1,88 @@
+"""
+렌더링 프로세스 풀 확장성 벤치마크
+
+대용량 HTML 템플릿과 한글 제목으로 메시지를 렌더링+직렬화(bytes)하는 처리량을
+단일 프로세스와 프로세스 수별 RenderPool에서 비교합니다.
+SMTP 발송은 포함하지 않습니다 (CPU 단계만 측정).
+
+실행:
+    cd backend
+    python -m benchmarks.bench_render_pool --recipients 5000 --body-kb 30
+"""
+
+import argparse
+import os
+import time
+
+from services import render_pool
+from services.render_pool import RenderPool
+
+SENDER_NAME = '컨퍼런스 운영팀'
+FROM_HEADER = f'{SENDER_NAME} <events@example.com>'
+
+
+def _template(body_kb: int) -> dict:
+    paragraph = '<p>{{name}}님, {{event_name}}에 오신 것을 환영합니다. 소속: {{company}} / {{position}}</p>\n'
+    repeat = max(1, body_kb * 1024 // len(paragraph.encode('utf-8')))
+    return {
+        'subject': '[{{event_name}}] {{name}}님, 참가 확정 안내드립니다',
+        'body': '<html><body>' + paragraph * repeat + '</body></html>'
+    }
+
+
+def _recipients(count: int) -> list:
+    return [
+        {'id': i, 'name': f'참석자{i}', 'email': f'user{i}@example.com', 'company': '테스트 주식회사', 'position': '엔지니어'}
+        for i in range(count)
+    ]
+
+
+def bench_inline(template: dict, data: dict, recipients: list) -> float:
+    """프로세스 풀 없이 현재 프로세스에서 렌더링"""
+    render_pool._init_worker(template['subject'], template['body'], data, SENDER_NAME, FROM_HEADER)
+    start = time.perf_counter()
+    render_pool.render_chunk(0, recipients)
+    return time.perf_counter() - start
+
+
+def bench_pool(template: dict, data: dict, recipients: list, processes: int, chunk_size: int) -> float:
+    with RenderPool(template, data, SENDER_NAME, FROM_HEADER, processes=processes, chunk_size=chunk_size) as pool:
+        # 워커 기동 비용은 제외 (장시간 캠페인에서는 무시 가능)
+        list(pool.render(recipients[:processes]))
+        start = time.perf_counter()
+        rendered = sum(len(chunk) for chunk in pool.render(recipients))
+        elapsed = time.perf_counter() - start
+    assert rendered == len(recipients)
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description='렌더링 프로세스 풀 벤치마크')
+    parser.add_argument('--recipients', type=int, default=5000)
+    parser.add_argument('--body-kb', type=int, default=30)
+    parser.add_argument('--chunk-size', type=int, default=200)
+    parser.add_argument('--processes', default='', help='콤마 구분 프로세스 수 (기본: 1,2,4,...,CPU 수)')
+    args = parser.parse_args()
+
+    template = _template(args.body_kb)
+    data = {'event_name': '2024 개발자 컨퍼런스'}
+    recipients = _recipients(args.recipients)
+
+    cpu_count = os.cpu_count() or 1
+    if args.processes:
+        counts = [int(value) for value in args.processes.split(',')]
+    else:
+        counts = sorted({1, cpu_count} | {2 ** i for i in range(1, 8) if 2 ** i < cpu_count})
+
+    inline = bench_inline(template, data, recipients)
+    print(f"CPU 수: {cpu_count}, 수신자: {args.recipients}, 본문: {args.body_kb}KB")
+    print(f"{'mode':<16}{'seconds':>10}{'msgs/s':>12}{'speedup':>10}")
+    print(f"{'inline':<16}{inline:>10.3f}{args.recipients / inline:>12.0f}{1.0:>10.2f}")
+
+    for processes in counts:
+        elapsed = bench_pool(template, data, recipients, processes, args.chunk_size)
+        print(f"{f'pool x{processes}':<16}{elapsed:>10.3f}{args.recipients / elapsed:>12.0f}{inline / elapsed:>10.2f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,243 @@
+"""
+Google Sheets 클라이언트 초기화 / 요청 지연 벤치마크 (로컬 대체 서버, 외부 네트워크 없음)
+
+로컬 HTTP/1.1 서버가 Sheets API v4 경로(values.get, values.batchGet, spreadsheets.get)를
+흉내 냅니다. 새 연결마다 --handshake-ms 만큼 지연해 TLS 연결 수립 비용을 흉내 내고,
+요청마다 --latency-ms 만큼 지연합니다. fields=가 있으면 요청한 필드만 응답합니다.
+
+초기화:
+- legacy: 인증 정보 로드 + build('sheets', 'v4') (기존 _initialize_service)
+- lazy: GoogleSheetsService() 생성 (클라이언트는 만들지 않음) + 첫 요청 시 정적 문서로 생성
+
+요청 (values.get, 같은 범위 반복):
+- legacy shared: 요청마다 spreadsheets().values() 리소스 생성, build 시 만든 Http 하나로 순차 요청
+  (스레드 안전하지 않아 동시 요청 불가)
+- fresh http: legacy와 같되 요청마다 새 Http (스레드 안전하지만 매번 새 연결)
+- pooled: GoogleSheetsService.get_sheet_data - 리소스 재사용 + HttpPool 연결 재사용 (순차 / 스레드 동시 요청)
+
+접근 확인: fields 제한 없는 spreadsheets.get과 fields=spreadsheetId,properties.title 비교
+
+실행:
+    cd backend
+    python -m benchmarks.bench_sheets_client --requests 200 --threads 8 --handshake-ms 20 --latency-ms 2
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, unquote, urlsplit
+
+os.environ.setdefault('LOG_LEVEL', 'WARNING')
+os.environ['GOOGLE_CREDENTIALS_PATH'] = os.devnull + '.missing'
+
+import httplib2
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+from google.auth.credentials import AnonymousCredentials
+from google.oauth2 import service_account
+from google_auth_httplib2 import AuthorizedHttp
+from googleapiclient.discovery import build
+
+from services.google_sheets import ACCESS_CHECK_FIELDS, GoogleSheetsService, HttpPool
+
+SPREADSHEET_ID = 'a' * 44
+SCOPES = ['https://www.googleapis.com/auth/spreadsheets.readonly']
+
+
+class StandInServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, handshake: float, latency: float, rows: int, sheets: int):
+        super().__init__(('127.0.0.1', 0), StandInHandler)
+        self.handshake = handshake
+        self.latency = latency
+        self.values = [['이름', '이메일']] + [[f'참석자{i}', f'user{i}@example.com'] for i in range(rows)]
+        self.metadata = {
+            'spreadsheetId': SPREADSHEET_ID,
+            'properties': {'title': '2024 컨퍼런스 참가 신청', 'locale': 'ko_KR', 'timeZone': 'Asia/Seoul'},
+            'sheets': [{
+                'properties': {'sheetId': i, 'title': f'Sheet{i}', 'index': i,
+                               'gridProperties': {'rowCount': 1000, 'columnCount': 26}},
+                'conditionalFormats': [{'ranges': [{'sheetId': i, 'startRowIndex': r}],
+                                        'booleanRule': {'condition': {'type': 'NOT_BLANK'}}} for r in range(40)],
+                'protectedRanges': [{'range': {'sheetId': i}, 'description': '수정 금지 ' * 20}]
+            } for i in range(sheets)],
+            'namedRanges': [{'name': f'range{i}', 'range': {'sheetId': 0, 'startRowIndex': i}} for i in range(200)]
+        }
+        self.connections = 0
+        self.bytes_sent = 0
+        self._lock = threading.Lock()
+
+    def reset(self):
+        with self._lock:
+            self.connections = 0
+            self.bytes_sent = 0
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'   # keep-alive
+    disable_nagle_algorithm = True  # 헤더/본문 분할 전송 시 지연 ACK 대기 방지
+
+    def setup(self):
+        super().setup()
+        with self.server._lock:
+            self.server.connections += 1
+        time.sleep(self.server.handshake)
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        time.sleep(self.server.latency)
+        url = urlsplit(self.path)
+        query = parse_qs(url.query)
+        parts = [unquote(part) for part in url.path.strip('/').split('/')]
+
+        if len(parts) == 4 and parts[3] == 'values:batchGet':
+            body = {'spreadsheetId': parts[2],
+                    'valueRanges': [{'range': name, 'values': self.server.values} for name in query.get('ranges', [])]}
+        elif len(parts) == 5 and parts[3] == 'values':
+            body = {'range': parts[4], 'majorDimension': 'ROWS', 'values': self.server.values}
+        elif len(parts) == 3 and parts[1] == 'spreadsheets':
+            body = self.server.metadata
+            if query.get('fields') == [ACCESS_CHECK_FIELDS]:
+                body = {'spreadsheetId': body['spreadsheetId'], 'properties': {'title': body['properties']['title']}}
+        else:
+            self.send_error(404)
+            return
+
+        payload = json.dumps(body, ensure_ascii=False).encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json; charset=UTF-8')
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+        with self.server._lock:
+            self.server.bytes_sent += len(payload)
+
+
+def _service_account_json() -> str:
+    key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    pem = key.private_bytes(serialization.Encoding.PEM, serialization.PrivateFormat.PKCS8,
+                            serialization.NoEncryption()).decode('ascii')
+    return json.dumps({
+        'type': 'service_account', 'project_id': 'bench', 'private_key_id': 'bench', 'private_key': pem,
+        'client_email': 'bench@bench.iam.gserviceaccount.com', 'client_id': '1',
+        'token_uri': 'https://oauth2.googleapis.com/token'
+    })
+
+
+def _mean_ms(samples):
+    return statistics.mean(samples) * 1000
+
+
+def bench_init(rounds: int):
+    credentials_json = _service_account_json()
+    os.environ['GOOGLE_CREDENTIALS_JSON'] = credentials_json
+
+    legacy, construct, first_call = [], [], []
+    for _ in range(rounds):
+        started = time.perf_counter()
+        credentials = service_account.Credentials.from_service_account_info(json.loads(credentials_json), scopes=SCOPES)
+        build('sheets', 'v4', credentials=credentials)
+        legacy.append(time.perf_counter() - started)
+
+        started = time.perf_counter()
+        service = GoogleSheetsService()
+        construct.append(time.perf_counter() - started)
+        started = time.perf_counter()
+        assert service.service is not None
+        first_call.append(time.perf_counter() - started)
+
+    print(f"초기화 ({rounds}회 평균): legacy {_mean_ms(legacy):.1f}ms, "
+          f"GoogleSheetsService() {_mean_ms(construct):.1f}ms + 첫 요청 시 클라이언트 생성 {_mean_ms(first_call):.1f}ms "
+          f"(첫 회 {first_call[0] * 1000:.1f}ms)")
+    os.environ.pop('GOOGLE_CREDENTIALS_JSON', None)
+
+
+def _timed(server: StandInServer, label: str, calls: int, call, threads: int = 1):
+    server.reset()
+    started = time.perf_counter()
+    if threads == 1:
+        for _ in range(calls):
+            call()
+    else:
+        with ThreadPoolExecutor(max_workers=threads) as executor:
+            list(executor.map(lambda _: call(), range(calls)))
+    elapsed = time.perf_counter() - started
+    print(f"{label:<28}{elapsed / calls * 1000:>10.2f}{calls / elapsed:>12.0f}{server.connections:>8}"
+          f"{server.bytes_sent / calls / 1024:>10.1f}")
+    return server.connections
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Google Sheets 클라이언트 벤치마크')
+    parser.add_argument('--requests', type=int, default=200)
+    parser.add_argument('--threads', type=int, default=8)
+    parser.add_argument('--rows', type=int, default=200)
+    parser.add_argument('--sheets', type=int, default=30)
+    parser.add_argument('--handshake-ms', type=float, default=20)
+    parser.add_argument('--latency-ms', type=float, default=2)
+    parser.add_argument('--init-rounds', type=int, default=10)
+    args = parser.parse_args()
+
+    bench_init(args.init_rounds)
+
+    server = StandInServer(args.handshake_ms / 1000, args.latency_ms / 1000, args.rows, args.sheets)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    endpoint = f'http://127.0.0.1:{server.server_address[1]}/'
+    credentials = AnonymousCredentials()
+
+    legacy = build('sheets', 'v4', credentials=credentials, client_options={'api_endpoint': endpoint})
+
+    os.environ['SHEETS_API_ENDPOINT'] = endpoint
+    service = GoogleSheetsService()
+    service.credentials = credentials
+    service.http_pool = HttpPool(credentials, size=args.threads)
+    range_name = 'Sheet1!A:B'
+    expected_rows = args.rows + 1
+
+    def legacy_call():
+        return legacy.spreadsheets().values().get(spreadsheetId=SPREADSHEET_ID, range=range_name).execute()
+
+    def fresh_call():
+        http = AuthorizedHttp(credentials, http=httplib2.Http())
+        return legacy.spreadsheets().values().get(spreadsheetId=SPREADSHEET_ID, range=range_name).execute(http=http)
+
+    def pooled_call():
+        assert len(service.get_sheet_data(SPREADSHEET_ID, range_name)) == expected_rows
+
+    print(f"요청 {args.requests}회, 연결 수립 {args.handshake_ms:.0f}ms, 응답 지연 {args.latency_ms:.0f}ms")
+    print(f"{'mode':<28}{'ms/call':>10}{'calls/s':>12}{'conns':>8}{'KB/call':>10}")
+    _timed(server, 'legacy shared (serial)', args.requests, legacy_call)
+    _timed(server, 'fresh http (serial)', args.requests, fresh_call)
+    fresh_conns = _timed(server, f'fresh http ({args.threads} threads)', args.requests, fresh_call, args.threads)
+    _timed(server, 'pooled (serial)', args.requests, pooled_call)
+    pooled_conns = _timed(server, f'pooled ({args.threads} threads)', args.requests, pooled_call, args.threads)
+
+    def full_metadata():
+        return legacy.spreadsheets().get(spreadsheetId=SPREADSHEET_ID).execute()
+
+    def access_check():
+        assert service.validate_spreadsheet_access(SPREADSHEET_ID)
+
+    _timed(server, 'metadata (all fields)', args.requests, full_metadata)
+    _timed(server, 'access check (fields=)', args.requests, access_check)
+
+    batch = service.get_batch_data(SPREADSHEET_ID, ['Sheet1!A:B', 'Sheet2!A:B'])
+    server.shutdown()
+
+    ok = pooled_conns <= args.threads < fresh_conns and [len(values) for values in batch] == [expected_rows] * 2
+    print(f"연결 풀: {service.http_pool.stats()}")
+    print('✅ 모든 확인 통과' if ok else '❌ 확인 실패')
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == '__main__':
+    main()
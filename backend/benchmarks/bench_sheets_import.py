@@ -0,0 +1,232 @@
+"""
+여러 시트 가져오기 벤치마크 / 동작 확인 (가짜 Sheets 클라이언트, 네트워크 없음)
+
+가짜 클라이언트는 요청마다 --latency-ms 만큼 지연한 뒤 생성된 시트 데이터를 반환합니다.
+다음 두 방식을 비교합니다.
+- sequential: 범위마다 values().get 한 번씩 순서대로 요청 (기존 import-attendees 반복)
+- batched: 스프레드시트마다 values().batchGet 한 번, 스프레드시트 간 스레드 풀 병렬 요청
+
+확인 항목:
+- batchGet 요청 수 = 스프레드시트 수, 동시 요청 수 ≤ 스레드 수
+- 이메일 기준 중복 제거 (대소문자 무시, 앞선 범위 우선)와 범위별 통계
+- 스프레드시트를 오가며 지정한 범위도 sources 순서대로 우선 (A!Speakers, B!Early, A!General)
+- 실패한 스프레드시트는 errors로 보고하고 나머지는 병합
+- /api/google-sheets/import-attendees의 sources 요청 (요청의 max_workers는 SHEETS_IMPORT_WORKERS로 제한)
+
+실행:
+    cd backend
+    python -m benchmarks.bench_sheets_import --spreadsheets 6 --ranges 3 --rows 2000 --latency-ms 150
+"""
+
+import argparse
+import os
+import sys
+import threading
+import time
+
+os.environ.setdefault('LOG_LEVEL', 'WARNING')
+os.environ['GOOGLE_CREDENTIALS_PATH'] = os.devnull + '.missing'
+os.environ.pop('GOOGLE_CREDENTIALS_JSON', None)
+
+import httplib2
+from flask import Flask
+from googleapiclient.errors import HttpError
+
+from routes.google_sheets import google_sheets_bp
+from services.google_sheets import GoogleSheetsService, google_sheets_service
+
+HEADER = ['이름', '이메일', '회사', '직책', '참석자 유형']
+FAILING_ID = 'f' * 44
+
+
+def _spreadsheet_id(index: int) -> str:
+    return f'{index:02d}'.ljust(44, 'x')
+
+
+class _Request:
+    def __init__(self, client, spreadsheet_id, ranges, batch):
+        self.client = client
+        self.spreadsheet_id = spreadsheet_id
+        self.ranges = ranges
+        self.batch = batch
+
+    def execute(self, http=None, num_retries=0):
+        value_ranges = self.client.respond(self.spreadsheet_id, self.ranges)
+        return {'spreadsheetId': self.spreadsheet_id, 'valueRanges': value_ranges} if self.batch else value_ranges[0]
+
+
+class FakeSheetsClient:
+    """service.spreadsheets().values().get / batchGet 만 흉내 내는 가짜 클라이언트"""
+
+    def __init__(self, rows: int, latency: float, overlap: int):
+        self.rows = rows
+        self.latency = latency
+        self.overlap = overlap   # 범위 간 겹치는 이메일 수 (중복 제거 확인용)
+        self.calls = {'get': 0, 'batchGet': 0}
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+
+    def spreadsheets(self):
+        return self
+
+    def values(self):
+        return self
+
+    def get(self, spreadsheetId, range, fields=None):
+        self.calls['get'] += 1
+        return _Request(self, spreadsheetId, [range], batch=False)
+
+    def batchGet(self, spreadsheetId, ranges, majorDimension='ROWS', fields=None):
+        self.calls['batchGet'] += 1
+        return _Request(self, spreadsheetId, list(ranges), batch=True)
+
+    def sheet(self, spreadsheet_id: str, range_name: str):
+        rows = [list(HEADER)]
+        for i in range(self.rows):
+            if i < self.overlap:
+                email = f'Shared{i}@Example.com'   # 모든 범위에 같은 주소 (대소문자만 다름)
+            else:
+                email = f'{spreadsheet_id[:2]}-{range_name.split("!")[0]}-{i}@example.com'
+            rows.append([f'참석자{i}', email, '회사', '직책', range_name.split('!')[0]])
+        return rows
+
+    def respond(self, spreadsheet_id, ranges):
+        with self._lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            time.sleep(self.latency)
+            if spreadsheet_id == FAILING_ID:
+                raise HttpError(httplib2.Response({'status': 403, 'reason': 'Forbidden'}), b'{"error": "forbidden"}')
+            return [{'range': name, 'values': self.sheet(spreadsheet_id, name)} for name in ranges]
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+
+
+class _LateOverlapClient(FakeSheetsClient):
+    """Speakers 범위에는 공유 주소가 없는 클라이언트 (스프레드시트를 오가는 범위 순서 확인용)"""
+
+    def sheet(self, spreadsheet_id: str, range_name: str):
+        rows = super().sheet(spreadsheet_id, range_name)
+        return rows[:1] + rows[1 + self.overlap:] if range_name.startswith('Speakers') else rows
+
+
+def _sources(spreadsheets: int, ranges: int):
+    tabs = ['Speakers', 'Sponsors', 'EarlyBird', 'Regular', 'Staff', 'VIP']
+    return [
+        {'spreadsheet_id': _spreadsheet_id(i), 'ranges': [f'{tabs[r % len(tabs)]}{r}!A:Z' for r in range(ranges)]}
+        for i in range(spreadsheets)
+    ]
+
+
+def _sequential(service: GoogleSheetsService, sources):
+    """기존 방식: 범위마다 get + 파싱, 순서대로 병합"""
+    seen, attendees = set(), []
+    for source in sources:
+        for range_name in source['ranges']:
+            for attendee in service.parse_attendees_from_sheet(service.get_sheet_data(source['spreadsheet_id'], range_name)):
+                if attendee['email'].lower() not in seen:
+                    seen.add(attendee['email'].lower())
+                    attendees.append(attendee)
+    return attendees
+
+
+def main():
+    parser = argparse.ArgumentParser(description='여러 시트 가져오기 벤치마크')
+    parser.add_argument('--spreadsheets', type=int, default=6)
+    parser.add_argument('--ranges', type=int, default=3)
+    parser.add_argument('--rows', type=int, default=2000)
+    parser.add_argument('--overlap', type=int, default=100)
+    parser.add_argument('--latency-ms', type=float, default=150)
+    parser.add_argument('--workers', type=int, default=4)
+    args = parser.parse_args()
+
+    sources = _sources(args.spreadsheets, args.ranges)
+    range_count = args.spreadsheets * args.ranges
+    unique = range_count * (args.rows - args.overlap) + args.overlap
+    checks = {}
+
+    print(f"스프레드시트 {args.spreadsheets} × 범위 {args.ranges}, 범위당 {args.rows:,}행, "
+          f"요청 지연 {args.latency_ms:.0f}ms, 스레드 {args.workers}")
+    print(f"{'mode':<12}{'seconds':>10}{'requests':>10}{'attendees':>12}")
+
+    service = GoogleSheetsService()
+    service.import_workers = args.workers
+    service.service = sequential_client = FakeSheetsClient(args.rows, args.latency_ms / 1000, args.overlap)
+    started = time.perf_counter()
+    baseline = _sequential(service, sources)
+    print(f"{'sequential':<12}{time.perf_counter() - started:>10.2f}{sequential_client.calls['get']:>10}"
+          f"{len(baseline):>12,}")
+
+    service.service = client = FakeSheetsClient(args.rows, args.latency_ms / 1000, args.overlap)
+    started = time.perf_counter()
+    result = service.import_from_sources(sources, max_workers=args.workers)
+    print(f"{'batched':<12}{time.perf_counter() - started:>10.2f}{client.calls['batchGet']:>10}"
+          f"{len(result['attendees']):>12,}")
+
+    emails = [attendee['email'] for attendee in result['attendees']]
+    first_range = sources[0]['ranges'][0]
+    checks['requests'] = client.calls == {'get': 0, 'batchGet': args.spreadsheets}
+    checks['bounded'] = client.max_in_flight <= args.workers
+    checks['dedupe'] = (
+        len(emails) == unique == len(baseline)
+        and len({email.lower() for email in emails}) == len(emails)
+        and result['duplicate_count'] == args.overlap * (range_count - 1)
+        and [attendee['email'] for attendee in baseline] == emails
+    )
+    checks['priority'] = all(
+        attendee['sheet_range'] == first_range for attendee in result['attendees'][:args.overlap]
+    ) and [attendee['id'] for attendee in result['attendees']] == list(range(1, len(emails) + 1))
+    checks['stats'] = (
+        len(result['sources']) == range_count
+        and result['total_rows'] == range_count * (args.rows + 1)
+        and sum(source['added'] for source in result['sources']) == len(emails)
+    )
+
+    # A!Speakers, B!Early, A!General 순서: 공유 주소는 B!Early가 가져가야 함
+    service.service = _LateOverlapClient(50, 0, 10)
+    interleaved = service.import_from_sources([
+        {'spreadsheet_id': _spreadsheet_id(0), 'range': 'Speakers!A:Z'},
+        {'spreadsheet_id': _spreadsheet_id(1), 'range': 'Early!A:Z'},
+        {'spreadsheet_id': _spreadsheet_id(0), 'range': 'General!A:Z'}
+    ], max_workers=args.workers)
+    shared = [attendee for attendee in interleaved['attendees'] if attendee['email'].startswith('Shared')]
+    checks['interleaved'] = (
+        [source['range'] for source in interleaved['sources']] == ['Speakers!A:Z', 'Early!A:Z', 'General!A:Z']
+        and len(shared) == 10 and all(attendee['sheet_range'] == 'Early!A:Z' for attendee in shared)
+        and service.service.calls['batchGet'] == 2
+    )
+
+    failing = sources[:1] + [{'spreadsheet_id': FAILING_ID, 'range': 'A:Z'}]
+    partial = service.import_from_sources(failing, max_workers=args.workers)
+    checks['errors'] = (
+        len(partial['errors']) == 1 and partial['errors'][0]['spreadsheet_id'] == FAILING_ID
+        and len(partial['sources']) == args.ranges
+    )
+
+    app = Flask(__name__)
+    app.register_blueprint(google_sheets_bp, url_prefix='/api/google-sheets')
+    google_sheets_service.service = FakeSheetsClient(50, 0, 10)
+    http = app.test_client()
+    response = http.post('/api/google-sheets/import-attendees', json={'sources': _sources(2, 2)})
+    bad = http.post('/api/google-sheets/import-attendees', json={'sources': [{'spreadsheet_id': 'short'}]})
+    body = response.get_json()
+    # 요청의 max_workers는 SHEETS_IMPORT_WORKERS를 넘지 못함
+    google_sheets_service.service = capped = FakeSheetsClient(10, 0.05, 0)
+    http.post('/api/google-sheets/import-attendees', json={'sources': _sources(16, 1), 'max_workers': 1000})
+    checks['route'] = (
+        response.status_code == 200 and body['valid_attendees'] == 4 * 40 + 10
+        and body['duplicate_count'] == 30 and bad.status_code == 400
+        and capped.max_in_flight <= google_sheets_service.import_workers
+    )
+
+    print(f"최대 동시 요청 {client.max_in_flight}, 중복 제거 {result['duplicate_count']:,}명")
+    failed = [name for name, ok in checks.items() if not ok]
+    print('✅ 모든 확인 통과' if not failed else f"❌ 확인 실패: {', '.join(failed)}")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,112 @@
+"""
+테스트 모드 스풀 싱크 처리량 벤치마크
+
+같은 대량 발송(send_bulk_emails)을 다음 모드로 실행해 비교합니다.
+- simulated: 기존 테스트 모드 (MIME 생성 없이 결과만 반환)
+- maildir / mbox: MIME 메시지를 끝까지 만들어 디스크 스풀에 배치 기록
+- mbox + render pool: BULK_RENDER_PROCESSES 프로세스 렌더링 + 스풀 기록
+
+기록된 메시지 수와 구조(multipart/alternative)는 mailbox 모듈로 다시 읽어 확인합니다.
+네트워크 없이 전체 파이프라인 비용을 측정하는 기준으로 사용할 수 있습니다.
+
+실행:
+    cd backend
+    python -m benchmarks.bench_spool_sink --recipients 5000 --body-kb 20 --processes 4
+"""
+
+import argparse
+import mailbox
+import os
+import shutil
+import tempfile
+import time
+
+os.environ['EMAIL_TEST_MODE'] = 'true'
+os.environ.setdefault('LOG_LEVEL', 'WARNING')
+
+from services.email_service import EmailService
+
+TEMPLATE_DATA = {'event_name': '2024 개발자 컨퍼런스'}
+
+
+def _template(body_kb: int) -> dict:
+    paragraph = '<p>{{name}}님, {{event_name}}에 오신 것을 환영합니다. 소속: {{company}}</p>\n'
+    repeat = max(1, body_kb * 1024 // len(paragraph.encode('utf-8')))
+    return {
+        'subject': '[{{event_name}}] {{name}}님, 참가 확정 안내드립니다',
+        'body': '<html><body>' + paragraph * repeat + '<p>From the organizers</p></body></html>'
+    }
+
+
+def _recipients(count: int) -> list:
+    return [
+        {'id': i, 'name': f'참석자{i}', 'email': f'user{i}@example.com', 'company': '테스트 주식회사'}
+        for i in range(count)
+    ]
+
+
+def _service(spool_path: str = '', spool_format: str = 'maildir', processes: int = 1) -> EmailService:
+    os.environ.update({
+        'EMAIL_SPOOL_PATH': spool_path,
+        'EMAIL_SPOOL_FORMAT': spool_format,
+        'BULK_RENDER_PROCESSES': str(processes),
+        'EMAIL_ADDRESS': 'events@example.com'
+    })
+    return EmailService()
+
+
+def _count(spool_path: str, spool_format: str) -> int:
+    box = mailbox.Maildir(spool_path, create=False) if spool_format == 'maildir' else mailbox.mbox(spool_path)
+    try:
+        count = 0
+        for message in box:
+            count += 1
+            if count == 1:
+                assert message.get_content_type() == 'multipart/alternative', message.get_content_type()
+        return count
+    finally:
+        box.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='테스트 모드 스풀 싱크 처리량 벤치마크')
+    parser.add_argument('--recipients', type=int, default=5000)
+    parser.add_argument('--body-kb', type=int, default=20)
+    parser.add_argument('--processes', type=int, default=min(4, os.cpu_count() or 1))
+    args = parser.parse_args()
+
+    template = _template(args.body_kb)
+    recipients = _recipients(args.recipients)
+    workdir = tempfile.mkdtemp(prefix='spool-bench-')
+
+    modes = [
+        ('simulated', '', 'maildir', 1),
+        ('maildir', os.path.join(workdir, 'maildir'), 'maildir', 1),
+        ('mbox', os.path.join(workdir, 'outbox.mbox'), 'mbox', 1)
+    ]
+    if args.processes > 1:
+        modes.append((f'mbox + render x{args.processes}', os.path.join(workdir, 'pool.mbox'), 'mbox', args.processes))
+
+    print(f"수신자: {args.recipients:,}, 본문: {args.body_kb}KB")
+    print(f"{'mode':<24}{'seconds':>10}{'msgs/s':>10}{'MB written':>12}{'flushes':>10}")
+    try:
+        for label, spool_path, spool_format, processes in modes:
+            service = _service(spool_path, spool_format, processes)
+            started = time.perf_counter()
+            results = service.send_bulk_emails(recipients, template, TEMPLATE_DATA)
+            elapsed = time.perf_counter() - started
+            assert results['success_count'] == args.recipients, results['failure_count']
+
+            written_mb = flushes = 0
+            if spool_path:
+                stats = service.spool_sink.stats()
+                service.spool_sink.close()
+                written_mb, flushes = stats['bytes'] / 1024 / 1024, stats['flushes']
+                assert _count(spool_path, spool_format) == args.recipients
+            print(f"{label:<24}{elapsed:>10.2f}{args.recipients / elapsed:>10.0f}{written_mb:>12.1f}{flushes:>10}")
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,211 @@
+"""
+발송 억제 목록 벤치마크 / 동작 확인
+
+1. 억제 주소 N건 등록 후 압축 → 디스크 크기 (레코드당 바이트)
+2. 로드 시간과 조회 처리량: 집합(set) 모드 / 블룸 모드 (억제된 주소 / 억제되지 않은 주소)
+3. send_bulk_emails 사전 필터: 수신자 중 억제된 주소가 발송 전에 제외되는지 확인
+4. DSN 수집: maildir에 반송(5.x.x / 4.x.x), 스팸 신고(ARF), 수신 거부 메일을 만들고
+   BounceIngester로 수집 → 다른 인스턴스가 refresh()로 새 기록만 읽어 반영하는지 확인
+
+네트워크와 DB 없이 실행됩니다.
+
+실행:
+    cd backend
+    python -m benchmarks.bench_suppression --entries 200000 --lookups 200000 --bounces 1000
+"""
+
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+from email.mime.text import MIMEText
+
+os.environ['EMAIL_TEST_MODE'] = 'true'
+os.environ.setdefault('LOG_LEVEL', 'WARNING')
+
+from services.bounces import BounceIngester
+from services.suppression import INDEX_FILE, SuppressionList, SuppressionReason
+
+
+def _address(i: int) -> str:
+    return f'suppressed{i}@example.com'
+
+
+def _report(report_type: str, sender: str, text: str, report_part: str, extra: str = '') -> bytes:
+    """multipart/report 메시지 (email 패키지 생성기는 message/delivery-status 문자열 본문을 다루지 못해 직접 조립)"""
+    boundary = '=_bench_report'
+    return (
+        f'From: {sender}\r\n'
+        'To: events@example.com\r\n'
+        'Subject: Delivery report\r\n'
+        'MIME-Version: 1.0\r\n'
+        f'Content-Type: multipart/report; report-type={report_type}; boundary="{boundary}"\r\n\r\n'
+        f'--{boundary}\r\nContent-Type: text/plain\r\n\r\n{text}\r\n'
+        f'--{boundary}\r\nContent-Type: message/{report_type}\r\n\r\n{report_part}\r\n'
+        f'{extra}'
+        f'--{boundary}--\r\n'
+    ).encode('utf-8')
+
+
+def _dsn(recipient: str, status: str, action: str = 'failed') -> bytes:
+    """RFC 3464 반송 메시지"""
+    fields = (
+        'Reporting-MTA: dns; mx.example.net\r\n\r\n'
+        f'Final-Recipient: rfc822; {recipient}\r\n'
+        f'Action: {action}\r\n'
+        f'Status: {status}\r\n'
+        f'Diagnostic-Code: smtp; {status} mailbox unavailable\r\n'
+    )
+    headers = (
+        '--=_bench_report\r\nContent-Type: text/rfc822-headers\r\n\r\n'
+        f'To: {recipient}\r\nSubject: notice\r\n\r\n'
+    )
+    return _report('delivery-status', 'MAILER-DAEMON@mx.example.net', f'Delivery to {recipient} failed.',
+                   fields, headers)
+
+
+def _arf(recipient: str) -> bytes:
+    """RFC 5965 스팸 신고 메시지"""
+    fields = f'Feedback-Type: abuse\r\nUser-Agent: FBL/1.0\r\nVersion: 1\r\nOriginal-Rcpt-To: {recipient}\r\n'
+    return _report('feedback-report', 'fbl@isp.example.net', 'This is an abuse report.', fields)
+
+
+def _unsubscribe(sender: str) -> bytes:
+    message = MIMEText('', 'plain')
+    message['From'] = sender
+    message['To'] = 'unsubscribe@example.com'
+    message['Subject'] = 'unsubscribe'
+    return message.as_bytes()
+
+
+def _timed_lookups(suppression: SuppressionList, addresses) -> float:
+    started = time.perf_counter()
+    for address in addresses:
+        address in suppression
+    return len(addresses) / (time.perf_counter() - started)
+
+
+def bench_index(workdir: str, entries: int, lookups: int) -> bool:
+    path = os.path.join(workdir, 'index')
+    writer = SuppressionList(path, compact_records=entries * 2)
+    started = time.perf_counter()
+    writer.add_many((_address(i), SuppressionReason.HARD_BOUNCE) for i in range(entries))
+    writer.compact()
+    build_s = time.perf_counter() - started
+    size = os.path.getsize(os.path.join(path, INDEX_FILE))
+    print(f"등록 + 압축 {entries:,}건: {build_s:.2f}초, index.bin {size / 1024 / 1024:.1f}MB "
+          f"({size / max(1, entries):.1f} bytes/주소)")
+
+    hits = [_address(i * 7 % entries) for i in range(lookups)]
+    misses = [f'active{i}@example.com' for i in range(lookups)]
+    ok = True
+
+    print(f"{'mode':<8}{'load s':>10}{'memory MB':>12}{'hit/s':>12}{'miss/s':>12}")
+    for mode, bloom in (('set', False), ('bloom', True)):
+        if bloom:
+            # 블룸 필터 파일 생성 (압축 시 만들어짐)
+            SuppressionList(path, bloom=True).compact()
+        tracemalloc.start()
+        started = time.perf_counter()
+        reader = SuppressionList(path, bloom=bloom)
+        load_s = time.perf_counter() - started
+        memory = tracemalloc.get_traced_memory()[0] / 1024 / 1024
+        tracemalloc.stop()
+
+        hit_rate = _timed_lookups(reader, hits)
+        miss_rate = _timed_lookups(reader, misses)
+        ok &= all(address in reader for address in hits[:1000])
+        ok &= not any(address in reader for address in misses[:1000])
+        ok &= reader.reason(hits[0]) == SuppressionReason.HARD_BOUNCE
+        print(f"{mode:<8}{load_s:>10.3f}{memory:>12.1f}{hit_rate:>12,.0f}{miss_rate:>12,.0f}")
+    return ok
+
+
+def bench_bulk_filter(workdir: str, recipients: int) -> bool:
+    path = os.path.join(workdir, 'bulk')
+    os.environ['SUPPRESSION_DIR'] = path
+    from services.email_service import EmailService
+
+    service = EmailService()
+    suppressed = {f'user{i}@example.com' for i in range(0, recipients, 10)}
+    service.suppression.add_many((address, SuppressionReason.UNSUBSCRIBE) for address in suppressed)
+
+    attendees = [{'id': i, 'name': f'참석자{i}', 'email': f'User{i}@Example.com'} for i in range(recipients)]
+    started = time.perf_counter()
+    results = service.send_bulk_emails(attendees, {'subject': '안내', 'body': '{{name}}님 안녕하세요'})
+    elapsed = time.perf_counter() - started
+    sent = {result['recipient'] for result in results['results'] if result['success']}
+    print(f"대량 발송 사전 필터: 수신자 {recipients:,}명 중 제외 {results['preflight']['suppressed_count']:,}명, "
+          f"{elapsed:.2f}초")
+    return results['preflight']['suppressed_count'] == len(suppressed) and not sent & suppressed
+
+
+def bench_ingest(workdir: str, bounces: int) -> bool:
+    path = os.path.join(workdir, 'ingest')
+    maildir = os.path.join(workdir, 'bounces')
+    sender = SuppressionList(path)   # 발송 프로세스 쪽 인스턴스 (시작 시 로드)
+    ingester = BounceIngester(maildir, SuppressionList(path))
+
+    expected = {}
+    soft = []
+    for i in range(bounces):
+        kind = i % 4
+        recipient = f'bounce{i}@example.org'
+        if kind == 0:
+            data, expected[recipient] = _dsn(recipient, '5.1.1'), SuppressionReason.HARD_BOUNCE
+        elif kind == 1:
+            data = _dsn(recipient, '4.2.2', action='delayed')
+            soft.append(recipient)
+        elif kind == 2:
+            data, expected[recipient] = _arf(recipient), SuppressionReason.COMPLAINT
+        else:
+            data, expected[recipient] = _unsubscribe(recipient), SuppressionReason.UNSUBSCRIBE
+        with open(os.path.join(maildir, 'new', f'{i:08d}.bounce'), 'wb') as f:
+            f.write(data)
+
+    started = time.perf_counter()
+    stats = ingester.scan(limit=bounces)
+    elapsed = time.perf_counter() - started
+    refreshed = sender.refresh()
+    second = ingester.scan()
+
+    print(f"DSN 수집 {bounces:,}건: {elapsed:.2f}초 ({bounces / elapsed:,.0f} msgs/s), "
+          f"영구 {stats['hard']}, 일시 {stats['soft']}, 신고 {stats['complaint']}, "
+          f"수신 거부 {stats['unsubscribe']}, 미인식 {stats['unrecognized']}, 발송 쪽 증분 반영 {refreshed}건")
+    return (
+        stats['suppressed'] == len(expected)
+        and refreshed == len(expected)
+        and second['messages'] == 0
+        and all(sender.reason(address) == reason for address, reason in expected.items())
+        and not any(address in sender for address in soft)
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description='발송 억제 목록 벤치마크')
+    parser.add_argument('--entries', type=int, default=200000)
+    parser.add_argument('--lookups', type=int, default=200000)
+    parser.add_argument('--recipients', type=int, default=5000)
+    parser.add_argument('--bounces', type=int, default=1000)
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix='suppression-bench-')
+    try:
+        checks = {
+            'index': bench_index(workdir, args.entries, args.lookups),
+            'bulk_filter': bench_bulk_filter(workdir, args.recipients),
+            'ingest': bench_ingest(workdir, args.bounces)
+        }
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    failed = [name for name, ok in checks.items() if not ok]
+    print('✅ 모든 확인 통과' if not failed else f"❌ 확인 실패: {', '.join(failed)}")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,243 @@
+"""
+백엔드 핫 패스 마이크로 벤치마크 스위트
+
+측정 대상:
+- EmailService.process_template (본문 크기 x 변수 개수)
+- EmailService.validate_email_address
+- MIME 메시지 생성 (EmailService.build_message)
+- GoogleSheetsService.parse_attendees_from_sheet (1k / 10k / 100k 행)
+- 참석자 대량 등록 (/api/attendees/bulk, SQLite)
+
+실행:
+    cd backend
+    python -m benchmarks.suite run --output benchmarks/baselines/current.json
+    python -m benchmarks.suite compare benchmarks/baselines/baseline.json benchmarks/baselines/current.json
+    python -m benchmarks.suite run --compare benchmarks/baselines/baseline.json --threshold 0.2
+
+compare는 기준선 대비 중앙값이 threshold 이상 느려진 항목이 있으면 종료 코드 1을 반환합니다.
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+from datetime import datetime
+from typing import Callable, Dict, List, Tuple
+
+# 벤치마크 중에는 실제 발송을 하지 않음
+os.environ.setdefault('EMAIL_TEST_MODE', 'true')
+
+from services.email_service import email_service
+from services.google_sheets import google_sheets_service
+from services.message_builder import render_text_body
+
+DEFAULT_THRESHOLD = 0.15
+
+# (이름, 준비 함수) - 준비 함수는 측정할 무인자 callable을 반환
+BENCHMARKS: List[Tuple[str, Callable[[], Callable[[], object]]]] = []
+
+
+def benchmark(name: str):
+    """벤치마크 등록 데코레이터"""
+    def decorator(setup):
+        BENCHMARKS.append((name, setup))
+        return setup
+    return decorator
+
+
+def _template(body_size: int, variable_count: int) -> Tuple[str, Dict[str, str]]:
+    """지정한 크기와 변수 개수를 가진 템플릿 생성"""
+    variables = {f'var{i}': f'값{i}' for i in range(variable_count)}
+    placeholders = ' '.join(f'{{{{var{i}}}}}' for i in range(variable_count))
+    filler = '안녕하세요 컨퍼런스 참석자 여러분. '
+    body = (filler * (body_size // len(filler.encode('utf-8')) + 1))[:body_size // 3]
+    return f'{body}\n{placeholders}\n{body}', variables
+
+
+def _sheet(rows: int) -> List[List[str]]:
+    """참석자 시트 데이터 생성 (5%는 잘못된 이메일)"""
+    types = ['연사', 'attendee', '스폰서', 'VIP', '스태프']
+    data = [['이름', '이메일', '회사', '직책', '참석자 유형']]
+    for i in range(rows):
+        email = f'user{i}@example.com' if i % 20 else f'user{i}-at-example'
+        data.append([f'참석자{i}', email, f'Company {i % 100}', 'Engineer', types[i % len(types)]])
+    return data
+
+
+for _size in (1_000, 10_000, 100_000):
+    for _count in (5, 50):
+        @benchmark(f'process_template[body={_size // 1000}k,vars={_count}]')
+        def _setup_template(size=_size, count=_count):
+            template, variables = _template(size, count)
+            return lambda: email_service.process_template(template, variables)
+
+
+@benchmark('validate_email_address[x1000]')
+def _setup_validate():
+    addresses = [f'User.{i}+tag@Sub{i % 7}.Example.com' if i % 10 else f'broken{i}@' for i in range(1000)]
+
+    def run():
+        for address in addresses:
+            email_service.validate_email_address(address)
+    return run
+
+
+for _kind, _body in (('text', '텍스트 본문 ' * 1000), ('html', '<html><p>' + 'HTML 본문 ' * 3000 + '</p></html>')):
+    @benchmark(f'build_message[{_kind},{len(_body.encode("utf-8")) // 1000}kB]')
+    def _setup_mime(body=_body):
+        def run():
+            # 발송 경로와 같이 템플릿 단위로 캐시된 텍스트 파트 사용
+            return email_service.build_message(
+                'user@example.com', '2024 컨퍼런스 참석을 환영합니다', body, '홍길동',
+                render_text_body(body, {})).as_bytes()
+        return run
+
+
+for _rows in (1_000, 10_000, 100_000):
+    @benchmark(f'parse_attendees_from_sheet[{_rows // 1000}k]')
+    def _setup_parse(rows=_rows):
+        data = _sheet(rows)
+        return lambda: google_sheets_service.parse_attendees_from_sheet(data)
+
+
+@benchmark('attendee_bulk_insert[sqlite,1k]')
+def _setup_bulk_insert():
+    from benchmarks.bench_list_endpoints import create_bench_app
+    from models import Attendee, db
+
+    app = create_bench_app(0)
+    client = app.test_client()
+    payload = {'attendees': [
+        {'name': f'참석자{i}', 'email': f'bulk{i}@example.com', 'company': 'ACME', 'attendee_type': 'attendee'}
+        for i in range(1000)
+    ]}
+
+    def run():
+        with app.app_context():
+            Attendee.query.delete()
+            db.session.commit()
+        response = client.post('/api/attendees/bulk', json=payload, headers={'Authorization': 'Bearer bench'})
+        assert response.json['created'] == 1000, response.json
+    return run
+
+
+def measure(fn: Callable[[], object], min_time: float = 0.2, repeat: int = 5) -> Dict[str, float]:
+    """
+    실행 시간 측정
+
+    한 번의 측정이 min_time 이상이 되도록 반복 횟수를 정한 뒤
+    repeat회 측정하여 1회당 소요 시간의 중앙값/최솟값을 반환합니다.
+    """
+    with contextlib.redirect_stdout(io.StringIO()):
+        start = time.perf_counter()
+        fn()
+        single = time.perf_counter() - start
+        number = max(1, int(min_time / single)) if single > 0 else 1000
+
+        samples = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            for _ in range(number):
+                fn()
+            samples.append((time.perf_counter() - start) / number)
+
+    return {
+        'median_s': statistics.median(samples),
+        'min_s': min(samples),
+        'number': number,
+        'repeat': repeat
+    }
+
+
+def run_suite(selected: str = '', repeat: int = 5) -> Dict[str, object]:
+    """등록된 벤치마크 실행"""
+    results = {}
+    for name, setup in BENCHMARKS:
+        if selected and selected not in name:
+            continue
+        with contextlib.redirect_stdout(io.StringIO()):
+            fn = setup()
+        results[name] = measure(fn, repeat=repeat)
+        print(f"{name:<45}{results[name]['median_s'] * 1000:>12.3f} ms", file=sys.stderr)
+
+    return {
+        'meta': {
+            'created_at': datetime.now().isoformat(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'cpu_count': os.cpu_count()
+        },
+        'results': results
+    }
+
+
+def compare(baseline: Dict[str, object], current: Dict[str, object], threshold: float) -> List[str]:
+    """기준선 대비 비교 결과 출력, 회귀 항목 이름 리스트 반환"""
+    regressions = []
+    base_results = baseline.get('results', {})
+
+    print(f"{'benchmark':<45}{'baseline ms':>13}{'current ms':>13}{'change':>10}")
+    for name, result in current.get('results', {}).items():
+        if name not in base_results:
+            print(f"{name:<45}{'-':>13}{result['median_s'] * 1000:>13.3f}{'new':>10}")
+            continue
+
+        before = base_results[name]['median_s']
+        after = result['median_s']
+        change = (after - before) / before if before else 0.0
+        flag = ' REGRESSION' if change > threshold else ''
+        print(f"{name:<45}{before * 1000:>13.3f}{after * 1000:>13.3f}{change:>+10.1%}{flag}")
+        if flag:
+            regressions.append(name)
+
+    return regressions
+
+
+def _load(path: str) -> Dict[str, object]:
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description='백엔드 핫 패스 마이크로 벤치마크')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    run_parser = subparsers.add_parser('run', help='벤치마크 실행')
+    run_parser.add_argument('--output', help='결과 JSON 저장 경로')
+    run_parser.add_argument('--filter', default='', help='이름에 포함된 문자열로 선택')
+    run_parser.add_argument('--repeat', type=int, default=5)
+    run_parser.add_argument('--compare', help='비교할 기준선 JSON 경로')
+    run_parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD)
+
+    compare_parser = subparsers.add_parser('compare', help='두 결과 JSON 비교')
+    compare_parser.add_argument('baseline')
+    compare_parser.add_argument('current')
+    compare_parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD)
+
+    args = parser.parse_args()
+
+    if args.command == 'compare':
+        regressions = compare(_load(args.baseline), _load(args.current), args.threshold)
+        return 1 if regressions else 0
+
+    report = run_suite(args.filter, args.repeat)
+    if args.output:
+        os.makedirs(os.path.dirname(args.output) or '.', exist_ok=True)
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+        print(f"결과 저장: {args.output}", file=sys.stderr)
+
+    if args.compare:
+        regressions = compare(_load(args.compare), report, args.threshold)
+        return 1 if regressions else 0
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
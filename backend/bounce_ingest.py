@@ -0,0 +1,115 @@
+"""
+Email Automation System - Bounce Ingester
+반송 메일함(maildir)의 DSN / 스팸 신고 / 수신 거부 메일을 읽어 발송 억제 목록에 반영
+
+- new/의 메시지만 처리하고 처리한 메시지는 cur/로 이동 (증분 수집)
+- 영구 반송(5.x.x), 스팸 신고, 수신 거부 → 억제 목록 journal에 추가 (발송 프로세스는 refresh로 반영)
+- 영구 반송은 그 주소에 마지막으로 발송한 캠페인의 bounced_count에 집계 (--no-campaigns로 생략)
+- journal이 커지면 억제 목록을 압축 (index.bin 재작성, 큰 목록이면 블룸 필터 생성)
+
+실행:
+    cd backend
+    python bounce_ingest.py --maildir /var/mail/bounces            # 계속 대기하며 수집
+    python bounce_ingest.py --maildir /var/mail/bounces --once     # 한 번 수집 후 종료
+    python bounce_ingest.py --compact                              # 억제 목록 압축만 실행
+"""
+
+import argparse
+import logging
+import os
+import time
+
+from dotenv import load_dotenv
+
+# Load environment variables
+load_dotenv('config.env')
+
+from services.log_pipeline import configure_logging
+
+configure_logging()
+
+from services.bounces import BounceIngester
+from services.suppression import SuppressionList, open_suppression
+
+logger = logging.getLogger('bounce_ingest')
+
+
+def record_campaign_bounces(app, hard_bounces) -> dict:
+    """영구 반송 주소를 캠페인 반송 건수에 반영"""
+    from services import campaigns
+
+    with app.app_context():
+        return campaigns.record_bounced_addresses(hard_bounces)
+
+
+def run_ingester(maildir: str, suppression: SuppressionList, poll_interval: float, once: bool,
+                 update_campaigns: bool = True, batch_size: int = 1000) -> dict:
+    ingester = BounceIngester(maildir, suppression)
+    app = None
+    if update_campaigns:
+        from worker import create_worker_app
+        app = create_worker_app()
+
+    totals = {'messages': 0, 'suppressed': 0, 'hard': 0, 'soft': 0, 'complaint': 0, 'unsubscribe': 0,
+              'unrecognized': 0}
+    logger.info("📥 반송 수집 시작: %s → %s", maildir, suppression.path)
+    try:
+        while True:
+            stats = ingester.scan(limit=batch_size)
+            for key in totals:
+                totals[key] += stats[key]
+
+            if stats['hard_bounces'] and app is not None:
+                try:
+                    counts = record_campaign_bounces(app, stats['hard_bounces'])
+                    if counts:
+                        logger.info("📊 캠페인 반송 집계: %s", counts)
+                except Exception as e:
+                    logger.warning("⚠️ 캠페인 반송 집계 실패: %s", e)
+
+            if stats['messages']:
+                logger.info("📥 반송 메시지 %d건 처리 (억제 %d건, 영구 %d, 일시 %d, 신고 %d, 수신 거부 %d, 미인식 %d)",
+                            stats['messages'], stats['suppressed'], stats['hard'], stats['soft'],
+                            stats['complaint'], stats['unsubscribe'], stats['unrecognized'])
+                if stats['messages'] >= batch_size:
+                    continue  # 남은 메시지 바로 처리
+            if once:
+                break
+            time.sleep(poll_interval)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        logger.info("🛑 반송 수집 종료: %s", totals)
+
+    return totals
+
+
+def main():
+    parser = argparse.ArgumentParser(description='반송 메일함 수집 → 발송 억제 목록')
+    parser.add_argument('--maildir', default=os.getenv('BOUNCE_MAILDIR', ''))
+    parser.add_argument('--suppression-dir', default=os.getenv('SUPPRESSION_DIR', 'suppression'))
+    parser.add_argument('--poll-interval', type=float, default=float(os.getenv('BOUNCE_POLL_INTERVAL', '30')))
+    parser.add_argument('--batch-size', type=int, default=1000, help='한 번에 처리할 메시지 수')
+    parser.add_argument('--no-campaigns', action='store_true', help='캠페인 반송 건수 집계 생략 (DB 미사용)')
+    parser.add_argument('--compact', action='store_true', help='억제 목록 압축만 실행')
+    parser.add_argument('--once', action='store_true', help='한 번 수집 후 종료')
+    args = parser.parse_args()
+
+    suppression = open_suppression(args.suppression_dir)
+    if suppression is None:
+        raise SystemExit('SUPPRESSION_DIR is not configured')
+
+    if args.compact:
+        count = suppression.compact()
+        logger.info("🗜️ 억제 목록 %d건: %s", count, suppression.stats())
+        return
+
+    if not args.maildir:
+        raise SystemExit('BOUNCE_MAILDIR (--maildir) is not configured')
+
+    run_ingester(args.maildir, suppression, args.poll_interval, args.once,
+                 update_campaigns=not args.no_campaigns, batch_size=args.batch_size)
+
+
+if __name__ == '__main__':
+    main()
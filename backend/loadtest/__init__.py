@@ -0,0 +1 @@
+# Offline load-test harness for the email sending pipeline
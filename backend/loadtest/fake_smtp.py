@@ -0,0 +1,214 @@
+"""
+부하 테스트용 로컬 SMTP 싱크 서버
+
+실제 메일을 전달하지 않고 수신만 하는 SMTP 서버입니다.
+- 명령별 지연 시간 설정 (예: DATA 응답을 50ms 지연)
+- 4xx/5xx 응답 무작위 주입 (RCPT/DATA 단계)
+- 무작위 연결 끊기
+- 수신 통계 (메시지 수, 바이트, 주입된 오류 수)
+
+단독 실행:
+    cd backend
+    python -m loadtest.fake_smtp --port 2525 --latency-ms 2 --command-latency DATA=20 --error-rate 0.01
+"""
+
+import argparse
+import random
+import socketserver
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Dict, Optional
+
+
+@dataclass
+class SinkConfig:
+    """SMTP 싱크 동작 설정"""
+    latency_ms: float = 0.0                 # 모든 명령에 적용되는 기본 지연
+    command_latency_ms: Dict[str, float] = field(default_factory=dict)  # 명령별 지연 (예: {'DATA': 50})
+    error_rate: float = 0.0                 # RCPT/DATA 단계 오류 응답 확률
+    temporary_error_ratio: float = 0.5      # 주입 오류 중 4xx 비율 (나머지는 5xx)
+    drop_rate: float = 0.0                  # 명령 처리 전 연결을 끊을 확률
+    seed: Optional[int] = None
+
+
+@dataclass
+class SinkStats:
+    """수신 통계 (스레드 안전)"""
+    connections: int = 0
+    messages: int = 0
+    bytes: int = 0
+    temporary_errors: int = 0
+    permanent_errors: int = 0
+    drops: int = 0
+    deliveries: Dict[str, int] = field(default_factory=dict, repr=False)  # 수신자별 수신 횟수
+    lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def add(self, **deltas: int):
+        with self.lock:
+            for name, delta in deltas.items():
+                setattr(self, name, getattr(self, name) + delta)
+
+    def delivered(self, recipients, size: int):
+        """메시지 수신 기록 (수신자별 횟수 포함)"""
+        with self.lock:
+            self.messages += 1
+            self.bytes += size
+            for recipient in recipients:
+                self.deliveries[recipient] = self.deliveries.get(recipient, 0) + 1
+
+    def snapshot(self) -> Dict[str, int]:
+        with self.lock:
+            return {
+                'connections': self.connections,
+                'messages': self.messages,
+                'bytes': self.bytes,
+                'temporary_errors': self.temporary_errors,
+                'permanent_errors': self.permanent_errors,
+                'drops': self.drops
+            }
+
+
+class _SMTPSinkHandler(socketserver.StreamRequestHandler):
+    """SMTP 세션 하나를 처리하는 핸들러"""
+
+    def reply(self, line: str):
+        self.wfile.write(line.encode('ascii') + b'\r\n')
+
+    def _delay(self, verb: str):
+        config = self.server.config
+        delay = config.command_latency_ms.get(verb, config.latency_ms)
+        if delay:
+            time.sleep(delay / 1000)
+
+    def _inject_error(self) -> bool:
+        """설정된 확률로 4xx/5xx 응답을 보내고 True 반환"""
+        config = self.server.config
+        if not config.error_rate or self.server.random.random() >= config.error_rate:
+            return False
+        if self.server.random.random() < config.temporary_error_ratio:
+            self.server.stats.add(temporary_errors=1)
+            self.reply('451 4.3.0 Temporary failure injected by load test')
+        else:
+            self.server.stats.add(permanent_errors=1)
+            self.reply('550 5.1.1 Permanent failure injected by load test')
+        return True
+
+    def _read_data(self) -> int:
+        """'.' 한 줄이 나올 때까지 본문을 읽고 바이트 수 반환"""
+        size = 0
+        while True:
+            line = self.rfile.readline()
+            if not line or line in (b'.\r\n', b'.\n'):
+                return size
+            size += len(line)
+
+    def handle(self):
+        server = self.server
+        server.stats.add(connections=1)
+        self.reply('220 loadtest.local ESMTP sink')
+        recipients = []
+
+        while True:
+            line = self.rfile.readline()
+            if not line:
+                return
+
+            command = line.decode('utf-8', 'replace').strip()
+            verb = command.split(' ', 1)[0].upper()
+            self._delay(verb)
+
+            if server.config.drop_rate and server.random.random() < server.config.drop_rate:
+                server.stats.add(drops=1)
+                return
+
+            if verb in ('EHLO', 'HELO'):
+                self.wfile.write(b'250-loadtest.local\r\n250-SIZE 52428800\r\n250-8BITMIME\r\n250 AUTH PLAIN LOGIN\r\n')
+            elif verb == 'AUTH':
+                self.reply('235 2.7.0 Authentication successful')
+            elif verb == 'MAIL':
+                recipients = []
+                self.reply('250 2.1.0 OK')
+            elif verb == 'RCPT':
+                if not self._inject_error():
+                    recipients.append(command.split(':', 1)[-1].partition('>')[0].strip().lstrip('<').lower())
+                    self.reply('250 2.1.5 OK')
+            elif verb == 'DATA':
+                self.reply('354 End data with <CR><LF>.<CR><LF>')
+                size = self._read_data()
+                if not self._inject_error():
+                    server.stats.delivered(recipients, size)
+                    self.reply('250 2.0.0 Queued')
+            elif verb in ('RSET', 'NOOP'):
+                if verb == 'RSET':
+                    recipients = []
+                self.reply('250 2.0.0 OK')
+            elif verb == 'QUIT':
+                self.reply('221 2.0.0 Bye')
+                return
+            else:
+                self.reply('502 5.5.2 Command not implemented')
+
+
+class FakeSMTPServer(socketserver.ThreadingTCPServer):
+    """스레드 기반 SMTP 싱크 서버"""
+
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, host: str = '127.0.0.1', port: int = 0, config: Optional[SinkConfig] = None):
+        self.config = config or SinkConfig()
+        self.stats = SinkStats()
+        self.random = random.Random(self.config.seed)
+        super().__init__((host, port), _SMTPSinkHandler)
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def port(self) -> int:
+        return self.server_address[1]
+
+    def start(self) -> 'FakeSMTPServer':
+        """백그라운드 스레드에서 서버 시작"""
+        self._thread = threading.Thread(target=self.serve_forever, name='fake-smtp', daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+
+
+def parse_command_latency(values) -> Dict[str, float]:
+    """'DATA=50' 형식의 인자 목록을 {'DATA': 50.0}으로 변환"""
+    latency = {}
+    for value in values or []:
+        verb, _, ms = value.partition('=')
+        latency[verb.strip().upper()] = float(ms)
+    return latency
+
+
+def main():
+    parser = argparse.ArgumentParser(description='로컬 SMTP 싱크 서버')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=2525)
+    parser.add_argument('--latency-ms', type=float, default=0.0)
+    parser.add_argument('--command-latency', action='append', metavar='VERB=MS')
+    parser.add_argument('--error-rate', type=float, default=0.0)
+    parser.add_argument('--drop-rate', type=float, default=0.0)
+    args = parser.parse_args()
+
+    server = FakeSMTPServer(args.host, args.port, SinkConfig(
+        latency_ms=args.latency_ms,
+        command_latency_ms=parse_command_latency(args.command_latency),
+        error_rate=args.error_rate,
+        drop_rate=args.drop_rate
+    ))
+    print(f"📮 SMTP sink listening on {args.host}:{server.port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print(server.stats.snapshot())
+
+
+if __name__ == '__main__':
+    main()
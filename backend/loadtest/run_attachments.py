@@ -0,0 +1,91 @@
+"""
+공통 첨부 대량 발송 메모리 검증
+
+같은 PDF(기본 5MB)를 N명에게 로컬 SMTP 싱크로 발송하면서 프로세스 RSS를 기록합니다.
+공통 첨부는 한 번만 인코딩되어 mmap으로 공유되므로, 워밍업 이후 RSS가
+수신자 수에 비례해 늘지 않아야 합니다.
+
+실행:
+    cd backend
+    python -m loadtest.run_attachments --recipients 10000 --size-mb 5
+    python -m loadtest.run_attachments --recipients 300 --size-mb 5 --per-recipient
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+from loadtest.fake_smtp import FakeSMTPServer
+from loadtest.run_load import MemorySampler
+
+
+def _rss_kb() -> int:
+    with open('/proc/self/status') as f:
+        for line in f:
+            if line.startswith('VmRSS:'):
+                return int(line.split()[1])
+    return 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description='공통 첨부 대량 발송 메모리 검증')
+    parser.add_argument('--recipients', type=int, default=10000)
+    parser.add_argument('--size-mb', type=float, default=5.0)
+    parser.add_argument('--per-recipient', action='store_true', help='수신자별 첨부(작은 수료증)도 함께 발송')
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix='attachments-')
+    with open(os.path.join(workdir, 'program.pdf'), 'wb') as f:
+        f.write(os.urandom(int(args.size_mb * 1024 * 1024)))
+
+    attachments = [{'path': 'program.pdf', 'filename': '컨퍼런스 프로그램.pdf'}]
+    if args.per_recipient:
+        os.makedirs(os.path.join(workdir, 'certificates'))
+        for i in range(args.recipients):
+            with open(os.path.join(workdir, 'certificates', f'{i + 1}.pdf'), 'wb') as f:
+                f.write(os.urandom(20 * 1024))
+        attachments.append({'path_template': 'certificates/{{id}}.pdf', 'filename': '수료증.pdf'})
+
+    sink = FakeSMTPServer().start()
+    os.environ.update({
+        'EMAIL_TEST_MODE': 'false',
+        'SMTP_SERVER': '127.0.0.1',
+        'SMTP_PORT': str(sink.port),
+        'SMTP_USE_TLS': 'false',
+        'EMAIL_ADDRESS': 'attachments@example.com',
+        'EMAIL_PASSWORD': 'attachments',
+        'ATTACHMENT_DIR': workdir,
+        'LOG_LEVEL': 'WARNING'
+    })
+
+    from services.email_service import email_service
+
+    attendees = [
+        {'id': i + 1, 'name': f'참석자{i}', 'email': f'user{i}@example.com', 'company': 'Test Inc'}
+        for i in range(args.recipients)
+    ]
+    template = {'subject': '[{{event_name}}] 프로그램 안내', 'body': '<p>{{name}}님, 첨부된 프로그램을 확인해 주세요.</p>'}
+
+    baseline_kb = _rss_kb()
+    sampler = MemorySampler(os.getpid(), interval=0.05)
+    sampler.start()
+    started = time.perf_counter()
+    results = email_service.send_bulk_emails(attendees, template, {'event_name': 'Attachment Test 2024'}, attachments)
+    elapsed = time.perf_counter() - started
+    sampler.stop()
+    sink.stop()
+
+    stats = sink.stats.snapshot()
+    print(f"수신자: {args.recipients:,}, 첨부: {args.size_mb}MB" + (' + 수신자별 20KB' if args.per_recipient else ''))
+    print(f"성공 {results['success_count']:,} / 실패 {results['failure_count']:,}, 싱크 수신 {stats['messages']:,}건 "
+          f"({stats['bytes'] / 1024 / 1024:,.0f} MB), {elapsed:.1f}s")
+    print(f"RSS: 시작 {baseline_kb / 1024:.1f} MB, 최대 {sampler.peak_rss_kb / 1024:.1f} MB, "
+          f"증가 {(sampler.peak_rss_kb - baseline_kb) / 1024:.1f} MB")
+
+    sys.exit(0 if results['failure_count'] == 0 and stats['messages'] == args.recipients else 1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,162 @@
+"""
+발송 레인 지연 시간 SLO 확인
+
+대량 발송이 SMTP 세션 풀과 발송 속도 한도를 모두 쓰고 있는 동안
+단건(transactional) 발송의 지연 시간이 목표 p95 이하인지 확인합니다.
+SMTP는 로컬 싱크(loadtest.fake_smtp)를 사용하므로 완전히 오프라인으로 동작합니다.
+
+- 대량 발송: --bulk-threads개 스레드가 bulk 레인으로 계속 발송 (세션 풀 크기보다 많게 → 항상 대기)
+- 단건 발송: --interval-ms마다 한 건씩 transactional 레인으로 발송하고 send_email 소요 시간 측정
+- 비교: 레인 예약 없음(shared) / 레인 예약(lanes) 두 설정으로 같은 부하 실행
+- 공유 용량 확인: 세션 풀 1개 + transactional=1 예약, 속도 예약 합계 1.0에서도 bulk 발송이 대기에 걸리지 않는지
+
+실행:
+    cd backend
+    python -m loadtest.run_lanes --data-latency-ms 20 --bulk-threads 16 --probes 100 --slo-ms 150
+    python -m loadtest.run_lanes --rate 200 --probes 100     # 발송 속도 한도 포함
+"""
+
+import argparse
+import json
+import os
+import sys
+import threading
+import time
+from typing import Dict, List
+
+from loadtest.fake_smtp import FakeSMTPServer, SinkConfig
+
+MODES = {
+    # 예약 없음: 모든 레인이 같은 세션/토큰을 두고 경쟁 (기존 동작)
+    'shared': {'SMTP_LANE_RESERVED': '', 'SMTP_RATE_RESERVED': ''},
+    # 단건 발송 예약 세션 1개 + 발송 속도 10%
+    'lanes': {'SMTP_LANE_RESERVED': 'transactional=1', 'SMTP_RATE_RESERVED': 'transactional=0.1'}
+}
+
+
+def percentile(values: List[float], ratio: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * ratio))] if ordered else 0.0
+
+
+def check_shared_capacity(timeout: float = 2.0) -> bool:
+    """예약이 전체 용량을 덮는 설정에서도 예약 없는 레인이 슬롯/토큰을 얻는지 확인"""
+    from models import SendLane
+    from services.lanes import LaneSlots
+    from services.rate_limiter import LaneRateLimiter
+
+    slots = LaneSlots(1, {SendLane.TRANSACTIONAL: 1})
+    limiter = LaneRateLimiter(100, {SendLane.TRANSACTIONAL: 1.0})
+    acquired = []
+
+    def bulk():
+        with slots.slot(SendLane.BULK):
+            limiter.acquire(SendLane.BULK)
+            acquired.append(True)
+
+    thread = threading.Thread(target=bulk, daemon=True)
+    thread.start()
+    thread.join(timeout)
+    return bool(acquired) and slots.shared == 1 and limiter.stats()['shared_rate'] > 0
+
+
+def run_mode(mode: str, sink: FakeSMTPServer, args) -> Dict[str, object]:
+    from models import SendLane
+    from services.email_service import EmailService
+
+    os.environ.update({
+        'EMAIL_TEST_MODE': 'false',
+        'SMTP_SERVER': '127.0.0.1',
+        'SMTP_PORT': str(sink.port),
+        'SMTP_USE_TLS': 'false',
+        'EMAIL_ADDRESS': 'lanes@example.com',
+        'EMAIL_PASSWORD': 'lanes',
+        'SMTP_POOL_SIZE': str(args.pool_size),
+        'SMTP_RATE_LIMIT': str(args.rate),
+        **MODES[mode]
+    })
+    service = EmailService()
+    stop = threading.Event()
+    bulk_sent = [0] * args.bulk_threads
+
+    def bulk(index: int):
+        while not stop.is_set():
+            service.send_email(f'bulk{index}-{bulk_sent[index]}@example.com', '[Bulk] {{name}}님 안내',
+                               '<p>대량 발송 본문</p>', 'Bulk', lane=SendLane.BULK)
+            bulk_sent[index] += 1
+
+    threads = [threading.Thread(target=bulk, args=(i,), daemon=True) for i in range(args.bulk_threads)]
+    for thread in threads:
+        thread.start()
+    time.sleep(args.warmup)
+
+    latencies = []
+    failures = 0
+    started = time.perf_counter()
+    for i in range(args.probes):
+        probe_started = time.perf_counter()
+        result = service.send_email(f'signup{mode}{i}@example.com', '가입 확인', '<p>가입을 환영합니다.</p>', 'Signup')
+        latencies.append((time.perf_counter() - probe_started) * 1000)
+        failures += 0 if result['success'] else 1
+        time.sleep(max(0.0, args.interval_ms / 1000 - (time.perf_counter() - probe_started)))
+    elapsed = time.perf_counter() - started
+
+    stop.set()
+    for thread in threads:
+        thread.join()
+    service.smtp_pool.close()
+
+    return {
+        'mode': mode,
+        'transactional_p50_ms': round(percentile(latencies, 0.5), 1),
+        'transactional_p95_ms': round(percentile(latencies, 0.95), 1),
+        'transactional_max_ms': round(max(latencies), 1),
+        'transactional_failures': failures,
+        'bulk_per_sec': round(sum(bulk_sent) / (elapsed + args.warmup), 1)
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='발송 레인 지연 시간 SLO 확인')
+    parser.add_argument('--pool-size', type=int, default=4)
+    parser.add_argument('--bulk-threads', type=int, default=16)
+    parser.add_argument('--data-latency-ms', type=float, default=20.0)
+    parser.add_argument('--rate', type=float, default=0.0, help='초당 발송 한도 (0이면 제한 없음)')
+    parser.add_argument('--probes', type=int, default=100, help='단건 발송 측정 횟수')
+    parser.add_argument('--interval-ms', type=float, default=50.0)
+    parser.add_argument('--warmup', type=float, default=1.0, help='대량 발송 시작 후 측정까지 대기(초)')
+    parser.add_argument('--slo-ms', type=float, default=150.0, help='단건 발송 p95 목표')
+    parser.add_argument('--json', action='store_true', help='결과를 JSON으로 출력')
+    args = parser.parse_args()
+
+    os.environ.setdefault('LOG_LEVEL', 'WARNING')
+    sink = FakeSMTPServer(config=SinkConfig(command_latency_ms={'DATA': args.data_latency_ms})).start()
+    try:
+        reports = [run_mode(mode, sink, args) for mode in MODES]
+    finally:
+        sink.stop()
+
+    lanes = reports[-1]
+    slo_ok = lanes['transactional_p95_ms'] <= args.slo_ms and lanes['transactional_failures'] == 0
+    shared_ok = check_shared_capacity()
+    ok = slo_ok and shared_ok
+
+    if args.json:
+        print(json.dumps({'reports': reports, 'slo_ms': args.slo_ms, 'shared_capacity': shared_ok, 'ok': ok},
+                         ensure_ascii=False, indent=2))
+    else:
+        print(f"세션 풀 {args.pool_size}, 대량 발송 스레드 {args.bulk_threads}, DATA 지연 {args.data_latency_ms}ms, "
+              f"발송 한도 {args.rate or '없음'}")
+        print(f"{'mode':<10}{'p50 ms':>10}{'p95 ms':>10}{'max ms':>10}{'bulk/s':>10}")
+        for report in reports:
+            print(f"{report['mode']:<10}{report['transactional_p50_ms']:>10}{report['transactional_p95_ms']:>10}"
+                  f"{report['transactional_max_ms']:>10}{report['bulk_per_sec']:>10}")
+        print(f"{'✅' if shared_ok else '❌'} 세션 풀 1개 + 예약 1개에서 bulk 발송 {'가능' if shared_ok else '대기 중 멈춤'}")
+        print(f"✅ 단건 발송 p95 {lanes['transactional_p95_ms']}ms ≤ {args.slo_ms}ms" if slo_ok
+              else f"❌ 단건 발송 p95 {lanes['transactional_p95_ms']}ms > {args.slo_ms}ms")
+
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,246 @@
+"""
+/api/emails/send-bulk 엔드투엔드 부하 테스트
+
+로컬 SMTP 싱크(loadtest.fake_smtp)를 띄우고, Flask 앱을 별도 프로세스로 실행해
+싱크를 SMTP 서버로 사용하도록 설정한 뒤 대량 발송 캠페인을 보냅니다.
+네트워크 외부 연결 없이 완전히 오프라인으로 동작합니다.
+
+보고 항목:
+- 초당 발송 메시지 수 (messages/sec)
+- 메시지별 처리 시간 p50 / p95 / p99
+- 서버 프로세스 메모리 (최대 RSS)
+- SMTP 싱크 통계 (수신 메시지, 주입된 오류, 끊긴 연결)
+
+실행:
+    cd backend
+    python -m loadtest.run_load --size 2000 --campaigns 2 --concurrency 2 \\
+        --latency-ms 1 --command-latency DATA=20 --error-rate 0.01 --drop-rate 0.001
+"""
+
+import argparse
+import json
+import os
+import socket
+import subprocess
+import sys
+import threading
+import time
+import urllib.request
+from typing import Dict, List, Optional
+
+from loadtest.fake_smtp import FakeSMTPServer, SinkConfig, parse_command_latency
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def _percentile(values: List[float], percent: float) -> Optional[float]:
+    if not values:
+        return None
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, int(round(percent / 100 * len(ordered))) - 1))
+    return ordered[index]
+
+
+class MemorySampler(threading.Thread):
+    """/proc/<pid>/status의 VmRSS를 주기적으로 읽어 최대값 기록 (Linux 전용)"""
+
+    def __init__(self, pid: int, interval: float = 0.1):
+        super().__init__(name='memory-sampler', daemon=True)
+        self.pid = pid
+        self.interval = interval
+        self.peak_rss_kb = 0
+        self._stopped = threading.Event()
+
+    def _read_rss_kb(self) -> int:
+        try:
+            with open(f'/proc/{self.pid}/status') as f:
+                for line in f:
+                    if line.startswith('VmRSS:'):
+                        return int(line.split()[1])
+        except OSError:
+            pass
+        return 0
+
+    def run(self):
+        while not self._stopped.is_set():
+            self.peak_rss_kb = max(self.peak_rss_kb, self._read_rss_kb())
+            self._stopped.wait(self.interval)
+
+    def stop(self):
+        self._stopped.set()
+        self.join()
+
+
+def start_app(smtp_port: int, app_port: int) -> subprocess.Popen:
+    """싱크를 SMTP 서버로 사용하는 Flask 앱을 별도 프로세스로 실행"""
+    env = dict(os.environ)
+    env.update({
+        'EMAIL_TEST_MODE': 'false',
+        'SMTP_SERVER': '127.0.0.1',
+        'SMTP_PORT': str(smtp_port),
+        'SMTP_USE_TLS': 'false',
+        'EMAIL_ADDRESS': 'loadtest@example.com',
+        'EMAIL_PASSWORD': 'loadtest',
+        'SENDER_NAME': 'Load Test'
+    })
+    code = (
+        'import simple_app; '
+        f"simple_app.app.run(host='127.0.0.1', port={app_port}, threaded=True, debug=False)"
+    )
+    process = subprocess.Popen(
+        [sys.executable, '-c', code],
+        cwd=BACKEND_DIR,
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL
+    )
+
+    deadline = time.time() + 30
+    while time.time() < deadline:
+        try:
+            urllib.request.urlopen(f'http://127.0.0.1:{app_port}/api/health', timeout=1).read()
+            return process
+        except OSError:
+            if process.poll() is not None:
+                raise RuntimeError('Flask 앱 프로세스가 시작 직후 종료되었습니다.')
+            time.sleep(0.2)
+
+    process.kill()
+    raise RuntimeError('Flask 앱이 30초 내에 시작되지 않았습니다.')
+
+
+def build_campaign(campaign: int, size: int, body_kb: int) -> Dict[str, object]:
+    """send-bulk 요청 페이로드 생성"""
+    paragraph = '<p>{{name}}님, {{event_name}}에 오신 것을 환영합니다. 회사: {{company}}</p>\n'
+    body = '<html><body>' + paragraph * max(1, body_kb * 1024 // len(paragraph.encode('utf-8'))) + '</body></html>'
+    return {
+        'attendees': [
+            {
+                'id': i,
+                'name': f'참석자{campaign}-{i}',
+                'email': f'load{campaign}-{i}@example.com',
+                'company': 'Load Test Inc',
+                'attendee_type': 'attendee'
+            }
+            for i in range(size)
+        ],
+        'template': {'subject': '[{{event_name}}] {{name}}님 환영합니다', 'body': body},
+        'template_data': {'event_name': 'Load Test Conference 2024'}
+    }
+
+
+def run_campaign(app_port: int, payload: Dict[str, object], results: List[Dict[str, object]]):
+    request = urllib.request.Request(
+        f'http://127.0.0.1:{app_port}/api/emails/send-bulk',
+        data=json.dumps(payload).encode('utf-8'),
+        headers={'Content-Type': 'application/json'},
+        method='POST'
+    )
+    with urllib.request.urlopen(request, timeout=3600) as response:
+        results.append(json.loads(response.read()))
+
+
+def run_load_test(args) -> Dict[str, object]:
+    sink = FakeSMTPServer(config=SinkConfig(
+        latency_ms=args.latency_ms,
+        command_latency_ms=parse_command_latency(args.command_latency),
+        error_rate=args.error_rate,
+        drop_rate=args.drop_rate,
+        seed=args.seed
+    )).start()
+
+    app_port = _free_port()
+    process = start_app(sink.port, app_port)
+    sampler = MemorySampler(process.pid)
+    sampler.start()
+
+    try:
+        payloads = [build_campaign(c, args.size, args.body_kb) for c in range(args.campaigns)]
+        responses: List[Dict[str, object]] = []
+        started = time.perf_counter()
+
+        pending = list(payloads)
+        while pending:
+            batch, pending = pending[:args.concurrency], pending[args.concurrency:]
+            threads = [
+                threading.Thread(target=run_campaign, args=(app_port, payload, responses))
+                for payload in batch
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        elapsed = time.perf_counter() - started
+    finally:
+        sampler.stop()
+        process.terminate()
+        process.wait(timeout=10)
+        sink.stop()
+
+    latencies = [
+        result['duration_ms']
+        for response in responses
+        for result in response.get('results', [])
+        if result.get('success') and 'duration_ms' in result
+    ]
+    sent = sum(response.get('success_count', 0) for response in responses)
+    failed = sum(response.get('failure_count', 0) for response in responses)
+
+    return {
+        'campaigns': args.campaigns,
+        'campaign_size': args.size,
+        'concurrency': args.concurrency,
+        'elapsed_s': round(elapsed, 3),
+        'sent': sent,
+        'failed': failed,
+        'messages_per_sec': round(sent / elapsed, 2) if elapsed else None,
+        'latency_ms': {
+            'p50': _percentile(latencies, 50),
+            'p95': _percentile(latencies, 95),
+            'p99': _percentile(latencies, 99)
+        },
+        'server_peak_rss_mb': round(sampler.peak_rss_kb / 1024, 1),
+        'sink': sink.stats.snapshot()
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='send-bulk 엔드투엔드 부하 테스트 (오프라인)')
+    parser.add_argument('--size', type=int, default=500, help='캠페인당 수신자 수')
+    parser.add_argument('--campaigns', type=int, default=1, help='보낼 캠페인 수')
+    parser.add_argument('--concurrency', type=int, default=1, help='동시에 실행할 캠페인 수')
+    parser.add_argument('--body-kb', type=int, default=10, help='HTML 본문 크기 (KB)')
+    parser.add_argument('--latency-ms', type=float, default=0.0, help='SMTP 명령 기본 지연')
+    parser.add_argument('--command-latency', action='append', metavar='VERB=MS', help='명령별 지연 (예: DATA=20)')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='4xx/5xx 주입 확률')
+    parser.add_argument('--drop-rate', type=float, default=0.0, help='연결 끊기 확률')
+    parser.add_argument('--seed', type=int, default=None)
+    parser.add_argument('--json', action='store_true', help='결과를 JSON으로 출력')
+    args = parser.parse_args()
+
+    report = run_load_test(args)
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+        return
+
+    latency = report['latency_ms']
+    fmt = lambda value: f'{value:.1f}' if value is not None else '-'
+    print(f"📊 부하 테스트 결과 ({report['campaigns']} x {report['campaign_size']}명, 동시 {report['concurrency']})")
+    print(f"   소요 시간: {report['elapsed_s']}s")
+    print(f"   성공 / 실패: {report['sent']} / {report['failed']}")
+    print(f"   처리량: {report['messages_per_sec']} messages/sec")
+    print(f"   메시지별 지연: p50={fmt(latency['p50'])}ms p95={fmt(latency['p95'])}ms p99={fmt(latency['p99'])}ms")
+    print(f"   서버 최대 RSS: {report['server_peak_rss_mb']} MB")
+    print(f"   SMTP 싱크: {report['sink']}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,155 @@
+"""
+아웃바운드 스풀 + 전달 데몬 검증
+
+1. 발송 쪽: EmailService.send_bulk_emails로 메시지를 아웃바운드 스풀에 기록 (렌더링 속도 측정)
+2. 전달 쪽: spool_daemon.py 프로세스가 로컬 SMTP 싱크(loadtest.fake_smtp)로 전달
+3. --kill-daemon: 데몬을 전달 중에 강제 종료한 뒤 다시 실행 → 스풀 재스캔으로 남은 메시지 전달
+
+확인 항목:
+- 모든 수신자가 최소 한 번 수신 (누락 없음)
+- 중복 수신은 강제 종료 시 fsync되지 않은 확인 기록 분량 이내 (at-least-once)
+- 전달 후 스풀이 비어 있음 (큐 깊이 0)
+
+실행:
+    cd backend
+    python -m loadtest.run_spool --messages 2000 --data-latency-ms 5
+    python -m loadtest.run_spool --messages 2000 --data-latency-ms 5 --kill-daemon
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Dict
+
+from loadtest.fake_smtp import FakeSMTPServer, SinkConfig
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+TEMPLATE = {
+    'subject': '[{{event_name}}] {{name}}님 안내',
+    'body': '<p>{{name}}님, {{event_name}}에 오신 것을 환영합니다. 소속: {{company}}</p>'
+}
+
+
+def produce(spool_dir: str, messages: int) -> float:
+    """스풀에 메시지 기록, 걸린 시간(초) 반환"""
+    os.environ.update({
+        'EMAIL_TEST_MODE': 'false',
+        'OUTBOUND_SPOOL_DIR': spool_dir,
+        'EMAIL_ADDRESS': 'spool@example.com',
+        'LOG_LEVEL': 'WARNING'
+    })
+    from services.email_service import EmailService
+
+    service = EmailService()
+    recipients = [
+        {'id': i, 'name': f'스풀{i}', 'email': f'spool{i}@example.com', 'company': 'Spool Test Inc'}
+        for i in range(messages)
+    ]
+    started = time.perf_counter()
+    results = service.send_bulk_emails(recipients, TEMPLATE, {'event_name': 'Spool Test 2024'})
+    elapsed = time.perf_counter() - started
+    assert results['success_count'] == messages, results['failure_count']
+    assert service.outbound_spool.depth() == messages
+    return elapsed
+
+
+def start_daemon(spool_dir: str, smtp_port: int, senders: int) -> subprocess.Popen:
+    env = dict(os.environ)
+    env.update({
+        'SMTP_SERVER': '127.0.0.1',
+        'SMTP_PORT': str(smtp_port),
+        'SMTP_USE_TLS': 'false',
+        'EMAIL_ADDRESS': 'spool@example.com',
+        'EMAIL_PASSWORD': 'spool',
+        'LOG_LEVEL': 'WARNING'
+    })
+    return subprocess.Popen(
+        [sys.executable, 'spool_daemon.py', '--once', '--spool-dir', spool_dir,
+         '--senders', str(senders), '--poll-interval', '0.2'],
+        cwd=BACKEND_DIR,
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL
+    )
+
+
+def run(args) -> Dict[str, object]:
+    from services.outbound_spool import OutboundSpool
+
+    sink = FakeSMTPServer(config=SinkConfig(command_latency_ms={'DATA': args.data_latency_ms})).start()
+
+    with tempfile.TemporaryDirectory() as spool_dir:
+        produce_s = produce(spool_dir, args.messages)
+
+        started = time.perf_counter()
+        daemon = start_daemon(spool_dir, sink.port, args.senders)
+        killed_at = None
+        if args.kill_daemon:
+            time.sleep(args.kill_after)
+            daemon.kill()
+            daemon.wait()
+            killed_at = sink.stats.snapshot()['messages']
+            # 재시작: 스풀 재스캔 후 확인되지 않은 레코드만 전달
+            daemon = start_daemon(spool_dir, sink.port, args.senders)
+        daemon.wait()
+        deliver_s = time.perf_counter() - started
+        depth = OutboundSpool(spool_dir).depth()
+
+    stats = sink.stats.snapshot()
+    deliveries = dict(sink.stats.deliveries)
+    sink.stop()
+
+    duplicates = sum(n - 1 for n in deliveries.values() if n > 1)
+    # 강제 종료 시 fsync되지 않은 확인 기록 + 전송 중이던 메시지는 재전달될 수 있음
+    from spool_daemon import ACK_SYNC_EVERY
+    allowed_duplicates = ACK_SYNC_EVERY + args.senders if args.kill_daemon else 0
+
+    return {
+        'messages': args.messages,
+        'produce_s': round(produce_s, 3),
+        'produce_per_sec': round(args.messages / produce_s, 1),
+        'deliver_s': round(deliver_s, 3),
+        'deliver_per_sec': round(stats['messages'] / deliver_s, 1),
+        'delivered_before_kill': killed_at,
+        'sink': stats,
+        'duplicates': duplicates,
+        'spool_depth': depth,
+        'ok': (
+            daemon.returncode == 0
+            and len(deliveries) == args.messages
+            and duplicates <= allowed_duplicates
+            and depth == 0
+        )
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='아웃바운드 스풀 + 전달 데몬 검증')
+    parser.add_argument('--messages', type=int, default=1000)
+    parser.add_argument('--senders', type=int, default=4)
+    parser.add_argument('--data-latency-ms', type=float, default=5.0)
+    parser.add_argument('--kill-daemon', action='store_true', help='데몬을 전달 중 강제 종료 후 재시작')
+    parser.add_argument('--kill-after', type=float, default=1.5, help='강제 종료까지 대기 시간(초)')
+    parser.add_argument('--json', action='store_true', help='결과를 JSON으로 출력')
+    args = parser.parse_args()
+
+    report = run(args)
+    if args.json:
+        print(json.dumps(report, ensure_ascii=False, indent=2))
+    else:
+        print(f"스풀 기록 {report['messages']}건: {report['produce_s']}초 ({report['produce_per_sec']} msgs/s)")
+        print(f"전달: {report['deliver_s']}초 ({report['deliver_per_sec']} msgs/s), "
+              f"강제 종료 전 전달 {report['delivered_before_kill']}건")
+        print(f"싱크 수신: {report['sink']['messages']}건, 중복: {report['duplicates']}건, 남은 스풀: {report['spool_depth']}건")
+        print('✅ 누락 없음' if report['ok'] else '❌ 검증 실패')
+
+    sys.exit(0 if report['ok'] else 1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,260 @@
+"""
+DB 발송 큐 다중 워커 검증
+
+임시 SQLite 파일 DB에 참석자와 pending EmailLog를 등록한 뒤,
+worker.py 프로세스 여러 개를 동시에 실행해 같은 큐를 나눠 발송합니다.
+SMTP는 로컬 싱크(loadtest.fake_smtp)를 사용하므로 완전히 오프라인으로 동작합니다.
+
+확인 항목:
+- 싱크가 받은 메시지 수 == 큐에 등록한 메시지 수
+- 같은 수신자에게 두 번 이상 발송된 메시지 없음
+- 모든 EmailLog가 sent/failed로 종료 (pending 잔여 없음)
+- 캠페인 카운터(sent_count)가 실제 발송 건수와 일치하고 completed 상태
+- --routed: 참석자 유형별 템플릿 라우팅 캠페인 → 그룹별 카운터도 각 그룹 등록 건수와 일치
+- --kill-one: 워커 하나를 발송 중에 강제 종료 → 임대 만료 후 다른 워커가 회수
+  (SMTP 전송 직후 결과 기록 전에 죽으면 그 한 건은 재발송될 수 있음: at-least-once)
+- --pause: 발송 중에 캠페인 일시 중지 → 중지 후 발송 건수가 워커당 한 배치 이내인지 확인,
+  재개 후 나머지 발송 (--once 워커는 선점할 행이 없으면 종료하므로 재개 후 다시 실행)
+
+실행:
+    cd backend
+    python -m loadtest.run_workers --messages 2000 --workers 4 --batch-size 50
+    python -m loadtest.run_workers --messages 1000 --workers 3 --lease-seconds 3 --kill-one
+    python -m loadtest.run_workers --messages 2000 --workers 4 --routed
+    python -m loadtest.run_workers --messages 2000 --workers 2 --command-latency DATA=5 --pause
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Dict
+
+from flask import Flask
+
+from loadtest.fake_smtp import FakeSMTPServer, SinkConfig, parse_command_latency
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+# --routed: 유형별 템플릿 (나머지 유형은 기본 템플릿)
+ROUTED_TYPES = ('attendee', 'speaker', 'vip', 'sponsor')
+ROUTES = {
+    'speaker': {'subject': '[{{event_name}}] {{name}} 연사님 안내', 'body': '<p>{{name}} 연사님, 발표 일정을 확인해 주세요.</p>'},
+    'vip': {'subject': '[{{event_name}}] {{name}}님 VIP 초대', 'body': '<p>{{name}}님, VIP 라운지에서 뵙겠습니다.</p>'}
+}
+DEFAULT_TEMPLATE = {
+    'subject': '[{{event_name}}] {{name}}님 안내',
+    'body': '<p>{{name}}님, {{event_name}}에 오신 것을 환영합니다.</p>'
+}
+
+
+def seed_queue(database_url: str, messages: int, routed: bool = False) -> int:
+    """임시 DB에 참석자를 만들고 발송 큐에 등록, 등록 건수 반환"""
+    from models import Attendee, AttendeeType, db
+    from services import campaigns
+
+    app = Flask(__name__)
+    app.config['SQLALCHEMY_DATABASE_URI'] = database_url
+    app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+    db.init_app(app)
+
+    with app.app_context():
+        db.create_all()
+        db.session.execute(Attendee.__table__.insert(), [
+            {
+                'name': f'워커{i}',
+                'email': f'worker{i}@example.com',
+                'company': 'Worker Test Inc',
+                'attendee_type': AttendeeType(ROUTED_TYPES[i % len(ROUTED_TYPES)]) if routed else AttendeeType.ATTENDEE,
+                'created_by': 1
+            }
+            for i in range(messages)
+        ])
+        db.session.commit()
+
+        attendees = Attendee.query.order_by(Attendee.id).all()
+        template_data = {'event_name': 'Worker Test 2024'}
+        if routed:
+            result = campaigns.start_routed_campaign(
+                name='worker loadtest (routed)',
+                attendees=attendees,
+                routes={AttendeeType(key): {'template': template} for key, template in ROUTES.items()},
+                template_data=template_data,
+                sender_name='Worker Test',
+                default_route={'template': DEFAULT_TEMPLATE}
+            )
+        else:
+            result = campaigns.start_campaign(
+                name='worker loadtest',
+                attendees=attendees,
+                email_template=DEFAULT_TEMPLATE,
+                template_data=template_data,
+                sender_name='Worker Test'
+            )
+        return result['queued']
+
+
+def queue_counts(database_url: str) -> Dict[str, object]:
+    from models import Campaign, db
+    from services import campaigns, send_queue
+
+    app = Flask(__name__)
+    app.config['SQLALCHEMY_DATABASE_URI'] = database_url
+    db.init_app(app)
+    with app.app_context():
+        campaign = Campaign.query.filter(Campaign.parent_id.is_(None)).one()
+        return {**send_queue.queue_stats(), 'campaign': campaigns.campaign_progress(campaign)}
+
+
+def set_campaign_state(database_url: str, action: str):
+    """최상위 캠페인 일시 중지 / 재개"""
+    from models import Campaign, db
+    from services import campaigns
+
+    app = Flask(__name__)
+    app.config['SQLALCHEMY_DATABASE_URI'] = database_url
+    app.config['SQLALCHEMY_ENGINE_OPTIONS'] = {'connect_args': {'timeout': 30}}
+    db.init_app(app)
+    with app.app_context():
+        campaign = Campaign.query.filter(Campaign.parent_id.is_(None)).one()
+        getattr(campaigns, f'{action}_campaign')(campaign)
+
+
+def start_worker(index: int, database_url: str, smtp_port: int, args) -> subprocess.Popen:
+    env = dict(os.environ)
+    env.update({
+        'DATABASE_URL': database_url,
+        'EMAIL_TEST_MODE': 'false',
+        'SMTP_SERVER': '127.0.0.1',
+        'SMTP_PORT': str(smtp_port),
+        'SMTP_USE_TLS': 'false',
+        'EMAIL_ADDRESS': 'worker@example.com',
+        'EMAIL_PASSWORD': 'worker',
+        'SENDER_NAME': 'Worker Test',
+        'LOG_LEVEL': 'WARNING'
+    })
+    return subprocess.Popen(
+        [
+            sys.executable, 'worker.py', '--once',
+            '--worker-id', f'loadtest-{index}',
+            '--batch-size', str(args.batch_size),
+            '--lease-seconds', str(args.lease_seconds),
+            '--poll-interval', '0.2'
+        ],
+        cwd=BACKEND_DIR,
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL
+    )
+
+
+def run(args) -> Dict[str, object]:
+    sink = FakeSMTPServer(config=SinkConfig(
+        latency_ms=args.latency_ms,
+        command_latency_ms=parse_command_latency(args.command_latency),
+        seed=args.seed
+    )).start()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        database_url = f"sqlite:///{os.path.join(workdir, 'queue.db')}"
+        queued = seed_queue(database_url, args.messages, args.routed)
+
+        started = time.perf_counter()
+        workers = [start_worker(i, database_url, sink.port, args) for i in range(args.workers)]
+
+        paused_growth = None
+        if args.pause:
+            # 일시 중지 → 워커는 처리 중인 배치까지만 발송하고 (선점할 행이 없어) 종료
+            time.sleep(args.kill_after)
+            set_campaign_state(database_url, 'pause')
+            at_pause = sink.stats.snapshot()['messages']
+            for worker in workers:
+                worker.wait()
+            paused_growth = sink.stats.snapshot()['messages'] - at_pause
+            set_campaign_state(database_url, 'resume')
+            workers = [start_worker(i, database_url, sink.port, args) for i in range(args.workers)]
+
+        if args.kill_one and workers:
+            # 첫 배치를 선점한 뒤 강제 종료 → 임대가 만료되면 남은 워커가 회수
+            time.sleep(args.kill_after)
+            workers[0].kill()
+
+        for worker in workers[1:] if args.kill_one else workers:
+            worker.wait()
+
+        if args.kill_one:
+            # 종료된 워커의 임대가 만료되기 전에 나머지가 끝났을 수 있으므로 회수용 워커 한 번 더 실행
+            time.sleep(args.lease_seconds)
+            start_worker(args.workers, database_url, sink.port, args).wait()
+
+        elapsed = time.perf_counter() - started
+        counts = queue_counts(database_url)
+
+    stats = sink.stats.snapshot()
+    duplicates = {email: n for email, n in sink.stats.deliveries.items() if n > 1}
+    sink.stop()
+
+    return {
+        'workers': args.workers,
+        'queued': queued,
+        'elapsed_s': round(elapsed, 3),
+        'messages_per_sec': round(stats['messages'] / elapsed, 1) if elapsed else None,
+        'sink': stats,
+        'queue': counts,
+        'duplicate_recipients': len(duplicates),
+        'sent_after_pause': paused_growth,
+        'ok': (
+            # 일시 중지 후에는 워커마다 발송 중이던 배치 하나까지만 발송
+            (paused_growth is None or paused_growth <= args.workers * args.batch_size)
+            and
+            # 강제 종료 시 전송 중이던 한 건은 재발송 허용
+            len(duplicates) <= (1 if args.kill_one else 0)
+            and counts['pending'] == 0
+            and len(sink.stats.deliveries) == counts['sent'] == queued
+            and counts['campaign']['sent_count'] == queued
+            and counts['campaign']['status'] == 'completed'
+            and all(
+                group['sent_count'] == group['queued_count'] and group['status'] == 'completed'
+                for group in counts['campaign'].get('groups', [])
+            )
+        )
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='DB 발송 큐 다중 워커 검증')
+    parser.add_argument('--messages', type=int, default=1000)
+    parser.add_argument('--workers', type=int, default=4)
+    parser.add_argument('--batch-size', type=int, default=50)
+    parser.add_argument('--lease-seconds', type=int, default=30)
+    parser.add_argument('--latency-ms', type=float, default=0.0)
+    parser.add_argument('--command-latency', action='append', metavar='VERB=MS')
+    parser.add_argument('--kill-one', action='store_true', help='워커 하나를 발송 중 강제 종료')
+    parser.add_argument('--kill-after', type=float, default=1.5, help='강제 종료/일시 중지까지 대기 시간(초)')
+    parser.add_argument('--pause', action='store_true', help='발송 중 캠페인 일시 중지 후 재개')
+    parser.add_argument('--seed', type=int, default=None)
+    parser.add_argument('--routed', action='store_true', help='참석자 유형별 템플릿 라우팅 캠페인으로 등록')
+    parser.add_argument('--json', action='store_true', help='결과를 JSON으로 출력')
+    args = parser.parse_args()
+
+    report = run(args)
+    if args.json:
+        print(json.dumps(report, ensure_ascii=False, indent=2))
+    else:
+        print(f"워커 {report['workers']}개, 큐 등록 {report['queued']}건, {report['elapsed_s']}초 "
+              f"({report['messages_per_sec']} msgs/s)")
+        print(f"큐 상태: {report['queue']}")
+        print(f"싱크 수신: {report['sink']['messages']}건, 중복 수신자: {report['duplicate_recipients']}명")
+        if report['sent_after_pause'] is not None:
+            print(f"일시 중지 후 발송: {report['sent_after_pause']}건")
+        print('✅ 중복/누락 없음' if report['ok'] else '❌ 검증 실패')
+
+    sys.exit(0 if report['ok'] else 1)
+
+
+if __name__ == '__main__':
+    main()
@@ -9,8 +9,10 @@ Design Principles:
 """
 
 from flask_sqlalchemy import SQLAlchemy
+from array import array
 from datetime import datetime
 from enum import Enum
+import sys
 
 db = SQLAlchemy()
 
@@ -20,6 +22,14 @@ class EmailStatus(Enum):
     SENT = "sent"
     FAILED = "failed"
     SCHEDULED = "scheduled"
+    CANCELLED = "cancelled"
+
+class CampaignStatus(Enum):
+    """캠페인 진행 상태"""
+    RUNNING = "running"
+    PAUSED = "paused"
+    COMPLETED = "completed"
+    CANCELLED = "cancelled"
 
 class AttendeeType(Enum):
     """참석자 유형"""
@@ -29,6 +39,12 @@ class AttendeeType(Enum):
     STAFF = "staff"
     VIP = "vip"
 
+class SendLane(Enum):
+    """발송 우선순위 레인 (정의 순서 = 우선순위)"""
+    TRANSACTIONAL = "transactional"  # 단건 발송 (가입 확인 등)
+    BULK = "bulk"                    # 일반 대량 발송 / 캠페인
+    REMINDER = "reminder"            # 낮은 우선순위 리마인더
+
 class User(db.Model):
     """사용자 모델 - Firebase UID 기반 인증"""
     __tablename__ = 'users'
@@ -122,9 +138,99 @@ class EmailTemplate(db.Model):
             'attendee_type': self.attendee_type.value if self.attendee_type else None,
             'variables': self.variables,
             'is_active': self.is_active,
-            'created_at': self.created_at.isoformat() if self.created_at else None
+            'created_at': self.created_at.isoformat() if self.created_at else None,
+            'updated_at': self.updated_at.isoformat() if self.updated_at else None
+        }
+
+class Campaign(db.Model):
+    """
+    발송 캠페인 모델
+    
+    시작 시점의 수신자 ID를 압축 배열(little-endian uint32)로 고정 저장하고,
+    발송 결과 건수는 EmailLog를 집계하지 않고 카운터 컬럼을 증분 갱신합니다.
+    """
+    __tablename__ = 'campaigns'
+    
+    id = db.Column(db.Integer, primary_key=True)
+    name = db.Column(db.String(200), nullable=False)
+    template_id = db.Column(db.Integer, db.ForeignKey('email_templates.id'))
+    sender_id = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=False)
+    status = db.Column(db.Enum(CampaignStatus), default=CampaignStatus.RUNNING, nullable=False)
+    # 발송 레인 (SMTP 세션/발송 속도 예약 용량과 우선순위)
+    lane = db.Column(db.Enum(SendLane), default=SendLane.BULK, nullable=False)
+    
+    # 참석자 유형별 라우팅 캠페인: 유형 그룹마다 하위 캠페인 (상위 캠페인은 전체 합계)
+    parent_id = db.Column(db.Integer, db.ForeignKey('campaigns.id'), index=True)
+    attendee_type = db.Column(db.Enum(AttendeeType))
+    
+    # 수신자 스냅샷 (시작 이후 참석자 목록이 바뀌어도 유지)
+    recipient_ids = db.Column(db.LargeBinary, nullable=False, default=b'')
+    recipient_count = db.Column(db.Integer, default=0, nullable=False)
+    
+    # 비정규화 카운터 (발송 결과마다 UPDATE ... SET x = x + 1)
+    queued_count = db.Column(db.Integer, default=0, nullable=False)
+    sent_count = db.Column(db.Integer, default=0, nullable=False)
+    failed_count = db.Column(db.Integer, default=0, nullable=False)
+    bounced_count = db.Column(db.Integer, default=0, nullable=False)
+    cancelled_count = db.Column(db.Integer, default=0, nullable=False)
+    
+    # 메타데이터
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    completed_at = db.Column(db.DateTime)
+    
+    # 관계 설정
+    email_logs = db.relationship('EmailLog', backref='campaign', lazy=True)
+    groups = db.relationship('Campaign', backref=db.backref('parent', remote_side=[id]), lazy=True)
+    
+    def set_recipients(self, recipient_ids):
+        """수신자 ID 목록을 압축 배열로 저장"""
+        packed = array('I', recipient_ids)
+        if sys.byteorder == 'big':
+            packed.byteswap()
+        self.recipient_ids = packed.tobytes()
+        self.recipient_count = len(packed)
+    
+    def get_recipients(self):
+        """저장된 수신자 ID 목록"""
+        packed = array('I')
+        packed.frombytes(self.recipient_ids or b'')
+        if sys.byteorder == 'big':
+            packed.byteswap()
+        return packed.tolist()
+    
+    def to_dict(self):
+        return {
+            'id': self.id,
+            'name': self.name,
+            'template_id': self.template_id,
+            'parent_id': self.parent_id,
+            'attendee_type': self.attendee_type.value if self.attendee_type else None,
+            'status': self.status.value,
+            'lane': self.lane.value if self.lane else SendLane.BULK.value,
+            'recipient_count': self.recipient_count,
+            'queued_count': self.queued_count,
+            'sent_count': self.sent_count,
+            'failed_count': self.failed_count,
+            'bounced_count': self.bounced_count,
+            'cancelled_count': self.cancelled_count,
+            'pending_count': max(0, self.queued_count - self.sent_count - self.failed_count - self.cancelled_count),
+            'created_at': self.created_at.isoformat() if self.created_at else None,
+            'completed_at': self.completed_at.isoformat() if self.completed_at else None
         }
 
+class EmailContent(db.Model):
+    """
+    중복 제거된 발송 내용 (템플릿 원문 + 공통 변수, zlib 압축)
+    
+    내용의 SHA-256 해시를 키로 사용하므로 같은 내용은 한 번만 저장됩니다.
+    """
+    __tablename__ = 'email_contents'
+    
+    hash = db.Column(db.String(64), primary_key=True)
+    data = db.Column(db.LargeBinary, nullable=False)
+    raw_size = db.Column(db.Integer, nullable=False)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+
 class EmailLog(db.Model):
     """이메일 전송 로그 모델"""
     __tablename__ = 'email_logs'
@@ -133,10 +239,13 @@ class EmailLog(db.Model):
     recipient_id = db.Column(db.Integer, db.ForeignKey('attendees.id'), nullable=False)
     template_id = db.Column(db.Integer, db.ForeignKey('email_templates.id'))
     sender_id = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=False)
+    campaign_id = db.Column(db.Integer, db.ForeignKey('campaigns.id'), index=True)
     
     # 이메일 내용
     subject = db.Column(db.String(255), nullable=False)
-    body = db.Column(db.Text, nullable=False)
+    body = db.Column(db.Text)  # 중복 제거 이전 행만 사용 (새 행은 content_hash + variables)
+    content_hash = db.Column(db.String(64), db.ForeignKey('email_contents.hash'), index=True)
+    variables = db.Column(db.JSON)  # 참석자별 템플릿 변수
     
     # 전송 정보
     status = db.Column(db.Enum(EmailStatus), default=EmailStatus.PENDING)
@@ -144,19 +253,55 @@ class EmailLog(db.Model):
     scheduled_at = db.Column(db.DateTime)
     error_message = db.Column(db.Text)
     
+    # 발송 큐 임대(lease) 정보 - 여러 워커가 같은 행을 중복 발송하지 않도록 사용
+    lease_owner = db.Column(db.String(64))
+    lease_expires_at = db.Column(db.DateTime)
+    attempts = db.Column(db.Integer, default=0, nullable=False)
+    
     # 메타데이터
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     
+    __table_args__ = (
+        db.Index('idx_email_logs_queue', 'status', 'lease_expires_at'),
+        # 목록 조회 필터 + id 키셋 페이지네이션용
+        db.Index('idx_email_logs_status_id', 'status', 'id'),
+        db.Index('idx_email_logs_template_id', 'template_id', 'id'),
+        db.Index('idx_email_logs_recipient_id', 'recipient_id', 'id'),
+        db.Index('idx_email_logs_created_at', 'created_at'),
+    )
+    
     def to_dict(self):
         return {
             'id': self.id,
             'recipient_id': self.recipient_id,
             'template_id': self.template_id,
+            'campaign_id': self.campaign_id,
             'subject': self.subject,
             'status': self.status.value,
             'sent_at': self.sent_at.isoformat() if self.sent_at else None,
             'scheduled_at': self.scheduled_at.isoformat() if self.scheduled_at else None,
             'error_message': self.error_message,
+            'attempts': self.attempts,
             'created_at': self.created_at.isoformat() if self.created_at else None
         }
 
+class EmailHourlyStat(db.Model):
+    """시간 × 상태별 발송 건수 롤업 (services/email_stats.py에서 증분 갱신)"""
+    __tablename__ = 'email_hourly_stats'
+    
+    hour = db.Column(db.DateTime, primary_key=True)
+    status = db.Column(db.Enum(EmailStatus), primary_key=True)
+    count = db.Column(db.Integer, default=0, nullable=False)
+
+class CacheVersion(db.Model):
+    """
+    프로세스 내 캐시 무효화용 버전 스탬프
+    
+    캐시 대상 테이블을 수정하는 트랜잭션에서 version을 1 올리면,
+    다른 프로세스는 이 한 행만 읽어 자기 캐시가 오래되었는지 판단합니다.
+    """
+    __tablename__ = 'cache_versions'
+    
+    name = db.Column(db.String(64), primary_key=True)
+    version = db.Column(db.Integer, default=0, nullable=False)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
@@ -9,18 +9,67 @@ Features:
 - Filtering and pagination
 """
 
-from flask import Blueprint, request, jsonify
+from flask import Blueprint, Response, request, jsonify, stream_with_context
 from models import Attendee, AttendeeType, db
 from routes.auth import verify_firebase_token
+from services.metrics import DB_BULK_INSERT_SECONDS
+from services.serialization import (
+    ProjectionError, parse_fields, rows_to_dicts, json_response, iter_csv, iter_ndjson
+)
 from sqlalchemy import or_
 import json
 
 attendees_bp = Blueprint('attendees', __name__)
 
+# fields= 파라미터로 선택 가능한 컬럼 (기본 출력 순서 = Attendee.to_dict)
+ATTENDEE_FIELDS = {
+    'id': Attendee.id,
+    'name': Attendee.name,
+    'email': Attendee.email,
+    'company': Attendee.company,
+    'position': Attendee.position,
+    'attendee_type': Attendee.attendee_type,
+    'phone': Attendee.phone,
+    'registration_date': Attendee.registration_date,
+    'custom_fields': Attendee.custom_fields,
+    'created_at': Attendee.created_at
+}
+
+# 내보내기 시 서버 측에서 한 번에 가져오는 행 수 (yield_per)
+EXPORT_CHUNK_SIZE = 1000
+
+EXPORT_FORMATS = {
+    'csv': (iter_csv, 'text/csv; charset=utf-8'),
+    'ndjson': (iter_ndjson, 'application/x-ndjson')
+}
+
+def _apply_attendee_filters(query, search: str, attendee_type: str):
+    """
+    목록/내보내기 공통 필터 적용
+
+    Raises:
+        ValueError: 잘못된 참석자 유형
+    """
+    # 검색 필터 적용
+    if search:
+        query = query.filter(
+            or_(
+                Attendee.name.contains(search),
+                Attendee.email.contains(search),
+                Attendee.company.contains(search)
+            )
+        )
+    
+    # 참석자 유형 필터 적용
+    if attendee_type:
+        query = query.filter(Attendee.attendee_type == AttendeeType(attendee_type))
+    
+    return query
+
 @attendees_bp.route('/', methods=['GET'])
 @verify_firebase_token
 def get_attendees():
-    """참석자 목록 조회 (페이지네이션 및 필터링 지원)"""
+    """참석자 목록 조회 (페이지네이션, 필터링 및 필드 프로젝션 지원)"""
     try:
         # 쿼리 파라미터 처리
         page = request.args.get('page', 1, type=int)
@@ -28,26 +77,18 @@ def get_attendees():
         search = request.args.get('search', '')
         attendee_type = request.args.get('type', '')
         
-        # 기본 쿼리 생성
-        query = Attendee.query
-        
-        # 검색 필터 적용
-        if search:
-            query = query.filter(
-                or_(
-                    Attendee.name.contains(search),
-                    Attendee.email.contains(search),
-                    Attendee.company.contains(search)
-                )
-            )
+        # 필드 프로젝션 (예: ?fields=id,name,email)
+        try:
+            fields = parse_fields(request.args.get('fields'), list(ATTENDEE_FIELDS))
+        except ProjectionError as e:
+            return jsonify({'error': str(e)}), 400
         
-        # 참석자 유형 필터 적용
-        if attendee_type:
-            try:
-                type_enum = AttendeeType(attendee_type)
-                query = query.filter(Attendee.attendee_type == type_enum)
-            except ValueError:
-                return jsonify({'error': 'Invalid attendee type'}), 400
+        # 기본 쿼리 생성 (요청된 컬럼만 SELECT) 및 필터 적용
+        query = Attendee.query.with_entities(*[ATTENDEE_FIELDS[f] for f in fields])
+        try:
+            query = _apply_attendee_filters(query, search, attendee_type)
+        except ValueError:
+            return jsonify({'error': 'Invalid attendee type'}), 400
         
         # 페이지네이션 적용
         pagination = query.paginate(
@@ -56,9 +97,10 @@ def get_attendees():
             error_out=False
         )
         
-        attendees = [attendee.to_dict() for attendee in pagination.items]
+        # ORM 객체 생성 없이 결과 튜플을 바로 직렬화
+        attendees = rows_to_dicts(pagination.items, fields)
         
-        return jsonify({
+        return json_response({
             'attendees': attendees,
             'pagination': {
                 'current_page': page,
@@ -73,6 +115,44 @@ def get_attendees():
     except Exception as e:
         return jsonify({'error': 'Failed to fetch attendees', 'details': str(e)}), 500
 
+@attendees_bp.route('/export', methods=['GET'])
+@verify_firebase_token
+def export_attendees():
+    """
+    참석자 전체 스트리밍 내보내기 (CSV / NDJSON)
+
+    ?format=csv|ndjson, search/type/fields 파라미터는 목록 조회와 동일합니다.
+    쿼리 결과를 EXPORT_CHUNK_SIZE 단위로 가져와 바로 응답에 기록하므로
+    참석자 수와 관계없이 메모리 사용량이 일정합니다.
+    """
+    export_format = request.args.get('format', 'csv').lower()
+    if export_format not in EXPORT_FORMATS:
+        return jsonify({'error': f'Unsupported export format: {export_format}'}), 400
+    
+    try:
+        fields = parse_fields(request.args.get('fields'), list(ATTENDEE_FIELDS))
+    except ProjectionError as e:
+        return jsonify({'error': str(e)}), 400
+    
+    query = Attendee.query.with_entities(*[ATTENDEE_FIELDS[f] for f in fields])
+    try:
+        query = _apply_attendee_filters(
+            query,
+            request.args.get('search', ''),
+            request.args.get('type', '')
+        )
+    except ValueError:
+        return jsonify({'error': 'Invalid attendee type'}), 400
+    
+    rows = query.order_by(Attendee.id).yield_per(EXPORT_CHUNK_SIZE)
+    encoder, mimetype = EXPORT_FORMATS[export_format]
+    
+    return Response(
+        stream_with_context(encoder(rows, fields, flush_every=EXPORT_CHUNK_SIZE)),
+        mimetype=mimetype,
+        headers={'Content-Disposition': f'attachment; filename=attendees.{export_format}'}
+    )
+
 @attendees_bp.route('/<int:attendee_id>', methods=['GET'])
 @verify_firebase_token
 def get_attendee(attendee_id):
@@ -236,7 +316,8 @@ def bulk_create_attendees():
         
         # 성공한 것들만 커밋
         if created_attendees:
-            db.session.commit()
+            with DB_BULK_INSERT_SECONDS.time():
+                db.session.commit()
         
         return jsonify({
             'created': len(created_attendees),
@@ -14,6 +14,8 @@ import firebase_admin
 from firebase_admin import auth, credentials
 import os
 
+from services.metrics import TOKEN_VERIFY_SECONDS
+
 auth_bp = Blueprint('auth', __name__)
 
 # Firebase Admin SDK 초기화 (환경변수 기반)
@@ -53,7 +55,8 @@ def verify_firebase_token(f):
             token = token.split('Bearer ')[1]
             
             # Firebase 토큰 검증
-            decoded_token = auth.verify_id_token(token)
+            with TOKEN_VERIFY_SECONDS.time():
+                decoded_token = auth.verify_id_token(token)
             request.user = decoded_token
             return f(*args, **kwargs)
             
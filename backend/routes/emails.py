@@ -3,48 +3,196 @@
 """
 
 from flask import Blueprint, request, jsonify
+from sqlalchemy import func
+from models import Attendee, AttendeeType, Campaign, EmailLog, EmailStatus, EmailTemplate, db
+from services.attachments import AttachmentError
 from services.email_service import email_service
+from services import campaigns, content_store, email_stats, send_queue, template_store
+from services.lanes import parse_lane
+from services.recipient_validation import preflight_recipients
+from services.suppression import parse_reason
+from services.template_preview import TemplatePreview
+from services.serialization import ProjectionError, parse_fields, rows_to_dicts, json_response
 from datetime import datetime
 
 emails_bp = Blueprint('emails', __name__)
 
+# fields= 파라미터로 선택 가능한 필드
+EMAIL_FIELDS = [
+    'id', 'recipient', 'recipient_id', 'template_id', 'campaign_id',
+    'subject', 'status', 'error_message', 'sent_at', 'created_at'
+]
+TEMPLATE_FIELDS = ['id', 'name', 'subject', 'body', 'attendee_type', 'created_at', 'updated_at']
+
+# 발송 로그 목록 페이지 크기
+DEFAULT_EMAIL_PAGE_SIZE = 50
+MAX_EMAIL_PAGE_SIZE = 500
+
+# 대량 미리보기 페이지 크기
+DEFAULT_PREVIEW_PAGE_SIZE = 50
+MAX_PREVIEW_PAGE_SIZE = 500
+
+def _request_template(data):
+    """
+    발송 템플릿 결정 - template(제목/본문 직접 지정) 또는 template_id(저장된 템플릿)
+    
+    template_id는 프로세스 내 컴파일 캐시에서 조회하므로 보통 DB를 읽지 않습니다.
+    
+    Raises:
+        template_store.TemplateNotFound: 없거나 비활성화된 template_id
+        ValueError: 템플릿 누락 또는 subject/body 누락
+    """
+    if 'template' not in data and data.get('template_id') is not None:
+        return template_store.get_template(int(data['template_id'])).as_email_template()
+    
+    if 'template' not in data:
+        raise ValueError("Missing required field: template")
+    
+    email_template = data['template']
+    if 'subject' not in email_template or 'body' not in email_template:
+        raise ValueError("Template must include 'subject' and 'body'")
+    return email_template
+
+def _request_route(route):
+    """
+    라우팅 캠페인의 그룹 템플릿 ({template | template_id, template_data})
+    
+    Raises:
+        template_store.TemplateNotFound, ValueError: _request_template과 같음
+    """
+    return {
+        'template': _request_template(route),
+        'template_id': route.get('template_id'),
+        'template_data': route.get('template_data')
+    }
+
+def _attendee_query(query, data):
+    """
+    발송 대상 필터 적용 - attendee_ids(참석자 ID 목록), attendee_type
+    
+    Raises:
+        ValueError: 잘못된 참석자 유형
+    """
+    if data.get('attendee_ids'):
+        query = query.filter(Attendee.id.in_(data['attendee_ids']))
+    if data.get('attendee_type'):
+        query = query.filter(Attendee.attendee_type == AttendeeType(data['attendee_type']))
+    return query
+
 @emails_bp.route('/', methods=['GET'])
 def get_emails():
-    """이메일 목록 조회"""
+    """
+    이메일 발송 로그 조회 (필터, 키셋 페이지네이션, fields= 프로젝션 지원)
+    
+    Query:
+        status, template_id, campaign_id, recipient(이메일) 또는 recipient_id,
+        since/until (ISO 8601, created_at 기준), limit (최대 MAX_EMAIL_PAGE_SIZE),
+        cursor (이전 응답의 next_cursor - 이 id보다 작은 로그부터 조회)
+    """
     try:
-        # Mock 데이터 (실제로는 데이터베이스에서 가져와야 함)
-        emails = [
-            {
-                "id": 1,
-                "recipient": "john.doe@example.com",
-                "subject": "Welcome to our event!",
-                "status": "sent",
-                "sent_at": "2024-09-18T10:00:00Z"
-            },
-            {
-                "id": 2,
-                "recipient": "jane.smith@example.com", 
-                "subject": "Speaker Information",
-                "status": "pending",
-                "sent_at": None
-            }
-        ]
+        try:
+            fields = parse_fields(request.args.get('fields'), EMAIL_FIELDS)
+        except ProjectionError as e:
+            return jsonify({"error": str(e)}), 400
         
-        return jsonify({
-            "emails": emails,
-            "total": len(emails)
+        limit = max(1, min(request.args.get('limit', DEFAULT_EMAIL_PAGE_SIZE, type=int), MAX_EMAIL_PAGE_SIZE))
+        cursor = request.args.get('cursor', type=int)
+        
+        columns = {
+            'id': EmailLog.id,
+            'recipient': Attendee.email,
+            'recipient_id': EmailLog.recipient_id,
+            'template_id': EmailLog.template_id,
+            'campaign_id': EmailLog.campaign_id,
+            'subject': EmailLog.subject,
+            'status': EmailLog.status,
+            'error_message': EmailLog.error_message,
+            'sent_at': EmailLog.sent_at,
+            'created_at': EmailLog.created_at
+        }
+        
+        # 키셋 기준 id는 항상 첫 컬럼으로 조회
+        query = EmailLog.query.with_entities(EmailLog.id, *[columns[f] for f in fields])
+        if 'recipient' in fields:
+            query = query.outerjoin(Attendee, Attendee.id == EmailLog.recipient_id)
+        
+        try:
+            if request.args.get('status'):
+                query = query.filter(EmailLog.status == EmailStatus(request.args['status']))
+            if request.args.get('since'):
+                query = query.filter(EmailLog.created_at >= datetime.fromisoformat(request.args['since']))
+            if request.args.get('until'):
+                query = query.filter(EmailLog.created_at < datetime.fromisoformat(request.args['until']))
+        except ValueError as e:
+            return jsonify({"error": f"Invalid filter: {e}"}), 400
+        
+        for param, column in (('template_id', EmailLog.template_id),
+                              ('campaign_id', EmailLog.campaign_id),
+                              ('recipient_id', EmailLog.recipient_id)):
+            value = request.args.get(param, type=int)
+            if value is not None:
+                query = query.filter(column == value)
+        
+        if request.args.get('recipient'):
+            # 참석자 이메일은 입력된 대소문자 그대로 저장되므로 소문자로 비교
+            recipient_ids = Attendee.query.with_entities(Attendee.id).filter(
+                func.lower(Attendee.email) == request.args['recipient'].strip().lower()
+            )
+            query = query.filter(EmailLog.recipient_id.in_(recipient_ids.scalar_subquery()))
+        
+        if cursor is not None:
+            query = query.filter(EmailLog.id < cursor)
+        
+        # 한 행 더 조회해서 다음 페이지 존재 여부 확인 (COUNT(*) 없음)
+        rows = query.order_by(EmailLog.id.desc()).limit(limit + 1).all()
+        has_next = len(rows) > limit
+        rows = rows[:limit]
+        
+        return json_response({
+            "emails": rows_to_dicts((row[1:] for row in rows), fields),
+            "next_cursor": rows[-1][0] if has_next else None,
+            "has_next": has_next
         })
         
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
 
+@emails_bp.route('/stats', methods=['GET'])
+def get_email_stats():
+    """
+    상태별 / 시간별 발송 건수 (email_hourly_stats 롤업 기반)
+    
+    Query:
+        since/until (ISO 8601, 기본 최근 24시간)
+    """
+    try:
+        try:
+            since = request.args.get('since')
+            until = request.args.get('until')
+            return jsonify(email_stats.summary(
+                datetime.fromisoformat(since) if since else None,
+                datetime.fromisoformat(until) if until else None
+            ))
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
+
+
 @emails_bp.route('/send', methods=['POST'])
 def send_single_email():
     """단일 이메일 발송"""
     try:
         data = request.get_json()
         
+        # 저장된 템플릿으로 발송 (template_id, 캐시 조회)
+        if data.get('template_id') is not None and 'subject' not in data and 'body' not in data:
+            try:
+                data.update(template_store.get_template(int(data['template_id'])).as_email_template())
+            except template_store.TemplateNotFound as e:
+                return jsonify({"error": str(e)}), 404
+        
         # 필수 필드 검증
         required_fields = ['recipient', 'subject', 'body']
         for field in required_fields:
@@ -59,6 +207,7 @@ def send_single_email():
             recipient_name=data.get('recipient_name', ''),
             template_data=data.get('template_data', {})
         )
+        email_service.flush_spool()
         
         if result['success']:
             return jsonify({
@@ -87,25 +236,32 @@ def send_bulk_emails():
         data = request.get_json()
         
         # 필수 필드 검증
-        required_fields = ['attendees', 'template']
-        for field in required_fields:
-            if field not in data:
-                return jsonify({"error": f"Missing required field: {field}"}), 400
+        if 'attendees' not in data:
+            return jsonify({"error": "Missing required field: attendees"}), 400
         
         attendees = data['attendees']
-        email_template = data['template']
         template_data = data.get('template_data', {})
         
-        # 템플릿 필수 필드 검증
-        if 'subject' not in email_template or 'body' not in email_template:
-            return jsonify({"error": "Template must include 'subject' and 'body'"}), 400
+        # 템플릿 결정 (template 또는 template_id), 발송 레인 (bulk 기본, reminder)
+        try:
+            email_template = _request_template(data)
+            lane = parse_lane(data.get('lane'))
+        except template_store.TemplateNotFound as e:
+            return jsonify({"error": str(e)}), 404
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
         
-        # 대량 이메일 발송
-        results = email_service.send_bulk_emails(
-            attendees=attendees,
-            email_template=email_template,
-            template_data=template_data
-        )
+        # 대량 이메일 발송 (attachments: ATTACHMENT_DIR 기준 경로)
+        try:
+            results = email_service.send_bulk_emails(
+                attendees=attendees,
+                email_template=email_template,
+                template_data=template_data,
+                attachments=data.get('attachments'),
+                lane=lane
+            )
+        except AttachmentError as e:
+            return jsonify({"error": str(e)}), 400
         
         return jsonify({
             "success": True,
@@ -113,6 +269,8 @@ def send_bulk_emails():
             "total": results['total'],
             "success_count": results['success_count'],
             "failure_count": results['failure_count'],
+            "skipped_count": results['skipped_count'],
+            "preflight": results['preflight'],
             "started_at": results['started_at'],
             "completed_at": results['completed_at'],
             "results": results['results']
@@ -122,6 +280,317 @@ def send_bulk_emails():
         return jsonify({"error": str(e)}), 500
 
 
+@emails_bp.route('/preflight', methods=['POST'])
+def preflight_recipient_list():
+    """발송 전 수신자 목록 사전 검증 (발송하지 않고 리포트만 반환)"""
+    try:
+        data = request.get_json()
+        
+        if 'attendees' not in data:
+            return jsonify({"error": "Missing required field: attendees"}), 400
+        
+        recipients, report = preflight_recipients(data['attendees'])
+        
+        return jsonify({
+            "success": True,
+            "report": report,
+            "recipients": recipients
+        })
+        
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
+
+
+@emails_bp.route('/suppressions', methods=['POST'])
+def add_suppressions():
+    """
+    발송 억제 주소 등록 (수신 거부 처리 등)
+
+    Body: {"emails": [...] 또는 "email": "...", "reason": "unsubscribe" | "hard_bounce" | "complaint" | "manual"}
+    """
+    try:
+        if email_service.suppression is None:
+            return jsonify({"error": "Suppression list is disabled (SUPPRESSION_DIR)"}), 400
+        
+        data = request.get_json() or {}
+        emails = data.get('emails') or ([data['email']] if data.get('email') else [])
+        if not emails:
+            return jsonify({"error": "Missing required field: emails"}), 400
+        try:
+            reason = parse_reason(data.get('reason'))
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
+        
+        added = email_service.suppression.add_many((email, reason) for email in emails)
+        return jsonify({"success": True, "added": added, "reason": reason.name.lower()})
+    
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
+
+
+@emails_bp.route('/suppressions/<path:email>', methods=['GET', 'DELETE'])
+def manage_suppression(email):
+    """억제 여부 조회 (GET) / 억제 해제 (DELETE)"""
+    try:
+        suppression = email_service.suppression
+        if suppression is None:
+            return jsonify({"error": "Suppression list is disabled (SUPPRESSION_DIR)"}), 400
+        
+        suppression.refresh()
+        if request.method == 'DELETE':
+            if not suppression.remove(email):
+                return jsonify({"error": f"Not suppressed: {email}"}), 404
+            return jsonify({"success": True, "email": email})
+        
+        reason = suppression.reason(email)
+        return jsonify({
+            "email": email,
+            "suppressed": reason is not None,
+            "reason": reason.name.lower() if reason is not None else None
+        })
+    
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
+
+
+@emails_bp.route('/queue', methods=['POST'])
+def enqueue_bulk_emails():
+    """
+    캠페인을 생성하고 대량 발송을 DB 큐에 등록 (worker.py가 발송)
+    
+    attendee_ids(참석자 ID 목록) 또는 attendee_type으로 대상을 지정하고,
+    template(제목/본문) 또는 template_id(저장된 템플릿)로 내용을 지정합니다.
+    
+    routes({참석자 유형: {template | template_id, template_data}})를 지정하면
+    유형별 그룹 캠페인으로 나누어 모든 그룹을 함께 발송합니다 (default_route: 나머지 유형).
+    
+    lane: 발송 레인 (bulk 기본, 낮은 우선순위 리마인더는 reminder)
+    """
+    try:
+        data = request.get_json()
+        
+        try:
+            query = _attendee_query(Attendee.query, data)
+        except ValueError:
+            return jsonify({"error": "Invalid attendee type"}), 400
+        
+        try:
+            lane = parse_lane(data.get('lane'))
+        except ValueError:
+            return jsonify({"error": "Invalid lane"}), 400
+        
+        name = data.get('name') or f"캠페인 {datetime.now().strftime('%Y-%m-%d %H:%M')}"
+        
+        # 라우팅 캠페인: routes = {참석자 유형: {template | template_id, template_data}}
+        if data.get('routes'):
+            try:
+                routes = {
+                    AttendeeType(attendee_type): _request_route(route)
+                    for attendee_type, route in data['routes'].items()
+                }
+                default_route = _request_route(data['default_route']) if data.get('default_route') else None
+            except template_store.TemplateNotFound as e:
+                return jsonify({"error": str(e)}), 404
+            except ValueError as e:
+                return jsonify({"error": str(e)}), 400
+            
+            result = campaigns.start_routed_campaign(
+                name=name,
+                attendees=query.order_by(Attendee.id).all(),
+                routes=routes,
+                template_data=data.get('template_data', {}),
+                sender_name=email_service.sender_name,
+                default_route=default_route,
+                lane=lane
+            )
+            return jsonify({
+                "success": True,
+                "message": f"{result['queued']}건의 이메일이 {len(result['groups'])}개 그룹으로 발송 큐에 등록되었습니다.",
+                **result
+            }), 202
+        
+        try:
+            email_template = _request_template(data)
+        except template_store.TemplateNotFound as e:
+            return jsonify({"error": str(e)}), 404
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
+        
+        result = campaigns.start_campaign(
+            name=name,
+            attendees=query.order_by(Attendee.id).all(),
+            email_template=email_template,
+            template_data=data.get('template_data', {}),
+            sender_name=email_service.sender_name,
+            template_id=data.get('template_id'),
+            lane=lane
+        )
+        
+        return jsonify({
+            "success": True,
+            "message": f"{result['queued']}건의 이메일이 발송 큐에 등록되었습니다.",
+            **result
+        }), 202
+        
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
+
+
+@emails_bp.route('/queue/stats', methods=['GET'])
+def get_queue_stats():
+    """발송 큐 상태별 건수 조회"""
+    try:
+        return jsonify(send_queue.queue_stats())
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
+
+
+@emails_bp.route('/campaigns', methods=['GET'])
+def get_campaigns():
+    """최근 캠페인 목록 (카운터 포함)"""
+    try:
+        limit = min(request.args.get('limit', 20, type=int), 100)
+        # 라우팅 캠페인의 그룹은 상위 캠페인 상세(/campaigns/<id>)에서 조회
+        rows = Campaign.query.filter(Campaign.parent_id.is_(None)) \
+            .order_by(Campaign.id.desc()).limit(limit).all()
+        return jsonify({"campaigns": [campaign.to_dict() for campaign in rows]})
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
+
+
+@emails_bp.route('/campaigns/<int:campaign_id>', methods=['GET'])
+def get_campaign(campaign_id):
+    """캠페인 진행 현황 (카운터 컬럼만 조회, 라우팅 캠페인은 그룹별 현황 포함)"""
+    try:
+        campaign = db.session.get(Campaign, campaign_id)
+        if campaign is None:
+            return jsonify({"error": f"Campaign not found: {campaign_id}"}), 404
+        return jsonify(campaigns.campaign_progress(campaign))
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
+
+
+CAMPAIGN_ACTIONS = {
+    'pause': campaigns.pause_campaign,
+    'resume': campaigns.resume_campaign,
+    'cancel': campaigns.cancel_campaign
+}
+
+
+@emails_bp.route('/campaigns/<int:campaign_id>/<action>', methods=['POST'])
+def control_campaign(campaign_id, action):
+    """
+    진행 중인 캠페인 제어: pause (일시 중지) / resume (재개) / cancel (취소)
+
+    일시 중지는 워커가 처리 중인 배치까지만 발송되고, 취소는 대기 중인 메시지를 cancelled로 바꿉니다.
+    """
+    try:
+        if action not in CAMPAIGN_ACTIONS:
+            return jsonify({"error": f"Unknown campaign action: {action}"}), 404
+
+        campaign = db.session.get(Campaign, campaign_id)
+        if campaign is None:
+            return jsonify({"error": f"Campaign not found: {campaign_id}"}), 404
+        try:
+            progress = CAMPAIGN_ACTIONS[action](campaign)
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 409
+        return jsonify(progress)
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({"error": str(e)}), 500
+
+
+@emails_bp.route('/campaigns/<int:campaign_id>/storage', methods=['GET'])
+def get_campaign_storage(campaign_id):
+    """캠페인 본문 저장 용량 (렌더링 저장 대비 중복 제거 저장)"""
+    try:
+        return jsonify(content_store.storage_report(campaign_id))
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
+
+
+@emails_bp.route('/<int:log_id>/content', methods=['GET'])
+def get_email_content(log_id):
+    """발송 로그의 실제 제목/본문 (저장된 템플릿과 변수로 재렌더링)"""
+    try:
+        log = db.session.get(EmailLog, log_id)
+        if log is None:
+            return jsonify({"error": f"Email log not found: {log_id}"}), 404
+        subject, body, text_body = content_store.render_log(log)
+        return jsonify({"id": log.id, "subject": subject, "body": body, "text_body": text_body})
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
+
+
+@emails_bp.route('/preview', methods=['POST'])
+def preview_bulk_emails():
+    """
+    실제 수신자 목록에 대한 템플릿 미리보기 (발송하지 않음, 페이지 단위)
+    
+    Body:
+        template 또는 template_id, template_data, attendee_ids / attendee_type (/queue와 같은 대상 필터),
+        limit (최대 MAX_PREVIEW_PAGE_SIZE), cursor (이전 응답의 next_cursor),
+        include_body (렌더링된 본문 포함 여부, 기본 false)
+    
+    수신자별로 해결되지 않는 {{변수}}, 빈 필드, 주소 오류를 보고합니다.
+    """
+    try:
+        data = request.get_json() or {}
+        
+        try:
+            email_template = _request_template(data)
+        except template_store.TemplateNotFound as e:
+            return jsonify({"error": str(e)}), 404
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
+        
+        try:
+            limit = max(1, min(int(data.get('limit') or DEFAULT_PREVIEW_PAGE_SIZE), MAX_PREVIEW_PAGE_SIZE))
+            cursor = int(data['cursor']) if data.get('cursor') is not None else None
+        except (TypeError, ValueError):
+            return jsonify({"error": "limit and cursor must be integers"}), 400
+        
+        query = Attendee.query.with_entities(
+            Attendee.id, Attendee.name, Attendee.email, Attendee.company,
+            Attendee.position, Attendee.attendee_type
+        )
+        try:
+            query = _attendee_query(query, data)
+        except ValueError:
+            return jsonify({"error": "Invalid attendee type"}), 400
+        if cursor is not None:
+            query = query.filter(Attendee.id > cursor)
+        
+        # 발송 큐와 같은 id 오름차순, 한 행 더 조회해서 다음 페이지 여부 확인
+        rows = query.order_by(Attendee.id).limit(limit + 1).all()
+        has_next = len(rows) > limit
+        rows = rows[:limit]
+        
+        preview = TemplatePreview(email_template, data.get('template_data', {}), email_service.sender_name)
+        page = preview.check_page([
+            {
+                'id': attendee_id,
+                'name': name,
+                'email': email,
+                'company': company or '',
+                'position': position or '',
+                'attendee_type': attendee_type.value if attendee_type else 'attendee'
+            }
+            for attendee_id, name, email, company, position, attendee_type in rows
+        ], bool(data.get('include_body')))
+        
+        return json_response({
+            "template_variables": list(preview.variables),
+            **page,
+            "next_cursor": rows[-1][0] if has_next else None,
+            "has_next": has_next
+        })
+        
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
+
+
 @emails_bp.route('/test-template', methods=['POST'])
 def test_email_template():
     """이메일 템플릿 테스트"""
@@ -182,80 +651,22 @@ def get_email_config():
 
 @emails_bp.route('/templates', methods=['GET'])
 def get_email_templates():
-    """이메일 템플릿 목록 조회"""
+    """이메일 템플릿 목록 조회 (활성 템플릿, fields= 프로젝션 지원)"""
     try:
-        # 기본 템플릿들
-        templates = [
-            {
-                "id": 1,
-                "name": "환영 이메일 - 일반 참석자",
-                "subject": "{{event_name}} 참석을 환영합니다!",
-                "body": """안녕하세요 {{name}}님,
-
-{{event_name}}에 참석해주셔서 감사합니다.
-
-📅 일정: {{event_date}}
-📍 장소: {{venue}}
-🕐 시간: {{event_time}}
-
-궁금한 사항이 있으시면 언제든 연락주세요.
-
-감사합니다.
-{{sender_name}}""",
-                "attendee_type": "attendee",
-                "created_at": "2024-09-18T10:00:00Z"
-            },
-            {
-                "id": 2,
-                "name": "연사 환영 이메일",
-                "subject": "연사로 모셔서 감사합니다 - {{event_name}}",
-                "body": """{{name}} 님께,
-
-{{event_name}}의 연사로 모셔서 진심으로 감사드립니다.
-
-🎤 연사 전용 혜택:
-- 연사 라운지 이용
-- 기술 지원 제공
-- 발표 장비 준비
-
-📋 참고사항:
-- 발표 30분 전 도착 부탁드립니다
-- 발표 자료는 {{event_date}} 전까지 전달 부탁드립니다
-
-성공적인 발표를 기원합니다.
-
-{{sender_name}} 드림""",
-                "attendee_type": "speaker",
-                "created_at": "2024-09-18T10:30:00Z"
-            },
-            {
-                "id": 3,
-                "name": "VIP 초대 이메일",
-                "subject": "VIP 초대 - {{event_name}}",
-                "body": """{{name}} 님께,
-
-VIP 게스트로 {{event_name}}에 초대합니다!
-
-⭐ VIP 전용 혜택:
-- VIP 라운지 이용
-- 우선 좌석 배정
-- 네트워킹 리셉션 참석
-- 연사와의 개별 만남 기회
-
-{{event_date}}에 뵙겠습니다.
-특별한 시간이 되기를 바랍니다.
-
-VIP 관계팀
-{{sender_name}}""",
-                "attendee_type": "vip",
-                "created_at": "2024-09-18T11:00:00Z"
-            }
-        ]
+        try:
+            fields = parse_fields(request.args.get('fields'), TEMPLATE_FIELDS)
+        except ProjectionError as e:
+            return jsonify({"error": str(e)}), 400
         
-        return jsonify({
-            "templates": templates,
-            "total": len(templates)
+        columns = {field: getattr(EmailTemplate, field) for field in TEMPLATE_FIELDS}
+        rows = EmailTemplate.query.with_entities(*[columns[f] for f in fields]) \
+            .filter(EmailTemplate.is_active.is_(True)) \
+            .order_by(EmailTemplate.id).all()
+        
+        return json_response({
+            "templates": rows_to_dicts(rows, fields),
+            "total": len(rows)
         })
         
     except Exception as e:
-        return jsonify({"error": str(e)}), 500
\ No newline at end of file
+        return jsonify({"error": str(e)}), 500
@@ -53,9 +53,17 @@ def test_google_sheets_connection():
 
 @google_sheets_bp.route('/import-attendees', methods=['POST'])
 def import_attendees_from_sheets():
-    """Google Sheets에서 참석자 데이터 가져오기"""
+    """
+    Google Sheets에서 참석자 데이터 가져오기
+    
+    sources([{spreadsheet_id, ranges | range}, ...])를 지정하면 여러 시트/스프레드시트를
+    병렬로 읽어 이메일 기준으로 중복을 제거해 합칩니다.
+    """
     try:
         data = request.get_json()
+        if data.get('sources'):
+            return _import_from_sources(data['sources'], data.get('max_workers'))
+        
         spreadsheet_id = data.get('spreadsheet_id', '')
         sheet_range = data.get('range', 'A:Z')  # 기본값: 전체 시트
         
@@ -100,6 +108,50 @@ def import_attendees_from_sheets():
         }), 500
 
 
+def _import_from_sources(sources, max_workers=None):
+    """여러 시트 가져오기 (import_attendees_from_sheets의 sources 요청)"""
+    if not isinstance(sources, list) or not all(isinstance(source, dict) for source in sources):
+        return jsonify({
+            'success': False,
+            'error': 'sources는 {spreadsheet_id, ranges} 객체 목록이어야 합니다.'
+        }), 400
+    
+    for source in sources:
+        if not _validate_spreadsheet_id(source.get('spreadsheet_id', '')):
+            return jsonify({
+                'success': False,
+                'error': f"올바르지 않은 스프레드시트 ID 형식입니다: {source.get('spreadsheet_id', '')}"
+            }), 400
+        if 'ranges' in source and not isinstance(source['ranges'], list):
+            return jsonify({
+                'success': False,
+                'error': 'ranges는 범위 목록이어야 합니다.'
+            }), 400
+    
+    result = google_sheets_service.import_from_sources(
+        sources, int(max_workers) if max_workers else None
+    )
+    
+    if not result['sources']:
+        return jsonify({
+            'success': False,
+            'error': '시트에서 데이터를 찾을 수 없습니다.',
+            'errors': result['errors']
+        }), 404
+    
+    attendees = result['attendees']
+    return jsonify({
+        'success': True,
+        'message': f'{len(result["sources"])}개 범위에서 {len(attendees)}명의 참석자 데이터를 가져왔습니다.',
+        'attendees': attendees,
+        'total_rows': result['total_rows'],
+        'valid_attendees': len(attendees),
+        'duplicate_count': result['duplicate_count'],
+        'sources': result['sources'],
+        'errors': result['errors']
+    })
+
+
 @google_sheets_bp.route('/preview-data', methods=['POST'])
 def preview_sheet_data():
     """Google Sheets 데이터 미리보기 (처음 10행만)"""
@@ -1,23 +1,106 @@
 """
 Email Templates Routes
 이메일 템플릿 관리를 위한 REST API 엔드포인트
+
+템플릿 변경은 services/template_store를 거쳐 캐시 버전 스탬프를 함께 올리므로,
+다른 프로세스의 템플릿 캐시도 다음 확인 주기에 갱신됩니다.
 """
 
 from flask import Blueprint, request, jsonify
+from models import EmailTemplate, db
 from routes.auth import verify_firebase_token
+from services import template_store
+from services.serialization import json_response
 
 templates_bp = Blueprint('templates', __name__)
 
 @templates_bp.route('/', methods=['GET'])
 @verify_firebase_token
 def get_templates():
-    """템플릿 목록 조회"""
-    # TODO: 실제 템플릿 조회 로직 구현
-    return jsonify({'templates': [], 'message': 'Templates feature coming soon'})
+    """템플릿 목록 조회 (type=참석자 유형, include_inactive=true)"""
+    try:
+        try:
+            query = template_store.list_templates(
+                request.args.get('type', ''),
+                request.args.get('include_inactive', 'false').lower() == 'true'
+            )
+        except ValueError:
+            return jsonify({'error': 'Invalid attendee type'}), 400
+
+        templates = [template.to_dict() for template in query]
+        return json_response({'templates': templates, 'total': len(templates)})
+
+    except Exception as e:
+        return jsonify({'error': 'Failed to fetch templates', 'details': str(e)}), 500
+
+@templates_bp.route('/<int:template_id>', methods=['GET'])
+@verify_firebase_token
+def get_template(template_id):
+    """템플릿 상세 조회"""
+    try:
+        template = db.session.get(EmailTemplate, template_id)
+        if template is None:
+            return jsonify({'error': f'Template not found: {template_id}'}), 404
+        return jsonify(template.to_dict())
+    except Exception as e:
+        return jsonify({'error': 'Failed to fetch template', 'details': str(e)}), 500
 
 @templates_bp.route('/', methods=['POST'])
 @verify_firebase_token
 def create_template():
     """새 템플릿 생성"""
-    # TODO: 실제 템플릿 생성 로직 구현
-    return jsonify({'message': 'Template creation feature coming soon'})
+    try:
+        data = request.get_json() or {}
+        try:
+            template = template_store.create_template(data)
+        except ValueError as e:
+            db.session.rollback()
+            return jsonify({'error': str(e)}), 400
+
+        return jsonify(template.to_dict()), 201
+
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({'error': 'Failed to create template', 'details': str(e)}), 500
+
+@templates_bp.route('/<int:template_id>', methods=['PUT'])
+@verify_firebase_token
+def update_template(template_id):
+    """템플릿 수정"""
+    try:
+        template = db.session.get(EmailTemplate, template_id)
+        if template is None:
+            return jsonify({'error': f'Template not found: {template_id}'}), 404
+        data = request.get_json() or {}
+        try:
+            template = template_store.update_template(template, data)
+        except ValueError as e:
+            db.session.rollback()
+            return jsonify({'error': str(e)}), 400
+
+        return jsonify(template.to_dict())
+
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({'error': 'Failed to update template', 'details': str(e)}), 500
+
+@templates_bp.route('/<int:template_id>', methods=['DELETE'])
+@verify_firebase_token
+def delete_template(template_id):
+    """템플릿 삭제 (비활성화 - 발송 로그 참조 유지)"""
+    try:
+        template = db.session.get(EmailTemplate, template_id)
+        if template is None:
+            return jsonify({'error': f'Template not found: {template_id}'}), 404
+        template_store.delete_template(template)
+        return jsonify({'message': 'Template deleted successfully'})
+
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({'error': 'Failed to delete template', 'details': str(e)}), 500
+
+@templates_bp.route('/cache', methods=['GET'])
+@verify_firebase_token
+def get_template_cache_stats():
+    """이 프로세스의 템플릿 캐시 상태 (항목 수, 버전, 적중/미스)"""
+    return jsonify(template_store.template_cache.stats())
@@ -0,0 +1,287 @@
+"""
+첨부 파일 - 한 번 인코딩, 디스크에서 스트리밍
+
+- 공통 첨부(프로그램북, 안내문 등)는 캠페인당 한 번만 base64로 인코딩해
+  임시 파일에 두고 mmap으로 모든 수신자 메시지에 그대로 재사용
+- 수신자별 첨부(수료증, 영수증 등)는 경로 템플릿(예: certificates/{{email}}.pdf)으로
+  ATTACHMENT_DIR 안의 파일을 찾아 발송 시 청크 단위로 읽으며 인코딩
+- 메시지는 MIME 헤더/본문 조각과 첨부 조각의 시퀀스로 만들어 SMTP DATA로
+  바로 흘려보냄 (SMTPSessionPool.send_stream) → 첨부 크기만큼 메시지 객체를 만들지 않음
+
+수신자 1만 명에게 같은 5MB PDF를 보내도 인코딩된 첨부는 mmap 한 벌뿐이므로
+프로세스 메모리가 수신자 수에 비례해 늘지 않습니다.
+"""
+
+import base64
+import mimetypes
+import mmap
+import os
+import re
+import tempfile
+from email.mime.base import MIMEBase
+from email.mime.multipart import MIMEMultipart
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Union
+
+from services.dkim_signer import DKIMSigner, split_message
+from services.message_builder import substitute_variables
+
+ATTACHMENT_DIR = os.getenv('ATTACHMENT_DIR', 'attachments')
+
+# base64 한 줄(76자)에 해당하는 원본 57바이트의 배수로 읽기
+READ_CHUNK_SIZE = 57 * 1024
+# 이보다 작은 공통 첨부는 임시 파일 대신 메모리에 보관
+INLINE_LIMIT = 256 * 1024
+
+_DOT_LINE = re.compile(rb'^\.', re.MULTILINE)
+
+Segment = Union[bytes, memoryview]
+
+
+class AttachmentError(ValueError):
+    """첨부 파일 경로가 잘못되었거나 파일이 없는 경우"""
+
+
+def resolve_path(path: str, base_dir: Optional[str] = None) -> str:
+    """
+    첨부 파일 경로를 base_dir 기준 절대 경로로 변환
+
+    Raises:
+        AttachmentError: base_dir 밖을 가리키거나 파일이 없는 경우
+    """
+    base = os.path.realpath(base_dir or ATTACHMENT_DIR)
+    resolved = os.path.realpath(os.path.join(base, path))
+    if os.path.commonpath([base, resolved]) != base:
+        raise AttachmentError(f'Attachment path outside attachment directory: {path}')
+    if not os.path.isfile(resolved):
+        raise AttachmentError(f'Attachment not found: {path}')
+    return resolved
+
+
+def encode_file(path: str) -> Iterator[bytes]:
+    """파일을 청크 단위로 읽어 base64(76자 줄, CRLF)로 인코딩"""
+    with open(path, 'rb') as f:
+        while True:
+            chunk = f.read(READ_CHUNK_SIZE)
+            if not chunk:
+                return
+            encoded = base64.b64encode(chunk)
+            yield b''.join(
+                encoded[i:i + 76] + b'\r\n' for i in range(0, len(encoded), 76)
+            )
+
+
+class MessageAttachment:
+    """메시지에 들어갈 첨부 하나 (인코딩된 내용을 조각으로 제공)"""
+
+    def __init__(self, filename: str, content_type: str):
+        self.filename = filename
+        self.content_type = content_type
+
+    def segments(self) -> Iterable[Segment]:
+        raise NotImplementedError
+
+
+class SharedAttachment(MessageAttachment):
+    """캠페인 공통 첨부 - 생성 시 한 번 인코딩하고 모든 메시지에서 재사용"""
+
+    def __init__(self, path: str, filename: Optional[str] = None, content_type: Optional[str] = None):
+        super().__init__(
+            filename or os.path.basename(path),
+            content_type or mimetypes.guess_type(path)[0] or 'application/octet-stream'
+        )
+        self.size = os.path.getsize(path)
+        self._file = None
+        self._mmap = None
+
+        if self.size <= INLINE_LIMIT:
+            self._encoded: Segment = b''.join(encode_file(path))
+            return
+
+        # 큰 파일: 임시 파일에 인코딩 후 mmap (페이지 캐시를 공유, 힙에 올리지 않음)
+        self._file = tempfile.TemporaryFile(prefix='attachment-')
+        for block in encode_file(path):
+            self._file.write(block)
+        self._file.flush()
+        self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        self._encoded = memoryview(self._mmap)
+
+    @property
+    def encoded_size(self) -> int:
+        return len(self._encoded)
+
+    def segments(self) -> Iterable[Segment]:
+        return (self._encoded,)
+
+    def close(self):
+        if self._mmap is not None:
+            self._encoded.release()
+            self._mmap.close()
+            self._file.close()
+            self._mmap = self._file = None
+
+
+class FileAttachment(MessageAttachment):
+    """수신자별 첨부 - 발송할 때마다 디스크에서 읽으며 인코딩"""
+
+    def __init__(self, path: str, filename: Optional[str] = None, content_type: Optional[str] = None):
+        super().__init__(
+            filename or os.path.basename(path),
+            content_type or mimetypes.guess_type(path)[0] or 'application/octet-stream'
+        )
+        self.path = path
+
+    def segments(self) -> Iterable[Segment]:
+        return encode_file(self.path)
+
+
+class AttachmentSet:
+    """
+    캠페인 첨부 구성
+
+    사용 예:
+        with AttachmentSet.from_spec([
+            {'path': 'program.pdf'},
+            {'path_template': 'certificates/{{email}}.pdf', 'filename': 'certificate.pdf'}
+        ]) as attachment_set:
+            attachments = attachment_set.for_recipient(variables)
+    """
+
+    def __init__(self, shared: List[SharedAttachment], per_recipient: List[Dict[str, Any]], base_dir: Optional[str]):
+        self.shared = shared
+        self.per_recipient = per_recipient
+        self.base_dir = base_dir
+
+    @classmethod
+    def from_spec(cls, specs: Optional[List[Dict[str, Any]]], base_dir: Optional[str] = None) -> 'AttachmentSet':
+        """
+        요청의 attachments 목록으로 구성 (공통 첨부는 이 시점에 한 번 인코딩)
+
+        Args:
+            specs: [{'path': ...} | {'path_template': ..., 'required': bool}, 'filename', 'content_type']
+            base_dir: 첨부 파일 기준 디렉터리 (기본 ATTACHMENT_DIR)
+
+        Raises:
+            AttachmentError: 잘못된 항목이나 없는 공통 첨부 파일
+        """
+        shared = []
+        per_recipient = []
+        try:
+            for spec in specs or []:
+                if spec.get('path'):
+                    shared.append(SharedAttachment(
+                        resolve_path(spec['path'], base_dir), spec.get('filename'), spec.get('content_type')
+                    ))
+                elif spec.get('path_template'):
+                    per_recipient.append(spec)
+                else:
+                    raise AttachmentError("Attachment must include 'path' or 'path_template'")
+        except Exception:
+            for attachment in shared:
+                attachment.close()
+            raise
+        return cls(shared, per_recipient, base_dir)
+
+    def __bool__(self) -> bool:
+        return bool(self.shared or self.per_recipient)
+
+    def for_recipient(self, variables: Dict[str, Any]) -> List[MessageAttachment]:
+        """
+        수신자 한 명의 첨부 목록
+
+        Raises:
+            AttachmentError: 필수(required, 기본값) 수신자별 첨부 파일이 없는 경우
+        """
+        attachments: List[MessageAttachment] = list(self.shared)
+        for spec in self.per_recipient:
+            path = substitute_variables(spec['path_template'], variables)
+            try:
+                resolved = resolve_path(path, self.base_dir)
+            except AttachmentError:
+                if spec.get('required', True):
+                    raise
+                continue
+            filename = substitute_variables(spec['filename'], variables) if spec.get('filename') else None
+            attachments.append(FileAttachment(resolved, filename, spec.get('content_type')))
+        return attachments
+
+    def close(self):
+        for attachment in self.shared:
+            attachment.close()
+
+    def __enter__(self) -> 'AttachmentSet':
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def _placeholder(index: int) -> str:
+    return f'@@ATTACHMENT-{index}@@'
+
+
+def message_segments(message: MIMEMultipart,
+                     attachments: List[MessageAttachment],
+                     signer: Optional[DKIMSigner] = None) -> Callable[[], Iterator[Segment]]:
+    """
+    본문 메시지 + 첨부를 SMTP DATA로 보낼 조각 생성 함수 반환 (CRLF, dot-stuffing 적용)
+
+    MIME 구조는 email 패키지로 한 번 직렬화하되 첨부 본문 자리에는 자리표시자를 넣고,
+    반환된 함수를 호출할 때마다 그 자리에 인코딩된 첨부 조각을 끼워 넣습니다
+    (SMTP 재시도 시 다시 호출). base64 줄은 '.'으로 시작하지 않으므로
+    첨부 조각은 dot-stuffing이 필요 없습니다.
+
+    signer를 지정하면 첨부 조각을 한 번 더 읽어 본문 해시를 계산하고
+    DKIM-Signature 헤더를 첫 조각 앞에 붙입니다 (base64 줄은 정규화가 필요 없음).
+    """
+    outer = MIMEMultipart('mixed')
+    for header in ('From', 'To', 'Subject'):
+        if header in message:
+            outer[header] = message[header]
+            del message[header]
+    outer.attach(message)
+
+    for index, attachment in enumerate(attachments):
+        maintype, _, subtype = attachment.content_type.partition('/')
+        part = MIMEBase(maintype, subtype or 'octet-stream', name=('utf-8', '', attachment.filename))
+        part['Content-Transfer-Encoding'] = 'base64'
+        part.add_header('Content-Disposition', 'attachment', filename=('utf-8', '', attachment.filename))
+        part.set_payload(_placeholder(index))
+        outer.attach(part)
+
+    raw = outer.as_bytes(policy=outer.policy.clone(linesep='\r\n'))
+
+    # MIME 조각 (첨부 사이사이)
+    pieces = []
+    position = 0
+    for index in range(len(attachments)):
+        marker = (_placeholder(index) + '\r\n').encode('ascii')
+        found = raw.index(marker, position)
+        pieces.append(raw[position:found])
+        position = found + len(marker)
+    tail = raw[position:]
+    if not tail.endswith(b'\r\n'):
+        tail += b'\r\n'
+    pieces.append(tail)
+
+    if signer is not None:
+        headers, first_body = split_message(pieces[0])
+
+        def body_parts() -> Iterator[tuple]:
+            yield first_body, False
+            for attachment, piece in zip(attachments, pieces[1:]):
+                for segment in attachment.segments():
+                    yield segment, True
+                yield piece, False
+
+        pieces[0] = signer.sign_parts(headers, body_parts()) + pieces[0]
+
+    # dot-stuffing은 한 번만 적용
+    pieces = [_DOT_LINE.sub(b'..', piece) for piece in pieces]
+
+    def segments() -> Iterator[Segment]:
+        for piece, attachment in zip(pieces, attachments):
+            yield piece
+            yield from attachment.segments()
+        yield pieces[-1]
+
+    return segments
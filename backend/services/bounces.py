@@ -0,0 +1,209 @@
+"""
+반송(DSN) / 스팸 신고(ARF) / 수신 거부 메일 파싱 및 억제 목록 수집
+
+반송 메일함(maildir)의 new/ 메시지만 읽고, 처리한 메시지는 cur/로 옮겨(':2,S')
+다음 수집에서 다시 읽지 않습니다 (증분 수집).
+
+- multipart/report; report-type=delivery-status (RFC 3464)
+  Action: failed + Status 5.x.x → 영구 반송 (억제), 4.x.x / delayed → 일시 반송 (집계만)
+- multipart/report; report-type=feedback-report (RFC 5965) → 스팸 신고 (억제)
+- 제목이 'unsubscribe'로 시작하는 메일 (List-Unsubscribe mailto 응답) → 수신 거부 (억제)
+- 그 밖의 메시지는 인식하지 못한 메시지로 집계
+"""
+
+import email
+import logging
+import os
+import re
+from email import policy
+from email.message import Message
+from email.utils import parseaddr
+from typing import Dict, Iterator, List, NamedTuple, Optional
+
+from services.suppression import SuppressionList, SuppressionReason
+
+logger = logging.getLogger(__name__)
+
+HARD = 'hard'
+SOFT = 'soft'
+COMPLAINT = 'complaint'
+UNSUBSCRIBE = 'unsubscribe'
+
+# 억제 목록에 기록하는 종류
+SUPPRESSED_KINDS = {
+    HARD: SuppressionReason.HARD_BOUNCE,
+    COMPLAINT: SuppressionReason.COMPLAINT,
+    UNSUBSCRIBE: SuppressionReason.UNSUBSCRIBE
+}
+
+_STATUS_PATTERN = re.compile(r'^([245])\.\d{1,3}\.\d{1,3}')
+_UNSUBSCRIBE_SUBJECT = re.compile(r'^\s*unsubscribe\b', re.IGNORECASE)
+
+
+class BounceEvent(NamedTuple):
+    """메시지에서 찾은 수신자별 이벤트"""
+    email: str
+    kind: str                      # hard / soft / complaint / unsubscribe
+    status: Optional[str] = None   # DSN Status (예: 5.1.1)
+    diagnostic: Optional[str] = None
+
+
+def _address(value: Optional[str]) -> Optional[str]:
+    """'rfc822; user@example.com' 형식의 DSN 주소 필드에서 주소만 추출"""
+    if not value:
+        return None
+    _, _, address = str(value).rpartition(';')
+    address = parseaddr(address.strip())[1] or address.strip().strip('<>')
+    return address or None
+
+
+def _report_parts(message: Message, content_type: str) -> Iterator[Message]:
+    for part in message.walk():
+        if part.get_content_type() == content_type:
+            yield part
+
+
+def _field_blocks(part: Message) -> List[Message]:
+    """
+    message/delivery-status, message/feedback-report 본문의 필드 블록
+
+    email 패키지는 delivery-status를 블록별 Message 목록으로 파싱하고,
+    feedback-report는 텍스트 본문으로 남기므로 필요하면 헤더로 다시 파싱합니다.
+    """
+    payload = part.get_payload()
+    if isinstance(payload, list):
+        return payload
+    text = part.get_payload(decode=True) or b''
+    return [email.message_from_bytes(text.strip() + b'\n')]
+
+
+def _delivery_status_events(message: Message) -> List[BounceEvent]:
+    events = []
+    for part in _report_parts(message, 'message/delivery-status'):
+        # 첫 블록은 메시지 단위 필드, 나머지는 수신자별 필드
+        for block in _field_blocks(part)[1:]:
+            recipient = _address(block.get('Final-Recipient')) or _address(block.get('Original-Recipient'))
+            if recipient is None:
+                continue
+            action = (block.get('Action') or '').strip().lower()
+            status = (block.get('Status') or '').strip()
+            match = _STATUS_PATTERN.match(status)
+            diagnostic = block.get('Diagnostic-Code')
+
+            if action == 'failed' and match and match.group(1) == '5':
+                kind = HARD
+            elif action in ('failed', 'delayed'):
+                kind = SOFT
+            else:
+                continue  # delivered / relayed / expanded
+            events.append(BounceEvent(recipient, kind, status or None, str(diagnostic) if diagnostic else None))
+    return events
+
+
+def _feedback_events(message: Message) -> List[BounceEvent]:
+    events = []
+    for part in _report_parts(message, 'message/feedback-report'):
+        for block in _field_blocks(part):
+            recipient = _address(block.get('Original-Rcpt-To'))
+            if recipient is None:
+                # 첨부된 원본 메시지(또는 헤더)의 수신자
+                for original in _report_parts(message, 'message/rfc822'):
+                    payload = original.get_payload()
+                    if isinstance(payload, list) and payload:
+                        recipient = parseaddr(payload[0].get('To', ''))[1] or None
+                for original in _report_parts(message, 'text/rfc822-headers'):
+                    headers = email.message_from_bytes(original.get_payload(decode=True) or b'')
+                    recipient = recipient or parseaddr(headers.get('To', ''))[1] or None
+            if recipient:
+                events.append(BounceEvent(recipient, COMPLAINT, None, block.get('Feedback-Type')))
+    return events
+
+
+def parse_message(message: Message) -> List[BounceEvent]:
+    """메시지에서 반송/신고/수신 거부 이벤트 추출 (인식하지 못하면 빈 목록)"""
+    if message.get_content_type() == 'multipart/report':
+        report_type = (message.get_param('report-type') or '').lower()
+        if report_type == 'delivery-status':
+            return _delivery_status_events(message)
+        if report_type == 'feedback-report':
+            return _feedback_events(message)
+        return []
+
+    if _UNSUBSCRIBE_SUBJECT.match(str(message.get('Subject', ''))):
+        sender = parseaddr(str(message.get('From', '')))[1]
+        return [BounceEvent(sender, UNSUBSCRIBE)] if sender else []
+    return []
+
+
+def parse_bytes(data: bytes) -> List[BounceEvent]:
+    return parse_message(email.message_from_bytes(data, policy=policy.compat32))
+
+
+class BounceIngester:
+    """반송 메일함(maildir) 증분 수집기"""
+
+    def __init__(self, maildir: str, suppression: SuppressionList):
+        self.maildir = maildir
+        self.suppression = suppression
+        for sub in ('tmp', 'new', 'cur'):
+            os.makedirs(os.path.join(maildir, sub), exist_ok=True)
+
+    def _mark_seen(self, name: str):
+        """처리한 메시지를 cur/로 이동 (maildir 읽음 표시)"""
+        base = name.split(':2,', 1)[0]
+        os.replace(os.path.join(self.maildir, 'new', name), os.path.join(self.maildir, 'cur', base + ':2,S'))
+
+    def scan(self, limit: Optional[int] = None) -> Dict[str, object]:
+        """
+        new/의 메시지를 읽어 억제 목록 갱신
+
+        Args:
+            limit: 한 번에 처리할 최대 메시지 수
+
+        Returns:
+            Dict: 처리 통계와 영구 반송 주소 목록 (캠페인 반송 집계용)
+        """
+        new_dir = os.path.join(self.maildir, 'new')
+        names = sorted(name for name in os.listdir(new_dir) if not name.startswith('.'))
+        if limit is not None:
+            names = names[:limit]
+
+        counts = {HARD: 0, SOFT: 0, COMPLAINT: 0, UNSUBSCRIBE: 0}
+        entries = []
+        hard_bounces = []
+        unrecognized = 0
+
+        for name in names:
+            try:
+                with open(os.path.join(new_dir, name), 'rb') as f:
+                    events = parse_bytes(f.read())
+            except FileNotFoundError:
+                continue  # 다른 수집기가 먼저 처리
+            except Exception as e:
+                logger.warning("⚠️ 반송 메시지 파싱 실패 (%s): %s", name, e)
+                events = []
+
+            if not events:
+                unrecognized += 1
+            for event in events:
+                counts[event.kind] += 1
+                if event.kind in SUPPRESSED_KINDS:
+                    entries.append((event.email, SUPPRESSED_KINDS[event.kind]))
+                if event.kind == HARD:
+                    hard_bounces.append(event.email)
+
+        # 억제 목록 기록(fsync) 후에 읽음 표시 → 중간에 죽으면 다음 수집에서 다시 처리
+        suppressed = self.suppression.add_many(entries) if entries else 0
+        for name in names:
+            try:
+                self._mark_seen(name)
+            except FileNotFoundError:
+                pass
+
+        return {
+            'messages': len(names),
+            'unrecognized': unrecognized,
+            'suppressed': suppressed,
+            'hard_bounces': hard_bounces,
+            **counts
+        }
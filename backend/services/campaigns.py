@@ -0,0 +1,281 @@
+"""
+발송 캠페인 서비스
+
+캠페인을 시작하면 수신자 ID 스냅샷과 pending EmailLog를 한 트랜잭션으로 등록하고,
+발송 결과는 Campaign 카운터 컬럼에 증분 반영합니다 (send_queue.complete).
+대시보드는 EmailLog를 집계하지 않고 Campaign 한 행만 읽습니다.
+
+라우팅 캠페인은 참석자 유형마다 템플릿을 지정해 한 번에 시작합니다.
+유형 그룹마다 하위 캠페인(자체 템플릿, 카운터)을 만들고, 그룹들의 행을 번갈아 등록해
+워커들이 모든 그룹을 동시에 발송하도록 합니다.
+
+진행 중인 캠페인은 일시 중지 / 재개 / 취소할 수 있습니다 (라우팅 캠페인은 그룹 전체).
+일시 중지된 캠페인의 행은 워커가 선점하지 않고, 이미 선점한 배치는 발송 직전에 반납하므로
+현재 발송 중인 배치 이후로는 더 발송되지 않습니다.
+"""
+
+from datetime import datetime
+from itertools import chain, zip_longest
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import func, update
+
+from models import Attendee, AttendeeType, Campaign, CampaignStatus, EmailLog, EmailStatus, SendLane, db
+from services import send_queue
+
+
+def start_campaign(name: str,
+                   attendees: List[Attendee],
+                   email_template: Dict[str, str],
+                   template_data: Optional[Dict[str, Any]],
+                   sender_name: str,
+                   template_id: Optional[int] = None,
+                   sender_id: int = 1,
+                   lane: SendLane = SendLane.BULK) -> Dict[str, Any]:
+    """
+    캠페인 생성 및 발송 큐 등록 (lane: 워커가 발송할 때 사용할 레인)
+
+    Returns:
+        Dict: 캠페인 정보, 큐 등록 건수, 사전 검증 리포트
+    """
+    campaign = Campaign(name=name, template_id=template_id, sender_id=sender_id, lane=lane)
+    db.session.add(campaign)
+    db.session.flush()
+
+    try:
+        result = send_queue.enqueue_emails(
+            attendees=attendees,
+            email_template=email_template,
+            template_data=template_data,
+            sender_name=sender_name,
+            sender_id=sender_id,
+            extra_columns={'campaign_id': campaign.id, 'template_id': template_id},
+            commit=False
+        )
+        # 워커가 결과를 기록하기 전에 카운터가 채워지도록 같은 트랜잭션에서 커밋
+        campaign.set_recipients(result.pop('recipient_ids'))
+        campaign.queued_count = result['queued']
+        if not result['queued']:
+            campaign.status = CampaignStatus.COMPLETED
+            campaign.completed_at = datetime.utcnow()
+        db.session.commit()
+    except Exception:
+        db.session.rollback()
+        raise
+
+    return {'campaign': campaign.to_dict(), **result}
+
+
+def start_routed_campaign(name: str,
+                          attendees: List[Attendee],
+                          routes: Dict[AttendeeType, Dict[str, Any]],
+                          template_data: Optional[Dict[str, Any]],
+                          sender_name: str,
+                          default_route: Optional[Dict[str, Any]] = None,
+                          sender_id: int = 1,
+                          lane: SendLane = SendLane.BULK) -> Dict[str, Any]:
+    """
+    참석자 유형별 템플릿으로 라우팅 캠페인 생성 및 발송 큐 등록
+
+    Args:
+        attendees: 대상 참석자 (유형이 없으면 ATTENDEE로 취급)
+        routes: {참석자 유형: {'template': {subject, body}, 'template_id', 'template_data'}}
+        template_data: 모든 그룹 공통 템플릿 데이터 (그룹의 template_data가 우선)
+        default_route: 라우트가 없는 유형에 쓸 템플릿 (없으면 해당 참석자는 제외)
+        lane: 모든 그룹의 발송 레인
+
+    Returns:
+        Dict: 상위 캠페인, 그룹별 캠페인/등록 결과, 라우트가 없어 제외된 유형별 인원
+    """
+    # 한 번 순회하며 유형별로 분류
+    partitions: Dict[AttendeeType, List[Attendee]] = {}
+    unrouted: Dict[str, int] = {}
+    for attendee in attendees:
+        attendee_type = attendee.attendee_type or AttendeeType.ATTENDEE
+        if attendee_type in routes or default_route is not None:
+            partitions.setdefault(attendee_type, []).append(attendee)
+        else:
+            unrouted[attendee_type.value] = unrouted.get(attendee_type.value, 0) + 1
+
+    parent = Campaign(name=name, sender_id=sender_id, lane=lane)
+    db.session.add(parent)
+    db.session.flush()
+
+    groups = []
+    try:
+        group_rows = []
+        for attendee_type, members in partitions.items():
+            route = routes.get(attendee_type, default_route)
+            campaign = Campaign(
+                name=f'{name} - {attendee_type.value}', parent_id=parent.id, attendee_type=attendee_type,
+                template_id=route.get('template_id'), sender_id=sender_id, lane=lane
+            )
+            db.session.add(campaign)
+            db.session.flush()
+
+            rows, result = send_queue.prepare_rows(
+                members, route['template'], {**(template_data or {}), **(route.get('template_data') or {})},
+                sender_name, sender_id,
+                extra_columns={'campaign_id': campaign.id, 'template_id': route.get('template_id')}
+            )
+            campaign.set_recipients(result.pop('recipient_ids'))
+            campaign.queued_count = result['queued']
+            if not result['queued']:
+                campaign.status = CampaignStatus.COMPLETED
+                campaign.completed_at = datetime.utcnow()
+            group_rows.append(rows)
+            groups.append((campaign, result))
+
+        # 그룹별 행을 번갈아 등록 → 큐(id 순 선점)에서 모든 그룹이 함께 진행
+        send_queue.insert_rows([
+            row for row in chain.from_iterable(zip_longest(*group_rows)) if row is not None
+        ])
+
+        parent.set_recipients([
+            recipient_id for campaign, _ in groups for recipient_id in campaign.get_recipients()
+        ])
+        parent.queued_count = sum(campaign.queued_count for campaign, _ in groups)
+        if not parent.queued_count:
+            parent.status = CampaignStatus.COMPLETED
+            parent.completed_at = datetime.utcnow()
+        db.session.commit()
+    except Exception:
+        db.session.rollback()
+        raise
+
+    return {
+        'campaign': parent.to_dict(),
+        'queued': parent.queued_count,
+        'groups': [{'campaign': campaign.to_dict(), **result} for campaign, result in groups],
+        'unrouted': unrouted
+    }
+
+
+def campaign_progress(campaign: Campaign) -> Dict[str, Any]:
+    """캠페인 진행 현황 (라우팅 캠페인이면 그룹별 카운터 포함)"""
+    progress = campaign.to_dict()
+    if campaign.groups:
+        progress['groups'] = [group.to_dict() for group in sorted(campaign.groups, key=lambda group: group.id)]
+    return progress
+
+
+def _family_ids(campaign: Campaign) -> List[int]:
+    """캠페인과 하위 그룹 ID"""
+    return [campaign.id] + [group.id for group in campaign.groups]
+
+
+def _transition(campaign: Campaign, allowed, status: CampaignStatus) -> int:
+    """
+    캠페인(+그룹) 상태 변경, 변경된 행 수 반환 (커밋은 호출자)
+
+    Raises:
+        ValueError: 현재 상태에서 허용되지 않는 변경
+    """
+    if campaign.status not in allowed:
+        raise ValueError(f'Cannot change campaign from {campaign.status.value} to {status.value}')
+    values = {'status': status}
+    if status == CampaignStatus.CANCELLED:
+        values['completed_at'] = datetime.utcnow()
+    # 이미 끝난 그룹은 그대로 유지
+    result = db.session.execute(
+        update(Campaign)
+        .where(Campaign.id.in_(_family_ids(campaign)))
+        .where(Campaign.status.in_(allowed))
+        .values(values)
+        .execution_options(synchronize_session=False)
+    )
+    return result.rowcount
+
+
+def pause_campaign(campaign: Campaign) -> Dict[str, Any]:
+    """발송 일시 중지 (워커가 처리 중인 배치까지만 발송)"""
+    try:
+        _transition(campaign, (CampaignStatus.RUNNING,), CampaignStatus.PAUSED)
+        db.session.commit()
+    except Exception:
+        db.session.rollback()
+        raise
+    return campaign_progress(campaign)
+
+
+def resume_campaign(campaign: Campaign) -> Dict[str, Any]:
+    """일시 중지된 캠페인 재개 (중지 중에 남은 행이 모두 처리되었으면 완료 처리)"""
+    try:
+        family_ids = _family_ids(campaign)
+        _transition(campaign, (CampaignStatus.PAUSED,), CampaignStatus.RUNNING)
+        db.session.execute(
+            update(Campaign)
+            .where(Campaign.id.in_(family_ids))
+            .where(Campaign.status == CampaignStatus.RUNNING)
+            .where(Campaign.sent_count + Campaign.failed_count >= Campaign.queued_count)
+            .values(status=CampaignStatus.COMPLETED, completed_at=datetime.utcnow())
+            .execution_options(synchronize_session=False)
+        )
+        db.session.commit()
+    except Exception:
+        db.session.rollback()
+        raise
+    return campaign_progress(campaign)
+
+
+def cancel_campaign(campaign: Campaign) -> Dict[str, Any]:
+    """
+    캠페인 취소: 대기 행을 cancelled로 변경
+
+    워커가 이미 선점한 행은 발송 직전 확인에서 취소되고,
+    SMTP 전송 중인 메시지는 그대로 발송 결과가 기록됩니다.
+    """
+    try:
+        _transition(campaign, (CampaignStatus.RUNNING, CampaignStatus.PAUSED), CampaignStatus.CANCELLED)
+        # 그룹별로 취소 (그룹 카운터 + 상위 카운터)
+        targets = [group.id for group in campaign.groups] or [campaign.id]
+        cancelled = sum(send_queue.cancel_pending(campaign_id) for campaign_id in targets)
+        db.session.commit()
+    except Exception:
+        db.session.rollback()
+        raise
+    return {**campaign_progress(campaign), 'cancelled': cancelled}
+
+
+def record_bounce(campaign_id: int, count: int = 1):
+    """반송(bounce) 건수 증가 (라우팅 캠페인 그룹이면 상위 캠페인도 함께)"""
+    campaign_ids = [campaign_id]
+    parent_id = send_queue.parent_campaign_id(campaign_id)
+    if parent_id is not None:
+        campaign_ids.append(parent_id)
+    db.session.execute(
+        update(Campaign)
+        .where(Campaign.id.in_(campaign_ids))
+        .values(bounced_count=Campaign.bounced_count + count)
+        .execution_options(synchronize_session=False)
+    )
+    db.session.commit()
+
+
+def record_bounced_addresses(emails: List[str], chunk_size: int = 500) -> Dict[int, int]:
+    """
+    영구 반송 주소를 마지막으로 발송한 캠페인별로 묶어 반송 건수 증가 (bounce_ingest.py)
+
+    Returns:
+        Dict[캠페인 ID, 반송 건수]
+    """
+    counts: Dict[int, int] = {}
+    addresses = list(dict.fromkeys(email.strip().lower() for email in emails if email))
+    for start in range(0, len(addresses), chunk_size):
+        chunk = addresses[start:start + chunk_size]
+        # 주소별 마지막 발송 로그
+        latest = db.session.query(func.max(EmailLog.id)) \
+            .join(Attendee, Attendee.id == EmailLog.recipient_id) \
+            .filter(func.lower(Attendee.email).in_(chunk),
+                    EmailLog.status == EmailStatus.SENT,
+                    EmailLog.campaign_id.isnot(None)) \
+            .group_by(func.lower(Attendee.email))
+        rows = db.session.query(EmailLog.campaign_id, func.count()) \
+            .filter(EmailLog.id.in_(latest.scalar_subquery())) \
+            .group_by(EmailLog.campaign_id).all()
+        for campaign_id, count in rows:
+            counts[campaign_id] = counts.get(campaign_id, 0) + count
+
+    for campaign_id, count in counts.items():
+        record_bounce(campaign_id, count)
+    return counts
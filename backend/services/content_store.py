@@ -0,0 +1,146 @@
+"""
+발송 본문 중복 제거 저장소
+
+캠페인 메시지는 템플릿 원문 + 공통 데이터가 같고 참석자 필드만 다릅니다.
+EmailLog마다 렌더링된 본문 전체를 저장하는 대신
+
+- 템플릿 원문(제목/본문)과 공통 변수를 zlib 압축 blob 하나로
+  email_contents에 저장 (내용의 SHA-256 해시가 키 → 같은 내용은 한 번만 저장)
+- EmailLog에는 content_hash와 참석자별 변수(name, email, ...)만 저장
+
+하고, 발송 시점이나 조회 시 render_log()로 원래 메시지를 그대로 다시 만듭니다.
+공통 변수는 등록 시점의 기본 변수(current_date 등)를 포함하므로 재렌더링 결과가 바뀌지 않습니다.
+"""
+
+import hashlib
+import json
+import zlib
+from functools import lru_cache
+from typing import Any, Dict, Optional, Tuple
+
+from sqlalchemy import func
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+
+from models import EmailContent, EmailLog, db
+from services.message_builder import render_text_body, substitute_variables
+
+COMPRESSION_LEVEL = 6
+
+# 저장 용량 리포트 시 한 번에 가져오는 행 수
+REPORT_CHUNK_SIZE = 1000
+
+
+def _encode(subject: str, body: str, shared_data: Dict[str, Any]) -> bytes:
+    # 같은 입력이면 같은 바이트 → 같은 해시
+    return json.dumps(
+        {'subject': subject, 'body': body, 'data': shared_data},
+        ensure_ascii=False,
+        separators=(',', ':'),
+        default=str
+    ).encode('utf-8')
+
+
+def store_content(subject: str, body: str, shared_data: Dict[str, Any]) -> str:
+    """
+    템플릿 원문과 공통 변수를 저장하고 content_hash 반환 (커밋은 호출자)
+
+    이미 같은 해시가 있으면 다시 저장하지 않습니다.
+    """
+    raw = _encode(subject, body, shared_data)
+    content_hash = hashlib.sha256(raw).hexdigest()
+
+    table = EmailContent.__table__
+    values = {
+        'hash': content_hash,
+        'data': zlib.compress(raw, COMPRESSION_LEVEL),
+        'raw_size': len(raw)
+    }
+    dialect = db.engine.dialect.name
+
+    if dialect in ('mysql', 'mariadb'):
+        db.session.execute(mysql_insert(table).values(**values).prefix_with('IGNORE'))
+    elif dialect == 'sqlite':
+        db.session.execute(sqlite_insert(table).values(**values).on_conflict_do_nothing())
+    elif db.session.get(EmailContent, content_hash) is None:
+        db.session.add(EmailContent(**values))
+
+    return content_hash
+
+
+@lru_cache(maxsize=256)
+def load_content(content_hash: str) -> Tuple[str, str, Dict[str, Any]]:
+    """(제목 템플릿, 본문 템플릿, 공통 변수) - 내용이 불변이므로 프로세스 내 캐시"""
+    content = db.session.get(EmailContent, content_hash)
+    if content is None:
+        raise LookupError(f'Email content not found: {content_hash}')
+    payload = json.loads(zlib.decompress(content.data))
+    return payload['subject'], payload['body'], payload['data']
+
+
+def render_log(log: EmailLog) -> Tuple[str, str, Optional[str]]:
+    """
+    EmailLog의 실제 발송 제목/본문/텍스트 파트
+
+    중복 제거 이전에 저장된 행은 저장된 subject/body를 그대로 반환합니다
+    (텍스트 파트는 None → 발송 시 본문에서 변환).
+    """
+    if not log.content_hash:
+        return log.subject, log.body, None
+    return _render(log.content_hash, log.variables)
+
+
+def _render(content_hash: str, variables: Optional[Dict[str, Any]]) -> Tuple[str, str, Optional[str]]:
+    subject_template, body_template, shared_data = load_content(content_hash)
+    data = {**shared_data, **(variables or {})}
+    return (
+        substitute_variables(subject_template, data),
+        substitute_variables(body_template, data),
+        render_text_body(body_template, data)
+    )
+
+
+def storage_report(campaign_id: int) -> Dict[str, Any]:
+    """
+    캠페인 본문 저장 용량 비교
+
+    Returns:
+        Dict: rendered_bytes (행마다 렌더링된 제목/본문을 저장했을 때),
+              stored_bytes (실제 저장: 제목 + 참석자별 변수 + 공유 blob), 비율
+    """
+    rows = (db.session.query(EmailLog.subject, EmailLog.body, EmailLog.content_hash, EmailLog.variables)
+            .filter(EmailLog.campaign_id == campaign_id)
+            .yield_per(REPORT_CHUNK_SIZE))
+
+    messages = 0
+    rendered_bytes = 0
+    stored_bytes = 0
+    content_hashes = set()
+
+    for subject, body, content_hash, variables in rows:
+        messages += 1
+        stored_bytes += len(subject.encode('utf-8'))
+        if content_hash:
+            content_hashes.add(content_hash)
+            stored_bytes += len(json.dumps(variables or {}, ensure_ascii=False).encode('utf-8'))
+            full_subject, body, _ = _render(content_hash, variables)
+            rendered_bytes += len(full_subject.encode('utf-8'))
+        else:
+            stored_bytes += len((body or '').encode('utf-8'))
+            rendered_bytes += len(subject.encode('utf-8'))
+        rendered_bytes += len((body or '').encode('utf-8'))
+
+    if content_hashes:
+        stored_bytes += sum(
+            size for (size,) in db.session.query(func.length(EmailContent.data))
+            .filter(EmailContent.hash.in_(content_hashes))
+        )
+
+    return {
+        'campaign_id': campaign_id,
+        'messages': messages,
+        'shared_contents': len(content_hashes),
+        'rendered_bytes': rendered_bytes,
+        'stored_bytes': stored_bytes,
+        'ratio': round(stored_bytes / rendered_bytes, 4) if rendered_bytes else None
+    }
@@ -0,0 +1,329 @@
+"""
+DKIM 서명 (RFC 6376, rsa-sha256, relaxed/relaxed)
+
+메시지마다 개인 키 파싱과 정규화를 반복하지 않도록 비용이 큰 단계를 캐시합니다.
+
+- 개인 키: 파일 경로당 프로세스에서 한 번만 파싱 (load_private_key)
+- 헤더: 정규화 결과를 원본 헤더 필드 단위로 캐시 → From / MIME-Version / Content-Type처럼
+  템플릿마다 값이 같은 헤더는 한 번만 정규화하고 To 등 수신자별 헤더만 매번 계산
+- DKIM-Signature의 고정 태그(v/a/c/d/s/h)는 서명 헤더 목록별로 한 번만 생성
+- 본문 해시: 같은 본문(개인화 변수가 없는 본문, 재발송)은 한 번만 정규화/해시 (LRU)
+
+메시지 생성 쪽(message_builder)에서 multipart 경계 문자열을 고정해 두었으므로
+렌더링 결과가 같으면 직렬화된 본문도 같습니다.
+
+서명에는 cryptography 패키지가 필요합니다 (없으면 서명하지 않고 경고만 남김).
+워커 프로세스(render_pool)에서도 import하므로 서비스/Flask 모듈에 의존하지 않습니다.
+"""
+
+import base64
+import hashlib
+import logging
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from email.policy import compat32
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+try:
+    from cryptography.hazmat.primitives import hashes, serialization
+    from cryptography.hazmat.primitives.asymmetric import padding
+except ImportError:  # pragma: no cover - 선택 의존성
+    serialization = None
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SIGNED_HEADERS = ('from', 'to', 'subject', 'mime-version', 'content-type')
+
+# 정규화 캐시 크기 (헤더 필드 수 / 본문 수 기준)
+HEADER_CACHE_SIZE = 1024
+BODY_CACHE_SIZE = 256
+# 이보다 큰 본문은 해시 캐시에 보관하지 않음 (키로 본문 전체를 들고 있으므로)
+BODY_CACHE_MAX_BYTES = 256 * 1024
+
+# SMTP 전송 형식 (CRLF) 직렬화 정책 - 서명은 실제 전송되는 bytes 기준
+SMTP_POLICY = compat32.clone(linesep='\r\n')
+
+_WSP_RUN = re.compile(rb'[ \t]+')
+_LINE_END_SPACE = re.compile(rb' (?=\r\n|\Z)')
+_SIGNATURE_VALUE = re.compile(rb'(\bb=)[^;]*')
+
+
+def split_message(data: bytes) -> Tuple[bytes, bytes]:
+    """CRLF 메시지를 헤더 블록(마지막 CRLF 포함)과 본문으로 분리"""
+    index = data.find(b'\r\n\r\n')
+    if index < 0:
+        return data, b''
+    return data[:index + 2], data[index + 4:]
+
+
+def header_fields(headers: bytes) -> List[Tuple[bytes, bytes]]:
+    """헤더 블록을 (소문자 이름, 접힌 줄을 포함한 원본 필드) 목록으로 분리"""
+    fields: List[Tuple[bytes, bytes]] = []
+    for line in headers.split(b'\r\n'):
+        if not line:
+            continue
+        if line[:1] in (b' ', b'\t') and fields:
+            name, raw = fields[-1]
+            fields[-1] = (name, raw + b'\r\n' + line)
+        else:
+            fields.append((line.partition(b':')[0].strip().lower(), line))
+    return fields
+
+
+def _relaxed_header(field: bytes) -> bytes:
+    """relaxed 헤더 정규화: 이름 소문자, 접힌 줄 펼치기, 공백 압축 (CRLF로 끝남)"""
+    name, _, value = field.partition(b':')
+    value = _WSP_RUN.sub(b' ', value.replace(b'\r\n', b'')).strip(b' ')
+    return name.strip().lower() + b':' + value + b'\r\n'
+
+
+# 같은 헤더 필드(템플릿 고정 헤더)는 한 번만 정규화
+relaxed_header = lru_cache(maxsize=HEADER_CACHE_SIZE)(_relaxed_header)
+
+
+class RelaxedBodyHasher:
+    """
+    relaxed 본문 정규화 + SHA-256 (조각 단위)
+
+    조각은 줄 경계에서 나뉘어야 합니다 (마지막 조각 제외).
+    본문 끝의 빈 줄은 제거해야 하므로 빈 줄은 다음 내용이 나올 때까지 미뤄 둡니다.
+    """
+
+    def __init__(self):
+        self._hash = hashlib.sha256()
+        self._blank_lines = 0
+
+    def update(self, chunk, canonical: bool = False):
+        """
+        Args:
+            chunk: 본문 조각 (bytes / memoryview)
+            canonical: 이미 정규화된 조각 (base64 첨부처럼 줄 안 공백과 빈 줄이 없는 경우)
+        """
+        if canonical:
+            if self._blank_lines:
+                self._hash.update(b'\r\n' * self._blank_lines)
+                self._blank_lines = 0
+            self._hash.update(chunk)
+            return
+
+        chunk = _LINE_END_SPACE.sub(b'', _WSP_RUN.sub(b' ', bytes(chunk)))
+        if chunk and not chunk.endswith(b'\r\n'):
+            chunk += b'\r\n'
+        content = chunk.rstrip(b'\r\n')
+        if not content:
+            self._blank_lines += len(chunk) // 2
+            return
+        if self._blank_lines:
+            self._hash.update(b'\r\n' * self._blank_lines)
+        self._hash.update(content)
+        self._hash.update(b'\r\n')
+        self._blank_lines = (len(chunk) - len(content)) // 2 - 1
+
+    def digest(self) -> bytes:
+        """bh= 태그 값 (base64)"""
+        return base64.b64encode(self._hash.digest())
+
+
+def body_hash(body: bytes) -> bytes:
+    hasher = RelaxedBodyHasher()
+    hasher.update(body)
+    return hasher.digest()
+
+
+@lru_cache(maxsize=4)
+def load_private_key(path: str):
+    """PEM 개인 키 파싱 (경로당 프로세스에서 한 번)"""
+    with open(path, 'rb') as f:
+        return serialization.load_pem_private_key(f.read(), password=None)
+
+
+def _fold(value: bytes, width: int = 72) -> bytes:
+    return b'\r\n\t '.join(value[i:i + width] for i in range(0, len(value), width))
+
+
+class DKIMSigner:
+    """스레드 안전한 DKIM 서명기 (키/헤더/본문 해시 캐시)"""
+
+    def __init__(self,
+                 domain: str,
+                 selector: str,
+                 private_key,
+                 headers: Sequence[str] = DEFAULT_SIGNED_HEADERS,
+                 body_cache_size: int = BODY_CACHE_SIZE):
+        """
+        Args:
+            domain: 서명 도메인 (d=)
+            selector: DNS 선택자 (s=, <selector>._domainkey.<domain> TXT 레코드)
+            private_key: cryptography RSA 개인 키 (load_private_key)
+            headers: 서명할 헤더 이름 (메시지에 있는 것만 h=에 포함)
+        """
+        self.domain = domain
+        self.selector = selector
+        self.private_key = private_key
+        self.headers = tuple(name.strip().lower().encode('ascii') for name in headers if name.strip())
+        self.body_cache_size = body_cache_size
+
+        self._prefix = (
+            b'DKIM-Signature: v=1; a=rsa-sha256; c=relaxed/relaxed; d=%s; s=%s;'
+            % (domain.encode('ascii'), selector.encode('ascii'))
+        )
+        self._tags: Dict[Tuple[bytes, ...], bytes] = {}
+        self._body_hashes: 'OrderedDict[bytes, bytes]' = OrderedDict()
+        self._lock = threading.Lock()
+
+        # 통계 (벤치마크용)
+        self.body_hash_hits = 0
+        self.body_hash_misses = 0
+
+    def body_hash(self, body: bytes) -> bytes:
+        """본문 해시 (같은 본문은 캐시된 값 사용)"""
+        cacheable = len(body) <= BODY_CACHE_MAX_BYTES
+        if cacheable:
+            with self._lock:
+                cached = self._body_hashes.get(body)
+                if cached is not None:
+                    self._body_hashes.move_to_end(body)
+                    self.body_hash_hits += 1
+                    return cached
+
+        digest = body_hash(body)
+
+        with self._lock:
+            self.body_hash_misses += 1
+            if cacheable:
+                self._body_hashes[body] = digest
+                if len(self._body_hashes) > self.body_cache_size:
+                    self._body_hashes.popitem(last=False)
+        return digest
+
+    def _signed_tags(self, signed: Tuple[bytes, ...]) -> bytes:
+        tags = self._tags.get(signed)
+        if tags is None:
+            tags = self._tags[signed] = self._prefix + b'\r\n\th=' + b':'.join(signed) + b';'
+        return tags
+
+    def signature_header(self, headers: bytes, body_digest: bytes) -> bytes:
+        """
+        DKIM-Signature 헤더 생성 (CRLF로 끝남, 메시지 맨 앞에 붙임)
+
+        Args:
+            headers: 서명할 메시지의 헤더 블록 (CRLF)
+            body_digest: 본문 해시 (body_hash / RelaxedBodyHasher.digest)
+        """
+        fields = dict(header_fields(headers))  # 같은 이름이 여러 번이면 마지막 필드
+        signed = tuple(name for name in self.headers if name in fields)
+
+        header = self._signed_tags(signed) + b'\r\n\tt=%d; bh=%s;\r\n\tb=' % (int(time.time()), body_digest)
+        data = b''.join(relaxed_header(fields[name]) for name in signed) + _relaxed_header(header)[:-2]
+        signature = self.private_key.sign(data, padding.PKCS1v15(), hashes.SHA256())
+        return header + _fold(base64.b64encode(signature)) + b'\r\n'
+
+    def sign(self, data: bytes) -> bytes:
+        """직렬화된 CRLF 메시지에 DKIM-Signature 헤더를 붙여 반환"""
+        headers, body = split_message(data)
+        return self.signature_header(headers, self.body_hash(body)) + data
+
+    def sign_message(self, message) -> bytes:
+        """MIME 메시지를 SMTP 전송 형식(CRLF)으로 직렬화하고 서명"""
+        return self.sign(message.as_bytes(policy=SMTP_POLICY))
+
+    def sign_parts(self, headers: bytes, parts: Iterable[Tuple[object, bool]]) -> bytes:
+        """
+        조각으로 나뉜 본문의 서명 헤더 생성 (첨부 스트리밍 발송)
+
+        Args:
+            headers: 헤더 블록 (CRLF)
+            parts: (본문 조각, 정규화 완료 여부) - dot-stuffing 전 원본 기준
+        """
+        hasher = RelaxedBodyHasher()
+        for chunk, canonical in parts:
+            hasher.update(chunk, canonical)
+        return self.signature_header(headers, hasher.digest())
+
+    def public_record(self) -> str:
+        """DNS TXT 레코드 값 (<selector>._domainkey.<domain>)"""
+        public_der = self.private_key.public_key().public_bytes(
+            serialization.Encoding.DER, serialization.PublicFormat.SubjectPublicKeyInfo
+        )
+        return f"v=DKIM1; k=rsa; p={base64.b64encode(public_der).decode('ascii')}"
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                'body_hash_hits': self.body_hash_hits,
+                'body_hash_misses': self.body_hash_misses,
+                'cached_bodies': len(self._body_hashes),
+                'cached_headers': relaxed_header.cache_info().currsize
+            }
+
+
+def verify(data: bytes, public_key) -> bool:
+    """
+    첫 번째 DKIM-Signature 헤더 검증 (relaxed/relaxed, rsa-sha256)
+
+    DNS 없이 키 쌍을 확인하는 용도입니다 (운영 점검 / 벤치마크, dkimpy가 없을 때).
+    """
+    headers, body = split_message(data)
+    fields = header_fields(headers)
+    if not fields or fields[0][0] != b'dkim-signature':
+        return False
+
+    signature_field = fields[0][1]
+    tags = {}
+    for item in signature_field.partition(b':')[2].split(b';'):
+        name, _, value = item.partition(b'=')
+        if name.strip():
+            tags[name.strip()] = re.sub(rb'\s+', b'', value)
+    if tags.get(b'a') != b'rsa-sha256' or tags.get(b'c') != b'relaxed/relaxed':
+        return False
+    if body_hash(body) != tags.get(b'bh'):
+        return False
+
+    # h=의 각 이름은 아래쪽 필드부터 하나씩 사용
+    remaining = fields[1:]
+    signed = []
+    for name in tags.get(b'h', b'').lower().split(b':'):
+        for index in range(len(remaining) - 1, -1, -1):
+            if remaining[index][0] == name:
+                signed.append(_relaxed_header(remaining.pop(index)[1]))
+                break
+    data_to_verify = b''.join(signed) + _relaxed_header(_SIGNATURE_VALUE.sub(rb'\1', signature_field))[:-2]
+    try:
+        public_key.verify(base64.b64decode(tags.get(b'b', b'')), data_to_verify, padding.PKCS1v15(), hashes.SHA256())
+    except Exception:
+        return False
+    return True
+
+
+def open_signer(default_address: Optional[str] = None) -> Optional[DKIMSigner]:
+    """
+    환경 변수 설정으로 서명기 생성 (DKIM_PRIVATE_KEY_PATH가 없으면 None)
+
+    - DKIM_DOMAIN: 서명 도메인 (없으면 발신 주소의 도메인)
+    - DKIM_SELECTOR: DNS 선택자
+    - DKIM_SIGNED_HEADERS: 서명할 헤더 (콤마 구분)
+    """
+    path = os.getenv('DKIM_PRIVATE_KEY_PATH', '')
+    if not path:
+        return None
+    if serialization is None:
+        logger.warning("⚠️ cryptography 패키지가 없어 DKIM 서명을 사용하지 않습니다.")
+        return None
+
+    address = default_address if default_address is not None else os.getenv('EMAIL_ADDRESS', '')
+    domain = os.getenv('DKIM_DOMAIN', '') or address.rpartition('@')[2]
+    selector = os.getenv('DKIM_SELECTOR', 'default')
+    headers = os.getenv('DKIM_SIGNED_HEADERS', ','.join(DEFAULT_SIGNED_HEADERS)).split(',')
+    if not domain:
+        logger.error("❌ DKIM 서명 도메인이 없습니다 (DKIM_DOMAIN 또는 EMAIL_ADDRESS 필요).")
+        return None
+    try:
+        private_key = load_private_key(path)
+    except (OSError, ValueError) as e:
+        logger.error("❌ DKIM 개인 키를 읽을 수 없습니다 (%s): %s", path, e)
+        return None
+    return DKIMSigner(domain, selector, private_key, headers)
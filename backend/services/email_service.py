@@ -2,15 +2,39 @@
 이메일 발송 서비스
 """
 
+import atexit
+import logging
 import os
 import smtplib
-import ssl
-from email.mime.text import MIMEText
+import threading
+import time
+from contextlib import nullcontext
+from concurrent.futures import ThreadPoolExecutor
 from email.mime.multipart import MIMEMultipart
-from email.header import Header
 from typing import List, Dict, Any, Optional
 from datetime import datetime
-import re
+
+from models import SendLane
+from services.attachments import AttachmentError, AttachmentSet, MessageAttachment, message_segments
+from services.dkim_signer import DKIMSigner, open_signer
+from services.metrics import (
+    DKIM_SIGN_SECONDS, EMAILS_SENT, MIME_BUILD_SECONDS, OUTBOUND_SPOOL_DEPTH, TEMPLATE_RENDER_SECONDS
+)
+from services.log_pipeline import RECIPIENT_LOGGER
+from services.message_builder import (
+    build_mime_message, default_variables, recipient_variables, render_text_body, substitute_variables
+)
+from services.lanes import parse_reservations
+from services.recipient_validation import is_valid_email, preflight_recipients
+from services.outbound_spool import OutboundSpool, open_spool
+from services.rate_limiter import LaneRateLimiter
+from services.smtp_pool import SMTPSessionPool
+from services.spool_sink import SpoolSink
+from services.suppression import SuppressionList, SuppressionReason, open_suppression
+
+logger = logging.getLogger(__name__)
+# 수신자별 이벤트 (LOG_SAMPLE_EVERY 건당 1건만 출력)
+recipient_logger = logging.getLogger(RECIPIENT_LOGGER)
 
 
 class EmailService:
@@ -20,14 +44,50 @@ class EmailService:
         self.email_address = os.getenv('EMAIL_ADDRESS', '')
         self.email_password = os.getenv('EMAIL_PASSWORD', '')
         self.sender_name = os.getenv('SENDER_NAME', 'Email Automation System')
+        # STARTTLS 사용 여부 (로컬 테스트용 SMTP 서버에서는 false)
+        self.use_tls = os.getenv('SMTP_USE_TLS', 'true').lower() == 'true'
+        
+        # SMTP 세션 풀 크기 (= 대량 발송 시 동시 발송 스레드 수)
+        self.smtp_pool_size = int(os.getenv('SMTP_POOL_SIZE', '4'))
+        self.smtp_max_idle_seconds = float(os.getenv('SMTP_MAX_IDLE_SECONDS', '30'))
+        # 발송 레인별 예약 세션 수 (나머지는 우선순위 순으로 공유)
+        self.lane_sessions = parse_reservations(os.getenv('SMTP_LANE_RESERVED', 'transactional=1'))
+        # 초당 발송 한도 (0이면 제한 없음)와 레인별 예약 비율
+        self.rate_limit = float(os.getenv('SMTP_RATE_LIMIT', '0'))
+        self.lane_rates = parse_reservations(os.getenv('SMTP_RATE_RESERVED', 'transactional=0.1'), float)
+        # 대량 발송 렌더링 프로세스 수 (1이면 기존 순차 처리)
+        self.render_processes = int(os.getenv('BULK_RENDER_PROCESSES', '1'))
+        self.render_chunk_size = int(os.getenv('BULK_RENDER_CHUNK_SIZE', '200'))
+        self._smtp_pool: Optional[SMTPSessionPool] = None
+        self._pool_lock = threading.Lock()
         
         # 테스트 모드 (실제 이메일 발송하지 않음)
         self.test_mode = os.getenv('EMAIL_TEST_MODE', 'true').lower() == 'true'
+        # 테스트 모드 스풀: 지정하면 MIME 메시지를 끝까지 만들어 maildir/mbox에 기록
+        self.spool_path = os.getenv('EMAIL_SPOOL_PATH', '')
+        self.spool_format = os.getenv('EMAIL_SPOOL_FORMAT', 'maildir').lower()
+        self.spool_batch_size = int(os.getenv('EMAIL_SPOOL_BATCH_SIZE', '100'))
+        self._spool_sink: Optional[SpoolSink] = None
+        # 아웃바운드 스풀: 지정하면 실제 발송은 스풀에 기록하고 spool_daemon.py가 SMTP로 전달
+        self.outbound_spool: Optional[OutboundSpool] = None if self.test_mode else open_spool()
+        if self.outbound_spool is not None:
+            OUTBOUND_SPOOL_DEPTH.set_function(self.outbound_spool.depth)
+            atexit.register(self.outbound_spool.close)
+        # DKIM 서명 (DKIM_PRIVATE_KEY_PATH 지정 시, 키는 여기서 한 번만 파싱)
+        self.dkim_signer: Optional[DKIMSigner] = open_signer(self.email_address)
+        if self.dkim_signer is not None:
+            logger.info("🔏 DKIM 서명을 사용합니다 (d=%s, s=%s).", self.dkim_signer.domain, self.dkim_signer.selector)
+        # 발송 억제 목록 (영구 반송 / 수신 거부 / 스팸 신고) - 시작 시 메모리 인덱스로 로드
+        self.suppression: Optional[SuppressionList] = open_suppression()
         
-        if self.test_mode:
-            print("📧 이메일 서비스가 테스트 모드로 실행됩니다.")
+        if self.spooling:
+            logger.info("📧 이메일 서비스가 테스트 모드(%s 스풀: %s)로 실행됩니다.", self.spool_format, self.spool_path)
+        elif self.test_mode:
+            logger.info("📧 이메일 서비스가 테스트 모드로 실행됩니다.")
+        elif self.outbound_spool is not None:
+            logger.info("📧 이메일 서비스가 아웃바운드 스풀(%s)에 기록합니다.", self.outbound_spool.path)
         else:
-            print("📧 이메일 서비스가 실제 발송 모드로 실행됩니다.")
+            logger.info("📧 이메일 서비스가 실제 발송 모드로 실행됩니다.")
     
     def validate_email_config(self) -> bool:
         """이메일 설정 검증"""
@@ -39,20 +99,22 @@ class EmailService:
             'EMAIL_ADDRESS': self.email_address,
             'EMAIL_PASSWORD': self.email_password
         }
+        if self.outbound_spool is not None:
+            # 스풀에 기록만 하는 프로세스는 SMTP 접속 정보가 필요 없음 (spool_daemon.py에서 검증)
+            required_configs = {'EMAIL_ADDRESS': self.email_address}
         
         missing_configs = [key for key, value in required_configs.items() if not value]
         
         if missing_configs:
-            print(f"❌ 필수 이메일 설정이 없습니다: {', '.join(missing_configs)}")
+            logger.error("❌ 필수 이메일 설정이 없습니다: %s", ', '.join(missing_configs))
             return False
         
-        print("✅ 이메일 설정이 완료되었습니다.")
+        logger.debug("✅ 이메일 설정이 완료되었습니다.")
         return True
     
     def validate_email_address(self, email: str) -> bool:
-        """이메일 주소 형식 검증"""
-        pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        return re.match(pattern, email) is not None
+        """이메일 주소 형식 검증 (미리 컴파일된 패턴 사용)"""
+        return is_valid_email(email)
     
     def process_template(self, template: str, data: Dict[str, Any]) -> str:
         """
@@ -65,31 +127,180 @@ class EmailService:
         Returns:
             str: 처리된 문자열
         """
-        processed = template
-        
-        # 기본 변수들
-        default_data = {
-            'current_date': datetime.now().strftime('%Y년 %m월 %d일'),
-            'current_time': datetime.now().strftime('%H:%M'),
-            'sender_name': self.sender_name
-        }
-        
         # 데이터 병합 (사용자 데이터가 우선)
-        all_data = {**default_data, **data}
+        all_data = {**default_variables(self.sender_name), **data}
         
         # 변수 치환
-        for key, value in all_data.items():
-            placeholder = f'{{{{{key}}}}}'
-            processed = processed.replace(placeholder, str(value))
+        return substitute_variables(template, all_data)
+    
+    @property
+    def from_header(self) -> str:
+        return f"{self.sender_name} <{self.email_address}>"
+    
+    @property
+    def smtp_pool(self) -> SMTPSessionPool:
+        """인증된 SMTP 세션을 재사용하는 풀 (최초 사용 시 생성)"""
+        if self._smtp_pool is None:
+            with self._pool_lock:
+                if self._smtp_pool is None:
+                    self._smtp_pool = SMTPSessionPool(
+                        self.smtp_server,
+                        self.smtp_port,
+                        self.email_address,
+                        self.email_password,
+                        use_tls=self.use_tls,
+                        size=self.smtp_pool_size,
+                        max_idle_seconds=self.smtp_max_idle_seconds,
+                        reserved=self.lane_sessions,
+                        rate_limiter=LaneRateLimiter(self.rate_limit, self.lane_rates) if self.rate_limit > 0 else None
+                    )
+        return self._smtp_pool
+    
+    @property
+    def spooling(self) -> bool:
+        """테스트 모드에서 디스크 스풀로 발송하는지 여부"""
+        return self.test_mode and bool(self.spool_path)
+    
+    @property
+    def spool_sink(self) -> SpoolSink:
+        """maildir/mbox 스풀 싱크 (최초 사용 시 생성, 종료 시 남은 버퍼 기록)"""
+        if self._spool_sink is None:
+            with self._pool_lock:
+                if self._spool_sink is None:
+                    self._spool_sink = SpoolSink(self.spool_path, self.spool_format, self.spool_batch_size)
+                    atexit.register(self._spool_sink.close)
+        return self._spool_sink
+    
+    @property
+    def transport(self):
+        """발송 백엔드 - 테스트 스풀 싱크, 아웃바운드 스풀 또는 SMTP 세션 풀 (같은 발송 메서드 제공)"""
+        if self.spooling:
+            return self.spool_sink
+        if self.outbound_spool is not None:
+            return self.outbound_spool
+        return self.smtp_pool
+    
+    @property
+    def buffers_deliveries(self) -> bool:
+        """발송 결과가 flush_spool() 이후에 디스크에 확정되는지 여부"""
+        return self.spooling or self.outbound_spool is not None
+    
+    @property
+    def _sent_label(self) -> str:
+        if self.spooling:
+            return 'spooled'
+        return 'queued' if self.outbound_spool is not None else 'sent'
+    
+    def flush_spool(self):
+        """스풀 버퍼에 남은 메시지 기록 (스풀을 쓰지 않으면 아무것도 하지 않음)"""
+        if self._spool_sink is not None:
+            self._spool_sink.flush()
+        if self.outbound_spool is not None:
+            self.outbound_spool.flush()
+    
+    def build_message(self,
+                      recipient_email: str,
+                      subject: str,
+                      body: str,
+                      recipient_name: str = '',
+                      text_body: Optional[str] = None) -> MIMEMultipart:
+        """
+        MIME 메시지 생성
+        
+        Args:
+            recipient_email: 수신자 이메일
+            subject: 처리된 이메일 제목
+            body: 처리된 이메일 본문
+            recipient_name: 수신자 이름
+            text_body: 처리된 텍스트 파트 (HTML 본문일 때)
         
-        return processed
+        Returns:
+            MIMEMultipart: 발송할 메시지
+        """
+        with MIME_BUILD_SECONDS.time():
+            return build_mime_message(self.from_header, recipient_email, subject, body, recipient_name, text_body)
+    
+    def _deliver(self, message: MIMEMultipart, recipient_email: str,
+                 attachments: Optional[List[MessageAttachment]] = None,
+                 lane: SendLane = SendLane.TRANSACTIONAL):
+        """풀에서 레인의 SMTP 세션을 빌려 발송 (연결/TLS/로그인은 세션 생성 시에만, 스풀 모드는 디스크 기록)"""
+        signer = self.dkim_signer
+        if attachments:
+            # 첨부는 메시지 객체에 넣지 않고 인코딩된 조각을 DATA로 바로 전송
+            with DKIM_SIGN_SECONDS.time() if signer is not None else nullcontext():
+                segments = message_segments(message, attachments, signer)
+            self.transport.send_stream(self.email_address, [recipient_email], segments, lane=lane)
+        elif signer is not None:
+            # 서명은 실제 전송되는 bytes 기준이므로 직렬화해서 그대로 발송
+            with DKIM_SIGN_SECONDS.time():
+                data = signer.sign_message(message)
+            self.transport.sendmail(self.email_address, [recipient_email], data, lane=lane)
+        else:
+            self.transport.send_message(message, lane=lane)
+    
+    @staticmethod
+    def _delivery_error(error: Exception, recipient_email: str) -> str:
+        """발송 예외를 사용자용 오류 메시지로 변환"""
+        if isinstance(error, smtplib.SMTPAuthenticationError):
+            return 'SMTP 인증 실패. 이메일 주소와 비밀번호를 확인하세요.'
+        if isinstance(error, smtplib.SMTPRecipientsRefused):
+            return f'수신자 이메일 주소가 거부되었습니다: {recipient_email}'
+        if isinstance(error, AttachmentError):
+            return f'첨부 파일 오류: {str(error)}'
+        return f'이메일 발송 중 오류가 발생했습니다: {str(error)}'
+    
+    def suppressed_reason(self, recipient_email: str) -> Optional[SuppressionReason]:
+        """억제된 주소면 사유 반환 (억제 목록을 쓰지 않거나 억제되지 않았으면 None)"""
+        if self.suppression is None:
+            return None
+        return self.suppression.reason(recipient_email)
+    
+    def suppressed_result(self, recipient_email: str, reason: SuppressionReason) -> Dict[str, Any]:
+        """억제된 주소에 대한 발송 결과 (발송하지 않음)"""
+        EMAILS_SENT.labels('suppressed').inc()
+        return {
+            'success': False,
+            'error': f'발송 억제된 주소입니다 ({reason.name.lower()}): {recipient_email}',
+            'recipient': recipient_email,
+            'suppressed': True
+        }
+    
+    def _success(self, recipient_email: str, subject: str) -> Dict[str, Any]:
+        """발송 성공 결과 - 스풀에 기록/등록만 된 경우 test_mode / spooled 표시"""
+        EMAILS_SENT.labels(self._sent_label).inc()
+        recipient_logger.info("✅ 이메일 발송 성공: %s", recipient_email, extra={'recipient': recipient_email})
+        result = {
+            'success': True,
+            'message': '이메일이 성공적으로 발송되었습니다.',
+            'recipient': recipient_email,
+            'subject': subject,
+            'sent_at': datetime.now().isoformat()
+        }
+        if self.spooling:
+            result.update({'message': '테스트 모드: 이메일이 스풀에 기록되었습니다.', 'test_mode': True})
+        elif self.outbound_spool is not None:
+            result.update({'message': '이메일이 발송 스풀에 등록되었습니다.', 'spooled': True})
+        return result
+    
+    def _failure(self, error: Exception, recipient_email: str) -> Dict[str, Any]:
+        error_msg = self._delivery_error(error, recipient_email)
+        EMAILS_SENT.labels('failed').inc()
+        recipient_logger.warning("❌ %s", error_msg, extra={'recipient': recipient_email})
+        return {
+            'success': False,
+            'error': error_msg,
+            'recipient': recipient_email
+        }
     
     def send_email(self, 
                    recipient_email: str, 
                    subject: str, 
                    body: str, 
                    recipient_name: str = '', 
-                   template_data: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+                   template_data: Optional[Dict[str, Any]] = None,
+                   attachments: Optional[List[MessageAttachment]] = None,
+                   text_body: Optional[str] = None,
+                   lane: SendLane = SendLane.TRANSACTIONAL) -> Dict[str, Any]:
         """
         단일 이메일 발송
         
@@ -99,12 +310,16 @@ class EmailService:
             body: 이메일 본문
             recipient_name: 수신자 이름
             template_data: 템플릿 변수 데이터
+            attachments: 첨부 목록 (AttachmentSet.for_recipient)
+            text_body: 처리된 텍스트 파트 (없으면 HTML 본문 템플릿에서 캐시된 변환 사용)
+            lane: 발송 레인 (대량 발송/워커는 bulk 또는 reminder)
         
         Returns:
             Dict: 발송 결과
         """
         # 이메일 주소 검증
         if not self.validate_email_address(recipient_email):
+            EMAILS_SENT.labels('invalid').inc()
             return {
                 'success': False,
                 'error': f'잘못된 이메일 주소: {recipient_email}',
@@ -116,21 +331,28 @@ class EmailService:
             template_data['name'] = recipient_name or recipient_email.split('@')[0]
             template_data['email'] = recipient_email
             
-            subject = self.process_template(subject, template_data)
-            body = self.process_template(body, template_data)
+            with TEMPLATE_RENDER_SECONDS.time():
+                all_data = {**default_variables(self.sender_name), **template_data}
+                # 텍스트 파트는 본문 템플릿 단위로 캐시된 변환 결과에 변수만 채움
+                text_body = render_text_body(body, all_data)
+                subject = substitute_variables(subject, all_data)
+                body = substitute_variables(body, all_data)
         
-        # 테스트 모드
-        if self.test_mode:
-            print(f"📧 [테스트] 이메일 발송 시뮬레이션")
-            print(f"   수신자: {recipient_name} <{recipient_email}>")
-            print(f"   제목: {subject}")
-            print(f"   본문 미리보기: {body[:100]}...")
+        # 테스트 모드 (스풀을 지정하면 아래 실제 발송 경로로 MIME 생성 후 스풀에 기록)
+        if self.test_mode and not self.spooling:
+            if recipient_logger.isEnabledFor(logging.DEBUG):
+                recipient_logger.debug(
+                    "📧 [테스트] 이메일 발송 시뮬레이션: %s <%s> 제목=%s 본문 미리보기=%s...",
+                    recipient_name, recipient_email, subject, body[:100]
+                )
             
+            EMAILS_SENT.labels('simulated').inc()
             return {
                 'success': True,
                 'message': '테스트 모드에서 성공적으로 시뮬레이션 되었습니다.',
                 'recipient': recipient_email,
                 'subject': subject,
+                'attachments': [attachment.filename for attachment in attachments or []],
                 'test_mode': True
             }
         
@@ -144,71 +366,20 @@ class EmailService:
                     'recipient': recipient_email
                 }
             
-            # MIME 메시지 생성
-            message = MIMEMultipart('alternative')
-            message['From'] = f"{self.sender_name} <{self.email_address}>"
-            message['To'] = f"{recipient_name} <{recipient_email}>" if recipient_name else recipient_email
-            message['Subject'] = Header(subject, 'utf-8')
-            
-            # 본문 추가 (HTML과 텍스트 모두 지원)
-            if '<html>' in body.lower() or '<p>' in body.lower():
-                # HTML 이메일
-                html_part = MIMEText(body, 'html', 'utf-8')
-                message.attach(html_part)
-            else:
-                # 텍스트 이메일
-                text_part = MIMEText(body, 'plain', 'utf-8')
-                message.attach(text_part)
-            
-            # SMTP 연결 및 발송
-            context = ssl.create_default_context()
-            
-            with smtplib.SMTP(self.smtp_server, self.smtp_port) as server:
-                server.starttls(context=context)
-                server.login(self.email_address, self.email_password)
-                server.send_message(message)
-            
-            print(f"✅ 이메일 발송 성공: {recipient_email}")
-            
-            return {
-                'success': True,
-                'message': '이메일이 성공적으로 발송되었습니다.',
-                'recipient': recipient_email,
-                'subject': subject,
-                'sent_at': datetime.now().isoformat()
-            }
-            
-        except smtplib.SMTPAuthenticationError:
-            error_msg = 'SMTP 인증 실패. 이메일 주소와 비밀번호를 확인하세요.'
-            print(f"❌ {error_msg}")
-            return {
-                'success': False,
-                'error': error_msg,
-                'recipient': recipient_email
-            }
-            
-        except smtplib.SMTPRecipientsRefused:
-            error_msg = f'수신자 이메일 주소가 거부되었습니다: {recipient_email}'
-            print(f"❌ {error_msg}")
-            return {
-                'success': False,
-                'error': error_msg,
-                'recipient': recipient_email
-            }
+            # MIME 메시지 생성 및 SMTP 발송
+            message = self.build_message(recipient_email, subject, body, recipient_name, text_body)
+            self._deliver(message, recipient_email, attachments, lane)
+            return self._success(recipient_email, subject)
             
         except Exception as e:
-            error_msg = f'이메일 발송 중 오류가 발생했습니다: {str(e)}'
-            print(f"❌ {error_msg}")
-            return {
-                'success': False,
-                'error': error_msg,
-                'recipient': recipient_email
-            }
+            return self._failure(e, recipient_email)
     
     def send_bulk_emails(self, 
                         attendees: List[Dict[str, Any]], 
                         email_template: Dict[str, str],
-                        template_data: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+                        template_data: Optional[Dict[str, Any]] = None,
+                        attachments: Optional[List[Dict[str, Any]]] = None,
+                        lane: SendLane = SendLane.BULK) -> Dict[str, Any]:
         """
         대량 이메일 발송
         
@@ -216,44 +387,50 @@ class EmailService:
             attendees: 참석자 정보 리스트
             email_template: 이메일 템플릿 (subject, body 포함)
             template_data: 공통 템플릿 데이터
+            attachments: 첨부 구성 (AttachmentSet.from_spec 형식)
+            lane: 발송 레인 (bulk 또는 reminder)
         
         Returns:
-            Dict: 대량 발송 결과
+            Dict: 대량 발송 결과 (사전 검증 리포트 포함)
+        
+        Raises:
+            AttachmentError: 공통 첨부 파일이 없거나 경로가 잘못된 경우
         """
+        # 사전 검증: 잘못된 주소와 중복 주소는 발송 큐에 넣지 않음
+        recipients, preflight = preflight_recipients(attendees)
+        
+        # 억제 목록: 영구 반송 / 수신 거부 / 스팸 신고 주소 제외 (다른 프로세스의 새 기록 먼저 반영)
+        suppressed = []
+        if self.suppression is not None:
+            self.suppression.refresh()
+            recipients, suppressed = self.suppression.filter(recipients)
+            if suppressed:
+                EMAILS_SENT.labels('suppressed').inc(len(suppressed))
+        preflight['suppressed_count'] = len(suppressed)
+        preflight['suppressed'] = suppressed
+        
         results = {
             'total': len(attendees),
             'success_count': 0,
             'failure_count': 0,
+            'skipped_count': len(attendees) - len(recipients),
+            'preflight': preflight,
             'results': [],
             'started_at': datetime.now().isoformat()
         }
         
-        for i, attendee in enumerate(attendees, 1):
-            print(f"📧 이메일 발송 중... ({i}/{len(attendees)}) - {attendee.get('email', 'Unknown')}")
-            
-            # 개별 템플릿 데이터 생성
-            individual_data = template_data.copy() if template_data else {}
-            individual_data.update({
-                'name': attendee.get('name', '참석자'),
-                'email': attendee.get('email', ''),
-                'company': attendee.get('company', ''),
-                'position': attendee.get('position', ''),
-                'attendee_type': attendee.get('attendee_type', 'attendee')
-            })
-            
-            # 개별 이메일 발송
-            result = self.send_email(
-                recipient_email=attendee.get('email', ''),
-                subject=email_template.get('subject', ''),
-                body=email_template.get('body', ''),
-                recipient_name=attendee.get('name', ''),
-                template_data=individual_data
-            )
-            
-            result['attendee_id'] = attendee.get('id')
-            result['attendee_name'] = attendee.get('name')
-            results['results'].append(result)
-            
+        # 공통 첨부는 여기서 한 번만 인코딩되어 모든 수신자가 공유
+        with AttachmentSet.from_spec(attachments) as attachment_set:
+            if attachment_set:
+                results['results'] = self._send_bulk_sequential(recipients, email_template, template_data, lane,
+                                                                attachment_set)
+            elif self._use_render_pool(len(recipients)):
+                results['results'] = self._send_bulk_parallel(recipients, email_template, template_data, lane)
+            else:
+                results['results'] = self._send_bulk_sequential(recipients, email_template, template_data, lane)
+        self.flush_spool()
+        
+        for result in results['results']:
             if result['success']:
                 results['success_count'] += 1
             else:
@@ -262,13 +439,128 @@ class EmailService:
         results['completed_at'] = datetime.now().isoformat()
         results['duration'] = f"{results['success_count'] + results['failure_count']} emails processed"
         
-        print(f"📊 대량 이메일 발송 완료:")
-        print(f"   총 {results['total']}명 대상")
-        print(f"   성공: {results['success_count']}명")
-        print(f"   실패: {results['failure_count']}명")
+        logger.info(
+            "📊 대량 이메일 발송 완료: 총 %d명 대상, 성공 %d명, 실패 %d명, 사전 검증 제외 %d명",
+            results['total'], results['success_count'], results['failure_count'], results['skipped_count'],
+            extra={
+                'total': results['total'],
+                'success_count': results['success_count'],
+                'failure_count': results['failure_count'],
+                'skipped_count': results['skipped_count']
+            }
+        )
         
         return results
 
+    
+    def _use_render_pool(self, recipient_count: int) -> bool:
+        """렌더링 프로세스 풀 사용 여부 (실제 발송/스풀 + 청크 1개 이상 분량일 때만)"""
+        return (
+            (not self.test_mode or self.spooling)
+            and self.render_processes > 1
+            and recipient_count > self.render_chunk_size
+        )
+    
+    def _send_bulk_sequential(self,
+                              recipients: List[Dict[str, Any]],
+                              email_template: Dict[str, str],
+                              template_data: Optional[Dict[str, Any]],
+                              lane: SendLane,
+                              attachment_set: Optional[AttachmentSet] = None) -> List[Dict[str, Any]]:
+        """수신자별로 렌더링과 발송을 차례로 수행"""
+        results = []
+        
+        for i, attendee in enumerate(recipients, 1):
+            recipient_logger.info("📧 이메일 발송 중... (%d/%d) - %s", i, len(recipients), attendee.get('email', 'Unknown'))
+            
+            # 개별 이메일 발송 (수신자별 처리 시간 기록)
+            started = time.perf_counter()
+            variables = recipient_variables(attendee, template_data)
+            try:
+                attachments = attachment_set.for_recipient({**variables, 'id': attendee.get('id')}) if attachment_set else None
+            except AttachmentError as e:
+                result = self._failure(e, attendee.get('email', ''))
+            else:
+                result = self.send_email(
+                    recipient_email=attendee.get('email', ''),
+                    subject=email_template.get('subject', ''),
+                    body=email_template.get('body', ''),
+                    recipient_name=attendee.get('name', ''),
+                    template_data=variables,
+                    attachments=attachments,
+                    lane=lane
+                )
+            
+            result['duration_ms'] = round((time.perf_counter() - started) * 1000, 3)
+            result['attendee_id'] = attendee.get('id')
+            result['attendee_name'] = attendee.get('name')
+            results.append(result)
+        
+        return results
+    
+    def _send_bulk_parallel(self,
+                            recipients: List[Dict[str, Any]],
+                            email_template: Dict[str, str],
+                            template_data: Optional[Dict[str, Any]],
+                            lane: SendLane) -> List[Dict[str, Any]]:
+        """
+        렌더링 프로세스 풀 + 발송 스레드 파이프라인
+        
+        프로세스 풀이 메시지를 bytes로 직렬화해 청크 단위로 넘기면
+        SMTP 세션 풀 크기만큼의 스레드가 재사용 세션으로 발송합니다.
+        """
+        from services.render_pool import RenderPool
+        
+        if not self.validate_email_config():
+            return [
+                {
+                    'success': False,
+                    'error': '이메일 설정이 올바르지 않습니다.',
+                    'recipient': attendee.get('email', ''),
+                    'attendee_id': attendee.get('id'),
+                    'attendee_name': attendee.get('name')
+                }
+                for attendee in recipients
+            ]
+        
+        results: List[Optional[Dict[str, Any]]] = [None] * len(recipients)
+        
+        def deliver(index: int, attendee: Dict[str, Any], recipient_email: str,
+                    subject: str, data: bytes, render_ms: float):
+            started = time.perf_counter()
+            try:
+                self.transport.sendmail(self.email_address, [recipient_email], data, lane=lane)
+                result = self._success(recipient_email, subject)
+            except Exception as e:
+                result = self._failure(e, recipient_email)
+            
+            result['duration_ms'] = round(render_ms + (time.perf_counter() - started) * 1000, 3)
+            result['attendee_id'] = attendee.get('id')
+            result['attendee_name'] = attendee.get('name')
+            results[index] = result
+        
+        # 발송 대기 메시지 수 제한: 릴레이가 느리면 여기서 막혀 렌더링 청크 소비가 멈춤
+        # (RenderPool도 대기 청크 수를 제한하므로 렌더링 프로세스까지 함께 멈춤)
+        in_flight = threading.BoundedSemaphore(self.smtp_pool_size * 2 + self.render_chunk_size)
+        
+        def deliver_bounded(*item):
+            try:
+                deliver(*item)
+            finally:
+                in_flight.release()
+        
+        with RenderPool(email_template, template_data, self.sender_name, self.from_header,
+                        processes=self.render_processes, chunk_size=self.render_chunk_size) as pool, \
+                ThreadPoolExecutor(max_workers=self.smtp_pool_size, thread_name_prefix='smtp-deliver') as senders:
+            futures = []
+            for chunk in pool.render(recipients):
+                for item in chunk:
+                    in_flight.acquire()
+                    futures.append(senders.submit(deliver_bounded, *item))
+            for future in futures:
+                future.result()
+        
+        return results
 
 # 전역 인스턴스
 email_service = EmailService()
@@ -0,0 +1,173 @@
+"""
+이메일 발송 통계 롤업
+
+email_logs 전체를 GROUP BY 하지 않도록 시간(hour) × 상태별 건수를
+email_hourly_stats 테이블에 증분으로 누적합니다.
+
+- 큐 등록 시 pending += n (등록 시각 기준)
+- 발송 결과 기록 시 sent/failed += 1 (처리 시각 기준), 캠페인 취소 시 cancelled += n
+- 현재 pending 건수 = 누적 등록 - 누적 sent - 누적 failed - 누적 cancelled
+
+record()는 커밋하지 않으므로 EmailLog 변경과 같은 트랜잭션에서 호출합니다.
+롤업 도입 전부터 있던 email_logs는 backfill()로 한 번 채웁니다
+(flask --app app backfill-email-stats).
+"""
+
+from datetime import datetime, timedelta
+from typing import Any, Dict, Optional
+
+from sqlalchemy import func, update
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+
+from models import EmailHourlyStat, EmailLog, EmailStatus, db
+
+# 큐를 거친 상태 (예약 행은 등록 시 집계하지 않음)
+QUEUED_STATUSES = (EmailStatus.PENDING, EmailStatus.SENT, EmailStatus.FAILED, EmailStatus.CANCELLED)
+
+# 조회 기간 기본값 / 최대값 (시간별 행 수 제한)
+DEFAULT_RANGE_HOURS = 24
+MAX_RANGE_HOURS = 24 * 31
+
+
+def hour_bucket(moment: datetime) -> datetime:
+    """시각을 시간 단위로 내림"""
+    return moment.replace(minute=0, second=0, microsecond=0)
+
+
+def record(status: EmailStatus, count: int = 1, at: Optional[datetime] = None):
+    """시간별 상태 카운터 증가 (UPSERT, 커밋은 호출자)"""
+    if count <= 0:
+        return
+
+    hour = hour_bucket(at or datetime.utcnow())
+    table = EmailHourlyStat.__table__
+    values = {'hour': hour, 'status': status, 'count': count}
+    dialect = db.engine.dialect.name
+
+    if dialect in ('mysql', 'mariadb'):
+        statement = mysql_insert(table).values(**values)
+        statement = statement.on_duplicate_key_update(count=table.c.count + count)
+    elif dialect == 'sqlite':
+        statement = sqlite_insert(table).values(**values)
+        statement = statement.on_conflict_do_update(
+            index_elements=['hour', 'status'],
+            set_={'count': table.c.count + count}
+        )
+    else:
+        result = db.session.execute(
+            update(EmailHourlyStat)
+            .where(EmailHourlyStat.hour == hour, EmailHourlyStat.status == status)
+            .values(count=EmailHourlyStat.count + count)
+            .execution_options(synchronize_session=False)
+        )
+        if result.rowcount:
+            return
+        statement = table.insert().values(**values)
+
+    db.session.execute(statement)
+
+
+def _hour_expression(column):
+    """DB별 시간 단위 내림 식 (GROUP BY용)"""
+    dialect = db.engine.dialect.name
+    if dialect == 'sqlite':
+        return func.strftime('%Y-%m-%d %H:00:00', column)
+    if dialect in ('mysql', 'mariadb'):
+        return func.date_format(column, '%Y-%m-%d %H:00:00')
+    return func.date_trunc('hour', column)
+
+
+def backfill() -> Dict[str, int]:
+    """
+    email_logs 전체로 email_hourly_stats 재구성 (롤업 도입 후 한 번 실행), 상태별 건수 반환
+
+    기존 롤업 행을 지우고 시간 × 상태로 GROUP BY 한 결과를 같은 트랜잭션에서 다시 씁니다.
+    - pending(등록): 큐를 거친 모든 행, created_at 기준
+    - sent: sent_at 기준 (없으면 created_at)
+    - failed / cancelled: 처리 시각이 남지 않으므로 created_at 기준
+
+    실행 중 기록되는 증분과 겹치지 않도록 워커를 멈춘 상태에서 실행합니다.
+    """
+    counts: Dict[tuple, int] = {}
+
+    def collect(rows, status=None):
+        for row in rows:
+            hour, count = row[0], row[-1]
+            if hour is None:
+                continue
+            if not isinstance(hour, datetime):
+                hour = datetime.fromisoformat(hour)
+            key = (hour, status or row[1])
+            counts[key] = counts.get(key, 0) + int(count)
+
+    queued_hour = _hour_expression(EmailLog.created_at)
+    collect(db.session.query(queued_hour, func.count(EmailLog.id))
+            .filter(EmailLog.status.in_(QUEUED_STATUSES))
+            .group_by(queued_hour), EmailStatus.PENDING)
+
+    # sent_at은 발송 성공 행에만 있음
+    result_hour = _hour_expression(func.coalesce(EmailLog.sent_at, EmailLog.created_at))
+    collect(db.session.query(result_hour, EmailLog.status, func.count(EmailLog.id))
+            .filter(EmailLog.status.in_(QUEUED_STATUSES[1:]))
+            .group_by(result_hour, EmailLog.status))
+
+    db.session.query(EmailHourlyStat).delete(synchronize_session=False)
+    if counts:
+        db.session.execute(EmailHourlyStat.__table__.insert(), [
+            {'hour': hour, 'status': status, 'count': count} for (hour, status), count in counts.items()
+        ])
+    db.session.commit()
+
+    totals = {status.value: 0 for status in QUEUED_STATUSES}
+    for (_, status), count in counts.items():
+        totals[status.value] += count
+    return totals
+
+
+def summary(since: Optional[datetime] = None, until: Optional[datetime] = None) -> Dict[str, Any]:
+    """
+    상태별 전체 건수와 기간 내 시간별 건수
+
+    Args:
+        since: 시작 시각 (기본: until - 24시간)
+        until: 종료 시각 (기본: 현재)
+
+    Raises:
+        ValueError: 기간이 잘못되었거나 MAX_RANGE_HOURS를 넘는 경우
+    """
+    until = until or datetime.utcnow()
+    since = since or until - timedelta(hours=DEFAULT_RANGE_HOURS)
+    if since > until:
+        raise ValueError('since must be earlier than until')
+    if until - since > timedelta(hours=MAX_RANGE_HOURS):
+        raise ValueError(f'Range must be at most {MAX_RANGE_HOURS} hours')
+
+    # 상태별 누적 (시간 × 상태 행 수만큼만 합산)
+    totals = {status: 0 for status in EmailStatus}
+    for status, count in (db.session.query(EmailHourlyStat.status, func.sum(EmailHourlyStat.count))
+                          .group_by(EmailHourlyStat.status)):
+        totals[status] = int(count or 0)
+
+    by_status = {status.value: totals[status] for status in EmailStatus}
+    by_status['pending'] = max(
+        0, totals[EmailStatus.PENDING] - totals[EmailStatus.SENT] - totals[EmailStatus.FAILED]
+        - totals[EmailStatus.CANCELLED]
+    )
+
+    # 시간별 (pending은 해당 시간에 등록된 건수)
+    hours: Dict[datetime, Dict[str, Any]] = {}
+    rows = (EmailHourlyStat.query
+            .filter(EmailHourlyStat.hour >= hour_bucket(since), EmailHourlyStat.hour <= until)
+            .order_by(EmailHourlyStat.hour))
+    for row in rows:
+        bucket = hours.setdefault(row.hour, {'hour': row.hour.isoformat(), 'queued': 0, 'sent': 0, 'failed': 0})
+        key = 'queued' if row.status == EmailStatus.PENDING else row.status.value
+        bucket[key] = bucket.get(key, 0) + row.count
+
+    return {
+        'by_status': by_status,
+        'by_hour': list(hours.values()),
+        'since': since.isoformat(),
+        'until': until.isoformat()
+    }
@@ -2,21 +2,160 @@
 Google Sheets API 연동 서비스
 """
 
+import logging
 import os
 import json
-from typing import List, Dict, Any, Optional
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import List, Dict, Any, Iterable, Iterator, Optional, Tuple
+import httplib2
 from google.oauth2.credentials import Credentials
 from google.oauth2 import service_account
-from googleapiclient.discovery import build
+from google_auth_httplib2 import AuthorizedHttp
+from googleapiclient.discovery import build, build_from_document
+from googleapiclient.discovery_cache import get_static_doc
 from googleapiclient.errors import HttpError
 
+from services.metrics import SHEETS_STAGE_SECONDS
+from services.recipient_validation import is_valid_email, normalize_email
+
+logger = logging.getLogger(__name__)
+
+# 여러 스프레드시트를 동시에 읽을 때 최대 스레드 수
+DEFAULT_IMPORT_WORKERS = 4
+# 재사용할 keep-alive HTTP 연결 수 (동시 요청이 더 많으면 임시 연결을 만들고 반납 시 닫음)
+DEFAULT_HTTP_POOL_SIZE = 8
+DEFAULT_HTTP_TIMEOUT = 30
+
+# 응답 필드 제한 (fields=) - 필요한 필드만 내려받음
+VALUES_FIELDS = 'values'
+BATCH_VALUES_FIELDS = 'valueRanges(range,values)'
+ACCESS_CHECK_FIELDS = 'spreadsheetId,properties.title'
+
+
+@lru_cache(maxsize=None)
+def _discovery_document(service_name: str = 'sheets', version: str = 'v4') -> Optional[str]:
+    """google-api-python-client에 포함된 정적 discovery 문서 (네트워크 조회 없음)"""
+    return get_static_doc(service_name, version)
+
+
+class HttpPool:
+    """
+    스레드 간 공유하는 keep-alive HTTP 연결 풀
+    
+    httplib2.Http는 스레드 안전하지 않으므로 요청마다 연결 하나를 빌려 쓰고 반납합니다.
+    반납된 연결은 TCP/TLS 연결을 유지한 채 다음 요청(다른 Flask 스레드 포함)이 재사용합니다.
+    """
+    
+    def __init__(self, credentials, size: int = DEFAULT_HTTP_POOL_SIZE, timeout: float = DEFAULT_HTTP_TIMEOUT):
+        self.credentials = credentials
+        self.size = size
+        self.timeout = timeout
+        self._idle = queue.LifoQueue()
+        self._lock = threading.Lock()
+        self.created = 0
+    
+    def _create(self) -> AuthorizedHttp:
+        with self._lock:
+            self.created += 1
+        return AuthorizedHttp(self.credentials, http=httplib2.Http(timeout=self.timeout))
+    
+    @contextmanager
+    def connection(self) -> Iterator[AuthorizedHttp]:
+        try:
+            http = self._idle.get_nowait()
+        except queue.Empty:
+            http = self._create()
+        
+        reusable = False
+        try:
+            yield http
+            reusable = True
+        except HttpError:
+            reusable = True  # API 오류 응답도 정상적으로 받은 응답이므로 연결 재사용
+            raise
+        finally:
+            # 네트워크 오류 등으로 실패한 연결은 상태를 알 수 없으므로 재사용하지 않음
+            if reusable and self._idle.qsize() < self.size:
+                self._idle.put(http)
+            else:
+                http.close()
+    
+    def stats(self) -> Dict[str, int]:
+        return {'size': self.size, 'idle': self._idle.qsize(), 'created': self.created}
+
 
 class GoogleSheetsService:
     def __init__(self):
-        self.service = None
+        self._service = None
+        self._spreadsheets = None
+        self._values = None
+        self._build_lock = threading.Lock()
         self.credentials = None
+        self.http_pool: Optional[HttpPool] = None
+        self.api_endpoint = os.getenv('SHEETS_API_ENDPOINT', '')
+        self.import_workers = int(os.getenv('SHEETS_IMPORT_WORKERS', str(DEFAULT_IMPORT_WORKERS)))
         self._initialize_service()
     
+    @property
+    def service(self):
+        """
+        Sheets API 클라이언트 (첫 요청 시 정적 discovery 문서로 생성)
+        
+        인증 정보가 없거나 생성에 실패하면 None (Mock 데이터 사용)
+        """
+        if self._service is None and self.credentials is not None:
+            with self._build_lock:
+                if self._service is None and self.credentials is not None:
+                    self._service = self._build_service()
+        return self._service
+    
+    @service.setter
+    def service(self, value):
+        self._service = value
+        self._spreadsheets = None
+        self._values = None
+    
+    def _build_service(self):
+        client_options = {'api_endpoint': self.api_endpoint} if self.api_endpoint else None
+        try:
+            document = _discovery_document()
+            if document is not None:
+                return build_from_document(document, credentials=self.credentials, client_options=client_options)
+            return build('sheets', 'v4', credentials=self.credentials, client_options=client_options,
+                         static_discovery=True, cache_discovery=False)
+        except Exception as e:
+            logger.warning("⚠️ Google Sheets API 클라이언트 생성 실패: %s", e)
+            self.credentials = None
+            return None
+    
+    def _spreadsheets_resource(self):
+        """
+        spreadsheets() 리소스 재사용
+        
+        리소스 생성은 discovery 문서의 메서드/스키마를 매번 다시 처리하므로(수십 ms)
+        한 번만 만들고 요청 객체만 새로 만듭니다. 리소스 자체는 상태가 없어 스레드 간 공유해도 됩니다.
+        """
+        if self._spreadsheets is None:
+            self._spreadsheets = self.service.spreadsheets()
+        return self._spreadsheets
+    
+    def _values_resource(self):
+        """spreadsheets().values() 리소스 재사용"""
+        if self._values is None:
+            self._values = self._spreadsheets_resource().values()
+        return self._values
+    
+    def _execute(self, request) -> Dict[str, Any]:
+        """공유 연결 풀의 keep-alive 연결로 요청 실행"""
+        if self.http_pool is None:
+            return request.execute()
+        with self.http_pool.connection() as http:
+            return request.execute(http=http)
+    
     def _initialize_service(self):
         """Google Sheets API 서비스 초기화"""
         try:
@@ -40,14 +179,19 @@ class GoogleSheetsService:
                     )
             
             if self.credentials:
-                self.service = build('sheets', 'v4', credentials=self.credentials)
-                print("✅ Google Sheets API 연동 성공")
+                # API 클라이언트는 첫 요청 시 생성 (import 시점에 discovery 문서를 파싱하지 않음)
+                self.http_pool = HttpPool(
+                    self.credentials,
+                    size=int(os.getenv('SHEETS_HTTP_POOL_SIZE', str(DEFAULT_HTTP_POOL_SIZE))),
+                    timeout=float(os.getenv('SHEETS_HTTP_TIMEOUT', str(DEFAULT_HTTP_TIMEOUT)))
+                )
+                logger.info("✅ Google Sheets API 연동 성공")
             else:
-                print("⚠️ Google Sheets 인증 정보가 없습니다. Mock 데이터를 사용합니다.")
+                logger.warning("⚠️ Google Sheets 인증 정보가 없습니다. Mock 데이터를 사용합니다.")
                 
         except Exception as e:
-            print(f"⚠️ Google Sheets API 초기화 실패: {str(e)}")
-            self.service = None
+            logger.warning("⚠️ Google Sheets API 초기화 실패: %s", e)
+            self.credentials = None
     
     def get_sheet_data(self, spreadsheet_id: str, range_name: str = 'A:Z') -> List[List[str]]:
         """
@@ -65,22 +209,169 @@ class GoogleSheetsService:
             return self._get_mock_data()
         
         try:
-            result = self.service.spreadsheets().values().get(
-                spreadsheetId=spreadsheet_id,
-                range=range_name
-            ).execute()
+            with SHEETS_STAGE_SECONDS.labels('fetch').time():
+                result = self._execute(self._values_resource().get(
+                    spreadsheetId=spreadsheet_id,
+                    range=range_name,
+                    fields=VALUES_FIELDS
+                ))
             
             values = result.get('values', [])
-            print(f"✅ Google Sheets에서 {len(values)}행의 데이터를 가져왔습니다.")
+            logger.info("✅ Google Sheets에서 %d행의 데이터를 가져왔습니다.", len(values))
             return values
             
         except HttpError as error:
-            print(f"❌ Google Sheets API 오류: {error}")
+            logger.error("❌ Google Sheets API 오류: %s", error)
             return self._get_mock_data()
         except Exception as error:
-            print(f"❌ 예상치 못한 오류: {error}")
+            logger.exception("❌ 예상치 못한 오류: %s", error)
             return self._get_mock_data()
     
+    def get_batch_data(self, spreadsheet_id: str, ranges: List[str]) -> List[List[List[str]]]:
+        """
+        한 스프레드시트의 여러 범위를 values().batchGet 한 번으로 가져오기
+        
+        get_sheet_data와 달리 API 오류 시 Mock 데이터로 대체하지 않고 예외를 그대로 올립니다
+        (여러 시트를 합칠 때 실패한 시트를 구분하기 위해).
+        
+        Args:
+            spreadsheet_id: 스프레드시트 ID
+            ranges: 읽을 범위 목록 (예: ['Early!A:Z', 'Speakers!A:Z'])
+        
+        Returns:
+            List[List[List[str]]]: 범위 순서대로 시트 데이터
+        """
+        if not self.service:
+            return [self._get_mock_data() for _ in ranges]
+        
+        with SHEETS_STAGE_SECONDS.labels('fetch').time():
+            result = self._execute(self._values_resource().batchGet(
+                spreadsheetId=spreadsheet_id,
+                ranges=list(ranges),
+                majorDimension='ROWS',
+                fields=BATCH_VALUES_FIELDS
+            ))
+        
+        value_ranges = result.get('valueRanges', [])
+        return [value_range.get('values', []) for value_range in value_ranges]
+    
+    def _fetch_source(self, source: Tuple[str, List[str]]) -> Tuple[str, List[str], Optional[List[List[List[str]]]], Optional[str]]:
+        """스레드 풀 작업: (스프레드시트 ID, 범위 목록, 시트 데이터 또는 None, 오류 메시지)"""
+        spreadsheet_id, ranges = source
+        try:
+            return spreadsheet_id, ranges, self.get_batch_data(spreadsheet_id, ranges), None
+        except HttpError as error:
+            logger.warning("❌ Google Sheets API 오류 (%s): %s", spreadsheet_id, error)
+            return spreadsheet_id, ranges, None, str(error)
+        except Exception as error:
+            logger.exception("❌ 예상치 못한 오류 (%s): %s", spreadsheet_id, error)
+            return spreadsheet_id, ranges, None, str(error)
+    
+    def iter_sources(self, sources: Iterable[Dict[str, Any]],
+                     max_workers: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+        """
+        여러 스프레드시트/범위를 병렬로 읽어 범위별 파싱 결과를 순서대로 반환
+        
+        같은 스프레드시트의 범위는 batchGet 한 번으로 묶고, 스프레드시트 간에는
+        스레드 풀(최대 max_workers)로 동시에 요청합니다. 결과는 범위 단위로 sources 순서를
+        지켜, 앞선 범위가 모두 준비되는 즉시 반환합니다.
+        
+        Args:
+            sources: [{'spreadsheet_id': ..., 'ranges': [...]} 또는 {'spreadsheet_id': ..., 'range': ...}]
+            max_workers: 동시 요청 수 (기본이자 상한: SHEETS_IMPORT_WORKERS)
+        
+        Yields:
+            Dict: {'spreadsheet_id', 'range', 'total_rows', 'attendees'} 또는 실패 시 {'spreadsheet_id', 'range', 'error'}
+        """
+        # sources 순서상 위치 → (스프레드시트 ID, 범위), 스프레드시트별 위치 목록
+        order: List[Tuple[str, str]] = []
+        positions: Dict[str, List[int]] = {}
+        for source in sources:
+            for range_name in source.get('ranges') or [source.get('range') or 'A:Z']:
+                positions.setdefault(source['spreadsheet_id'], []).append(len(order))
+                order.append((source['spreadsheet_id'], range_name))
+        if not positions:
+            return
+        
+        # 요청은 스프레드시트 단위로 묶되, 반환은 sources 순서를 지킴
+        # (중복 제거에서 앞선 범위가 우선하도록 다른 스프레드시트 범위가 사이에 있으면 기다림)
+        ready: Dict[int, Dict[str, Any]] = {}
+        next_position = 0
+        groups = [(spreadsheet_id, [order[i][1] for i in indexes]) for spreadsheet_id, indexes in positions.items()]
+        # 요청에서 받은 max_workers는 SHEETS_IMPORT_WORKERS를 넘지 못함
+        workers = max(1, min(max_workers or self.import_workers, self.import_workers, len(groups)))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='sheets-import') as executor:
+            for spreadsheet_id, ranges, values, error in executor.map(self._fetch_source, groups):
+                for index, (position, range_name) in enumerate(zip(positions[spreadsheet_id], ranges)):
+                    if values is None:
+                        ready[position] = {'spreadsheet_id': spreadsheet_id, 'range': range_name, 'error': error}
+                    else:
+                        ready[position] = {
+                            'spreadsheet_id': spreadsheet_id,
+                            'range': range_name,
+                            'total_rows': len(values[index]),
+                            'attendees': self.parse_attendees_from_sheet(values[index])
+                        }
+                while next_position in ready:
+                    yield ready.pop(next_position)
+                    next_position += 1
+    
+    def import_from_sources(self, sources: Iterable[Dict[str, Any]],
+                            max_workers: Optional[int] = None) -> Dict[str, Any]:
+        """
+        여러 스프레드시트/범위의 참석자를 하나로 병합 (이메일 기준 중복 제거)
+        
+        범위별 결과가 도착하는 대로 병합하며, 같은 이메일은 sources 순서상
+        먼저 나온 범위의 행을 유지합니다 (예: 연사 시트를 일반 등록 시트보다 앞에 지정).
+        
+        Returns:
+            Dict: attendees, total_rows, duplicate_count, sources(범위별 통계), errors
+        """
+        attendees = []
+        seen = set()
+        duplicate_count = 0
+        total_rows = 0
+        source_stats = []
+        errors = []
+        
+        for result in self.iter_sources(sources, max_workers):
+            if 'error' in result:
+                errors.append(result)
+                continue
+            
+            added = 0
+            for attendee in result['attendees']:
+                key = normalize_email(attendee['email'])[0] or attendee['email'].lower()
+                if key in seen:
+                    duplicate_count += 1
+                    continue
+                seen.add(key)
+                attendee['row_number'] = attendee['id']
+                attendee['spreadsheet_id'] = result['spreadsheet_id']
+                attendee['sheet_range'] = result['range']
+                attendee['id'] = len(attendees) + 1
+                attendees.append(attendee)
+                added += 1
+            
+            total_rows += result['total_rows']
+            source_stats.append({
+                'spreadsheet_id': result['spreadsheet_id'],
+                'range': result['range'],
+                'total_rows': result['total_rows'],
+                'valid_attendees': len(result['attendees']),
+                'added': added
+            })
+        
+        logger.info("✅ %d개 범위에서 참석자 %d명을 병합했습니다 (중복 %d명, 실패 %d개 범위).",
+                    len(source_stats), len(attendees), duplicate_count, len(errors))
+        return {
+            'attendees': attendees,
+            'total_rows': total_rows,
+            'duplicate_count': duplicate_count,
+            'sources': source_stats,
+            'errors': errors
+        }
+    
     def _get_mock_data(self) -> List[List[str]]:
         """Mock 데이터 반환 (테스트용)"""
         return [
@@ -93,6 +384,11 @@ class GoogleSheetsService:
         ]
     
     def parse_attendees_from_sheet(self, sheet_data: List[List[str]]) -> List[Dict[str, Any]]:
+        """시트 데이터를 참석자 객체로 변환 (파싱 지연 시간 기록)"""
+        with SHEETS_STAGE_SECONDS.labels('parse').time():
+            return self._parse_attendees(sheet_data)
+    
+    def _parse_attendees(self, sheet_data: List[List[str]]) -> List[Dict[str, Any]]:
         """
         시트 데이터를 참석자 객체로 변환
         
@@ -108,6 +404,8 @@ class GoogleSheetsService:
         # 첫 번째 행을 헤더로 사용
         headers = [header.lower().strip() for header in sheet_data[0]]
         attendees = []
+        invalid_email_rows = []
+        missing_field_rows = []
         
         # 헤더 매핑 (다양한 헤더명 지원)
         header_mapping = {
@@ -158,18 +456,28 @@ class GoogleSheetsService:
             
             # 필수 필드 검증
             if attendee.get('name') and attendee.get('email'):
-                # 이메일 형식 간단 검증
+                # 이메일 형식 검증 (발송 사전 검증과 동일한 규칙)
                 email = attendee['email']
-                if '@' in email and '.' in email:
+                if is_valid_email(email):
                     attendee['id'] = row_index
                     attendee['created_at'] = '2024-09-18T12:00:00Z'
                     attendees.append(attendee)
                 else:
-                    print(f"⚠️ 잘못된 이메일 형식: {email} (행 {row_index})")
+                    invalid_email_rows.append(row_index)
+                    logger.debug("⚠️ 잘못된 이메일 형식: %s (행 %d)", email, row_index)
             else:
-                print(f"⚠️ 필수 정보 누락 (행 {row_index}): 이름={attendee.get('name')}, 이메일={attendee.get('email')}")
+                missing_field_rows.append(row_index)
+                logger.debug("⚠️ 필수 정보 누락 (행 %d): 이름=%s, 이메일=%s",
+                             row_index, attendee.get('name'), attendee.get('email'))
         
-        print(f"✅ {len(attendees)}명의 참석자 데이터를 처리했습니다.")
+        # 행 단위 경고 대신 요약 1건만 출력
+        if invalid_email_rows or missing_field_rows:
+            logger.warning(
+                "⚠️ 건너뛴 행: 잘못된 이메일 %d개, 필수 정보 누락 %d개 (예: 행 %s)",
+                len(invalid_email_rows), len(missing_field_rows),
+                sorted(invalid_email_rows[:5] + missing_field_rows[:5])[:5]
+            )
+        logger.info("✅ %d명의 참석자 데이터를 처리했습니다.", len(attendees))
         return attendees
     
     def validate_spreadsheet_access(self, spreadsheet_id: str) -> bool:
@@ -186,19 +494,20 @@ class GoogleSheetsService:
             return False
         
         try:
-            # 스프레드시트 메타데이터만 가져와서 접근 권한 확인
-            metadata = self.service.spreadsheets().get(
-                spreadsheetId=spreadsheet_id
-            ).execute()
+            # 제목만 가져와서 접근 권한 확인 (시트 목록 등 전체 메타데이터는 받지 않음)
+            metadata = self._execute(self._spreadsheets_resource().get(
+                spreadsheetId=spreadsheet_id,
+                fields=ACCESS_CHECK_FIELDS
+            ))
             
-            print(f"✅ 스프레드시트 접근 성공: {metadata.get('properties', {}).get('title', 'Unknown')}")
+            logger.info("✅ 스프레드시트 접근 성공: %s", metadata.get('properties', {}).get('title', 'Unknown'))
             return True
             
         except HttpError as error:
-            print(f"❌ 스프레드시트 접근 실패: {error}")
+            logger.warning("❌ 스프레드시트 접근 실패: %s", error)
             return False
         except Exception as error:
-            print(f"❌ 예상치 못한 오류: {error}")
+            logger.exception("❌ 예상치 못한 오류: %s", error)
             return False
 
 
@@ -0,0 +1,129 @@
+"""
+발송 우선순위 레인
+
+- transactional: 단건 발송 (/api/emails/send - 가입 확인 등), 가장 높은 우선순위
+- bulk: 일반 대량 발송 / 캠페인
+- reminder: 낮은 우선순위 리마인더 캠페인
+
+SMTP 세션 풀(LaneSlots)과 발송 속도 제한(rate_limiter.LaneRateLimiter)은 레인마다 예약 용량을 두고,
+나머지 공유 용량은 기다리는 레인 중 우선순위가 높은 쪽에 먼저 배정합니다.
+대량 발송이 공유 용량을 모두 쓰고 있어도 단건 발송은 자기 예약분으로 바로 나갑니다.
+"""
+
+import threading
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, Optional
+
+from models import SendLane
+
+# 우선순위 순서 (앞쪽이 높음)
+LANE_PRIORITY = tuple(SendLane)
+
+# 예약 없는 레인도 발송할 수 있도록 항상 남기는 공유 용량 (슬롯 수 / 속도 비율)
+MIN_SHARED_SLOTS = 1
+MIN_SHARED_FRACTION = 0.1
+
+
+def parse_lane(value: Optional[str], default: SendLane = SendLane.BULK) -> SendLane:
+    """
+    레인 이름 해석 (없으면 default)
+
+    Raises:
+        ValueError: 알 수 없는 레인
+    """
+    if value is None or value == '':
+        return default
+    if isinstance(value, SendLane):
+        return value
+    return SendLane(str(value).strip().lower())
+
+
+def parse_reservations(spec: str, cast: Callable[[str], Any] = int) -> Dict[SendLane, Any]:
+    """
+    'transactional=1,bulk=0.5' 형식의 레인별 예약값 해석
+
+    Raises:
+        ValueError: 형식이 잘못되었거나 알 수 없는 레인
+    """
+    reservations: Dict[SendLane, Any] = {}
+    for item in (spec or '').split(','):
+        if not item.strip():
+            continue
+        name, _, value = item.partition('=')
+        reservations[parse_lane(name)] = cast(value.strip())
+    return reservations
+
+
+def higher_lanes(lane: SendLane):
+    return LANE_PRIORITY[:LANE_PRIORITY.index(lane)]
+
+
+class LaneSlots:
+    """
+    레인별 예약 슬롯 + 공유 슬롯 (SMTP 세션 동시 사용 수 제한)
+
+    예약이 없는 레인이 영원히 기다리지 않도록 공유 슬롯은 최소 1개 남기고,
+    예약 합계가 그보다 크면 우선순위 순으로 잘라냅니다 (크기 1이면 예약 없이 공유 슬롯 1개).
+    공유 슬롯이 비면 대기 중인 레인 중 우선순위가 가장 높은 레인이 가져갑니다.
+    """
+
+    def __init__(self, size: int, reserved: Optional[Dict[SendLane, int]] = None):
+        reserved = reserved or {}
+        remaining = max(1, size) - MIN_SHARED_SLOTS
+        self.reserved: Dict[SendLane, int] = {}
+        for lane in LANE_PRIORITY:
+            self.reserved[lane] = min(max(0, reserved.get(lane, 0)), remaining)
+            remaining -= self.reserved[lane]
+        self.shared = remaining + MIN_SHARED_SLOTS
+
+        self._cond = threading.Condition()
+        self._in_reserved = {lane: 0 for lane in LANE_PRIORITY}
+        self._in_shared = 0
+        self._waiting = {lane: 0 for lane in LANE_PRIORITY}
+
+    def acquire(self, lane: SendLane) -> bool:
+        """슬롯 하나 확보 (없으면 대기), 공유 슬롯이면 True"""
+        with self._cond:
+            while True:
+                if self._in_reserved[lane] < self.reserved[lane]:
+                    self._in_reserved[lane] += 1
+                    return False
+                if self._in_shared < self.shared and not any(self._waiting[higher] for higher in higher_lanes(lane)):
+                    self._in_shared += 1
+                    return True
+                self._waiting[lane] += 1
+                try:
+                    self._cond.wait()
+                finally:
+                    self._waiting[lane] -= 1
+
+    def release(self, lane: SendLane, shared: bool):
+        with self._cond:
+            if shared:
+                self._in_shared -= 1
+            else:
+                self._in_reserved[lane] -= 1
+            self._cond.notify_all()
+
+    @contextmanager
+    def slot(self, lane: SendLane) -> Iterator[None]:
+        shared = self.acquire(lane)
+        try:
+            yield
+        finally:
+            self.release(lane, shared)
+
+    def stats(self) -> Dict[str, object]:
+        with self._cond:
+            return {
+                'shared': self.shared,
+                'shared_in_use': self._in_shared,
+                'lanes': {
+                    lane.value: {
+                        'reserved': self.reserved[lane],
+                        'reserved_in_use': self._in_reserved[lane],
+                        'waiting': self._waiting[lane]
+                    }
+                    for lane in LANE_PRIORITY
+                }
+            }
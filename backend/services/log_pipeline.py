@@ -0,0 +1,126 @@
+"""
+비동기 구조화 로깅 파이프라인
+
+발송 루프에서 stdout에 동기적으로 쓰지 않도록 로그 레코드를 큐에 넣고
+백그라운드 스레드(QueueListener)가 실제 출력을 담당합니다.
+
+- LOG_LEVEL: 로그 레벨 (기본 INFO)
+- LOG_FORMAT: text | json (json이면 JSON Lines 출력)
+- LOG_SAMPLE_EVERY: 수신자별 이벤트 로거(RECIPIENT_LOGGER)를 N건당 1건만 출력 (기본 100)
+"""
+
+import atexit
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import sys
+import threading
+from datetime import datetime, timezone
+from typing import Optional
+
+# 수신자별(건당) 이벤트 전용 로거 - 샘플링 대상
+RECIPIENT_LOGGER = 'email.recipient'
+
+_STANDARD_ATTRS = set(vars(logging.LogRecord('', 0, '', 0, '', (), None))) | {'message', 'asctime'}
+
+_listener: Optional[logging.handlers.QueueListener] = None
+_lock = threading.Lock()
+
+
+class JsonLinesFormatter(logging.Formatter):
+    """로그 레코드를 한 줄짜리 JSON으로 변환 (extra 필드 포함)"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        payload = {
+            'ts': datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
+            'level': record.levelname,
+            'logger': record.name,
+            'msg': record.getMessage()
+        }
+        for key, value in record.__dict__.items():
+            if key not in _STANDARD_ATTRS and not key.startswith('_'):
+                payload[key] = value
+        if record.exc_info:
+            payload['exc_info'] = self.formatException(record.exc_info)
+        return json.dumps(payload, ensure_ascii=False, default=str)
+
+
+class SamplingFilter(logging.Filter):
+    """
+    N건당 1건만 통과시키는 필터
+
+    WARNING 이상은 샘플링하지 않고 항상 통과시킵니다.
+    카운터 증가는 GIL 하에서 원자적이지 않을 수 있지만 샘플링 용도로는 충분합니다.
+    """
+
+    def __init__(self, every: int):
+        super().__init__()
+        self.every = max(1, every)
+        self._count = 0
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= logging.WARNING:
+            return True
+        self._count += 1
+        if self._count % self.every:
+            return False
+        record.sampled_every = self.every
+        return True
+
+
+def configure_logging(level: Optional[str] = None,
+                      log_format: Optional[str] = None,
+                      sample_every: Optional[int] = None,
+                      stream=None) -> logging.handlers.QueueListener:
+    """
+    큐 기반 로깅 설정 (여러 번 호출해도 마지막 설정으로 교체)
+
+    Returns:
+        QueueListener: 백그라운드 출력 스레드
+    """
+    global _listener
+
+    level = (level or os.getenv('LOG_LEVEL', 'INFO')).upper()
+    log_format = (log_format or os.getenv('LOG_FORMAT', 'text')).lower()
+    if sample_every is None:
+        sample_every = int(os.getenv('LOG_SAMPLE_EVERY', '100'))
+
+    output = logging.StreamHandler(stream or sys.stdout)
+    if log_format == 'json':
+        output.setFormatter(JsonLinesFormatter())
+    else:
+        output.setFormatter(logging.Formatter('%(asctime)s %(levelname)s [%(name)s] %(message)s'))
+
+    with _lock:
+        shutdown_logging()
+
+        log_queue: queue.SimpleQueue = queue.SimpleQueue()
+        root = logging.getLogger()
+        for handler in list(root.handlers):
+            if isinstance(handler, logging.handlers.QueueHandler):
+                root.removeHandler(handler)
+        root.addHandler(logging.handlers.QueueHandler(log_queue))
+        root.setLevel(level)
+
+        recipient_logger = logging.getLogger(RECIPIENT_LOGGER)
+        recipient_logger.filters = [f for f in recipient_logger.filters if not isinstance(f, SamplingFilter)]
+        if sample_every > 1:
+            recipient_logger.addFilter(SamplingFilter(sample_every))
+
+        _listener = logging.handlers.QueueListener(log_queue, output, respect_handler_level=True)
+        _listener.start()
+
+    return _listener
+
+
+def shutdown_logging():
+    """남은 로그를 모두 출력하고 백그라운드 스레드 종료"""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+atexit.register(shutdown_logging)
@@ -0,0 +1,206 @@
+"""
+메시지 렌더링 / MIME 생성 순수 함수
+
+EmailService와 렌더링 프로세스 풀(render_pool)이 함께 사용합니다.
+서비스 인스턴스나 환경 변수에 의존하지 않으므로 워커 프로세스에서
+부작용 없이 import할 수 있습니다.
+
+- 템플릿은 고정 텍스트 / {{변수}} 조각으로 한 번만 컴파일(캐시)하고
+  수신자별로는 변수 조각만 채워 넣음
+- HTML 본문의 텍스트 버전은 템플릿 단위로 한 번만 변환(캐시)하여
+  multipart/alternative (text/plain + text/html) 메시지 생성
+"""
+
+import re
+from datetime import datetime
+from email.header import Header
+from email.mime.multipart import MIMEMultipart
+from email.mime.text import MIMEText
+from functools import lru_cache
+from html.parser import HTMLParser
+from typing import Any, Dict, List, Optional, Tuple
+
+# 프로세스 내 컴파일/텍스트 변환 캐시 크기 (템플릿 수 기준)
+TEMPLATE_CACHE_SIZE = 256
+
+# multipart/alternative 경계 문자열 (고정)
+# 파트 본문은 utf-8 base64로 인코딩되어 '-'로 시작하는 줄이 없으므로 경계와 겹치지 않고,
+# 같은 내용이면 직렬화 결과도 같아짐 → DKIM 본문 해시 캐시(dkim_signer)가 재사용 가능
+ALTERNATIVE_BOUNDARY = '=_EmailAutomation_alternative'
+
+PLACEHOLDER_PATTERN = re.compile(r'\{\{([^{}]+?)\}\}')
+HTML_TAG_PATTERN = re.compile(
+    r'<\s*/?\s*(html|body|p|div|br|table|tr|td|a|span|h[1-6]|ul|ol|li|strong|em|b|i|img)\b',
+    re.IGNORECASE
+)
+
+
+def default_variables(sender_name: str, now: Optional[datetime] = None) -> Dict[str, str]:
+    """모든 템플릿에 제공되는 기본 변수"""
+    now = now or datetime.now()
+    return {
+        'current_date': now.strftime('%Y년 %m월 %d일'),
+        'current_time': now.strftime('%H:%M'),
+        'sender_name': sender_name
+    }
+
+
+class CompiledTemplate:
+    """
+    고정 텍스트와 {{변수}} 조각으로 나눈 템플릿
+
+    렌더링 시 변수 조각만 값으로 바꿔 이어 붙입니다.
+    data에 없는 변수는 {{변수}} 그대로 남깁니다.
+    """
+
+    __slots__ = ('source', 'parts', 'variables')
+
+    def __init__(self, source: str):
+        self.source = source
+        # 짝수 인덱스: 고정 텍스트, 홀수 인덱스: 변수 이름
+        self.parts: List[str] = PLACEHOLDER_PATTERN.split(source)
+        self.variables: Tuple[str, ...] = tuple(dict.fromkeys(self.parts[1::2]))
+
+    def render(self, data: Dict[str, Any]) -> str:
+        if not self.variables:
+            return self.source
+        parts = self.parts[:]
+        for index in range(1, len(parts), 2):
+            name = parts[index]
+            parts[index] = str(data[name]) if name in data else f'{{{{{name}}}}}'
+        return ''.join(parts)
+
+
+@lru_cache(maxsize=TEMPLATE_CACHE_SIZE)
+def compile_template(template: str) -> CompiledTemplate:
+    """템플릿 컴파일 (같은 템플릿 문자열은 프로세스당 한 번)"""
+    return CompiledTemplate(template)
+
+
+def substitute_variables(template: str, data: Dict[str, Any]) -> str:
+    """{{variable}} 형식의 플레이스홀더 치환"""
+    return compile_template(template).render(data)
+
+
+class _TextExtractor(HTMLParser):
+    """HTML → 텍스트 변환기 (블록 태그는 줄바꿈, 링크는 '텍스트 (URL)')"""
+
+    BLOCK_TAGS = {
+        'p', 'div', 'br', 'tr', 'li', 'ul', 'ol', 'table', 'blockquote',
+        'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'hr', 'section', 'article', 'header', 'footer'
+    }
+    SKIP_TAGS = {'script', 'style', 'head', 'title'}
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.chunks: List[str] = []
+        self._skip_depth = 0
+        self._links: List[Optional[str]] = []
+
+    def handle_starttag(self, tag, attrs):
+        if tag in self.SKIP_TAGS:
+            self._skip_depth += 1
+        elif tag in self.BLOCK_TAGS:
+            self.chunks.append('\n')
+            if tag == 'li':
+                self.chunks.append('- ')
+        elif tag == 'a':
+            self._links.append(dict(attrs).get('href'))
+
+    def handle_endtag(self, tag):
+        if tag in self.SKIP_TAGS:
+            self._skip_depth = max(0, self._skip_depth - 1)
+        elif tag in self.BLOCK_TAGS and tag not in ('li', 'br'):
+            self.chunks.append('\n')
+        elif tag == 'a' and self._links:
+            href = self._links.pop()
+            if href and not href.startswith(('#', 'mailto:')):
+                self.chunks.append(f' ({href})')
+
+    def handle_data(self, data):
+        if not self._skip_depth:
+            self.chunks.append(re.sub(r'\s+', ' ', data))
+
+    def text(self) -> str:
+        lines = [line.strip() for line in ''.join(self.chunks).split('\n')]
+        # 빈 줄은 최대 한 줄만 유지
+        text = re.sub(r'\n{3,}', '\n\n', '\n'.join(lines))
+        return text.strip() + '\n'
+
+
+def html_to_text(html: str) -> str:
+    """HTML 본문을 읽기 좋은 텍스트로 변환 ({{변수}}는 그대로 유지)"""
+    extractor = _TextExtractor()
+    extractor.feed(html)
+    extractor.close()
+    return extractor.text()
+
+
+@lru_cache(maxsize=TEMPLATE_CACHE_SIZE)
+def text_template(body_template: str) -> Optional[str]:
+    """HTML 본문 템플릿의 텍스트 버전 템플릿 (템플릿당 한 번 변환, HTML이 아니면 None)"""
+    if not is_html_body(body_template):
+        return None
+    return html_to_text(body_template)
+
+
+def render_text_body(body_template: str, data: Dict[str, Any]) -> Optional[str]:
+    """본문 템플릿에 대한 텍스트 파트 렌더링 (HTML 본문이 아니면 None)"""
+    template = text_template(body_template)
+    return substitute_variables(template, data) if template is not None else None
+
+
+def recipient_variables(attendee: Dict[str, Any], template_data: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """참석자별 템플릿 데이터 생성 (공통 데이터 + 참석자 필드)"""
+    email = attendee.get('email', '')
+    data = template_data.copy() if template_data else {}
+    data.update({
+        'name': attendee.get('name') or email.split('@')[0],
+        'email': email,
+        'company': attendee.get('company', ''),
+        'position': attendee.get('position', ''),
+        'attendee_type': attendee.get('attendee_type', 'attendee')
+    })
+    return data
+
+
+def is_html_body(body: str) -> bool:
+    """본문이 HTML인지 판별 (알려진 HTML 태그 포함 여부)"""
+    return HTML_TAG_PATTERN.search(body) is not None
+
+
+def build_mime_message(from_header: str,
+                       recipient_email: str,
+                       subject: str,
+                       body: str,
+                       recipient_name: str = '',
+                       text_body: Optional[str] = None) -> MIMEMultipart:
+    """
+    MIME 메시지 생성
+
+    HTML 본문이면 text/plain + text/html 두 파트로 구성합니다.
+
+    Args:
+        from_header: From 헤더 값 ("이름 <주소>")
+        recipient_email: 수신자 이메일
+        subject: 처리된 제목
+        body: 처리된 본문
+        recipient_name: 수신자 이름
+        text_body: 처리된 텍스트 파트 (render_text_body, 없으면 본문에서 변환)
+
+    Returns:
+        MIMEMultipart: 발송할 메시지
+    """
+    message = MIMEMultipart('alternative', boundary=ALTERNATIVE_BOUNDARY)
+    message['From'] = from_header
+    message['To'] = f"{recipient_name} <{recipient_email}>" if recipient_name else recipient_email
+    message['Subject'] = Header(subject, 'utf-8')
+
+    # 본문 추가 (대체 파트는 단순한 것부터: text/plain → text/html)
+    if is_html_body(body):
+        message.attach(MIMEText(text_body if text_body is not None else html_to_text(body), 'plain', 'utf-8'))
+        message.attach(MIMEText(body, 'html', 'utf-8'))
+    else:
+        message.attach(MIMEText(body, 'plain', 'utf-8'))
+
+    return message
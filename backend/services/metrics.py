@@ -0,0 +1,346 @@
+"""
+메트릭 수집 서비스 (Prometheus 텍스트 포맷)
+
+Design:
+- 카운터/히스토그램은 스레드별 샤드에 기록하고 스크랩 시점에만 합산
+  → 발송 루프의 기록 경로에는 락이 없음 (샤드 생성 시 1회만 락 사용)
+- 게이지는 요청 단위로만 갱신되므로 단순 락 사용
+- init_app(app)으로 요청 지연 시간/동시 처리 수 수집 및 /api/metrics 등록
+"""
+
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from flask import Flask, Response, g, request
+
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+def _format_labels(labelnames: Sequence[str], labelvalues: Sequence[str], extra: str = '') -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(labelnames, labelvalues)]
+    if extra:
+        pairs.append(extra)
+    return '{' + ','.join(pairs) + '}' if pairs else ''
+
+
+def _escape(value: str) -> str:
+    return str(value).replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+
+class _ShardedValues:
+    """
+    스레드별 값 배열 (기록은 락 없이, 합산은 스크랩 시점에)
+
+    요청마다 스레드가 생성되는 개발 서버에서도 샤드가 무한히 늘지 않도록
+    새 샤드를 만들 때 종료된 스레드의 샤드를 누적값으로 합쳐 둡니다.
+    """
+
+    def __init__(self, size: int):
+        self._size = size
+        self._local = threading.local()
+        self._shards: List[Tuple[threading.Thread, List[float]]] = []
+        self._retired = [0.0] * size
+        self._lock = threading.Lock()
+
+    def shard(self) -> List[float]:
+        shard = getattr(self._local, 'shard', None)
+        if shard is None:
+            shard = [0.0] * self._size
+            with self._lock:
+                live = []
+                for thread, values in self._shards:
+                    if thread.is_alive():
+                        live.append((thread, values))
+                    else:
+                        for i, value in enumerate(values):
+                            self._retired[i] += value
+                live.append((threading.current_thread(), shard))
+                self._shards = live
+            self._local.shard = shard
+        return shard
+
+    def totals(self) -> List[float]:
+        with self._lock:
+            totals = list(self._retired)
+            shards = [values for _, values in self._shards]
+        for shard in shards:
+            for i, value in enumerate(shard):
+                totals[i] += value
+        return totals
+
+
+class _Metric:
+    """레이블별 자식 메트릭을 관리하는 공통 베이스"""
+
+    type_name = ''
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._children: Dict[Tuple[str, ...], object] = {}
+        self._lock = threading.Lock()
+
+    def labels(self, *labelvalues: str):
+        key = tuple(str(v) for v in labelvalues)
+        child = self._children.get(key)
+        if child is None:
+            if len(key) != len(self.labelnames):
+                raise ValueError(f'{self.name}: expected labels {self.labelnames}')
+            with self._lock:
+                child = self._children.setdefault(key, self._new_child())
+        return child
+
+    def _default_child(self):
+        return self.labels()
+
+    def _new_child(self):
+        raise NotImplementedError
+
+    def collect(self) -> List[str]:
+        lines = [f'# HELP {self.name} {self.documentation}', f'# TYPE {self.name} {self.type_name}']
+        for labelvalues, child in sorted(self._children.items()):
+            lines.extend(self._render_child(labelvalues, child))
+        return lines
+
+    def _render_child(self, labelvalues, child) -> List[str]:
+        raise NotImplementedError
+
+
+class _CounterChild:
+    def __init__(self):
+        self._values = _ShardedValues(1)
+
+    def inc(self, amount: float = 1.0):
+        self._values.shard()[0] += amount
+
+    def value(self) -> float:
+        return self._values.totals()[0]
+
+
+class Counter(_Metric):
+    """단조 증가 카운터"""
+
+    type_name = 'counter'
+
+    def _new_child(self):
+        return _CounterChild()
+
+    def inc(self, amount: float = 1.0):
+        self._default_child().inc(amount)
+
+    def _render_child(self, labelvalues, child):
+        return [f'{self.name}_total{_format_labels(self.labelnames, labelvalues)} {child.value()}']
+
+
+class _HistogramChild:
+    def __init__(self, bounds: Tuple[float, ...]):
+        self._bounds = bounds
+        # [bucket counts..., +Inf count, sum]
+        self._values = _ShardedValues(len(bounds) + 2)
+
+    def observe(self, value: float):
+        shard = self._values.shard()
+        shard[bisect_left(self._bounds, value)] += 1
+        shard[-1] += value
+
+    @contextmanager
+    def time(self):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start)
+
+    def snapshot(self) -> Tuple[List[float], float, float]:
+        """(누적 버킷 카운트, 전체 카운트, 합계)"""
+        totals = self._values.totals()
+        cumulative = []
+        running = 0.0
+        for count in totals[:-1]:
+            running += count
+            cumulative.append(running)
+        return cumulative, running, totals[-1]
+
+
+class Histogram(_Metric):
+    """지연 시간 히스토그램 (초 단위)"""
+
+    type_name = 'histogram'
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                 buckets: Sequence[float] = DEFAULT_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def _new_child(self):
+        return _HistogramChild(self.buckets)
+
+    def observe(self, value: float):
+        self._default_child().observe(value)
+
+    def time(self):
+        return self._default_child().time()
+
+    def _render_child(self, labelvalues, child):
+        cumulative, count, total = child.snapshot()
+        lines = []
+        for bound, value in zip(self.buckets + (float('inf'),), cumulative):
+            le = '+Inf' if bound == float('inf') else repr(bound)
+            labels = _format_labels(self.labelnames, labelvalues, f'le="{le}"')
+            lines.append(f'{self.name}_bucket{labels} {value}')
+        labels = _format_labels(self.labelnames, labelvalues)
+        lines.append(f'{self.name}_count{labels} {count}')
+        lines.append(f'{self.name}_sum{labels} {total}')
+        return lines
+
+
+class _GaugeChild:
+    def __init__(self):
+        self._value = 0.0
+        self._function: Optional[Callable[[], float]] = None
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1.0):
+        with self._lock:
+            self._value += amount
+
+    def dec(self, amount: float = 1.0):
+        with self._lock:
+            self._value -= amount
+
+    def set(self, value: float):
+        with self._lock:
+            self._value = value
+
+    def set_function(self, function: Callable[[], float]):
+        """스크랩 시점에 값을 계산하는 콜백 등록 (큐 깊이 등)"""
+        self._function = function
+
+    def value(self) -> float:
+        if self._function is not None:
+            return float(self._function())
+        return self._value
+
+
+class Gauge(_Metric):
+    """증감 가능한 현재 값"""
+
+    type_name = 'gauge'
+
+    def _new_child(self):
+        return _GaugeChild()
+
+    def inc(self, amount: float = 1.0):
+        self._default_child().inc(amount)
+
+    def dec(self, amount: float = 1.0):
+        self._default_child().dec(amount)
+
+    def set(self, value: float):
+        self._default_child().set(value)
+
+    def set_function(self, function: Callable[[], float]):
+        self._default_child().set_function(function)
+
+    def _render_child(self, labelvalues, child):
+        return [f'{self.name}{_format_labels(self.labelnames, labelvalues)} {child.value()}']
+
+
+class MetricsRegistry:
+    """메트릭 레지스트리"""
+
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+
+    def register(self, metric: _Metric) -> _Metric:
+        with self._lock:
+            existing = self._metrics.get(metric.name)
+            if existing is not None:
+                return existing
+            self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self.register(Counter(name, documentation, labelnames))
+
+    def histogram(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                  buckets: Sequence[float] = DEFAULT_BUCKETS) -> Histogram:
+        return self.register(Histogram(name, documentation, labelnames, buckets))
+
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Gauge:
+        return self.register(Gauge(name, documentation, labelnames))
+
+    def render(self) -> str:
+        """Prometheus 텍스트 포맷 출력"""
+        with self._lock:
+            metrics = list(self._metrics.values())
+        lines = []
+        for metric in metrics:
+            lines.extend(metric.collect())
+        return '\n'.join(lines) + '\n'
+
+
+# 전역 레지스트리
+registry = MetricsRegistry()
+
+# 핫 패스 메트릭
+SMTP_STAGE_SECONDS = registry.histogram(
+    'email_smtp_stage_seconds', 'SMTP stage latency (connect, tls, login, send)', ['stage'])
+TEMPLATE_RENDER_SECONDS = registry.histogram(
+    'email_template_render_seconds', 'Template variable substitution latency')
+MIME_BUILD_SECONDS = registry.histogram(
+    'email_mime_build_seconds', 'MIME message construction latency')
+DKIM_SIGN_SECONDS = registry.histogram(
+    'email_dkim_sign_seconds', 'DKIM signing latency (serialize, canonicalize, sign)')
+SMTP_LANE_WAIT_SECONDS = registry.histogram(
+    'email_smtp_lane_wait_seconds', 'Wait for an SMTP session or rate-limit token by lane', ['lane', 'stage'])
+EMAILS_SENT = registry.counter(
+    'email_messages', 'Email send attempts by result', ['result'])
+SHEETS_STAGE_SECONDS = registry.histogram(
+    'sheets_stage_seconds', 'Google Sheets fetch and parse latency', ['stage'])
+DB_BULK_INSERT_SECONDS = registry.histogram(
+    'db_bulk_insert_seconds', 'Attendee bulk insert latency')
+TOKEN_VERIFY_SECONDS = registry.histogram(
+    'auth_token_verify_seconds', 'Firebase token verification latency')
+HTTP_REQUEST_SECONDS = registry.histogram(
+    'http_request_seconds', 'HTTP request latency by endpoint', ['method', 'endpoint', 'status'])
+HTTP_IN_FLIGHT = registry.gauge(
+    'http_requests_in_flight', 'HTTP requests currently being processed')
+OUTBOUND_SPOOL_DEPTH = registry.gauge(
+    'email_outbound_spool_depth', 'Messages waiting in the outbound spool')
+OUTBOUND_DELIVERIES = registry.counter(
+    'email_outbound_deliveries', 'Outbound spool delivery attempts by result', ['result'])
+
+
+def init_app(app: Flask, path: str = '/api/metrics'):
+    """요청 지연 시간 수집 훅과 메트릭 엔드포인트 등록"""
+
+    @app.before_request
+    def _start_request_timer():
+        g._metrics_start = time.perf_counter()
+        g._metrics_in_flight = True
+        HTTP_IN_FLIGHT.inc()
+
+    @app.after_request
+    def _record_request_latency(response):
+        start = g.pop('_metrics_start', None)
+        if start is not None:
+            endpoint = request.url_rule.rule if request.url_rule else 'unmatched'
+            HTTP_REQUEST_SECONDS.labels(request.method, endpoint, response.status_code).observe(
+                time.perf_counter() - start)
+        return response
+
+    @app.teardown_request
+    def _finish_request(exc):
+        if g.pop('_metrics_in_flight', False):
+            HTTP_IN_FLIGHT.dec()
+
+    @app.route(path)
+    def metrics_endpoint():
+        """Prometheus 메트릭 스크랩 엔드포인트"""
+        return Response(registry.render(), mimetype='text/plain; version=0.0.4; charset=utf-8')
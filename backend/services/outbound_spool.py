@@ -0,0 +1,317 @@
+"""
+저장 후 전달(store-and-forward) 아웃바운드 스풀
+
+렌더링과 SMTP 전달을 분리합니다. 발송 쪽(EmailService, worker.py)은 직렬화된 메시지를
+디스크 스풀에 CPU 속도로 기록하고, 별도의 전달 데몬(spool_daemon.py)이 SMTP 세션 풀로
+스풀을 비웁니다. 느린 릴레이가 렌더링을 막지 않고, 렌더링이 전달을 막지 않습니다.
+
+디렉터리 구조:
+    tmp/     작성 중인 세그먼트 (rename 전이므로 데몬은 보지 않음)
+    ready/   전달 대기 세그먼트 (*.seg) + 전달 진행 기록 (*.ack)
+    failed/  영구 실패 메시지 (*.eml + *.json)
+
+- 세그먼트 = 메시지 레코드 여러 개. 배치 단위로 한 파일에 쓰고 fsync 한 번 →
+  tmp/에서 ready/로 rename → 디렉터리 fsync 한 번 (메시지마다 fsync하지 않음)
+- 레코드: 헤더(meta 길이, data 길이, CRC32) + meta JSON(발신자, 수신자, 발송 레인) + 메시지 bytes
+- 데몬은 전달 결과를 세그먼트 옆 .ack 파일에 (레코드 번호, 결과)로 추가하고 배치마다 fsync
+- 크래시 후에는 ready/를 다시 스캔하고 .ack에 없는 레코드만 다시 전달 (at-least-once)
+- 대기 메시지 수(큐 깊이)는 세그먼트 파일 이름의 레코드 수와 .ack 크기로 계산 (파일을 열지 않음)
+"""
+
+import json
+import logging
+import os
+import re
+import struct
+import threading
+import time
+import zlib
+from email.utils import getaddresses, parseaddr
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from models import SendLane
+
+logger = logging.getLogger(__name__)
+
+# 배치 기준: 메시지 수 또는 크기 중 먼저 도달하는 쪽에서 세그먼트 하나로 기록
+SPOOL_BATCH_SIZE = 200
+SPOOL_BATCH_BYTES = 8 * 1024 * 1024
+
+RECORD_HEADER = struct.Struct('!III')   # meta 길이, data 길이, CRC32(meta + data)
+ACK_RECORD = struct.Struct('!IB')       # 레코드 번호, 결과
+
+ACK_SENT = 1
+ACK_FAILED = 2
+
+_SEGMENT_NAME = re.compile(r'^\d+-\d+-\d+-n(\d+)\.seg$')
+_WRITER_PID = re.compile(r'^\d+-(\d+)-')
+
+# 작성 프로세스가 살아 있어도 이 시간보다 오래된 tmp/ 세그먼트는 중단된 것으로 보고 삭제
+TMP_GRACE_SECONDS = 3600
+_DOT_STUFFED = re.compile(rb'^\.\.', re.MULTILINE)
+
+
+class CorruptSegment(ValueError):
+    """CRC가 맞지 않거나 잘린 세그먼트 레코드"""
+
+
+def _fsync_dir(path: str):
+    """rename 결과를 디스크에 반영 (디렉터리 fsync를 지원하지 않는 플랫폼은 무시)"""
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def _pid_alive(pid: int) -> bool:
+    """같은 호스트에서 pid 프로세스가 살아 있는지 (신호 0)"""
+    if pid == os.getpid():
+        return True
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True  # 다른 사용자의 프로세스
+    except OSError:
+        return False
+    return True
+
+
+class OutboundSpool:
+    """
+    아웃바운드 스풀 (발송 쪽 기록 + 데몬 쪽 읽기/확인)
+
+    발송 쪽은 SMTPSessionPool과 같은 발송 메서드(send_message / sendmail / send_stream)를
+    사용하므로 EmailService.transport로 바로 바꿔 끼울 수 있습니다.
+    """
+
+    def __init__(self,
+                 path: str,
+                 batch_size: int = SPOOL_BATCH_SIZE,
+                 batch_bytes: int = SPOOL_BATCH_BYTES,
+                 fsync: bool = True):
+        self.path = path
+        self.batch_size = max(1, batch_size)
+        self.batch_bytes = batch_bytes
+        self.fsync = fsync
+        self.tmp_dir = os.path.join(path, 'tmp')
+        self.ready_dir = os.path.join(path, 'ready')
+        self.failed_dir = os.path.join(path, 'failed')
+        for directory in (self.tmp_dir, self.ready_dir, self.failed_dir):
+            os.makedirs(directory, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._pending: List[bytes] = []
+        self._pending_bytes = 0
+        self._sequence = 0
+
+    # 발송 쪽: SMTPSessionPool 호환 메서드 (스풀에 등록되면 거부된 수신자 없음 → 빈 dict)
+    # 발송 레인은 meta에 기록 → 데몬이 같은 레인으로 SMTP 세션 풀에 전달
+
+    def send_message(self, message, lane: Optional[SendLane] = None) -> dict:
+        """MIME 메시지를 직렬화해 스풀에 등록 (봉투 주소는 헤더에서)"""
+        sender = parseaddr(message.get('From', ''))[1]
+        recipients = [address for _, address in getaddresses(message.get_all('To', []) + message.get_all('Cc', []))]
+        # SMTP 전송 형식(CRLF)으로 저장 → 데몬이 변환 없이 sendmail로 전달
+        self._append(sender, recipients, message.as_bytes(policy=message.policy.clone(linesep='\r\n')), lane)
+        return {}
+
+    def sendmail(self, from_addr: str, to_addrs: List[str], data: bytes, lane: Optional[SendLane] = None) -> dict:
+        """직렬화된 메시지를 스풀에 등록"""
+        self._append(from_addr, list(to_addrs), data, lane)
+        return {}
+
+    def send_stream(self, from_addr: str, to_addrs: List[str], segments: Callable[[], Iterable],
+                    lane: Optional[SendLane] = None) -> dict:
+        """SMTP DATA용 조각(dot-stuffing 적용)을 원래 메시지 bytes로 합쳐 등록"""
+        data = _DOT_STUFFED.sub(b'.', b''.join(bytes(segment) for segment in segments()))
+        self._append(from_addr, list(to_addrs), data, lane)
+        return {}
+
+    def flush(self):
+        """모인 메시지를 세그먼트 하나로 기록 (fsync 후 ready/로 이동)"""
+        with self._lock:
+            self._flush_locked()
+
+    def close(self):
+        self.flush()
+
+    def _append(self, sender: str, recipients: List[str], data: bytes, lane: Optional[SendLane] = None):
+        meta = json.dumps({'from': sender, 'to': recipients, 'lane': (lane or SendLane.BULK).value,
+                           'queued_at': time.time()},
+                          separators=(',', ':')).encode('utf-8')
+        record = RECORD_HEADER.pack(len(meta), len(data), zlib.crc32(data, zlib.crc32(meta))) + meta + data
+        with self._lock:
+            self._pending.append(record)
+            self._pending_bytes += len(record)
+            if len(self._pending) >= self.batch_size or self._pending_bytes >= self.batch_bytes:
+                self._flush_locked()
+
+    def _flush_locked(self):
+        if not self._pending:
+            return
+        records, self._pending = self._pending, []
+        self._pending_bytes = 0
+        self._sequence += 1
+
+        # 이름 순서 = 기록 순서 (데몬은 오래된 세그먼트부터 전달)
+        name = f'{time.time_ns():020d}-{os.getpid()}-{self._sequence:06d}-n{len(records)}.seg'
+        tmp_path = os.path.join(self.tmp_dir, name)
+        with open(tmp_path, 'wb') as f:
+            f.write(b''.join(records))
+            f.flush()
+            if self.fsync:
+                os.fsync(f.fileno())
+        os.replace(tmp_path, os.path.join(self.ready_dir, name))
+        if self.fsync:
+            _fsync_dir(self.ready_dir)
+
+    # 데몬 쪽: 스캔 / 읽기 / 전달 확인
+
+    def recover(self, grace_seconds: float = TMP_GRACE_SECONDS) -> int:
+        """
+        크래시 후 정리: ready/로 옮겨지지 못한 tmp/ 세그먼트 삭제, 삭제한 파일 수 반환
+
+        tmp/ 세그먼트는 fsync 이전에 중단된 배치이므로 발송 쪽에서 결과가 확정되지 않았습니다
+        (worker.py는 스풀 기록 후에 결과를 기록 → 임대 만료 후 다시 렌더링).
+        다른 프로세스(API 서버, 워커)가 지금 작성 중인 세그먼트는 남겨 둡니다:
+        파일 이름의 작성 PID가 살아 있고 grace_seconds보다 새로운 파일은 삭제하지 않습니다.
+        """
+        removed = 0
+        now = time.time()
+        for name in os.listdir(self.tmp_dir):
+            path = os.path.join(self.tmp_dir, name)
+            match = _WRITER_PID.match(name)
+            try:
+                age = now - os.path.getmtime(path)
+            except FileNotFoundError:
+                continue  # 작성자가 이미 ready/로 옮김
+            if match and _pid_alive(int(match.group(1))) and age < grace_seconds:
+                continue
+            try:
+                os.remove(path)
+                removed += 1
+            except FileNotFoundError:
+                pass
+        return removed
+
+    def segments(self) -> List[str]:
+        """전달 대기 세그먼트 경로 (오래된 순)"""
+        return [
+            os.path.join(self.ready_dir, name)
+            for name in sorted(os.listdir(self.ready_dir))
+            if _SEGMENT_NAME.match(name)
+        ]
+
+    def depth(self) -> int:
+        """전달 대기 메시지 수 (세그먼트 레코드 수 - 확인된 레코드 수)"""
+        total = 0
+        for name in os.listdir(self.ready_dir):
+            match = _SEGMENT_NAME.match(name)
+            if not match:
+                continue
+            try:
+                acked = os.path.getsize(os.path.join(self.ready_dir, name[:-4] + '.ack')) // ACK_RECORD.size
+            except OSError:
+                acked = 0
+            total += max(0, int(match.group(1)) - acked)
+        return total
+
+    @staticmethod
+    def read_segment(path: str) -> Iterator[Tuple[int, Dict[str, Any], bytes]]:
+        """
+        세그먼트의 (레코드 번호, meta, 메시지 bytes) 순회
+
+        Raises:
+            CorruptSegment: 잘렸거나 CRC가 맞지 않는 레코드
+        """
+        with open(path, 'rb') as f:
+            index = 0
+            while True:
+                header = f.read(RECORD_HEADER.size)
+                if not header:
+                    return
+                if len(header) < RECORD_HEADER.size:
+                    raise CorruptSegment(f'Truncated record header in {path} at record {index}')
+                meta_size, data_size, crc = RECORD_HEADER.unpack(header)
+                meta = f.read(meta_size)
+                data = f.read(data_size)
+                if len(meta) < meta_size or len(data) < data_size or zlib.crc32(data, zlib.crc32(meta)) != crc:
+                    raise CorruptSegment(f'Corrupt record in {path} at record {index}')
+                yield index, json.loads(meta), data
+                index += 1
+
+    @staticmethod
+    def acked(path: str) -> Dict[int, int]:
+        """세그먼트의 전달 확인 기록 {레코드 번호: 결과}"""
+        try:
+            with open(path[:-4] + '.ack', 'rb') as f:
+                raw = f.read()
+        except FileNotFoundError:
+            return {}
+        usable = len(raw) - len(raw) % ACK_RECORD.size  # 기록 중 중단된 마지막 항목 무시
+        return dict(ACK_RECORD.iter_unpack(raw[:usable]))
+
+    def open_ack(self, path: str) -> 'SegmentAck':
+        return SegmentAck(path[:-4] + '.ack', self.fsync)
+
+    def retire(self, path: str):
+        """모든 레코드가 확인된 세그먼트 삭제"""
+        for target in (path, path[:-4] + '.ack'):
+            try:
+                os.remove(target)
+            except FileNotFoundError:
+                pass
+
+    def quarantine(self, path: str):
+        """읽을 수 없는 세그먼트를 failed/로 이동 (확인 기록 포함)"""
+        for target in (path, path[:-4] + '.ack'):
+            if os.path.exists(target):
+                os.replace(target, os.path.join(self.failed_dir, os.path.basename(target)))
+
+    def dead_letter(self, path: str, index: int, meta: Dict[str, Any], data: bytes, error: str):
+        """영구 실패 메시지를 failed/에 보관 (원본 .eml + 사유 .json)"""
+        base = os.path.join(self.failed_dir, f'{os.path.basename(path)[:-4]}-{index}')
+        with open(base + '.eml', 'wb') as f:
+            f.write(data)
+        with open(base + '.json', 'w', encoding='utf-8') as f:
+            json.dump({**meta, 'error': error, 'failed_at': time.time()}, f, ensure_ascii=False)
+
+
+class SegmentAck:
+    """세그먼트 전달 확인 기록 (추가 전용, sync()마다 fsync)"""
+
+    def __init__(self, path: str, fsync: bool = True):
+        self._file = open(path, 'ab')
+        self.fsync = fsync
+
+    def record(self, index: int, result: int):
+        self._file.write(ACK_RECORD.pack(index, result))
+
+    def sync(self):
+        self._file.flush()
+        if self.fsync:
+            os.fsync(self._file.fileno())
+
+    def close(self):
+        self.sync()
+        self._file.close()
+
+
+def open_spool(path: Optional[str] = None) -> Optional[OutboundSpool]:
+    """OUTBOUND_SPOOL_DIR(또는 path)로 스풀 생성, 설정이 없으면 None"""
+    path = path or os.getenv('OUTBOUND_SPOOL_DIR', '')
+    if not path:
+        return None
+    return OutboundSpool(
+        path,
+        batch_size=int(os.getenv('OUTBOUND_SPOOL_BATCH_SIZE', str(SPOOL_BATCH_SIZE))),
+        fsync=os.getenv('OUTBOUND_SPOOL_FSYNC', 'true').lower() == 'true'
+    )
@@ -0,0 +1,115 @@
+"""
+레인별 예약 비율을 둔 발송 속도 제한 (토큰 버킷)
+
+SMTP 계정/릴레이의 초당 발송 한도(SMTP_RATE_LIMIT)를 레인별 예약 버킷과 공유 버킷으로 나눕니다.
+
+- 레인 버킷: 전체 속도 × 예약 비율 (그 레인만 사용)
+- 공유 버킷: 나머지 비율, 최소 MIN_SHARED_FRACTION (대기 중인 레인 중 우선순위가 높은 레인이 먼저 사용)
+
+대량 발송이 공유 버킷을 다 써도 단건 발송은 자기 버킷의 토큰으로 바로 나갑니다.
+버킷 용량은 burst_seconds 동안의 토큰 수 (최소 1)입니다.
+"""
+
+import threading
+import time
+from typing import Dict, Optional
+
+from models import SendLane
+from services.lanes import LANE_PRIORITY, MIN_SHARED_FRACTION, higher_lanes
+
+# 대기 시간을 계산할 수 없을 때(속도 0인 버킷만 있는 경우) 다시 확인하는 간격
+_POLL_SECONDS = 0.05
+
+
+class TokenBucket:
+    """단순 토큰 버킷 (락은 호출자가 관리)"""
+
+    def __init__(self, rate: float, burst_seconds: float = 1.0):
+        self.rate = rate
+        self.capacity = max(1.0, rate * burst_seconds)
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+
+    def _refill(self, now: float):
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def take(self, now: float) -> bool:
+        self._refill(now)
+        if self.tokens >= 1.0:
+            self.tokens -= 1.0
+            return True
+        return False
+
+    def seconds_until_token(self) -> Optional[float]:
+        if self.rate <= 0:
+            return None
+        return max(0.0, (1.0 - self.tokens) / self.rate)
+
+
+class LaneRateLimiter:
+    """레인별 예약 버킷 + 공유 버킷 발송 속도 제한 (스레드 안전)"""
+
+    def __init__(self, rate: float, reserved: Optional[Dict[SendLane, float]] = None, burst_seconds: float = 1.0):
+        """
+        Args:
+            rate: 전체 초당 발송 수
+            reserved: 레인별 예약 비율 (0~1, 공유 버킷에 MIN_SHARED_FRACTION은 남도록 우선순위 순으로 잘라냄)
+        """
+        reserved = reserved or {}
+        self.rate = rate
+        remaining = 1.0 - MIN_SHARED_FRACTION
+        self.reserved: Dict[SendLane, float] = {}
+        for lane in LANE_PRIORITY:
+            self.reserved[lane] = min(max(0.0, reserved.get(lane, 0.0)), remaining)
+            remaining -= self.reserved[lane]
+        remaining += MIN_SHARED_FRACTION
+
+        self._buckets = {
+            lane: TokenBucket(rate * fraction, burst_seconds)
+            for lane, fraction in self.reserved.items() if fraction > 0
+        }
+        self._shared = TokenBucket(rate * remaining, burst_seconds)
+        self._lock = threading.Lock()
+        self._waiting = {lane: 0 for lane in LANE_PRIORITY}
+
+    def acquire(self, lane: SendLane) -> float:
+        """토큰 하나 확보 (없으면 대기), 대기한 시간(초) 반환"""
+        started = time.monotonic()
+        waiting = False
+        try:
+            while True:
+                with self._lock:
+                    now = time.monotonic()
+                    own = self._buckets.get(lane)
+                    if own is not None and own.take(now):
+                        return now - started
+                    if not any(self._waiting[higher] for higher in higher_lanes(lane)) and self._shared.take(now):
+                        return now - started
+                    if not waiting:
+                        self._waiting[lane] += 1
+                        waiting = True
+                    waits = [
+                        wait for wait in (
+                            own.seconds_until_token() if own is not None else None,
+                            self._shared.seconds_until_token()
+                        )
+                        if wait is not None
+                    ]
+                # 우선순위가 높은 레인이 기다리는 중이면 그 레인이 토큰을 가져갈 때까지 잠깐 양보
+                time.sleep(max(min(waits), 0.001) if waits else _POLL_SECONDS)
+        finally:
+            if waiting:
+                with self._lock:
+                    self._waiting[lane] -= 1
+
+    def stats(self) -> Dict[str, object]:
+        with self._lock:
+            return {
+                'rate': self.rate,
+                'shared_rate': self._shared.rate,
+                'lanes': {
+                    lane.value: {'reserved_rate': self.rate * self.reserved[lane], 'waiting': self._waiting[lane]}
+                    for lane in LANE_PRIORITY
+                }
+            }
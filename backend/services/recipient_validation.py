@@ -0,0 +1,108 @@
+"""
+수신자 사전 검증(pre-flight) 서비스
+
+발송 전에 전체 수신자 목록을 한 번에 검사합니다.
+- 미리 컴파일된 정규식으로 주소 형식 검증
+- 대소문자 및 IDN(국제화 도메인) 정규화
+- 정규화된 주소 기준 중복 제거
+- 검증 리포트 반환 (깨끗한 고유 수신자만 발송 큐에 진입)
+"""
+
+import re
+from typing import Any, Dict, List, Optional, Tuple
+
+# 로컬 파트 / 도메인 패턴 (모듈 로드 시 한 번만 컴파일)
+LOCAL_PART_PATTERN = re.compile(r'^[a-zA-Z0-9._%+-]+$')
+DOMAIN_LABEL = r'[a-zA-Z0-9](?:[a-zA-Z0-9-]{0,61}[a-zA-Z0-9])?'
+DOMAIN_PATTERN = re.compile(rf'^(?:{DOMAIN_LABEL}\.)+(?:[a-zA-Z]{{2,63}}|xn--[a-zA-Z0-9-]{{1,59}})$')
+
+MAX_ADDRESS_LENGTH = 254
+MAX_LOCAL_PART_LENGTH = 64
+
+
+def normalize_email(email: str) -> Tuple[Optional[str], Optional[str]]:
+    """
+    이메일 주소 정규화 및 검증
+
+    Args:
+        email: 원본 이메일 주소
+
+    Returns:
+        Tuple[정규화된 주소, 오류 사유]: 유효하면 (주소, None), 아니면 (None, 사유)
+    """
+    if not isinstance(email, str):
+        return None, 'missing'
+
+    email = email.strip()
+    if not email:
+        return None, 'missing'
+
+    local, sep, domain = email.rpartition('@')
+    if not sep or not local or not domain:
+        return None, 'invalid_format'
+
+    if len(local) > MAX_LOCAL_PART_LENGTH or not LOCAL_PART_PATTERN.match(local):
+        return None, 'invalid_local_part'
+
+    # IDN 도메인은 punycode(ASCII)로 변환
+    try:
+        domain = domain.rstrip('.').encode('idna').decode('ascii').lower()
+    except UnicodeError:
+        return None, 'invalid_domain'
+
+    if not DOMAIN_PATTERN.match(domain):
+        return None, 'invalid_domain'
+
+    normalized = f'{local.lower()}@{domain}'
+    if len(normalized) > MAX_ADDRESS_LENGTH:
+        return None, 'too_long'
+
+    return normalized, None
+
+
+def is_valid_email(email: str) -> bool:
+    """이메일 주소 형식 검증"""
+    return normalize_email(email)[0] is not None
+
+
+def preflight_recipients(attendees: List[Dict[str, Any]]) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+    """
+    발송 전 수신자 목록 일괄 검증
+
+    Args:
+        attendees: 참석자 정보 리스트 ('email' 키 필수)
+
+    Returns:
+        Tuple[깨끗한 수신자 리스트, 검증 리포트]
+        깨끗한 수신자의 'email'은 정규화된 주소로 교체됩니다.
+    """
+    clean = []
+    invalid = []
+    duplicates = []
+    seen = {}
+
+    for index, attendee in enumerate(attendees):
+        original = attendee.get('email', '')
+        normalized, reason = normalize_email(original)
+
+        if normalized is None:
+            invalid.append({'index': index, 'email': original, 'reason': reason})
+            continue
+
+        if normalized in seen:
+            duplicates.append({'index': index, 'email': original, 'duplicate_of': seen[normalized]})
+            continue
+
+        seen[normalized] = index
+        clean.append({**attendee, 'email': normalized})
+
+    report = {
+        'total': len(attendees),
+        'valid': len(clean),
+        'invalid_count': len(invalid),
+        'duplicate_count': len(duplicates),
+        'invalid': invalid,
+        'duplicates': duplicates
+    }
+
+    return clean, report
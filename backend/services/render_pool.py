@@ -0,0 +1,138 @@
+"""
+멀티 프로세스 렌더링 / MIME 인코딩 풀
+
+템플릿 치환, base64/QP 인코딩, 한글 제목 Header 인코딩은 CPU 작업이므로
+GIL 때문에 한 코어에 묶입니다. 이 모듈은 렌더링과 직렬화(bytes)를
+프로세스 풀에서 병렬로 수행하고, 결과를 청크 단위로 발송 스레드에 넘깁니다.
+
+- 템플릿(제목/본문)과 발신자 정보는 워커 초기화 시 한 번만 전달
+  → 작업마다 큰 템플릿을 다시 pickle하지 않음
+- 작업 단위는 수신자 청크 (기본 200명)
+- 동시에 진행 중인 청크 수를 제한하여 렌더링 결과가 메모리에 쌓이지 않게 함
+- DKIM 서명(DKIM_PRIVATE_KEY_PATH 설정 시)도 워커에서 직렬화와 함께 수행
+"""
+
+import multiprocessing
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from services.dkim_signer import open_signer
+from services.message_builder import (
+    build_mime_message, default_variables, recipient_variables, render_text_body, substitute_variables
+)
+
+# 워커 프로세스 전역 상태 (initializer에서 한 번 설정)
+_worker_template: Dict[str, Any] = {}
+
+# (원래 순번, attendee, 수신자 주소, 렌더링된 제목, 직렬화된 메시지, 렌더링 소요 ms)
+RenderedMessage = Tuple[int, Dict[str, Any], str, str, bytes, float]
+
+
+def _init_worker(subject: str, body: str, template_data: Dict[str, Any], sender_name: str, from_header: str):
+    """워커 초기화: 템플릿을 프로세스 전역에 보관"""
+    _worker_template.update({
+        'subject': subject,
+        'body': body,
+        'template_data': template_data,
+        'sender_name': sender_name,
+        'from_header': from_header,
+        # DKIM 서명도 워커에서 병렬로 수행 (키는 워커 프로세스당 한 번 파싱)
+        'signer': open_signer()
+    })
+
+
+def render_chunk(start: int, attendees: List[Dict[str, Any]]) -> List[RenderedMessage]:
+    """수신자 청크를 렌더링하여 직렬화된 메시지 리스트 반환 (워커에서 실행)"""
+    template = _worker_template
+    defaults = default_variables(template['sender_name'])
+    signer = template['signer']
+    rendered = []
+
+    for index, attendee in enumerate(attendees, start):
+        started = time.perf_counter()
+        data = {**defaults, **recipient_variables(attendee, template['template_data'])}
+        subject = substitute_variables(template['subject'], data)
+        body = substitute_variables(template['body'], data)
+        text_body = render_text_body(template['body'], data)
+        message = build_mime_message(
+            template['from_header'], attendee['email'], subject, body, attendee.get('name', ''), text_body
+        )
+        rendered.append((
+            index,
+            attendee,
+            attendee['email'],
+            subject,
+            signer.sign_message(message) if signer is not None else message.as_bytes(),
+            (time.perf_counter() - started) * 1000
+        ))
+
+    return rendered
+
+
+def _chunks(items: List[Dict[str, Any]], size: int) -> Iterator[Tuple[int, List[Dict[str, Any]]]]:
+    for start in range(0, len(items), size):
+        yield start, items[start:start + size]
+
+
+class RenderPool:
+    """
+    렌더링 프로세스 풀
+
+    사용 예:
+        with RenderPool(template, data, sender_name, from_header, processes=4) as pool:
+            for chunk in pool.render(recipients):
+                ...  # 발송 스레드로 전달
+    """
+
+    def __init__(self,
+                 email_template: Dict[str, str],
+                 template_data: Optional[Dict[str, Any]],
+                 sender_name: str,
+                 from_header: str,
+                 processes: Optional[int] = None,
+                 chunk_size: int = 200,
+                 max_pending_chunks: Optional[int] = None):
+        self.processes = processes or os.cpu_count() or 1
+        self.chunk_size = chunk_size
+        self.max_pending_chunks = max_pending_chunks or self.processes * 2
+        # spawn: 부모 프로세스의 스레드(로깅 리스너 등) 상태를 복제하지 않음
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.processes,
+            mp_context=multiprocessing.get_context('spawn'),
+            initializer=_init_worker,
+            initargs=(
+                email_template.get('subject', ''),
+                email_template.get('body', ''),
+                template_data or {},
+                sender_name,
+                from_header
+            )
+        )
+
+    def render(self, recipients: List[Dict[str, Any]]) -> Iterator[List[RenderedMessage]]:
+        """완료된 순서대로 렌더링된 청크를 반환"""
+        chunks = _chunks(recipients, self.chunk_size)
+        pending = set()
+
+        for start, chunk in chunks:
+            pending.add(self._executor.submit(render_chunk, start, chunk))
+            if len(pending) >= self.max_pending_chunks:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield future.result()
+
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield future.result()
+
+    def close(self):
+        self._executor.shutdown(wait=True, cancel_futures=True)
+
+    def __enter__(self) -> 'RenderPool':
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,369 @@
+"""
+데이터베이스 기반 발송 큐
+
+pending 상태의 EmailLog 행을 발송 대기열로 사용합니다.
+여러 워커(worker.py)가 여러 서버에서 같은 DB를 공유해도
+임대(lease)를 통해 같은 메시지를 중복 발송하지 않습니다.
+
+- MySQL/PostgreSQL: SELECT ... FOR UPDATE SKIP LOCKED 로 배치 선점
+- SQLite: 행 잠금이 없으므로 단일 UPDATE ... WHERE id IN (SELECT ... LIMIT n) 로 원자적 선점
+- 만료된 임대는 다른 워커가 다시 선점 (죽은 워커 복구)
+- 발송 중에는 워커가 주기적으로 임대를 갱신
+- 일시 중지/취소된 캠페인의 행은 선점하지 않음 (이미 선점한 행은 워커가 배치마다 확인해 반납/취소)
+"""
+
+from datetime import datetime, timedelta
+from functools import lru_cache
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import and_, exists, func, or_, select, update
+from sqlalchemy.orm import joinedload
+
+from models import Attendee, Campaign, CampaignStatus, EmailLog, EmailStatus, SendLane, db
+from services import email_stats
+from services.content_store import store_content
+from services.message_builder import compile_template, default_variables, recipient_variables
+from services.recipient_validation import preflight_recipients
+
+DEFAULT_LEASE_SECONDS = 120
+
+# SKIP LOCKED를 지원하는 DB
+_SKIP_LOCKED_DIALECTS = ('mysql', 'mariadb', 'postgresql')
+
+# 발송을 멈춘 캠페인 상태 (행을 선점하지 않음)
+HELD_CAMPAIGN_STATUSES = (CampaignStatus.PAUSED, CampaignStatus.CANCELLED)
+
+
+def _claimable(now: datetime):
+    """선점 가능한 행 조건: pending 이면서 임대가 없거나 만료됨"""
+    return and_(
+        EmailLog.status == EmailStatus.PENDING,
+        or_(EmailLog.lease_expires_at.is_(None), EmailLog.lease_expires_at < now)
+    )
+
+
+def _not_held():
+    """일시 중지/취소된 캠페인의 행 제외 (캠페인 PK 조회)"""
+    return or_(
+        EmailLog.campaign_id.is_(None),
+        ~exists().where(
+            Campaign.id == EmailLog.campaign_id,
+            Campaign.status.in_(HELD_CAMPAIGN_STATUSES)
+        )
+    )
+
+
+def enqueue_emails(attendees: List[Attendee],
+                   email_template: Dict[str, str],
+                   template_data: Optional[Dict[str, Any]],
+                   sender_name: str,
+                   sender_id: int = 1,
+                   extra_columns: Optional[Dict[str, Any]] = None,
+                   commit: bool = True) -> Dict[str, Any]:
+    """
+    참석자별 메시지를 pending EmailLog 행으로 일괄 등록
+
+    본문은 렌더링하지 않고 content_hash + 참석자별 변수로 저장합니다 (content_store.render_log로 복원).
+
+    Args:
+        attendees: 대상 참석자 (DB 모델)
+        email_template: 이메일 템플릿 (subject, body)
+        template_data: 공통 템플릿 데이터
+        sender_name: 기본 변수 {{sender_name}} 값
+        sender_id: 발신 사용자 ID
+        extra_columns: 모든 행에 공통으로 넣을 추가 컬럼 값
+        commit: False면 호출자가 같은 트랜잭션에서 커밋
+
+    Returns:
+        Dict: 등록 건수, 등록된 참석자 ID, 사전 검증 리포트
+    """
+    rows, result = prepare_rows(attendees, email_template, template_data, sender_name, sender_id, extra_columns)
+    insert_rows(rows)
+    if commit:
+        db.session.commit()
+    return result
+
+
+def prepare_rows(attendees: List[Attendee],
+                 email_template: Dict[str, str],
+                 template_data: Optional[Dict[str, Any]],
+                 sender_name: str,
+                 sender_id: int = 1,
+                 extra_columns: Optional[Dict[str, Any]] = None):
+    """
+    사전 검증 후 등록할 EmailLog 행 생성 (공유 본문 blob은 이 시점에 저장, INSERT는 insert_rows)
+
+    Returns:
+        Tuple[행 리스트, 결과 dict (enqueue_emails 반환값과 같은 형태)]
+    """
+    by_id = {attendee.id: attendee for attendee in attendees}
+    recipients, preflight = preflight_recipients([
+        {
+            'id': attendee.id,
+            'name': attendee.name,
+            'email': attendee.email,
+            'company': attendee.company or '',
+            'position': attendee.position or '',
+            'attendee_type': attendee.attendee_type.value if attendee.attendee_type else 'attendee'
+        }
+        for attendee in attendees
+    ])
+
+    subject_template = email_template.get('subject', '')
+    body_template = email_template.get('body', '')
+    # 본문은 템플릿 원문 + 공통 변수(등록 시점 기본 변수 포함)로 한 번만 저장
+    shared_data = {**default_variables(sender_name), **(template_data or {})}
+    content_hash = store_content(subject_template, body_template, shared_data) if recipients else None
+    subject = compile_template(subject_template)
+    rows = []
+
+    for recipient in recipients:
+        variables = recipient_variables(recipient)
+        rows.append({
+            'recipient_id': recipient['id'],
+            'sender_id': sender_id,
+            # 목록 표시용 제목만 렌더링하여 저장
+            'subject': subject.render({**shared_data, **variables})[:255],
+            'content_hash': content_hash,
+            'variables': variables,
+            'status': EmailStatus.PENDING,
+            'attempts': 0,
+            **(extra_columns or {})
+        })
+
+    return rows, {
+        'queued': len(rows),
+        'recipient_ids': [row['recipient_id'] for row in rows],
+        'skipped': len(by_id) - len(rows),
+        'preflight': preflight
+    }
+
+
+def insert_rows(rows: List[Dict[str, Any]]):
+    """prepare_rows 결과를 한 번에 INSERT하고 pending 롤업 반영 (커밋은 호출자)"""
+    if rows:
+        db.session.execute(EmailLog.__table__.insert(), rows)
+        email_stats.record(EmailStatus.PENDING, len(rows))
+
+
+def claim_batch(worker_id: str, batch_size: int, lease_seconds: int = DEFAULT_LEASE_SECONDS) -> List[EmailLog]:
+    """
+    발송할 EmailLog 배치 선점
+
+    Returns:
+        List[EmailLog]: 이 워커가 임대한 행 (recipient 관계 포함)
+    """
+    now = datetime.utcnow()
+    expires_at = now + timedelta(seconds=lease_seconds)
+    dialect = db.engine.dialect.name
+
+    if dialect in _SKIP_LOCKED_DIALECTS:
+        ids = db.session.execute(
+            select(EmailLog.id)
+            .where(_claimable(now), _not_held())
+            .order_by(EmailLog.id)
+            .limit(batch_size)
+            .with_for_update(skip_locked=True)
+        ).scalars().all()
+        if ids:
+            db.session.execute(
+                update(EmailLog)
+                .where(EmailLog.id.in_(ids))
+                .values(lease_owner=worker_id, lease_expires_at=expires_at, attempts=EmailLog.attempts + 1)
+            )
+    else:
+        # SQLite: 쓰기가 직렬화되므로 단일 UPDATE 문이 원자적 선점 역할
+        candidates = (
+            select(EmailLog.id)
+            .where(_claimable(now), _not_held())
+            .order_by(EmailLog.id)
+            .limit(batch_size)
+            .scalar_subquery()
+        )
+        # RETURNING으로 이번에 선점한 ID를 받음 (파이프라인의 이전 배치 행과 섞이지 않도록)
+        ids = db.session.execute(
+            update(EmailLog)
+            .where(EmailLog.id.in_(candidates))
+            .where(_claimable(now))
+            .values(lease_owner=worker_id, lease_expires_at=expires_at, attempts=EmailLog.attempts + 1)
+            .returning(EmailLog.id)
+            .execution_options(synchronize_session=False)
+        ).scalars().all()
+
+    db.session.commit()
+
+    if not ids:
+        return []
+
+    # 선점한 ID로 조회 (MySQL은 만료 시각을 초 단위로 저장하므로 만료 시각 동등 비교는 하지 않음)
+    return EmailLog.query.options(joinedload(EmailLog.recipient)).filter(
+        EmailLog.id.in_(ids),
+        EmailLog.lease_owner == worker_id,
+        EmailLog.status == EmailStatus.PENDING
+    ).order_by(EmailLog.id).all()
+
+
+def renew_leases(worker_id: str, log_ids: List[int], lease_seconds: int = DEFAULT_LEASE_SECONDS) -> int:
+    """발송 중인 행의 임대 연장, 연장된 행 수 반환"""
+    if not log_ids:
+        return 0
+    result = db.session.execute(
+        update(EmailLog)
+        .where(EmailLog.id.in_(log_ids))
+        .where(EmailLog.lease_owner == worker_id)
+        .where(EmailLog.status == EmailStatus.PENDING)
+        .values(lease_expires_at=datetime.utcnow() + timedelta(seconds=lease_seconds))
+        .execution_options(synchronize_session=False)
+    )
+    db.session.commit()
+    return result.rowcount
+
+
+def complete(worker_id: str, log_id: int, success: bool, error_message: Optional[str] = None,
+             campaign_id: Optional[int] = None) -> bool:
+    """
+    발송 결과 기록
+
+    임대를 잃은 경우(다른 워커가 회수) 기록하지 않고 False를 반환합니다.
+    campaign_id가 있으면 같은 트랜잭션에서 캠페인 카운터를 증분 갱신합니다.
+    """
+    result = db.session.execute(
+        update(EmailLog)
+        .where(EmailLog.id == log_id)
+        .where(EmailLog.lease_owner == worker_id)
+        .where(EmailLog.status == EmailStatus.PENDING)
+        .values(
+            status=EmailStatus.SENT if success else EmailStatus.FAILED,
+            sent_at=datetime.utcnow() if success else None,
+            error_message=error_message,
+            lease_owner=None,
+            lease_expires_at=None
+        )
+        .execution_options(synchronize_session=False)
+    )
+    recorded = result.rowcount == 1
+    if recorded:
+        email_stats.record(EmailStatus.SENT if success else EmailStatus.FAILED)
+    if recorded and campaign_id is not None:
+        _count_result(campaign_id, success)
+    db.session.commit()
+    return recorded
+
+
+def _count_result(campaign_id: int, success: bool):
+    """
+    캠페인 sent/failed 카운터 증가, 모두 처리되면 완료 처리 (커밋은 호출자)
+
+    라우팅 캠페인의 그룹이면 상위 캠페인 카운터도 같은 문장으로 증가시킵니다.
+    """
+    campaign_ids = [campaign_id]
+    parent_id = parent_campaign_id(campaign_id)
+    if parent_id is not None:
+        campaign_ids.append(parent_id)
+
+    counter = Campaign.sent_count if success else Campaign.failed_count
+    db.session.execute(
+        update(Campaign)
+        .where(Campaign.id.in_(campaign_ids))
+        .values({counter: counter + 1})
+        .execution_options(synchronize_session=False)
+    )
+    db.session.execute(
+        update(Campaign)
+        .where(Campaign.id.in_(campaign_ids))
+        .where(Campaign.status == CampaignStatus.RUNNING)
+        .where(Campaign.sent_count + Campaign.failed_count >= Campaign.queued_count)
+        .values(status=CampaignStatus.COMPLETED, completed_at=datetime.utcnow())
+        .execution_options(synchronize_session=False)
+    )
+
+
+def held_campaigns(campaign_ids) -> Dict[int, CampaignStatus]:
+    """주어진 캠페인 중 일시 중지/취소된 캠페인 {id: 상태} (배치마다 한 번 조회)"""
+    campaign_ids = {campaign_id for campaign_id in campaign_ids if campaign_id is not None}
+    if not campaign_ids:
+        return {}
+    return dict(
+        db.session.query(Campaign.id, Campaign.status)
+        .filter(Campaign.id.in_(campaign_ids), Campaign.status.in_(HELD_CAMPAIGN_STATUSES))
+        .all()
+    )
+
+
+def release(worker_id: str, log_ids: List[int]) -> int:
+    """선점한 행의 임대 반납 (다시 선점 가능), 반납된 행 수 반환"""
+    if not log_ids:
+        return 0
+    result = db.session.execute(
+        update(EmailLog)
+        .where(EmailLog.id.in_(log_ids))
+        .where(EmailLog.lease_owner == worker_id)
+        .where(EmailLog.status == EmailStatus.PENDING)
+        .values(lease_owner=None, lease_expires_at=None)
+        .execution_options(synchronize_session=False)
+    )
+    db.session.commit()
+    return result.rowcount
+
+
+def cancel_pending(campaign_id: int, worker_id: Optional[str] = None, log_ids: Optional[List[int]] = None) -> int:
+    """
+    캠페인의 대기 행을 cancelled로 변경하고 카운터 반영, 취소된 행 수 반환 (커밋은 호출자)
+
+    다른 워커가 임대 중인 행은 건드리지 않습니다 (발송 중이므로 결과가 그대로 기록됨).
+    worker_id와 log_ids를 주면 그 워커가 선점한 행도 함께 취소합니다.
+    """
+    owned = and_(EmailLog.lease_owner == worker_id, EmailLog.id.in_(log_ids)) if worker_id and log_ids else None
+    now = datetime.utcnow()
+    result = db.session.execute(
+        update(EmailLog)
+        .where(EmailLog.campaign_id == campaign_id)
+        .where(or_(_claimable(now), owned) if owned is not None else _claimable(now))
+        .where(EmailLog.status == EmailStatus.PENDING)
+        .values(status=EmailStatus.CANCELLED, error_message='Campaign cancelled',
+                lease_owner=None, lease_expires_at=None)
+        .execution_options(synchronize_session=False)
+    )
+    cancelled = result.rowcount
+    if cancelled:
+        email_stats.record(EmailStatus.CANCELLED, cancelled)
+        campaign_ids = [campaign_id]
+        parent_id = parent_campaign_id(campaign_id)
+        if parent_id is not None:
+            campaign_ids.append(parent_id)
+        db.session.execute(
+            update(Campaign)
+            .where(Campaign.id.in_(campaign_ids))
+            .values(cancelled_count=Campaign.cancelled_count + cancelled)
+            .execution_options(synchronize_session=False)
+        )
+    return cancelled
+
+
+@lru_cache(maxsize=1024)
+def parent_campaign_id(campaign_id: int) -> Optional[int]:
+    """그룹 캠페인의 상위 캠페인 ID (생성 후 바뀌지 않으므로 프로세스 내 캐시)"""
+    return db.session.query(Campaign.parent_id).filter(Campaign.id == campaign_id).scalar()
+
+
+@lru_cache(maxsize=1024)
+def campaign_lane(campaign_id: Optional[int]) -> SendLane:
+    """캠페인의 발송 레인 (생성 후 바뀌지 않으므로 프로세스 내 캐시, 캠페인이 없으면 bulk)"""
+    if campaign_id is None:
+        return SendLane.BULK
+    lane = db.session.query(Campaign.lane).filter(Campaign.id == campaign_id).scalar()
+    return lane or SendLane.BULK
+
+
+def queue_stats() -> Dict[str, int]:
+    """상태별 행 수와 현재 임대 중인 행 수"""
+    now = datetime.utcnow()
+    counts = {status.value: 0 for status in EmailStatus}
+    for status, count in db.session.query(EmailLog.status, func.count(EmailLog.id)).group_by(EmailLog.status):
+        counts[status.value] = count
+
+    counts['leased'] = db.session.query(func.count(EmailLog.id)).filter(
+        EmailLog.status == EmailStatus.PENDING,
+        EmailLog.lease_expires_at >= now
+    ).scalar()
+    return counts
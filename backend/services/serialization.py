@@ -0,0 +1,127 @@
+"""
+목록 API용 필드 프로젝션 및 빠른 JSON 직렬화 유틸리티
+
+- fields= 파라미터를 SQL 컬럼 선택으로 변환 (필요한 컬럼만 조회)
+- ORM 객체 대신 결과 튜플을 바로 dict로 변환
+- orjson이 설치되어 있으면 사용하고, 없으면 표준 json으로 대체
+- 대용량 내보내기용 CSV / NDJSON 스트리밍 인코더
+"""
+
+import csv
+import io
+import json
+from datetime import date, datetime
+from enum import Enum
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from flask import Response
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - 선택 의존성
+    orjson = None
+
+
+class ProjectionError(ValueError):
+    """허용되지 않은 필드가 요청된 경우"""
+
+
+def parse_fields(raw: Optional[str], allowed: Sequence[str]) -> List[str]:
+    """
+    fields= 쿼리 파라미터 파싱
+
+    Args:
+        raw: 콤마로 구분된 필드 목록 (예: 'id,name,email')
+        allowed: 허용된 필드 이름 (순서가 기본 출력 순서)
+
+    Returns:
+        List[str]: 요청된 필드 목록 (비어 있으면 허용된 전체 필드)
+    """
+    if not raw:
+        return list(allowed)
+
+    fields = []
+    for field in raw.split(','):
+        field = field.strip()
+        if not field or field in fields:
+            continue
+        if field not in allowed:
+            raise ProjectionError(f'Unknown field: {field}')
+        fields.append(field)
+
+    return fields or list(allowed)
+
+
+def _convert(value: Any) -> Any:
+    """JSON 직렬화가 불가능한 컬럼 값 변환"""
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return value
+
+
+def rows_to_dicts(rows: Iterable[Tuple], fields: Sequence[str]) -> List[Dict[str, Any]]:
+    """SQL 결과 튜플을 필드 이름 기반 dict 리스트로 변환"""
+    fields = tuple(fields)
+    return [
+        {field: _convert(value) for field, value in zip(fields, row)}
+        for row in rows
+    ]
+
+
+def project_dicts(items: Iterable[Dict[str, Any]], fields: Sequence[str]) -> List[Dict[str, Any]]:
+    """이미 dict 형태인 데이터에 필드 프로젝션 적용"""
+    return [{field: item.get(field) for field in fields} for item in items]
+
+
+def dumps(payload: Any) -> bytes:
+    """빠른 JSON 인코딩 (orjson 우선)"""
+    if orjson is not None:
+        return orjson.dumps(payload, default=_convert)
+    return json.dumps(payload, ensure_ascii=False, separators=(',', ':'), default=_convert).encode('utf-8')
+
+
+def iter_csv(rows: Iterable[Tuple], fields: Sequence[str], flush_every: int = 1000) -> Iterator[bytes]:
+    """
+    결과 튜플을 CSV 청크로 인코딩 (헤더 포함)
+
+    버퍼를 flush_every 행마다 비워서 메모리 사용량을 일정하게 유지합니다.
+    dict/list 값(custom_fields 등)은 JSON 문자열로 기록합니다.
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(fields)
+
+    for count, row in enumerate(rows, 1):
+        writer.writerow([
+            dumps(value).decode('utf-8') if isinstance(value, (dict, list)) else _convert(value)
+            for value in row
+        ])
+        if count % flush_every == 0:
+            yield buffer.getvalue().encode('utf-8')
+            buffer.seek(0)
+            buffer.truncate()
+
+    if buffer.tell():
+        yield buffer.getvalue().encode('utf-8')
+
+
+def iter_ndjson(rows: Iterable[Tuple], fields: Sequence[str], flush_every: int = 1000) -> Iterator[bytes]:
+    """결과 튜플을 NDJSON(한 줄에 하나의 JSON 객체) 청크로 인코딩"""
+    fields = tuple(fields)
+    lines = []
+
+    for row in rows:
+        lines.append(dumps({field: value for field, value in zip(fields, row)}))
+        if len(lines) >= flush_every:
+            yield b'\n'.join(lines) + b'\n'
+            lines = []
+
+    if lines:
+        yield b'\n'.join(lines) + b'\n'
+
+
+def json_response(payload: Any, status: int = 200) -> Response:
+    """Flask 기본 인코더를 거치지 않는 JSON 응답 생성"""
+    return Response(dumps(payload), status=status, mimetype='application/json')
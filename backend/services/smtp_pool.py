@@ -0,0 +1,248 @@
+"""
+SMTP 세션 풀
+
+메시지마다 연결/STARTTLS/로그인을 반복하지 않도록 인증된 SMTP 세션을
+재사용합니다. 여러 발송 스레드가 동시에 사용할 수 있습니다.
+
+- 최대 세션 수(size)만큼만 동시에 연결
+- 오래 쉰 세션(max_idle_seconds 초과)은 빌려줄 때 NOOP으로 확인하고, 끊겼으면 폐기
+- 끊긴 세션을 만나면 유휴 세션을 모두 비우고(릴레이 유휴 시간 초과로 함께 끊겼을 수 있음)
+  새로 연결하여 1회 재시도
+- 세션당 최대 메시지 수(max_messages_per_session) 도달 시 재연결
+- 발송 레인별 예약 세션 + 공유 세션 (services/lanes.LaneSlots) - 대량 발송이 풀을 채워도
+  단건(transactional) 발송은 예약 세션으로 바로 발송
+- 발송 속도 제한 (rate_limiter, 선택) - 세션을 빌리기 전에 레인별 토큰 확보
+"""
+
+import queue
+import smtplib
+import ssl
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from models import SendLane
+from services.lanes import LaneSlots
+from services.metrics import SMTP_LANE_WAIT_SECONDS, SMTP_STAGE_SECONDS
+from services.rate_limiter import LaneRateLimiter
+
+
+class SMTPSessionPool:
+    """스레드 안전한 SMTP 세션 풀"""
+
+    def __init__(self,
+                 host: str,
+                 port: int,
+                 username: str = '',
+                 password: str = '',
+                 use_tls: bool = True,
+                 size: int = 4,
+                 max_messages_per_session: int = 100,
+                 timeout: float = 30.0,
+                 max_idle_seconds: float = 30.0,
+                 reserved: Optional[Dict[SendLane, int]] = None,
+                 rate_limiter: Optional[LaneRateLimiter] = None):
+        self.host = host
+        self.port = port
+        self.username = username
+        self.password = password
+        self.use_tls = use_tls
+        self.size = size
+        self.max_messages_per_session = max_messages_per_session
+        self.timeout = timeout
+        self.max_idle_seconds = max_idle_seconds
+
+        # (세션, 반납 시각)
+        self._idle: 'queue.LifoQueue[Tuple[smtplib.SMTP, float]]' = queue.LifoQueue()
+        self.slots = LaneSlots(size, reserved)
+        self.rate_limiter = rate_limiter
+        self._sent_counts = {}
+        self._lock = threading.Lock()
+
+    def _connect(self) -> smtplib.SMTP:
+        """새 세션 연결 (연결/TLS/로그인 단계별 지연 시간 기록)"""
+        with SMTP_STAGE_SECONDS.labels('connect').time():
+            server = smtplib.SMTP(self.host, self.port, timeout=self.timeout)
+        try:
+            if self.use_tls:
+                with SMTP_STAGE_SECONDS.labels('tls').time():
+                    server.starttls(context=ssl.create_default_context())
+            if self.username:
+                with SMTP_STAGE_SECONDS.labels('login').time():
+                    server.login(self.username, self.password)
+        except Exception:
+            self._discard(server)
+            raise
+        return server
+
+    def _discard(self, server: smtplib.SMTP):
+        with self._lock:
+            self._sent_counts.pop(id(server), None)
+        try:
+            server.quit()
+        except Exception:
+            try:
+                server.close()
+            except Exception:
+                pass
+
+    def _checkout_idle(self) -> Optional[smtplib.SMTP]:
+        """
+        유휴 세션 하나 꺼내기 (없으면 None)
+
+        max_idle_seconds보다 오래 쉰 세션은 NOOP으로 살아 있는지 확인하고, 응답이 없으면 폐기 후 다음 세션 확인
+        """
+        while True:
+            try:
+                server, returned_at = self._idle.get_nowait()
+            except queue.Empty:
+                return None
+            if time.monotonic() - returned_at < self.max_idle_seconds:
+                return server
+            try:
+                if server.noop()[0] == 250:
+                    return server
+            except (smtplib.SMTPException, OSError):
+                pass
+            self._discard(server)
+
+    def _release_idle(self, server: smtplib.SMTP):
+        self._idle.put((server, time.monotonic()))
+
+    def _drain_idle(self):
+        """유휴 세션 모두 폐기"""
+        while True:
+            try:
+                server, _ = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            self._discard(server)
+
+    @contextmanager
+    def session(self, lane: SendLane = SendLane.BULK) -> Iterator[smtplib.SMTP]:
+        """
+        세션 대여 (레인의 예약 슬롯 → 공유 슬롯 순으로 확보)
+
+        정상 종료되거나 수신자 거부처럼 세션이 유효한 오류면 풀에 반납하고,
+        그 밖의 오류(연결 끊김 등)가 발생하면 세션을 폐기합니다.
+        """
+        started = time.perf_counter()
+        shared = self.slots.acquire(lane)
+        SMTP_LANE_WAIT_SECONDS.labels(lane.value, 'session').observe(time.perf_counter() - started)
+        server = None
+        try:
+            server = self._checkout_idle()
+            if server is None:
+                server = self._connect()
+
+            yield server
+
+            with self._lock:
+                count = self._sent_counts.get(id(server), 0) + 1
+                self._sent_counts[id(server)] = count
+            if count >= self.max_messages_per_session:
+                self._discard(server)
+            else:
+                self._release_idle(server)
+            server = None
+        except (smtplib.SMTPResponseException, smtplib.SMTPRecipientsRefused):
+            # 수신자 거부 등 세션 자체는 정상인 오류 → 상태 초기화 후 반납
+            if server is not None:
+                try:
+                    server.rset()
+                    self._release_idle(server)
+                except Exception:
+                    self._discard(server)
+                server = None
+            raise
+        finally:
+            if server is not None:
+                self._discard(server)
+            self.slots.release(lane, shared)
+
+    def _with_retry(self, operation: Callable[[smtplib.SMTP], object], lane: SendLane):
+        """
+        발송 속도 토큰 확보 후 발송, 끊긴 세션을 재사용한 경우 새 세션으로 1회 재시도
+
+        한 세션이 끊겼으면 같은 시점에 반납된 다른 유휴 세션도 릴레이 유휴 시간 초과로
+        끊겼을 가능성이 높으므로, 재시도 전에 유휴 세션을 비워 새 연결을 사용합니다.
+        """
+        if self.rate_limiter is not None:
+            SMTP_LANE_WAIT_SECONDS.labels(lane.value, 'rate').observe(self.rate_limiter.acquire(lane))
+        try:
+            with self.session(lane) as server:
+                return operation(server)
+        except smtplib.SMTPServerDisconnected:
+            self._drain_idle()
+            with self.session(lane) as server:
+                return operation(server)
+
+    def send_message(self, message, lane: SendLane = SendLane.BULK) -> dict:
+        """MIME 메시지 발송"""
+        def operation(server):
+            with SMTP_STAGE_SECONDS.labels('send').time():
+                return server.send_message(message)
+        return self._with_retry(operation, lane)
+
+    def sendmail(self, from_addr: str, to_addrs: List[str], data: bytes, lane: SendLane = SendLane.BULK) -> dict:
+        """이미 직렬화된 메시지(bytes) 발송"""
+        def operation(server):
+            with SMTP_STAGE_SECONDS.labels('send').time():
+                return server.sendmail(from_addr, to_addrs, data)
+        return self._with_retry(operation, lane)
+
+    def send_stream(self, from_addr: str, to_addrs: List[str], segments: Callable[[], Iterable],
+                    lane: SendLane = SendLane.BULK) -> dict:
+        """
+        조각 시퀀스로 된 메시지를 DATA에 바로 흘려보내며 발송
+
+        segments는 CRLF 줄바꿈과 dot-stuffing이 적용된 bytes/memoryview 조각을
+        반환하는 함수입니다 (재시도 시 다시 호출). 큰 첨부를 메시지 bytes로
+        합치지 않고 mmap 등에서 그대로 소켓에 씁니다.
+        """
+        def operation(server):
+            with SMTP_STAGE_SECONDS.labels('send').time():
+                return _stream_data(server, from_addr, to_addrs, segments())
+        return self._with_retry(operation, lane)
+
+    def close(self):
+        """유휴 세션 모두 종료"""
+        self._drain_idle()
+
+
+def _stream_data(server: smtplib.SMTP, from_addr: str, to_addrs: List[str], segments: Iterable) -> dict:
+    """smtplib.SMTP.sendmail과 같은 흐름이지만 DATA 본문을 조각 단위로 전송"""
+    server.ehlo_or_helo_if_needed()
+
+    code, response = server.mail(from_addr)
+    if code != 250:
+        if code == 421:
+            server.close()
+        else:
+            server.rset()
+        raise smtplib.SMTPSenderRefused(code, response, from_addr)
+
+    refused = {}
+    for address in to_addrs:
+        code, response = server.rcpt(address)
+        if code not in (250, 251):
+            refused[address] = (code, response)
+    if len(refused) == len(to_addrs):
+        server.rset()
+        raise smtplib.SMTPRecipientsRefused(refused)
+
+    code, response = server.docmd('data')
+    if code != 354:
+        raise smtplib.SMTPDataError(code, response)
+
+    for segment in segments:
+        server.send(segment)
+    server.send(b'.\r\n')
+
+    code, response = server.getreply()
+    if code != 250:
+        if code == 421:
+            server.close()
+        raise smtplib.SMTPDataError(code, response)
+    return refused
@@ -0,0 +1,206 @@
+"""
+테스트 모드용 디스크 스풀 싱크 (maildir / mbox)
+
+EMAIL_TEST_MODE=true에서 EMAIL_SPOOL_PATH를 지정하면 SMTP 대신 이 싱크로 발송합니다.
+MIME 메시지는 실제 발송과 똑같이 끝까지 만들어지므로
+
+- QA: 로컬 maildir/mbox를 메일 클라이언트나 mailbox 모듈로 열어 실제 메시지 확인
+- 벤치마크: 네트워크 없이 렌더링 + MIME 직렬화 + 쓰기까지 전체 파이프라인 처리량 측정
+
+에 사용할 수 있습니다. SMTPSessionPool과 같은 발송 메서드(send_message / sendmail /
+send_stream)를 제공하며, 메시지는 메모리에 모아 두었다가 배치 단위로 한 번에 씁니다.
+버퍼에 남은 메시지는 flush() / close() 시점에 기록됩니다.
+"""
+
+import os
+import re
+import socket
+import threading
+import time
+from email.utils import parseaddr
+from typing import Callable, Iterable, List, Optional, Tuple
+
+SPOOL_FORMATS = ('maildir', 'mbox')
+
+# 배치 기준: 메시지 수 또는 버퍼 크기 중 먼저 도달하는 쪽에서 기록
+SPOOL_BATCH_SIZE = 100
+SPOOL_FLUSH_BYTES = 4 * 1024 * 1024
+# mbox 파일 쓰기 버퍼
+SPOOL_BUFFER_SIZE = 1024 * 1024
+
+# SMTP DATA용 dot-stuffing 되돌리기 / mboxrd From 줄 인용
+_DOT_STUFFED = re.compile(rb'^\.\.', re.MULTILINE)
+_FROM_LINE = re.compile(rb'^(>*From )', re.MULTILINE)
+
+
+def _to_lf(data: bytes) -> bytes:
+    """저장 형식은 LF 줄바꿈 (SMTP용 CRLF 변환)"""
+    return data.replace(b'\r\n', b'\n')
+
+
+class SpoolSink:
+    """스레드 안전한 maildir / mbox 스풀 (SMTPSessionPool 호환 발송 인터페이스)"""
+
+    def __init__(self,
+                 path: str,
+                 spool_format: str = 'maildir',
+                 batch_size: int = SPOOL_BATCH_SIZE,
+                 flush_bytes: int = SPOOL_FLUSH_BYTES):
+        """
+        Args:
+            path: maildir 디렉터리 또는 mbox 파일 경로
+            spool_format: 'maildir' 또는 'mbox'
+            batch_size: 한 번에 기록하는 메시지 수
+
+        Raises:
+            ValueError: 지원하지 않는 형식
+        """
+        if spool_format not in SPOOL_FORMATS:
+            raise ValueError(f'Unsupported spool format: {spool_format}')
+
+        self.path = path
+        self.spool_format = spool_format
+        self.batch_size = max(1, batch_size)
+        self.flush_bytes = flush_bytes
+        self._lock = threading.Lock()
+        self._pending: List[Tuple[str, bytes]] = []
+        self._pending_bytes = 0
+        self._file = None
+        self._sequence = 0
+        self._hostname = socket.gethostname().replace('/', '_').replace(':', '_')
+
+        # 통계 (벤치마크용)
+        self.messages = 0
+        self.bytes = 0
+        self.flushes = 0
+
+        if spool_format == 'maildir':
+            for sub in ('tmp', 'new', 'cur'):
+                os.makedirs(os.path.join(path, sub), exist_ok=True)
+        else:
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+
+    # SMTPSessionPool 호환 발송 메서드 (거부된 수신자 없음 → 빈 dict, 발송 레인은 무시)
+
+    def send_message(self, message, lane=None) -> dict:
+        """MIME 메시지를 직렬화해 스풀에 추가"""
+        self._append(parseaddr(message.get('From', ''))[1], message.as_bytes())
+        return {}
+
+    def sendmail(self, from_addr: str, to_addrs: List[str], data: bytes, lane=None) -> dict:
+        """이미 직렬화된 메시지(bytes)를 스풀에 추가"""
+        self._append(from_addr, _to_lf(data))
+        return {}
+
+    def send_stream(self, from_addr: str, to_addrs: List[str], segments: Callable[[], Iterable], lane=None) -> dict:
+        """
+        SMTP DATA용 조각 시퀀스(CRLF, dot-stuffing)를 스풀에 바로 기록
+
+        큰 첨부를 배치 버퍼에 쌓지 않도록 버퍼를 먼저 비우고 조각 단위로 씁니다.
+        조각은 항상 줄 경계에서 나뉘므로 조각별로 변환해도 결과가 같습니다.
+        """
+        def converted() -> Iterable[bytes]:
+            for segment in segments():
+                yield _DOT_STUFFED.sub(b'.', _to_lf(bytes(segment)))
+
+        with self._lock:
+            self._flush_locked()
+            if self.spool_format == 'maildir':
+                self._write_maildir(converted())
+            else:
+                self._write_mbox(from_addr, converted())
+            self.flushes += 1
+        return {}
+
+    def flush(self):
+        """버퍼에 모인 메시지 기록"""
+        with self._lock:
+            self._flush_locked()
+
+    def close(self):
+        """버퍼를 비우고 mbox 파일 닫기"""
+        with self._lock:
+            self._flush_locked()
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    def stats(self) -> dict:
+        return {
+            'format': self.spool_format,
+            'path': self.path,
+            'messages': self.messages,
+            'bytes': self.bytes,
+            'flushes': self.flushes,
+            'pending': len(self._pending)
+        }
+
+    def _append(self, sender: str, data: bytes):
+        with self._lock:
+            self._pending.append((sender, data))
+            self._pending_bytes += len(data)
+            if len(self._pending) >= self.batch_size or self._pending_bytes >= self.flush_bytes:
+                self._flush_locked()
+
+    def _flush_locked(self):
+        if not self._pending:
+            return
+        pending, self._pending = self._pending, []
+        self._pending_bytes = 0
+
+        if self.spool_format == 'maildir':
+            for _, data in pending:
+                self._write_maildir((data,))
+        else:
+            # mbox: 배치 전체를 한 번의 write로 추가
+            self._mbox_file().write(b''.join(self._mbox_record(sender, data) for sender, data in pending))
+            self._file.flush()
+            self.messages += len(pending)
+            self.bytes += sum(len(data) for _, data in pending)
+        self.flushes += 1
+
+    def _write_maildir(self, chunks: Iterable[bytes]):
+        """tmp/에 쓴 뒤 new/로 rename (maildir 전달 규약 - 읽는 쪽은 완성된 파일만 봄)"""
+        self._sequence += 1
+        now = time.time()
+        name = f'{int(now)}.M{int(now % 1 * 1e6)}P{os.getpid()}Q{self._sequence}.{self._hostname}'
+        tmp_path = os.path.join(self.path, 'tmp', name)
+        size = 0
+        with open(tmp_path, 'wb') as f:
+            for chunk in chunks:
+                f.write(chunk)
+                size += len(chunk)
+        os.replace(tmp_path, os.path.join(self.path, 'new', name))
+        self.messages += 1
+        self.bytes += size
+
+    def _mbox_file(self):
+        if self._file is None:
+            self._file = open(self.path, 'ab', buffering=SPOOL_BUFFER_SIZE)
+        return self._file
+
+    @staticmethod
+    def _mbox_separator(sender: Optional[str]) -> bytes:
+        return f"From {sender or 'MAILER-DAEMON'} {time.asctime(time.gmtime())}\n".encode('ascii', 'replace')
+
+    def _mbox_record(self, sender: str, data: bytes) -> bytes:
+        """mboxrd 형식 레코드 (본문의 From 줄은 '>' 인용)"""
+        body = _FROM_LINE.sub(rb'>\1', data)
+        if not body.endswith(b'\n'):
+            body += b'\n'
+        return self._mbox_separator(sender) + body + b'\n'
+
+    def _write_mbox(self, sender: str, chunks: Iterable[bytes]):
+        f = self._mbox_file()
+        f.write(self._mbox_separator(sender))
+        last = b''
+        size = 0
+        for chunk in chunks:
+            chunk = _FROM_LINE.sub(rb'>\1', chunk)
+            f.write(chunk)
+            size += len(chunk)
+            last = chunk[-1:] or last
+        f.write(b'\n' if last == b'\n' else b'\n\n')
+        f.flush()
+        self.messages += 1
+        self.bytes += size
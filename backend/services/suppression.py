@@ -0,0 +1,539 @@
+"""
+발송 억제(suppression) 목록 - 영구 반송 / 수신 거부 / 스팸 신고 주소
+
+발송 전에 모든 수신자를 확인하므로 조회는 메모리에서 O(1)로 처리하고,
+디스크에는 주소 대신 8바이트 레코드만 저장합니다.
+
+레코드 (uint64, 네이티브 바이트 순서)
+    상위 56비트: 정규화된 주소의 BLAKE2b 해시, 하위 8비트: 사유 코드 (0 = 해제)
+
+파일 (SUPPRESSION_DIR)
+- index.bin: 헤더 + 해시 순으로 정렬된 레코드 (압축 시 다시 씀)
+- journal.bin: 마지막 압축 이후 추가/해제 레코드 (추가만, O_APPEND)
+- bloom.bin: 큰 목록용 블룸 필터 비트 (압축 시 함께 생성, index.bin과 세대 번호로 짝을 맞춤)
+
+조회 구조
+- 기본: index.bin 전체를 해시 집합(set)으로 로드 → O(1) 조회
+- 블룸 모드 (SUPPRESSION_BLOOM, 기본 auto = SUPPRESSION_BLOOM_THRESHOLD 이상):
+  집합을 만들지 않고 mmap한 블룸 필터로 먼저 거른 뒤 양성일 때만 mmap한 index.bin을 이진 탐색
+- journal.bin 레코드는 항상 메모리 dict (가장 먼저 확인, 해제 기록 포함)
+
+다른 프로세스(bounce_ingest.py, API 서버)가 추가한 레코드는 refresh()가 journal.bin의
+새로 늘어난 부분만 읽어 반영합니다. 압축으로 index.bin이 바뀌면 다시 로드합니다.
+"""
+
+import fcntl
+import hashlib
+import logging
+import math
+import mmap
+import os
+import struct
+import threading
+from array import array
+from bisect import bisect_left
+from enum import IntEnum
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from services.recipient_validation import normalize_email
+
+logger = logging.getLogger(__name__)
+
+INDEX_FILE = 'index.bin'
+JOURNAL_FILE = 'journal.bin'
+BLOOM_FILE = 'bloom.bin'
+
+INDEX_MAGIC = b'SUPIDX01'
+BLOOM_MAGIC = b'SUPBLM01'
+# magic, 레코드 수, 세대 번호
+INDEX_HEADER = struct.Struct('=8sQQ')
+# magic, 세대 번호, 비트 수, 해시 함수 수
+BLOOM_HEADER = struct.Struct('=8sQQQ')
+RECORD_SIZE = 8
+
+# 이 레코드 수 이상이면 블룸 모드 (auto)
+DEFAULT_BLOOM_THRESHOLD = 1_000_000
+DEFAULT_BLOOM_ERROR_RATE = 0.001
+# journal.bin이 이 레코드 수를 넘거나 index.bin의 절반을 넘으면 add_many 후 압축
+DEFAULT_COMPACT_RECORDS = 100_000
+# 압축 시 한 번에 쓰는 레코드 수
+_WRITE_CHUNK = 1 << 16
+
+
+class SuppressionReason(IntEnum):
+    """억제 사유 (레코드 하위 8비트)"""
+    REMOVED = 0       # 해제 (journal 전용)
+    HARD_BOUNCE = 1   # 영구 반송 (DSN 5.x.x)
+    UNSUBSCRIBE = 2   # 수신 거부
+    COMPLAINT = 3     # 스팸 신고 (ARF feedback report)
+    MANUAL = 4        # 관리자 등록
+
+
+def parse_reason(value: Optional[str], default: SuppressionReason = SuppressionReason.UNSUBSCRIBE) -> SuppressionReason:
+    """
+    사유 이름 해석 (없으면 default)
+
+    Raises:
+        ValueError: 알 수 없는 사유
+    """
+    if value is None or value == '':
+        return default
+    if isinstance(value, SuppressionReason):
+        return value
+    try:
+        reason = SuppressionReason[str(value).strip().upper()]
+    except KeyError:
+        raise ValueError(f'Unknown suppression reason: {value}')
+    if reason == SuppressionReason.REMOVED:
+        raise ValueError(f'Unknown suppression reason: {value}')
+    return reason
+
+
+def address_hash(email: str) -> int:
+    """정규화된 주소의 56비트 해시"""
+    normalized = normalize_email(email)[0] or str(email).strip().lower()
+    return int.from_bytes(hashlib.blake2b(normalized.encode('utf-8'), digest_size=7).digest(), 'big')
+
+
+def _record(key: int, reason: SuppressionReason) -> int:
+    return (key << 8) | int(reason)
+
+
+class BloomFilter:
+    """
+    블룸 필터 (비트 배열은 bytearray 또는 mmap)
+
+    키가 이미 균일한 해시이므로 상위/하위 비트로 이중 해싱(h1 + i * h2)합니다.
+    """
+
+    def __init__(self, bits: int, hashes: int, buffer=None):
+        self.bits = max(8, bits)
+        self.hashes = max(1, hashes)
+        self.buffer = buffer if buffer is not None else bytearray((self.bits + 7) // 8)
+
+    @classmethod
+    def for_capacity(cls, capacity: int, error_rate: float = DEFAULT_BLOOM_ERROR_RATE) -> 'BloomFilter':
+        capacity = max(1, capacity)
+        bits = int(math.ceil(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        return cls(bits, int(round(bits / capacity * math.log(2))))
+
+    def _positions(self, key: int) -> Iterator[int]:
+        h1 = key & 0xFFFFFFF
+        h2 = (key >> 28) | 1
+        for i in range(self.hashes):
+            yield (h1 + i * h2) % self.bits
+
+    def add(self, key: int):
+        buffer = self.buffer
+        for position in self._positions(key):
+            buffer[position >> 3] |= 1 << (position & 7)
+
+    def __contains__(self, key: int) -> bool:
+        buffer = self.buffer
+        return all(buffer[position >> 3] & (1 << (position & 7)) for position in self._positions(key))
+
+
+class SuppressionList:
+    """스레드 안전한 억제 목록 (여러 프로세스가 같은 디렉터리를 공유)"""
+
+    def __init__(self,
+                 path: str,
+                 bloom: Optional[bool] = None,
+                 bloom_threshold: int = DEFAULT_BLOOM_THRESHOLD,
+                 bloom_error_rate: float = DEFAULT_BLOOM_ERROR_RATE,
+                 compact_records: int = DEFAULT_COMPACT_RECORDS,
+                 fsync: bool = True):
+        """
+        Args:
+            path: 억제 목록 디렉터리 (없으면 첫 기록 시 생성)
+            bloom: 블룸 모드 (None이면 레코드 수가 bloom_threshold 이상일 때)
+            compact_records: 자동 압축 기준 journal 레코드 수
+            fsync: 추가 기록마다 fsync
+        """
+        self.path = path
+        self.bloom_mode = bloom
+        self.bloom_threshold = bloom_threshold
+        self.bloom_error_rate = bloom_error_rate
+        self.compact_records = compact_records
+        self.fsync = fsync
+        self._lock = threading.RLock()
+
+        self._generation = 0
+        self._base_count = 0
+        self._base_id: Optional[Tuple[int, int]] = None
+        self._base_records = None        # array('Q') 또는 mmap memoryview (정렬됨)
+        self._base_keys: Optional[set] = None
+        self._bloom: Optional[BloomFilter] = None
+        self._delta: Dict[int, int] = {}
+        self._journal_offset = 0
+
+        self._load()
+
+    # 파일 경로 / 잠금
+
+    def _file(self, name: str) -> str:
+        return os.path.join(self.path, name)
+
+    def _journal_lock(self, exclusive: bool):
+        """journal.bin에 대한 프로세스 간 잠금 (압축 중에는 추가/새로 읽기를 막음)"""
+        return _FileLock(self._file(JOURNAL_FILE), exclusive)
+
+    # 로드
+
+    @staticmethod
+    def _map(path: str, offset: int, view_format: str = 'B') -> memoryview:
+        """
+        파일을 mmap하고 헤더 뒤 본문 memoryview 반환
+
+        mmap은 memoryview가 참조하는 동안 유지되고, 다시 로드하면서 참조가 없어지면 닫힙니다.
+        """
+        with open(path, 'rb') as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        return memoryview(mapped)[offset:].cast(view_format)
+
+    def _load(self):
+        """index.bin / bloom.bin / journal.bin 전체 로드"""
+        with self._lock:
+            if not os.path.isdir(self.path):
+                self._reset()
+                return
+            with self._journal_lock(exclusive=False):
+                self._load_locked()
+
+    def _reset(self):
+        self._generation = self._base_count = 0
+        self._base_id = None
+        self._base_records = array('Q')
+        self._base_keys = set()
+        self._bloom = None
+        self._delta = {}
+        self._journal_offset = 0
+
+    def _load_locked(self):
+        """전체 다시 로드 (journal 잠금을 잡은 상태에서 호출)"""
+        self._reset()
+        self._load_base()
+        self._read_journal()
+
+    def _load_base(self):
+        index_path = self._file(INDEX_FILE)
+        try:
+            stat = os.stat(index_path)
+        except FileNotFoundError:
+            return
+        self._base_id = (stat.st_ino, stat.st_mtime_ns)
+
+        with open(index_path, 'rb') as f:
+            magic, count, generation = INDEX_HEADER.unpack(f.read(INDEX_HEADER.size))
+            if magic != INDEX_MAGIC:
+                raise ValueError(f'Not a suppression index: {index_path}')
+            self._base_count, self._generation = count, generation
+
+            use_bloom = self.bloom_mode if self.bloom_mode is not None else count >= self.bloom_threshold
+            if not use_bloom:
+                records = array('Q')
+                records.fromfile(f, count)
+                self._base_records = records
+                self._base_keys = {record >> 8 for record in records}
+                return
+
+        # 블룸 모드: 집합 없이 mmap (프로세스 간 페이지 캐시 공유)
+        self._base_records = self._map(index_path, INDEX_HEADER.size, 'Q') if count else array('Q')
+        self._base_keys = None
+        self._bloom = self._load_bloom()
+
+    def _load_bloom(self) -> BloomFilter:
+        """bloom.bin이 현재 index.bin과 같은 세대면 mmap, 아니면 메모리에서 생성"""
+        bloom_path = self._file(BLOOM_FILE)
+        try:
+            with open(bloom_path, 'rb') as f:
+                magic, generation, bits, hashes = BLOOM_HEADER.unpack(f.read(BLOOM_HEADER.size))
+            if magic == BLOOM_MAGIC and generation == self._generation:
+                return BloomFilter(bits, hashes, self._map(bloom_path, BLOOM_HEADER.size))
+        except (FileNotFoundError, struct.error):
+            pass
+
+        logger.warning("⚠️ 억제 목록 블룸 필터를 다시 생성합니다 (%d건).", self._base_count)
+        bloom = BloomFilter.for_capacity(self._base_count, self.bloom_error_rate)
+        for record in self._base_records:
+            bloom.add(record >> 8)
+        return bloom
+
+    def _read_journal(self) -> int:
+        """journal.bin에서 아직 읽지 않은 레코드 반영, 읽은 레코드 수 반환"""
+        try:
+            with open(self._file(JOURNAL_FILE), 'rb') as f:
+                f.seek(self._journal_offset)
+                data = f.read()
+        except FileNotFoundError:
+            return 0
+        usable = len(data) - len(data) % RECORD_SIZE
+        records = array('Q')
+        records.frombytes(data[:usable])
+        for record in records:
+            self._delta[record >> 8] = record & 0xFF
+        self._journal_offset += usable
+        return len(records)
+
+    def refresh(self) -> int:
+        """
+        다른 프로세스가 기록한 변경 반영 (journal.bin 증분, 압축되었으면 전체 다시 로드)
+
+        Returns:
+            int: 새로 반영한 journal 레코드 수 (다시 로드했으면 -1)
+        """
+        with self._lock:
+            if not os.path.isdir(self.path):
+                return 0
+            with self._journal_lock(exclusive=False):
+                return self._sync_locked()
+
+    def _sync_locked(self) -> int:
+        """refresh() 본체 (journal 잠금을 잡은 상태에서 호출)"""
+        try:
+            stat = os.stat(self._file(INDEX_FILE))
+            base_id = (stat.st_ino, stat.st_mtime_ns)
+        except FileNotFoundError:
+            base_id = None
+        try:
+            journal_size = os.path.getsize(self._file(JOURNAL_FILE))
+        except FileNotFoundError:
+            journal_size = 0
+        if base_id != self._base_id or journal_size < self._journal_offset:
+            self._load_locked()
+            return -1
+        return self._read_journal() if journal_size > self._journal_offset else 0
+
+    # 조회
+
+    def _base_record(self, key: int) -> Optional[int]:
+        records = self._base_records
+        index = bisect_left(records, key << 8)
+        if index < len(records) and records[index] >> 8 == key:
+            return records[index]
+        return None
+
+    def _reason_for_key(self, key: int) -> Optional[SuppressionReason]:
+        delta = self._delta.get(key)
+        if delta is not None:
+            return SuppressionReason(delta) if delta else None
+        if self._base_keys is not None:
+            if key not in self._base_keys:
+                return None
+        elif key not in self._bloom:
+            return None
+        record = self._base_record(key)
+        return SuppressionReason(record & 0xFF) if record is not None else None
+
+    def reason(self, email: str) -> Optional[SuppressionReason]:
+        """억제 사유 (억제되지 않은 주소면 None)"""
+        return self._reason_for_key(address_hash(email))
+
+    def __contains__(self, email: str) -> bool:
+        key = address_hash(email)
+        delta = self._delta.get(key)
+        if delta is not None:
+            return delta != SuppressionReason.REMOVED
+        if self._base_keys is not None:
+            return key in self._base_keys
+        return key in self._bloom and self._base_record(key) is not None
+
+    def filter(self, recipients: List[Dict[str, Any]]) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """
+        수신자 목록에서 억제된 주소 제외
+
+        Returns:
+            Tuple[발송할 수신자, 제외된 수신자 리포트 ({'email', 'reason', 'attendee_id'})]
+        """
+        allowed = []
+        suppressed = []
+        for recipient in recipients:
+            email = recipient.get('email', '')
+            if email in self:
+                suppressed.append({
+                    'email': email,
+                    'reason': self.reason(email).name.lower(),
+                    'attendee_id': recipient.get('id')
+                })
+            else:
+                allowed.append(recipient)
+        return allowed, suppressed
+
+    # 기록
+
+    def add(self, email: str, reason: SuppressionReason = SuppressionReason.MANUAL) -> bool:
+        """주소 억제 (새로 억제되었거나 사유가 바뀌면 True)"""
+        return self.add_many([(email, reason)]) == 1
+
+    def remove(self, email: str) -> bool:
+        """억제 해제 (억제되어 있었으면 True)"""
+        return self._append([(address_hash(email), SuppressionReason.REMOVED)]) == 1
+
+    def add_many(self, entries: Iterable[Tuple[str, SuppressionReason]]) -> int:
+        """
+        여러 주소 억제 (DSN 수집 등), 변경된 주소 수 반환
+
+        이미 같은 사유로 억제된 주소는 기록하지 않습니다.
+        """
+        return self._append([(address_hash(email), reason) for email, reason in entries])
+
+    def _append(self, entries: List[Tuple[int, SuppressionReason]]) -> int:
+        with self._lock:
+            os.makedirs(self.path, exist_ok=True)
+            with self._journal_lock(exclusive=True):
+                # 다른 프로세스의 기록/압축을 먼저 반영해야 변경 여부를 올바르게 판단
+                self._sync_locked()
+                records = array('Q')
+                for key, reason in entries:
+                    current = self._reason_for_key(key)
+                    if reason == SuppressionReason.REMOVED:
+                        changed = current is not None
+                    else:
+                        changed = current != reason
+                    if changed:
+                        records.append(_record(key, reason))
+                        self._delta[key] = int(reason)
+                if records:
+                    with open(self._file(JOURNAL_FILE), 'ab') as f:
+                        records.tofile(f)
+                        f.flush()
+                        if self.fsync:
+                            os.fsync(f.fileno())
+                    self._journal_offset += len(records) * RECORD_SIZE
+
+            journal_records = self._journal_offset // RECORD_SIZE
+            if journal_records >= self.compact_records or (
+                    self._base_count and journal_records > max(1000, self._base_count // 2)):
+                self.compact()
+            return len(records)
+
+    # 압축
+
+    def _merged(self) -> Iterator[int]:
+        """index.bin 레코드 + journal 변경을 해시 순으로 병합 (해제된 주소 제외)"""
+        delta = sorted(self._delta.items())
+        position = 0
+        for record in self._base_records:
+            key = record >> 8
+            while position < len(delta) and delta[position][0] < key:
+                if delta[position][1]:
+                    yield _record(*delta[position])
+                position += 1
+            if position < len(delta) and delta[position][0] == key:
+                if delta[position][1]:
+                    yield _record(*delta[position])
+                position += 1
+            else:
+                yield record
+        for key, reason in delta[position:]:
+            if reason:
+                yield _record(key, reason)
+
+    def compact(self) -> int:
+        """
+        journal을 index.bin에 병합하고 블룸 필터 다시 생성, 레코드 수 반환
+
+        압축 중에는 다른 프로세스의 추가가 잠금에서 대기합니다.
+        """
+        with self._lock:
+            os.makedirs(self.path, exist_ok=True)
+            with self._journal_lock(exclusive=True):
+                self._sync_locked()
+                generation = self._generation + 1
+                index_path = self._file(INDEX_FILE)
+                tmp_path = index_path + '.tmp'
+
+                count = 0
+                with open(tmp_path, 'wb') as f:
+                    f.write(INDEX_HEADER.pack(INDEX_MAGIC, 0, generation))
+                    chunk = array('Q')
+                    for record in self._merged():
+                        chunk.append(record)
+                        if len(chunk) >= _WRITE_CHUNK:
+                            chunk.tofile(f)
+                            count += len(chunk)
+                            chunk = array('Q')
+                    chunk.tofile(f)
+                    count += len(chunk)
+                    f.seek(0)
+                    f.write(INDEX_HEADER.pack(INDEX_MAGIC, count, generation))
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp_path, index_path)
+
+                use_bloom = self.bloom_mode if self.bloom_mode is not None else count >= self.bloom_threshold
+                if use_bloom:
+                    self._write_bloom(generation, count)
+
+                # journal 비우기 (같은 파일을 잘라 잠금 유지)
+                with open(self._file(JOURNAL_FILE), 'r+b') as f:
+                    f.truncate(0)
+                    os.fsync(f.fileno())
+
+                self._load_locked()
+            logger.info("🗜️ 억제 목록 압축 완료: %d건 (세대 %d)", count, generation)
+            return count
+
+    def _write_bloom(self, generation: int, count: int):
+        with open(self._file(INDEX_FILE), 'rb') as f:
+            f.seek(INDEX_HEADER.size)
+            records = array('Q')
+            records.fromfile(f, count)
+        bloom = BloomFilter.for_capacity(count, self.bloom_error_rate)
+        for record in records:
+            bloom.add(record >> 8)
+
+        bloom_path = self._file(BLOOM_FILE)
+        with open(bloom_path + '.tmp', 'wb') as f:
+            f.write(BLOOM_HEADER.pack(BLOOM_MAGIC, generation, bloom.bits, bloom.hashes))
+            f.write(bloom.buffer)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(bloom_path + '.tmp', bloom_path)
+
+    def close(self):
+        with self._lock:
+            self._reset()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                'path': self.path,
+                'mode': 'set' if self._base_keys is not None else 'bloom',
+                'index_records': self._base_count,
+                'journal_records': self._journal_offset // RECORD_SIZE,
+                'generation': self._generation,
+                'bloom_bits': self._bloom.bits if self._bloom is not None else 0
+            }
+
+
+class _FileLock:
+    """fcntl.flock 컨텍스트 (파일이 없으면 생성)"""
+
+    def __init__(self, path: str, exclusive: bool):
+        self.path = path
+        self.exclusive = exclusive
+        self._fd = None
+
+    def __enter__(self):
+        self._fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+        fcntl.flock(self._fd, fcntl.LOCK_EX if self.exclusive else fcntl.LOCK_SH)
+        return self
+
+    def __exit__(self, *exc):
+        fcntl.flock(self._fd, fcntl.LOCK_UN)
+        os.close(self._fd)
+
+
+def open_suppression(path: Optional[str] = None) -> Optional[SuppressionList]:
+    """환경 변수 설정으로 억제 목록 로드 (SUPPRESSION_DIR이 비어 있으면 None)"""
+    path = path if path is not None else os.getenv('SUPPRESSION_DIR', 'suppression')
+    if not path:
+        return None
+    bloom = os.getenv('SUPPRESSION_BLOOM', 'auto').lower()
+    return SuppressionList(
+        path,
+        bloom=None if bloom == 'auto' else bloom == 'true',
+        bloom_threshold=int(os.getenv('SUPPRESSION_BLOOM_THRESHOLD', str(DEFAULT_BLOOM_THRESHOLD))),
+        fsync=os.getenv('SUPPRESSION_FSYNC', 'true').lower() == 'true'
+    )
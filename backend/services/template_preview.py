@@ -0,0 +1,87 @@
+"""
+실제 수신자 목록에 대한 템플릿 미리보기
+
+발송 전에 수백 명의 실제 참석자에게 템플릿이 어떻게 렌더링되는지 점검합니다.
+MIME 메시지는 만들지 않고 컴파일된 템플릿(변수 목록 + 조각)만 사용합니다.
+
+- 해결되지 않는 {{변수}}: 템플릿이 쓰는 변수 중 데이터에 없는 것 (렌더링 결과에 그대로 남음)
+- 빈 필드: 데이터에는 있지만 값이 비어 있는 변수 (예: 회사명 미입력)
+- 주소 오류: 사전 검증(preflight)에서 제외될 주소
+"""
+
+from typing import Any, Dict, List, Optional
+
+from services.message_builder import compile_template, default_variables, recipient_variables, text_template
+from services.recipient_validation import normalize_email
+
+
+class TemplatePreview:
+    """템플릿을 한 번 컴파일해 두고 수신자별 점검 결과를 만드는 미리보기"""
+
+    def __init__(self, email_template: Dict[str, str], template_data: Optional[Dict[str, Any]], sender_name: str):
+        self.subject = compile_template(email_template.get('subject', ''))
+        self.body = compile_template(email_template.get('body', ''))
+        text_source = text_template(email_template.get('body', ''))
+        self.text = compile_template(text_source) if text_source is not None else None
+        # 발송(send_queue.enqueue_emails)과 같은 순서로 공통 데이터 구성
+        self.shared_data = {**default_variables(sender_name), **(template_data or {})}
+        # 제목 → 본문 순서로 템플릿이 쓰는 변수 (중복 제거)
+        self.variables = tuple(dict.fromkeys(self.subject.variables + self.body.variables))
+
+    def check(self, recipient: Dict[str, Any], include_body: bool = False) -> Dict[str, Any]:
+        """
+        수신자 한 명에 대한 렌더링 점검
+
+        Args:
+            recipient: 참석자 정보 (id, name, email, company, position, attendee_type)
+            include_body: True면 렌더링된 본문(HTML/텍스트)도 포함
+        """
+        data = {**self.shared_data, **recipient_variables(recipient)}
+        unresolved = [name for name in self.variables if name not in data]
+        empty_fields = [
+            name for name in self.variables
+            if name in data and (data[name] is None or not str(data[name]).strip())
+        ]
+        _, email_error = normalize_email(recipient.get('email'))
+
+        result = {
+            'attendee_id': recipient.get('id'),
+            'email': recipient.get('email'),
+            'subject': self.subject.render(data),
+            'unresolved': unresolved,
+            'empty_fields': empty_fields,
+            'email_error': email_error,
+            'ok': not (unresolved or empty_fields or email_error)
+        }
+        if include_body:
+            result['body'] = self.body.render(data)
+            result['text_body'] = self.text.render(data) if self.text is not None else None
+        return result
+
+    def check_page(self, recipients: List[Dict[str, Any]], include_body: bool = False) -> Dict[str, Any]:
+        """
+        수신자 한 페이지 점검 + 페이지 요약
+
+        Returns:
+            Dict: recipients (수신자별 결과), summary (문제 수신자 수, 변수별 미해결/빈 값 건수)
+        """
+        results = [self.check(recipient, include_body) for recipient in recipients]
+
+        unresolved_counts: Dict[str, int] = {}
+        empty_counts: Dict[str, int] = {}
+        for result in results:
+            for name in result['unresolved']:
+                unresolved_counts[name] = unresolved_counts.get(name, 0) + 1
+            for name in result['empty_fields']:
+                empty_counts[name] = empty_counts.get(name, 0) + 1
+
+        return {
+            'recipients': results,
+            'summary': {
+                'checked': len(results),
+                'with_issues': sum(1 for result in results if not result['ok']),
+                'invalid_emails': sum(1 for result in results if result['email_error']),
+                'unresolved': unresolved_counts,
+                'empty_fields': empty_counts
+            }
+        }
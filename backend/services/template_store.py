@@ -0,0 +1,313 @@
+"""
+이메일 템플릿 저장소 - DB 기반 CRUD + 프로세스 내 템플릿 캐시
+
+template_id로 발송할 때마다 email_templates를 조회하지 않도록,
+템플릿 스냅샷(제목/본문)을 (id, updated_at) 기준으로 프로세스 안에 보관합니다.
+플레이스홀더 파싱과 텍스트 파트 변환은 message_builder의 compile_template / text_template
+캐시(템플릿 문자열 기준)가 재사용하므로 여기서는 따로 컴파일하지 않습니다.
+
+- 템플릿을 생성/수정/삭제하는 트랜잭션에서 cache_versions의 'email_templates' 스탬프를 1 증가
+- 각 프로세스는 VERSION_CHECK_SECONDS마다 스탬프 한 행만 읽고, 스탬프가 바뀐 경우에만
+  캐시된 템플릿의 (id, updated_at)을 다시 읽어 수정/삭제된 항목만 버림
+- 정상 상태(수정 없음)에서 template_id 발송은 DB 조회 없이 캐시된 제목/본문 사용
+"""
+
+import os
+import threading
+import time
+from datetime import datetime
+from typing import Any, Dict, Optional, Tuple
+
+from sqlalchemy import update
+
+from models import AttendeeType, CacheVersion, EmailTemplate, db
+
+# cache_versions에서 템플릿 캐시가 사용하는 스탬프 이름
+TEMPLATE_STAMP = 'email_templates'
+
+# 다른 프로세스의 수정 사항을 확인하는 주기 (초, 0이면 조회마다 확인)
+VERSION_CHECK_SECONDS = float(os.getenv('TEMPLATE_VERSION_CHECK_SECONDS', '5'))
+
+# 생성/수정 요청에서 받는 필드
+EDITABLE_FIELDS = ('name', 'subject', 'body', 'attendee_type', 'variables', 'is_active')
+REQUIRED_FIELDS = ('name', 'subject', 'body')
+
+# 템플릿 테이블이 비어 있을 때 등록하는 기본 템플릿
+DEFAULT_TEMPLATES = [
+    {
+        'name': '환영 이메일 - 일반 참석자',
+        'subject': '{{event_name}} 참석을 환영합니다!',
+        'body': """안녕하세요 {{name}}님,
+
+{{event_name}}에 참석해주셔서 감사합니다.
+
+📅 일정: {{event_date}}
+📍 장소: {{venue}}
+🕐 시간: {{event_time}}
+
+궁금한 사항이 있으시면 언제든 연락주세요.
+
+감사합니다.
+{{sender_name}}""",
+        'attendee_type': 'attendee'
+    },
+    {
+        'name': '연사 환영 이메일',
+        'subject': '연사로 모셔서 감사합니다 - {{event_name}}',
+        'body': """{{name}} 님께,
+
+{{event_name}}의 연사로 모셔서 진심으로 감사드립니다.
+
+🎤 연사 전용 혜택:
+- 연사 라운지 이용
+- 기술 지원 제공
+- 발표 장비 준비
+
+📋 참고사항:
+- 발표 30분 전 도착 부탁드립니다
+- 발표 자료는 {{event_date}} 전까지 전달 부탁드립니다
+
+성공적인 발표를 기원합니다.
+
+{{sender_name}} 드림""",
+        'attendee_type': 'speaker'
+    },
+    {
+        'name': 'VIP 초대 이메일',
+        'subject': 'VIP 초대 - {{event_name}}',
+        'body': """{{name}} 님께,
+
+VIP 게스트로 {{event_name}}에 초대합니다!
+
+⭐ VIP 전용 혜택:
+- VIP 라운지 이용
+- 우선 좌석 배정
+- 네트워킹 리셉션 참석
+- 연사와의 개별 만남 기회
+
+{{event_date}}에 뵙겠습니다.
+특별한 시간이 되기를 바랍니다.
+
+VIP 관계팀
+{{sender_name}}""",
+        'attendee_type': 'vip'
+    }
+]
+
+
+class TemplateNotFound(LookupError):
+    """없거나 비활성화된 템플릿"""
+
+
+class CachedTemplate:
+    """템플릿 스냅샷 (캐시 항목, 읽기 전용)"""
+
+    def __init__(self, template: EmailTemplate):
+        self.id = template.id
+        self.name = template.name
+        self.subject = template.subject
+        self.body = template.body
+        self.attendee_type = template.attendee_type
+        self.updated_at = template.updated_at
+
+    @property
+    def key(self) -> Tuple[int, Optional[datetime]]:
+        return self.id, self.updated_at
+
+    def as_email_template(self) -> Dict[str, str]:
+        """send_bulk_emails / start_campaign에 넘기는 {'subject', 'body'} 형태"""
+        return {'subject': self.subject, 'body': self.body}
+
+
+class TemplateCache:
+    """
+    (id, updated_at) 기준 템플릿 캐시
+
+    get()은 스탬프 확인 주기가 지나지 않았으면 DB를 전혀 읽지 않습니다.
+    """
+
+    def __init__(self, check_seconds: float = VERSION_CHECK_SECONDS):
+        self.check_seconds = check_seconds
+        self._entries: Dict[int, CachedTemplate] = {}
+        self._version: Optional[int] = None
+        self._checked_at = float('-inf')
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, template_id: int) -> CachedTemplate:
+        """
+        활성 템플릿 조회 (캐시 우선)
+
+        Raises:
+            TemplateNotFound: 없거나 비활성화된 템플릿
+        """
+        self._revalidate()
+
+        entry = self._entries.get(template_id)
+        if entry is not None:
+            self.hits += 1
+            return entry
+
+        self.misses += 1
+        template = db.session.get(EmailTemplate, template_id)
+        if template is None or not template.is_active:
+            raise TemplateNotFound(f'Template not found: {template_id}')
+
+        entry = CachedTemplate(template)
+        with self._lock:
+            self._entries[template_id] = entry
+        return entry
+
+    def invalidate(self, template_id: Optional[int] = None):
+        """이 프로세스에서 수정한 템플릿을 즉시 버림 (None이면 전체)"""
+        with self._lock:
+            if template_id is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(template_id, None)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            'entries': len(self._entries),
+            'version': self._version,
+            'hits': self.hits,
+            'misses': self.misses
+        }
+
+    def _revalidate(self):
+        """스탬프가 바뀌었으면 updated_at이 달라진(또는 삭제된) 항목만 제거"""
+        now = time.monotonic()
+        if now - self._checked_at < self.check_seconds:
+            return
+
+        with self._lock:
+            if now - self._checked_at < self.check_seconds:
+                return
+
+            version = db.session.query(CacheVersion.version).filter(
+                CacheVersion.name == TEMPLATE_STAMP
+            ).scalar() or 0
+
+            if version != self._version and self._entries:
+                current = dict(
+                    db.session.query(EmailTemplate.id, EmailTemplate.updated_at)
+                    .filter(EmailTemplate.id.in_(list(self._entries)), EmailTemplate.is_active.is_(True))
+                )
+                self._entries = {
+                    template_id: entry for template_id, entry in self._entries.items()
+                    if current.get(template_id) == entry.updated_at
+                }
+
+            self._version = version
+            self._checked_at = now
+
+
+def bump_version():
+    """템플릿 스탬프 증가 (커밋은 호출자 - 템플릿 변경과 같은 트랜잭션)"""
+    result = db.session.execute(
+        update(CacheVersion)
+        .where(CacheVersion.name == TEMPLATE_STAMP)
+        .values(version=CacheVersion.version + 1, updated_at=datetime.utcnow())
+        .execution_options(synchronize_session=False)
+    )
+    if not result.rowcount:
+        db.session.add(CacheVersion(name=TEMPLATE_STAMP, version=1))
+
+
+def _apply_fields(template: EmailTemplate, data: Dict[str, Any]):
+    """
+    요청 데이터를 템플릿에 반영
+
+    Raises:
+        ValueError: 빈 필수 필드, 잘못된 참석자 유형
+    """
+    for field in EDITABLE_FIELDS:
+        if field not in data:
+            continue
+        value = data[field]
+        if field in REQUIRED_FIELDS and not str(value or '').strip():
+            raise ValueError(f'Template {field} must not be empty')
+        if field == 'attendee_type':
+            value = AttendeeType(value) if value else None
+        setattr(template, field, value)
+
+
+def list_templates(attendee_type: Optional[str] = None, include_inactive: bool = False):
+    """
+    템플릿 목록 쿼리
+
+    Raises:
+        ValueError: 잘못된 참석자 유형
+    """
+    query = EmailTemplate.query
+    if not include_inactive:
+        query = query.filter(EmailTemplate.is_active.is_(True))
+    if attendee_type:
+        query = query.filter(EmailTemplate.attendee_type == AttendeeType(attendee_type))
+    return query.order_by(EmailTemplate.id)
+
+
+def create_template(data: Dict[str, Any], created_by: Optional[int] = None) -> EmailTemplate:
+    """
+    템플릿 생성
+
+    Raises:
+        ValueError: 필수 필드 누락 또는 잘못된 값
+    """
+    missing = [field for field in REQUIRED_FIELDS if field not in data]
+    if missing:
+        raise ValueError(f"Missing required field: {missing[0]}")
+
+    template = EmailTemplate(created_by=created_by)
+    _apply_fields(template, data)
+    db.session.add(template)
+    bump_version()
+    db.session.commit()
+    return template
+
+
+def update_template(template: EmailTemplate, data: Dict[str, Any]) -> EmailTemplate:
+    """
+    템플릿 수정 (updated_at 갱신 → 다른 프로세스 캐시 키가 바뀜)
+
+    Raises:
+        ValueError: 잘못된 값
+    """
+    _apply_fields(template, data)
+    template.updated_at = datetime.utcnow()
+    bump_version()
+    db.session.commit()
+    template_cache.invalidate(template.id)
+    return template
+
+
+def delete_template(template: EmailTemplate):
+    """템플릿 비활성화 (발송 로그의 template_id 참조를 유지하기 위해 행은 남김)"""
+    template.is_active = False
+    template.updated_at = datetime.utcnow()
+    bump_version()
+    db.session.commit()
+    template_cache.invalidate(template.id)
+
+
+def seed_default_templates() -> int:
+    """템플릿 테이블이 비어 있으면 기본 템플릿 등록 (개발용), 등록 건수 반환"""
+    if db.session.query(EmailTemplate.id).first() is not None:
+        return 0
+    for data in DEFAULT_TEMPLATES:
+        template = EmailTemplate()
+        _apply_fields(template, data)
+        db.session.add(template)
+    bump_version()
+    db.session.commit()
+    return len(DEFAULT_TEMPLATES)
+
+
+def get_template(template_id: int) -> CachedTemplate:
+    """발송용 템플릿 조회 (전역 캐시)"""
+    return template_cache.get(template_id)
+
+
+# 전역 템플릿 캐시 인스턴스
+template_cache = TemplateCache()
@@ -5,8 +5,15 @@ Simple Email Automation Backend
 
 from flask import Flask, jsonify, request
 from flask_cors import CORS
+from services.log_pipeline import configure_logging
+
+# 라우트/서비스 import 전에 로깅 설정 (서비스 초기화 로그 포함)
+configure_logging()
+
 from routes.google_sheets import google_sheets_bp
 from routes.emails import emails_bp
+from models import db
+from services import metrics, template_store
 import os
 
 # Initialize Flask app
@@ -14,7 +21,17 @@ app = Flask(__name__)
 
 # Configuration
 app.config['SECRET_KEY'] = 'dev-secret-key-email-automation-2024'
+# 발송 로그 / 통계 / 캠페인 라우트가 사용하는 DB (app.py와 같은 models.db 인스턴스)
+app.config['SQLALCHEMY_DATABASE_URI'] = os.getenv('DATABASE_URL', 'sqlite:///email_automation.db')
+app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+db.init_app(app)
 CORS(app, origins=['http://localhost:3000'])
+metrics.init_app(app)
+
+# 데이터베이스 테이블 생성 및 기본 템플릿 등록 (개발용)
+with app.app_context():
+    db.create_all()
+    template_store.seed_default_templates()
 
 # Health check endpoint
 @app.route('/api/health')
@@ -156,6 +173,7 @@ if __name__ == '__main__':
     print("📍 Health Check: http://localhost:5001/api/health")
     print("📍 Mock Login: http://localhost:5001/api/auth/mock-login")
     print("📍 Attendees: http://localhost:5001/api/attendees/")
+    print("📍 Metrics: http://localhost:5001/api/metrics")
     print("")
     print("Press Ctrl+C to stop the server")
     
@@ -0,0 +1,219 @@
+"""
+Email Automation System - Outbound Spool Delivery Daemon
+아웃바운드 스풀(OUTBOUND_SPOOL_DIR)을 SMTP 세션 풀로 비우는 전달 데몬
+
+발송 쪽(API 서버, worker.py)은 완성된 메시지를 스풀 세그먼트에 기록만 하고,
+이 데몬이 오래된 세그먼트부터 읽어 SMTP로 전달합니다.
+
+- 시작 시 스풀 재스캔: 중단된 tmp/ 세그먼트 정리 후 .ack에 없는 레코드만 다시 전달
+- 전달 결과는 .ack 파일에 추가하고 ACK_SYNC_EVERY건마다 fsync (배치 fsync)
+- 영구 실패(5xx, 수신 거부)와 보관 기한이 지난 메시지는 failed/로 이동
+- 일시 오류(4xx, 연결 실패)는 확인하지 않고 남겨 두었다가 다음 주기에 재시도
+- 스풀 디렉터리당 데몬 하나만 실행 (잠금 파일)
+
+실행:
+    cd backend
+    python spool_daemon.py                         # 계속 대기하며 전달
+    python spool_daemon.py --once                  # 스풀이 빌 때까지 전달 후 종료
+    python spool_daemon.py --spool-dir /var/spool/email --senders 8
+"""
+
+import argparse
+import fcntl
+import logging
+import os
+import smtplib
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Tuple
+
+from dotenv import load_dotenv
+
+# Load environment variables
+load_dotenv('config.env')
+
+from services.log_pipeline import configure_logging
+
+configure_logging()
+
+from services.email_service import email_service
+from services.metrics import OUTBOUND_DELIVERIES, OUTBOUND_SPOOL_DEPTH
+from services.lanes import LANE_PRIORITY, parse_lane
+from services.outbound_spool import ACK_FAILED, ACK_SENT, CorruptSegment, OutboundSpool, open_spool
+
+logger = logging.getLogger('spool_daemon')
+
+# .ack fsync 간격 (크래시 시 최대 이만큼 중복 전달될 수 있음)
+ACK_SYNC_EVERY = 50
+
+# 전달 결과
+DELIVERED = 'sent'
+DEFERRED = 'deferred'
+FAILED = 'failed'
+
+
+def classify_error(error: Exception) -> str:
+    """SMTP 오류를 영구 실패(FAILED) / 일시 오류(DEFERRED)로 분류"""
+    if isinstance(error, smtplib.SMTPRecipientsRefused):
+        codes = [code for code, _ in error.recipients.values()]
+        return FAILED if codes and all(code >= 500 for code in codes) else DEFERRED
+    if isinstance(error, smtplib.SMTPResponseException):
+        return FAILED if error.smtp_code >= 500 else DEFERRED
+    return DEFERRED
+
+
+class SpoolDaemon:
+    """스풀 세그먼트를 읽어 SMTP 세션 풀로 전달"""
+
+    def __init__(self, spool: OutboundSpool, pool, senders: int = 4, max_age_seconds: float = 48 * 3600):
+        self.spool = spool
+        self.pool = pool
+        self.senders = max(1, senders)
+        self.max_age_seconds = max_age_seconds
+        self.counts = {DELIVERED: 0, DEFERRED: 0, FAILED: 0}
+
+    def _deliver(self, meta: dict, data: bytes) -> Tuple[str, Optional[str]]:
+        """메시지 한 건 전달, (결과, 오류) 반환"""
+        try:
+            refused = self.pool.sendmail(meta['from'], meta['to'], data, lane=parse_lane(meta.get('lane')))
+            if refused:
+                logger.warning("⚠️ 일부 수신자 거부: %s", refused)
+            return DELIVERED, None
+        except Exception as e:
+            outcome = classify_error(e)
+            if outcome == DEFERRED and time.time() - meta.get('queued_at', time.time()) > self.max_age_seconds:
+                outcome = FAILED
+            return outcome, str(e)
+
+    def drain_segment(self, path: str, executor: ThreadPoolExecutor) -> int:
+        """
+        세그먼트 하나 전달, 일시 오류로 남은 레코드 수 반환
+
+        모든 레코드가 확인되면 세그먼트를 삭제합니다.
+        """
+        done = self.spool.acked(path)
+        records = []
+        corrupt = None
+        try:
+            for index, meta, data in self.spool.read_segment(path):
+                if index not in done:
+                    records.append((index, meta, data))
+        except CorruptSegment as e:
+            corrupt = e
+
+        # 세그먼트 안에서는 우선순위가 높은 레인부터 전달 (정렬은 안정적이므로 레인 안에서는 기록 순서)
+        records.sort(key=lambda record: LANE_PRIORITY.index(parse_lane(record[1].get('lane'))))
+        pending = [(index, meta, data, executor.submit(self._deliver, meta, data)) for index, meta, data in records]
+
+        if corrupt is not None:
+            # 읽은 레코드까지는 전달하고 세그먼트는 격리
+            logger.error("❌ 손상된 세그먼트 격리: %s", corrupt)
+            self._record(path, pending)
+            self.spool.quarantine(path)
+            return 0
+
+        deferred = self._record(path, pending)
+        if not deferred:
+            self.spool.retire(path)
+        return deferred
+
+    def _record(self, path: str, pending) -> int:
+        """전달 결과를 .ack에 기록 (ACK_SYNC_EVERY건마다 fsync), 일시 오류 건수 반환"""
+        deferred = 0
+        ack = self.spool.open_ack(path)
+        try:
+            for count, (index, meta, data, future) in enumerate(pending, 1):
+                outcome, error = future.result()
+                self.counts[outcome] += 1
+                OUTBOUND_DELIVERIES.labels(outcome).inc()
+                if outcome == DELIVERED:
+                    ack.record(index, ACK_SENT)
+                elif outcome == FAILED:
+                    logger.error("❌ 영구 실패 메시지 보관: %s (%s)", meta.get('to'), error)
+                    self.spool.dead_letter(path, index, meta, data, error)
+                    ack.record(index, ACK_FAILED)
+                else:
+                    deferred += 1
+                    logger.warning("⏳ 일시 오류, 다음 주기에 재시도: %s (%s)", meta.get('to'), error)
+                if count % ACK_SYNC_EVERY == 0:
+                    ack.sync()
+        finally:
+            ack.close()
+        return deferred
+
+    def run_once(self, executor: ThreadPoolExecutor) -> int:
+        """현재 대기 중인 세그먼트 모두 전달, 일시 오류로 남은 레코드 수 반환"""
+        deferred = 0
+        for path in self.spool.segments():
+            deferred += self.drain_segment(path, executor)
+        return deferred
+
+
+def acquire_lock(spool: OutboundSpool):
+    """스풀 디렉터리 잠금 (같은 스풀에 데몬 둘이 붙으면 중복 전달)"""
+    lock_file = open(os.path.join(spool.path, 'daemon.lock'), 'w')
+    try:
+        fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except OSError:
+        lock_file.close()
+        raise SystemExit(f'Another spool daemon is running on {spool.path}')
+    return lock_file
+
+
+def run_daemon(spool: OutboundSpool, senders: int, poll_interval: float, max_backoff: float,
+               max_age_seconds: float, once: bool) -> dict:
+    lock_file = acquire_lock(spool)
+    OUTBOUND_SPOOL_DEPTH.set_function(spool.depth)
+
+    removed = spool.recover()
+    logger.info("📮 스풀 전달 데몬 시작: %s (senders=%d, 대기 %d건, 정리한 미완성 세그먼트 %d개)",
+                spool.path, senders, spool.depth(), removed)
+
+    daemon = SpoolDaemon(spool, email_service.smtp_pool, senders, max_age_seconds)
+    backoff = poll_interval
+    try:
+        with ThreadPoolExecutor(max_workers=daemon.senders, thread_name_prefix='spool-sender') as executor:
+            while True:
+                deferred = daemon.run_once(executor)
+                if once and not deferred:
+                    break
+                if deferred:
+                    # 일시 오류: 릴레이가 회복될 때까지 대기 간격을 늘림
+                    logger.info("⏳ 재시도 대기 %.1fs (남은 메시지 %d건)", backoff, spool.depth())
+                    time.sleep(backoff)
+                    backoff = min(max_backoff, backoff * 2)
+                    continue
+                backoff = poll_interval
+                time.sleep(poll_interval)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        email_service.smtp_pool.close()
+        lock_file.close()
+        logger.info("🛑 스풀 전달 데몬 종료: %s", daemon.counts)
+
+    return daemon.counts
+
+
+def main():
+    parser = argparse.ArgumentParser(description='아웃바운드 스풀 전달 데몬')
+    parser.add_argument('--spool-dir', default=os.getenv('OUTBOUND_SPOOL_DIR', ''))
+    parser.add_argument('--senders', type=int, default=int(os.getenv('SMTP_POOL_SIZE', '4')),
+                        help='동시 전달 스레드 수 (SMTP 세션 수)')
+    parser.add_argument('--poll-interval', type=float, default=float(os.getenv('SPOOL_POLL_INTERVAL', '1')))
+    parser.add_argument('--max-backoff', type=float, default=60.0, help='일시 오류 재시도 최대 대기(초)')
+    parser.add_argument('--max-age-hours', type=float, default=48.0, help='일시 오류 메시지 보관 기한')
+    parser.add_argument('--once', action='store_true', help='스풀이 비면 종료')
+    args = parser.parse_args()
+
+    spool = open_spool(args.spool_dir)
+    if spool is None:
+        parser.error('OUTBOUND_SPOOL_DIR or --spool-dir is required')
+
+    # 전달 스레드 수만큼 SMTP 세션 사용
+    email_service.smtp_pool_size = args.senders
+    run_daemon(spool, args.senders, args.poll_interval, args.max_backoff, args.max_age_hours * 3600, args.once)
+
+
+if __name__ == '__main__':
+    main()
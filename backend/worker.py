@@ -0,0 +1,348 @@
+"""
+Email Automation System - Send Worker
+DB 기반 발송 큐(pending EmailLog)를 처리하는 워커 프로세스
+
+여러 서버에서 같은 데이터베이스를 바라보는 워커를 여러 개 띄우면
+임대(lease) 기반으로 캠페인을 나눠서 발송합니다.
+
+워커 안에서는 선점(select) → 렌더링(render) → 발송(deliver) 단계가 각자 스레드로 돌고,
+단계 사이 큐는 배치 WORKER_PIPELINE_DEPTH개로 제한됩니다. 릴레이가 느려 발송이 밀리면
+큐가 차서 렌더링과 선점이 멈추므로 메모리에 발송 대기분이 쌓이지 않습니다.
+일시 중지/취소된 캠페인은 발송 단계가 배치마다 확인해 남은 행을 반납/취소합니다.
+억제 목록(반송/수신 거부)에 오른 주소는 발송하지 않고 실패로 기록합니다.
+
+실행:
+    cd backend
+    python worker.py                       # 계속 대기하며 처리
+    python worker.py --once                # 큐가 빌 때까지 처리 후 종료
+    python worker.py --batch-size 100 --lease-seconds 120 --worker-id node-a-1
+"""
+
+import argparse
+import logging
+import os
+import queue
+import socket
+import threading
+import uuid
+from typing import Any, Dict, List, NamedTuple, Optional
+
+from dotenv import load_dotenv
+from flask import Flask
+
+# Load environment variables
+load_dotenv('config.env')
+
+from models import CampaignStatus, SendLane, db
+from services.log_pipeline import configure_logging
+
+configure_logging()
+
+from services import send_queue
+from services.content_store import render_log
+from services.email_service import email_service
+
+logger = logging.getLogger('worker')
+
+# 단계 사이 큐 크기 (배치 수)
+DEFAULT_PIPELINE_DEPTH = 2
+
+
+class QueuedMessage(NamedTuple):
+    """선점한 EmailLog의 발송에 필요한 값 (세션과 분리되어 다른 단계 스레드에서 사용)"""
+    id: int
+    campaign_id: Optional[int]
+    email: str
+    name: str
+    subject: str
+    body: Optional[str]
+    content_hash: Optional[str]
+    variables: Optional[Dict[str, Any]]
+    lane: SendLane
+
+    @classmethod
+    def from_log(cls, log) -> 'QueuedMessage':
+        return cls(log.id, log.campaign_id, log.recipient.email, log.recipient.name,
+                   log.subject, log.body, log.content_hash, log.variables,
+                   send_queue.campaign_lane(log.campaign_id))
+
+
+def create_worker_app() -> Flask:
+    """DB 연결만 설정한 Flask 앱 (HTTP 서버는 띄우지 않음)"""
+    app = Flask(__name__)
+    database_url = os.getenv('DATABASE_URL', 'sqlite:///email_automation.db')
+    app.config['SQLALCHEMY_DATABASE_URI'] = database_url
+    app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+    if database_url.startswith('sqlite'):
+        # 여러 프로세스가 같은 SQLite 파일에 쓸 때 잠금 대기
+        app.config['SQLALCHEMY_ENGINE_OPTIONS'] = {'connect_args': {'timeout': 30}}
+    db.init_app(app)
+    return app
+
+
+class LeaseKeeper(threading.Thread):
+    """발송 중인 배치의 임대를 주기적으로 연장하는 스레드"""
+
+    def __init__(self, app: Flask, worker_id: str, lease_seconds: int):
+        super().__init__(name='lease-keeper', daemon=True)
+        self.app = app
+        self.worker_id = worker_id
+        self.lease_seconds = lease_seconds
+        self.log_ids = set()
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+
+    def track(self, log_ids):
+        """선점한 행 추가 (파이프라인에 여러 배치가 있을 수 있음)"""
+        with self._lock:
+            self.log_ids.update(log_ids)
+
+    def release(self, log_id: int):
+        with self._lock:
+            self.log_ids.discard(log_id)
+
+    def run(self):
+        # 임대 기간의 1/3마다 연장
+        interval = max(1.0, self.lease_seconds / 3)
+        while not self._stopped.wait(interval):
+            with self._lock:
+                log_ids = list(self.log_ids)
+            if not log_ids:
+                continue
+            try:
+                with self.app.app_context():
+                    send_queue.renew_leases(self.worker_id, log_ids, self.lease_seconds)
+            except Exception as e:
+                logger.warning("⚠️ 임대 연장 실패: %s", e)
+
+    def stop(self):
+        self._stopped.set()
+
+
+def render_batch(messages: List[QueuedMessage]) -> List[tuple]:
+    """(메시지, 제목, 본문, 텍스트 파트) 목록"""
+    return [(message, *render_log(message)) for message in messages]
+
+
+def deliver_batch(worker_id: str, rendered: List[tuple], keeper: LeaseKeeper) -> int:
+    """렌더링된 배치 발송, 처리한 행 수 반환"""
+    # 선점 이후 일시 중지/취소된 캠페인 확인 (배치마다 한 번)
+    held = send_queue.held_campaigns({message.campaign_id for message, *_ in rendered})
+    if held:
+        rendered = _hold(worker_id, rendered, held, keeper)
+
+    # 큐 등록 이후 반송/수신 거부된 주소 반영 (배치마다 한 번, 새 기록만 읽음)
+    if email_service.suppression is not None:
+        email_service.suppression.refresh()
+
+    # 스풀 발송은 디스크에 기록(flush_spool)된 뒤에 결과를 기록 → 그 전에 죽으면 임대 만료 후 재처리
+    deferred = []
+
+    for message, subject, body, text_body in rendered:
+        reason = email_service.suppressed_reason(message.email)
+        if reason is not None:
+            # 억제된 주소는 발송하지 않고 실패로 기록
+            _record_result(worker_id, message, email_service.suppressed_result(message.email, reason), keeper)
+            continue
+        result = email_service.send_email(
+            recipient_email=message.email,
+            subject=subject,
+            body=body,
+            recipient_name=message.name,
+            text_body=text_body,
+            lane=message.lane
+        )
+        if email_service.buffers_deliveries:
+            deferred.append((message, result))
+        else:
+            _record_result(worker_id, message, result, keeper)
+
+    email_service.flush_spool()
+    for message, result in deferred:
+        _record_result(worker_id, message, result, keeper)
+
+    return len(rendered)
+
+
+def _hold(worker_id: str, rendered: List[tuple], held: Dict[int, CampaignStatus], keeper: LeaseKeeper) -> List[tuple]:
+    """멈춘 캠페인의 행은 반납(일시 중지) 또는 취소하고 나머지 반환"""
+    held_ids: Dict[int, List[int]] = {}
+    remaining = []
+    for item in rendered:
+        message = item[0]
+        if message.campaign_id in held:
+            held_ids.setdefault(message.campaign_id, []).append(message.id)
+        else:
+            remaining.append(item)
+
+    for campaign_id, log_ids in held_ids.items():
+        if held[campaign_id] == CampaignStatus.CANCELLED:
+            send_queue.cancel_pending(campaign_id, worker_id, log_ids)
+            db.session.commit()
+        else:
+            send_queue.release(worker_id, log_ids)
+        for log_id in log_ids:
+            keeper.release(log_id)
+        logger.info("⏸️ 캠페인 %d %s: %d건 발송 보류", campaign_id, held[campaign_id].value, len(log_ids))
+
+    return remaining
+
+
+def _record_result(worker_id: str, message: QueuedMessage, result, keeper: LeaseKeeper):
+    if not send_queue.complete(worker_id, message.id, result['success'], result.get('error'), message.campaign_id):
+        logger.warning("⚠️ 임대를 잃은 메시지 결과 기록 생략: email_log=%d", message.id)
+    keeper.release(message.id)
+
+
+class SendPipeline:
+    """
+    선점 → 렌더링 → 발송 파이프라인
+
+    단계마다 스레드 하나(발송은 호출한 스레드)와 앱 컨텍스트(DB 세션)를 사용합니다.
+    단계 사이 큐는 배치 depth개로 제한되어 느린 단계가 앞 단계를 멈춥니다 (backpressure).
+    """
+
+    def __init__(self, app: Flask, worker_id: str, keeper: LeaseKeeper, batch_size: int,
+                 lease_seconds: int, poll_interval: float, once: bool, depth: int = DEFAULT_PIPELINE_DEPTH):
+        self.app = app
+        self.worker_id = worker_id
+        self.keeper = keeper
+        self.batch_size = batch_size
+        self.lease_seconds = lease_seconds
+        self.poll_interval = poll_interval
+        self.once = once
+        self.claimed: 'queue.Queue[Optional[List[QueuedMessage]]]' = queue.Queue(maxsize=max(1, depth))
+        self.rendered: 'queue.Queue[Optional[List[tuple]]]' = queue.Queue(maxsize=max(1, depth))
+        self.stopped = threading.Event()
+
+    def _put(self, target: queue.Queue, item) -> bool:
+        """큐가 빌 때까지 대기 (중지되면 False)"""
+        while not self.stopped.is_set():
+            try:
+                target.put(item, timeout=0.5)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _get(self, source: queue.Queue):
+        while not self.stopped.is_set():
+            try:
+                return source.get(timeout=0.5)
+            except queue.Empty:
+                continue
+        return None
+
+    def _drop(self, messages: List[QueuedMessage]):
+        """처리하지 못한 배치는 임대 연장을 멈춤 → 만료 후 다시 선점됨"""
+        for message in messages:
+            self.keeper.release(message.id)
+
+    def select(self):
+        with self.app.app_context():
+            try:
+                while not self.stopped.is_set():
+                    batch = send_queue.claim_batch(self.worker_id, self.batch_size, self.lease_seconds)
+                    if batch:
+                        messages = [QueuedMessage.from_log(log) for log in batch]
+                        self.keeper.track([message.id for message in messages])
+                        if not self._put(self.claimed, messages):
+                            break
+                        continue
+
+                    if self.once:
+                        break
+                    self.stopped.wait(self.poll_interval)
+            except Exception:
+                logger.exception("❌ 발송 큐 선점 실패")
+                self.stopped.set()
+            finally:
+                self._put(self.claimed, None)
+
+    def render(self):
+        with self.app.app_context():
+            while True:
+                messages = self._get(self.claimed)
+                if messages is None:
+                    break
+                try:
+                    rendered = render_batch(messages)
+                except Exception:
+                    logger.exception("❌ 배치 렌더링 실패 (%d건, 임대 만료 후 재처리)", len(messages))
+                    self._drop(messages)
+                    continue
+                if not self._put(self.rendered, rendered):
+                    break
+            self._put(self.rendered, None)
+
+    def run(self) -> int:
+        """파이프라인 실행 (발송 단계는 이 스레드), 처리한 행 수 반환"""
+        stages = [
+            threading.Thread(target=self.select, name='pipeline-select', daemon=True),
+            threading.Thread(target=self.render, name='pipeline-render', daemon=True)
+        ]
+        for stage in stages:
+            stage.start()
+
+        processed = 0
+        try:
+            with self.app.app_context():
+                while True:
+                    rendered = self._get(self.rendered)
+                    if rendered is None:
+                        break
+                    try:
+                        processed += deliver_batch(self.worker_id, rendered, self.keeper)
+                    except Exception:
+                        logger.exception("❌ 배치 발송 실패 (%d건)", len(rendered))
+                        db.session.rollback()
+                        self._drop([message for message, *_ in rendered])
+        finally:
+            self.stopped.set()
+            for stage in stages:
+                stage.join(timeout=5)
+        return processed
+
+
+def run_worker(worker_id: str, batch_size: int, lease_seconds: int, poll_interval: float, once: bool,
+               pipeline_depth: int = DEFAULT_PIPELINE_DEPTH):
+    app = create_worker_app()
+    keeper = LeaseKeeper(app, worker_id, lease_seconds)
+    keeper.start()
+
+    processed = 0
+    logger.info("🚚 발송 워커 시작: %s (batch=%d, lease=%ds, pipeline=%d)",
+                worker_id, batch_size, lease_seconds, pipeline_depth)
+
+    pipeline = SendPipeline(app, worker_id, keeper, batch_size, lease_seconds, poll_interval, once, pipeline_depth)
+    try:
+        with app.app_context():
+            db.create_all()
+        processed = pipeline.run()
+    except KeyboardInterrupt:
+        pipeline.stopped.set()
+    finally:
+        keeper.stop()
+        logger.info("🛑 발송 워커 종료: %s (처리 %d건)", worker_id, processed)
+
+    return processed
+
+
+def main():
+    parser = argparse.ArgumentParser(description='DB 기반 발송 큐 워커')
+    parser.add_argument('--worker-id', default=f'{socket.gethostname()}-{os.getpid()}-{uuid.uuid4().hex[:6]}')
+    parser.add_argument('--batch-size', type=int, default=int(os.getenv('WORKER_BATCH_SIZE', '50')))
+    parser.add_argument('--lease-seconds', type=int, default=int(os.getenv('WORKER_LEASE_SECONDS', '120')))
+    parser.add_argument('--poll-interval', type=float, default=float(os.getenv('WORKER_POLL_INTERVAL', '2')))
+    parser.add_argument('--pipeline-depth', type=int,
+                        default=int(os.getenv('WORKER_PIPELINE_DEPTH', str(DEFAULT_PIPELINE_DEPTH))),
+                        help='단계 사이 큐에 둘 수 있는 배치 수')
+    parser.add_argument('--once', action='store_true', help='큐가 비면 종료')
+    args = parser.parse_args()
+
+    run_worker(args.worker_id, args.batch_size, args.lease_seconds, args.poll_interval, args.once,
+               args.pipeline_depth)
+
+
+if __name__ == '__main__':
+    main()
@@ -72,7 +72,8 @@ CREATE TABLE email_templates (
     -- 메타데이터
     created_by INT,
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+    -- 컴파일 템플릿 캐시 키 (id, updated_at) - 같은 초 안의 수정도 구분하도록 마이크로초 정밀도
+    updated_at TIMESTAMP(6) DEFAULT CURRENT_TIMESTAMP(6) ON UPDATE CURRENT_TIMESTAMP(6),
     is_active BOOLEAN DEFAULT TRUE,
     
     INDEX idx_name (name),
@@ -83,36 +84,110 @@ CREATE TABLE email_templates (
     FOREIGN KEY (created_by) REFERENCES users(id) ON DELETE SET NULL
 );
 
+-- Campaigns Table (발송 캠페인)
+CREATE TABLE campaigns (
+    id INT AUTO_INCREMENT PRIMARY KEY,
+    name VARCHAR(200) NOT NULL,
+    template_id INT,
+    sender_id INT NOT NULL,
+    status ENUM('running', 'paused', 'completed', 'cancelled') NOT NULL DEFAULT 'running',
+    lane ENUM('transactional', 'bulk', 'reminder') NOT NULL DEFAULT 'bulk',
+    
+    -- 참석자 유형별 라우팅 캠페인의 하위 그룹 (상위 캠페인 카운터 = 하위 합계)
+    parent_id INT NULL,
+    attendee_type ENUM('speaker', 'attendee', 'sponsor', 'staff', 'vip') NULL,
+    
+    -- 수신자 스냅샷 (little-endian uint32 배열)
+    recipient_ids MEDIUMBLOB NOT NULL,
+    recipient_count INT NOT NULL DEFAULT 0,
+    
+    -- 비정규화 카운터
+    queued_count INT NOT NULL DEFAULT 0,
+    sent_count INT NOT NULL DEFAULT 0,
+    failed_count INT NOT NULL DEFAULT 0,
+    bounced_count INT NOT NULL DEFAULT 0,
+    cancelled_count INT NOT NULL DEFAULT 0,
+    
+    -- 메타데이터
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    completed_at TIMESTAMP NULL,
+    
+    INDEX idx_campaign_status (status),
+    INDEX idx_campaign_created_at (created_at),
+    INDEX idx_campaign_parent (parent_id),
+    
+    FOREIGN KEY (parent_id) REFERENCES campaigns(id) ON DELETE CASCADE,
+    FOREIGN KEY (template_id) REFERENCES email_templates(id) ON DELETE SET NULL,
+    FOREIGN KEY (sender_id) REFERENCES users(id) ON DELETE RESTRICT
+);
+
+-- Email Contents Table (중복 제거된 발송 내용: 템플릿 원문 + 공통 변수, zlib 압축)
+CREATE TABLE email_contents (
+    hash CHAR(64) PRIMARY KEY,         -- 압축 전 내용의 SHA-256
+    data MEDIUMBLOB NOT NULL,
+    raw_size INT NOT NULL,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
 -- Email Logs Table (이메일 전송 로그)
 CREATE TABLE email_logs (
     id INT AUTO_INCREMENT PRIMARY KEY,
     recipient_id INT NOT NULL,
     template_id INT,
     sender_id INT NOT NULL,
+    campaign_id INT,
     
     -- 이메일 내용
     subject VARCHAR(255) NOT NULL,
-    body TEXT NOT NULL,
+    body TEXT,                         -- 중복 제거 이전 행만 사용
+    content_hash CHAR(64),             -- email_contents.hash
+    variables JSON,                    -- 참석자별 템플릿 변수
     
     -- 전송 정보
-    status ENUM('pending', 'sent', 'failed', 'scheduled') DEFAULT 'pending',
+    status ENUM('pending', 'sent', 'failed', 'scheduled', 'cancelled') DEFAULT 'pending',
     sent_at TIMESTAMP NULL,
     scheduled_at TIMESTAMP NULL,
     error_message TEXT,
     
+    -- 발송 큐 임대(lease) 정보 (worker.py)
+    lease_owner VARCHAR(64),
+    lease_expires_at TIMESTAMP NULL,
+    attempts INT NOT NULL DEFAULT 0,
+    
     -- 메타데이터
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     
-    INDEX idx_recipient (recipient_id),
-    INDEX idx_template (template_id),
+    INDEX idx_email_logs_queue (status, lease_expires_at),
+    INDEX idx_campaign (campaign_id),
+    INDEX idx_content_hash (content_hash),
+    INDEX idx_recipient (recipient_id, id),
+    INDEX idx_template (template_id, id),
     INDEX idx_sender (sender_id),
-    INDEX idx_status (status),
+    INDEX idx_status (status, id),
     INDEX idx_sent_at (sent_at),
     INDEX idx_created_at (created_at),
     
     FOREIGN KEY (recipient_id) REFERENCES attendees(id) ON DELETE CASCADE,
     FOREIGN KEY (template_id) REFERENCES email_templates(id) ON DELETE SET NULL,
-    FOREIGN KEY (sender_id) REFERENCES users(id) ON DELETE RESTRICT
+    FOREIGN KEY (sender_id) REFERENCES users(id) ON DELETE RESTRICT,
+    FOREIGN KEY (campaign_id) REFERENCES campaigns(id) ON DELETE SET NULL,
+    FOREIGN KEY (content_hash) REFERENCES email_contents(hash) ON DELETE RESTRICT
+);
+
+-- Email Hourly Stats Table (시간 × 상태별 발송 건수 롤업)
+CREATE TABLE email_hourly_stats (
+    hour DATETIME NOT NULL,
+    status ENUM('pending', 'sent', 'failed', 'scheduled', 'cancelled') NOT NULL,
+    count INT NOT NULL DEFAULT 0,
+    
+    PRIMARY KEY (hour, status)
+);
+
+-- Cache Versions Table (프로세스 내 캐시 무효화용 버전 스탬프)
+CREATE TABLE cache_versions (
+    name VARCHAR(64) PRIMARY KEY,
+    version INT NOT NULL DEFAULT 0,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP
 );
 
 -- Google Sheets Integration Table (Google Sheets 연동 설정)
@@ -173,6 +248,9 @@ INSERT INTO email_templates (name, subject, body, attendee_type, variables, crea
     TRUE
 );
 
+-- 템플릿 캐시 버전 스탬프 (템플릿 생성/수정/삭제 시 증가)
+INSERT INTO cache_versions (name, version) VALUES ('email_templates', 1);
+
 -- 기본 사용자 생성 (개발용)
 INSERT INTO users (firebase_uid, email, display_name, is_active) VALUES
 ('dev-user-001', 'admin@example.com', 'System Administrator', TRUE);